@@ -0,0 +1,28 @@
+//=============================================================================
+// 文件名: hann_window_rom_sym.v
+// 功能: 8192点Hann窗系数ROM (对称存储, 只存前4096点)
+// 自动生成: generate_hann_window.py --symmetric
+// 读取: addr < 4096 ? rom[addr] : rom[8191-addr]
+//       8191-addr 的低12位即 ~addr, 只需一级异或, 不用减法器
+//=============================================================================
+
+module hann_window_rom_sym #(
+    parameter INIT_FILE = "source/hann_window_8192_half.hex"  // 仿真时可按工作目录覆盖
+)(
+    input                   clk,
+    input      [12:0]      addr,    // 0-8191
+    output reg [15:0]       coeff    // Q15窗系数, 1周期延迟
+);
+
+reg  [15:0] half_rom [0:4095];
+wire [11:0] half_addr = addr[11:0] ^ {12{addr[12]}};
+
+initial begin
+    $readmemh(INIT_FILE, half_rom);
+end
+
+always @(posedge clk) begin
+    coeff <= half_rom[half_addr];
+end
+
+endmodule
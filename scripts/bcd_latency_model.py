@@ -0,0 +1,691 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BCD转换延迟模型 (auto_test.v 的BCD状态机 + bcd_converter.v)
+
+逐周期模拟 auto_test.v 中"阈值调整逻辑 + BCD_CONV_32/BCD_CONV_16状态机"两个always块,
+给出每次按键到HDMI显示寄存器更新的周期数, 以及7个阈值依次刷新的总周期数.
+数据通路 (逐位移位加3) 向量化实现, 对数百万个输入逐位比对精确BCD结果;
+bcd_converter.v (未例化) 的近似地址ROM方案按同样方式穷举检查.
+
+另外评估几种替代方案的 周期数 / LUT估算:
+    - 串行double dabble, 每周期1/2/4位 (当前为1位)
+    - 全并行组合double dabble (按LUT级数切流水线)
+    - 全分辨率ROM查表
+    - BCD域直接加减步进值 (步进均为10的幂)
+并把延迟折算成720p@60Hz的HDMI帧数, 判断重新设计是否值得.
+
+常量取自 auto_test.v (阈值/步进/BCD复位值直接从RTL解析), 显示时序取自
+hdmi_display_ctrl.v, 消抖时间取自 key_debounce.v.
+
+用法:
+    python scripts/bcd_latency_model.py                    # 默认: 200万随机输入 + 2万次随机按键
+    python scripts/bcd_latency_model.py --samples 10000000 --events 100000
+    python scripts/bcd_latency_model.py --json bcd_latency.json
+"""
+
+import argparse
+import json
+import re
+import sys
+
+import numpy as np
+
+from generate_bcd_lut import bcd_decode, bcd_encode, estimate_case_luts
+from mem_image import estimate_drm
+
+RTL_FILE = "source/source/auto_test.v"
+CONVERTER_FILE = "source/source/bcd_converter.v"
+
+CLK_HZ = 100_000_000            # auto_test 时钟 (clk_100m)
+PIXEL_HZ = 74_250_000           # 720p@60Hz 像素时钟
+H_TOTAL, V_TOTAL = 1650, 750
+THRESH_LINES = (400, 400 + 4 * 28)  # 自动测试区阈值所在扫描行 (AUTO_TEST_Y_START, 4行×28)
+DEBOUNCE_CYCLES = 1_000_000     # key_debounce.v: 10ms, 松开沿输出脉冲
+
+LUTS_PER_ADD3 = 4               # 加3单元: 4输入4输出, 每个输出位1个LUT6
+LUT_LEVELS_PER_CYCLE = 8        # 100MHz下每周期可容纳的LUT级数 (含布线, 估算)
+CHUNK = 1 << 20                 # 向量化数据通路每批输入数
+
+# 转换器: 输入位宽 → BCD位数 (auto_test.v 的 bcd_shift_32 / bcd_shift_16)
+CONVERTERS = {32: 6, 16: 4}
+
+# 阈值: 名称 → (转换器, 调整模式, 步进参数前缀, 上限(不含))
+THRESHOLDS = {
+    'freq_min': (32, 'FREQ', 'FREQ', 500000),
+    'freq_max': (32, 'FREQ', 'FREQ', 500000),
+    'amp_min':  (16, 'AMP', 'AMP', 5000),
+    'amp_max':  (16, 'AMP', 'AMP', 5000),
+    'duty_min': (16, 'DUTY', 'DUTY', 1000),
+    'duty_max': (16, 'DUTY', 'DUTY', 1000),
+    'thd_max':  (16, 'THD', 'THD', 1000),
+}
+MODE_GROUPS = {
+    'FREQ': ('freq_min', 'freq_max'),
+    'AMP': ('amp_min', 'amp_max'),
+    'DUTY': ('duty_min', 'duty_max'),
+    'THD': ('thd_max',),
+}
+STEP_NAMES = ('FINE', 'MID', 'COARSE')
+BUTTONS = ('dn_dn', 'dn_up', 'up_dn', 'up_up')
+
+#=============================================================================
+# RTL常量解析
+#=============================================================================
+def parse_rtl(path=RTL_FILE):
+    """
+    从auto_test.v解析默认阈值、步进和BCD复位/恢复常量
+
+    返回:
+        (defaults, steps, bcd_literals, taps)
+        defaults: 阈值名 → 二进制复位值
+        steps: 模式 → [细调, 中调, 粗调]
+        bcd_literals: 阈值名 → RTL中出现过的全部BCD常量 (复位与恢复两处)
+        taps: 转换器位宽 → 完成时截取结果的最低位 (bcd_shift_temp_xx[hi:lo]的lo)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    lp = {name: int(value) for name, value in
+          re.findall(r"localparam\s+(\w+)\s*=\s*\d+'d(\d+);", text)}
+
+    defaults = {}
+    for mode in ('FREQ', 'AMP', 'DUTY'):
+        center, tol = lp[f'{mode}_DEFAULT'], lp[f'{mode}_TOL_DEFAULT']
+        defaults[f'{mode.lower()}_min'] = center - tol
+        defaults[f'{mode.lower()}_max'] = center + tol
+    defaults['thd_max'] = lp['THD_MAX_DEFAULT']
+
+    steps = {mode: [lp[f'{mode}_STEP_{s}'] for s in STEP_NAMES] for mode in MODE_GROUPS}
+
+    bcd_literals = {name: [] for name in THRESHOLDS}
+    for name, value in re.findall(r"\{(\w+?)_d\d[^}]*\}\s*<=\s*\d+'h([0-9A-Fa-f]+);", text):
+        bcd_literals[name].append(int(value, 16))
+
+    taps = {}
+    for width in CONVERTERS:
+        m = re.search(rf"<=\s*bcd_shift_temp_{width}\[(\d+):(\d+)\];", text)
+        taps[width] = int(m.group(2))
+    return defaults, steps, bcd_literals, taps
+
+#=============================================================================
+# 数据通路 (向量化)
+#=============================================================================
+def double_dabble(x, width, digits, tap=None):
+    """
+    逐位移位加3, 与BCD_CONV_32/BCD_CONV_16逐位一致
+
+    每次迭代先对BCD区各位 >=5 的数字加3, 再左移1位; 最后一次迭代加3后
+    从寄存器的第tap位起截取digits位BCD (RTL的截取位置, 见parse_rtl).
+    tap=width-1 等价于完成第width次移位, 结果为 x mod 10^digits.
+    """
+    if tap is None:
+        tap = width - 1
+    shift = np.asarray(x, dtype=np.uint64) & np.uint64((1 << width) - 1)
+    mask = np.uint64((1 << (width + 4 * digits)) - 1)
+    for i in range(width):
+        for j in range(digits):
+            pos = np.uint64(width + 4 * j)
+            digit = (shift >> pos) & np.uint64(0xF)
+            shift = shift + np.where(digit >= 5, np.uint64(3) << pos, np.uint64(0))
+        if i < width - 1:
+            shift = (shift << np.uint64(1)) & mask
+    return (shift >> np.uint64(tap)) & np.uint64((1 << (4 * digits)) - 1)
+
+def bcd_step(bcd, digits, step_digit, sign):
+    """BCD域加/减 10^step_digit (向量化, 逐位进位/借位, 超出digits位丢弃)"""
+    bcd = np.asarray(bcd, dtype=np.uint64).copy()
+    carry = np.ones(bcd.shape, dtype=np.int64)
+    for j in range(step_digit, digits):
+        pos = np.uint64(4 * j)
+        d = ((bcd >> pos) & np.uint64(0xF)).astype(np.int64) + sign * carry
+        carry = ((d < 0) | (d > 9)).astype(np.int64)
+        d = np.where(d < 0, d + 10, np.where(d > 9, d - 10, d))
+        bcd = (bcd & ~(np.uint64(0xF) << pos)) | (d.astype(np.uint64) << pos)
+    return bcd
+
+def check_datapath(samples, rng, taps):
+    """
+    穷举 + 随机输入比对逐位模型与精确BCD
+
+    32位转换器: 0~499999全部 + samples个32位随机数; 16位转换器: 全部65536个值.
+    """
+    results = []
+    for width, digits in CONVERTERS.items():
+        limit = max(THRESHOLDS[n][3] for n in THRESHOLDS if THRESHOLDS[n][0] == width)
+        exhaustive = np.arange(min(limit, 1 << width), dtype=np.uint64)
+        parts = [exhaustive]
+        if width == 32:
+            parts.append(rng.integers(0, 1 << 32, samples, dtype=np.uint64))
+        else:
+            parts = [np.arange(1 << width, dtype=np.uint64)]
+        x = np.concatenate(parts)
+        bad, first = 0, None
+        for start in range(0, len(x), CHUNK):
+            chunk = x[start:start + CHUNK]
+            got = double_dabble(chunk, width, digits, taps[width])
+            wrong = got != bcd_encode(chunk % np.uint64(10 ** digits), digits).astype(np.uint64)
+            bad += int(wrong.sum())
+            if first is None and wrong.any():
+                first = int(chunk[wrong][0])
+        results.append({'converter': width, 'digits': digits, 'checked': len(x),
+                        'errors': bad, 'first_error': first})
+    return results
+
+def check_bcd_step(steps):
+    """BCD域步进方案: 对每个阈值的全部取值与全部步进档位验证 (溢出/越界按RTL条件跳过)"""
+    checked = bad = 0
+    for name, (width, mode, _, limit) in THRESHOLDS.items():
+        digits = CONVERTERS[width]
+        x = np.arange(limit, dtype=np.int64)
+        bcd = bcd_encode(x, digits)
+        for step in steps[mode]:
+            k = len(str(step)) - 1
+            for sign in (1, -1):
+                y = x + sign * step
+                ok = (y >= 0) & (y < limit)
+                got = bcd_step(bcd[ok], digits, k, sign)
+                bad += int((got != bcd_encode(y[ok], digits).astype(np.uint64)).sum())
+                checked += int(ok.sum())
+    return checked, bad
+
+#=============================================================================
+# 逐周期控制模型
+#=============================================================================
+class AutoTestBcdModel:
+    """
+    auto_test.v 阈值调整always块 + BCD转换状态机always块的逐周期模型
+
+    clock() 对应一个时钟沿: 两个always块都基于沿前的寄存器值计算, 沿后统一更新.
+    转换结果在最后一次迭代时由 double_dabble() 给出 (中间移位寄存器对外不可见).
+    bcd_target 在完成周期读取 (与RTL相同), 而不是在启动时锁存.
+    """
+
+    def __init__(self, defaults, bcd_reset, steps, taps):
+        self.defaults = dict(defaults)
+        self.bcd_reset = dict(bcd_reset)
+        self.steps = steps
+        self.taps = taps
+        self.binary = dict(defaults)
+        self.bcd = dict(bcd_reset)
+        self.state = 'IDLE'
+        self.cnt = 0
+        self.latched = 0
+        self.start = {32: False, 16: False}
+        self.input = {32: 0, 16: 0}
+        self.target = 'freq_min'
+        self.restore = {mode: False for mode in MODE_GROUPS}
+
+    def busy(self):
+        return (self.state != 'IDLE' or any(self.start.values())
+                or any(self.restore.values()))
+
+    def clock(self, mode=None, step_idx=0, buttons=(), reset_btn=False, test_enable=True):
+        """一个时钟沿; 返回本沿二进制阈值发生变化的名称列表"""
+        fsm = self._fsm_next()
+        adjust = self._adjust_next(mode, step_idx, set(buttons), reset_btn) \
+            if test_enable and self.state == 'IDLE' else {}
+
+        changed = []
+        for key, value in fsm.items():
+            if key == 'bcd':
+                self.bcd.update(value)
+            else:
+                setattr(self, key, value)
+        for key, value in adjust.items():
+            if key == 'binary':
+                changed = [n for n, v in value.items() if v != self.binary[n]]
+                self.binary.update(value)
+            elif key in ('start', 'input', 'restore'):
+                getattr(self, key).update(value)
+            else:
+                setattr(self, key, value)
+        return changed
+
+    def _fsm_next(self):
+        if self.state == 'IDLE':
+            for mode in MODE_GROUPS:
+                if self.restore[mode]:
+                    return {'bcd': {n: self.bcd_reset[n] for n in MODE_GROUPS[mode]}}
+            for width in (32, 16):
+                if self.start[width]:
+                    return {'state': f'CONV_{width}', 'latched': self.input[width], 'cnt': 0}
+            return {}
+        if self.state.startswith('CONV_'):
+            width = int(self.state[5:])
+            if self.cnt == width - 1:
+                out = {'state': 'WAIT', 'cnt': self.cnt + 1}
+                if THRESHOLDS[self.target][0] == width:
+                    value = double_dabble([self.latched], width, CONVERTERS[width],
+                                          self.taps[width])[0]
+                    out['bcd'] = {self.target: int(value)}
+                return out
+            return {'cnt': self.cnt + 1}
+        return {'state': 'IDLE'}
+
+    def _adjust_next(self, mode, step_idx, buttons, reset_btn):
+        if reset_btn:
+            if mode not in MODE_GROUPS:
+                return {}
+            return {'binary': {n: self.defaults[n] for n in MODE_GROUPS[mode]},
+                    'restore': {mode: True}}
+
+        out = {'restore': {m: False for m in MODE_GROUPS}, 'start': {32: False, 16: False}}
+        if mode not in MODE_GROUPS:
+            return out
+        step = self.steps[mode][step_idx]
+        binary = {}
+
+        def trigger(name, value):
+            width = THRESHOLDS[name][0]
+            binary[name] = value
+            out['input'] = {width: value}
+            out['target'] = name
+            out['start'][width] = True
+
+        if mode == 'THD':
+            thd = self.binary['thd_max']
+            if 'up_dn' in buttons and thd >= step:
+                trigger('thd_max', thd - step)
+            elif 'up_up' in buttons and thd + step < THRESHOLDS['thd_max'][3]:
+                trigger('thd_max', thd + step)
+        else:
+            lo_name, hi_name = MODE_GROUPS[mode]
+            lo, hi = self.binary[lo_name], self.binary[hi_name]
+            limit = THRESHOLDS[hi_name][3]
+            if 'dn_dn' in buttons and lo >= step:
+                trigger(lo_name, lo - step)
+            elif 'dn_up' in buttons and lo + step < hi:
+                trigger(lo_name, lo + step)
+            if 'up_dn' in buttons and hi > lo + step:
+                trigger(hi_name, hi - step)
+            elif 'up_up' in buttons and hi + step < limit:
+                trigger(hi_name, hi + step)
+        if binary:
+            out['binary'] = binary
+        return out
+
+def bcd_reset_values(defaults, bcd_literals):
+    """取RTL中的BCD复位常量, 并检查每一处都与二进制默认值一致"""
+    reset, mismatches = {}, []
+    for name, literals in bcd_literals.items():
+        digits = CONVERTERS[THRESHOLDS[name][0]]
+        expected = int(bcd_encode(defaults[name], digits))
+        reset[name] = literals[0] if literals else expected
+        mismatches += [(name, defaults[name], lit, literals.count(lit))
+                       for lit in sorted(set(literals)) if lit != expected]
+    return reset, mismatches
+
+def run_trace(model, events):
+    """
+    按事件序列驱动模型, 空闲期直接跳到下一个事件
+
+    参数:
+        events: [(周期, 模式, 步进档位, 按键元组, 恢复默认)], 按周期升序
+
+    返回:
+        dict: 各次更新的显示延迟、被忽略/被覆盖的按键数、最终仍不一致的显示
+    """
+    pending = {}            # 阈值名 → 二进制改变的周期
+    latencies = {32: [], 16: []}
+    dropped = superseded = 0
+    t, i = 0, 0
+    while i < len(events) or model.busy() or pending:
+        if i < len(events) and not model.busy() and not pending:
+            t = max(t, events[i][0])
+        if i < len(events) and events[i][0] <= t:
+            _, mode, step_idx, buttons, reset_btn = events[i]
+            i += 1
+            if model.state != 'IDLE':
+                dropped += 1
+            changed = model.clock(mode, step_idx, buttons, reset_btn)
+        else:
+            changed = model.clock()
+        t += 1
+        for name in changed:
+            superseded += name in pending
+            pending[name] = t
+        for name in list(pending):
+            digits = CONVERTERS[THRESHOLDS[name][0]]
+            if model.bcd[name] == int(bcd_encode(model.binary[name], digits)):
+                latencies[THRESHOLDS[name][0]].append(t - pending.pop(name) + 1)
+        if not model.busy() and pending and i >= len(events):
+            break  # 状态机已空闲而显示仍不一致: 更新丢失
+    return {'latencies': latencies, 'dropped': dropped, 'superseded': superseded,
+            'stale': sorted(pending), 'cycles': t}
+
+def isolated_latency(defaults, bcd_reset, steps, taps):
+    """单次按键 (前后都空闲) 到显示寄存器更新的周期数, 以及恢复默认值的周期数"""
+    out = {}
+    for name, (width, mode, _, _) in THRESHOLDS.items():
+        btn = 'up_up' if name.endswith('max') else 'dn_up'
+        model = AutoTestBcdModel(defaults, bcd_reset, steps, taps)
+        res = run_trace(model, [(0, mode, 0, (btn,), False)])
+        out[name] = res['latencies'][width][0] if res['latencies'][width] else None
+    model = AutoTestBcdModel(defaults, bcd_reset, steps, taps)
+    model.binary['freq_min'] += 1
+    model.bcd['freq_min'] = int(bcd_encode(model.binary['freq_min'], 6))
+    res = run_trace(model, [(0, 'FREQ', 0, (), True)])
+    out['restore'] = max(max(v) for v in res['latencies'].values() if v)
+    return out
+
+def full_refresh(defaults, bcd_reset, steps, taps, spacing):
+    """
+    依次修改全部7个阈值, 每次在状态机可以接受时立即按下一个键
+
+    spacing='safe': 等上一次转换完成 (状态机空闲且无待处理触发) 再按
+    spacing='eager': 只要调整逻辑使能 (bcd_state==IDLE) 就按, 会碰到
+                     "完成时才读取bcd_target" 的竞争
+    """
+    model = AutoTestBcdModel(defaults, bcd_reset, steps, taps)
+    order = list(THRESHOLDS)
+    t, pending, done = 0, {}, {}
+    while order or pending:
+        ready = (not model.busy()) if spacing == 'safe' else (model.state == 'IDLE')
+        if order and ready:
+            name = order.pop(0)
+            mode = THRESHOLDS[name][1]
+            btn = 'up_up' if name.endswith('max') else 'dn_up'
+            changed = model.clock(mode, 0, (btn,))
+        else:
+            changed = model.clock()
+        t += 1
+        for name in changed:
+            pending[name] = t
+        for name in list(pending):
+            digits = CONVERTERS[THRESHOLDS[name][0]]
+            if model.bcd[name] == int(bcd_encode(model.binary[name], digits)):
+                done[name] = t
+                pending.pop(name)
+        if not order and not model.busy() and pending:
+            break
+    return {'cycles': max(done.values()) if done else None,
+            'updated': len(done), 'stale': sorted(pending)}
+
+def random_events(rng, count, mean_gap, multi_prob):
+    """随机按键序列: 指数分布间隔, 以multi_prob概率同一周期按下两个键"""
+    gaps = np.maximum(1, rng.exponential(mean_gap, count).astype(np.int64))
+    times = np.cumsum(gaps)
+    modes = rng.choice(list(MODE_GROUPS), count)
+    step_idx = rng.integers(0, len(STEP_NAMES), count)
+    first = rng.integers(0, len(BUTTONS), count)
+    second = rng.integers(0, len(BUTTONS), count)
+    multi = rng.random(count) < multi_prob
+    reset = rng.random(count) < 0.02
+    events = []
+    for k in range(count):
+        buttons = (BUTTONS[first[k]],) + ((BUTTONS[second[k]],) if multi[k] else ())
+        events.append((int(times[k]), str(modes[k]), int(step_idx[k]), buttons, bool(reset[k])))
+    return events
+
+#=============================================================================
+# bcd_converter.v (近似地址 + 部分初始化ROM)
+#=============================================================================
+def parse_converter_roms(path=CONVERTER_FILE):
+    """解析bcd_converter.v initial块中已初始化的ROM条目: 名称 → {地址: 值}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    roms = {}
+    for name, addr, value in re.findall(r"(\w+_rom)\[(\d+)\]\s*=\s*\d+'h([0-9A-Fa-f]+);", text):
+        roms.setdefault(name, {})[int(addr)] = int(value, 16)
+    return roms
+
+def check_bcd_converter():
+    """
+    穷举bcd_converter.v的地址计算 (与RTL的assign逐位一致) 与ROM内容
+
+    ROM值单位: freq为Hz, amp为mV, duty为1% (duty输入单位0.1%).
+    """
+    roms = parse_converter_roms()
+    freq = np.arange(500000, dtype=np.int64)
+    amp = np.arange(5001, dtype=np.int64)
+    duty = np.arange(1001, dtype=np.int64)
+    cases = [
+        ('freq_rom', freq, 6, 1,
+         np.where(freq < 10000, (freq >> 6) & 0xFF,
+                  np.where(freq < 100000, (100 + ((freq >> 10) & 0x7F)) & 0xFF,
+                           (200 + ((freq >> 14) & 0x3F)) & 0xFF))),
+        ('amp_rom', amp, 4, 1, ((amp * 205) >> 12) & 0x7F),
+        ('duty_rom', duty, 4, 10, ((duty * 103) >> 10) & 0x7F),
+    ]
+    results = []
+    for name, x, digits, unit, addr in cases:
+        init = roms.get(name, {})
+        lut = np.full(256, -1, dtype=np.int64)
+        for a, v in init.items():
+            lut[a] = v
+        value = lut[addr]
+        hit = value >= 0
+        shown = bcd_decode(np.where(hit, value, 0), digits) * unit
+        err = np.abs(shown - x)[hit]
+        results.append({'rom': name, 'inputs': len(x), 'initialized_entries': len(init),
+                        'uninitialized_hits': int((~hit).sum()),
+                        'max_error': int(err.max()) if len(err) else None,
+                        'median_error': float(np.median(err)) if len(err) else None})
+    return results
+
+#=============================================================================
+# 替代方案: 周期数与LUT估算
+#=============================================================================
+def live_add3_cells(max_value, digits):
+    """
+    组合double dabble中可能触发加3的单元数与级数
+
+    第i级时BCD区为输入高i位; 第j位数字只有在高i位可达 5*10^j 时才需要加3单元.
+    """
+    width = max(1, int(max_value).bit_length())
+    cells = levels = 0
+    for i in range(1, width):
+        live = sum(1 for j in range(digits) if (max_value >> (width - i)) >= 5 * 10 ** j)
+        cells += live
+        levels += live > 0
+    return cells, levels, width
+
+def evaluate_alternatives(steps):
+    """
+    每种方案: 单次转换周期, 7个阈值全部刷新的周期, LUT估算, DRM块数
+
+    两个转换器 (6位/4位) 共用一套控制; 握手开销与当前状态机相同
+    (触发1周期 + 状态机检测1周期 + 完成后WAIT 1周期).
+    """
+    handshake, wait = 2, 1
+    counts = {w: sum(1 for n in THRESHOLDS if THRESHOLDS[n][0] == w) for w in CONVERTERS}
+    max_in = {w: max(THRESHOLDS[n][3] - 1 for n in THRESHOLDS if THRESHOLDS[n][0] == w)
+              for w in CONVERTERS}
+    shift_bits = sum(w + 4 * d for w, d in CONVERTERS.items())
+
+    def refresh(conv_cycles):
+        # 每次等上一次完成再按键 (与full_refresh的'safe'一致), 最后一次不计回到空闲
+        return sum(counts[w] * (handshake + conv_cycles[w] + wait) for w in CONVERTERS) - 1
+
+    alts = []
+    for k in (1, 2, 4):
+        cycles = {w: -(-w // k) for w in CONVERTERS}
+        luts = (k * sum(CONVERTERS.values()) * LUTS_PER_ADD3 + shift_bits + 12)
+        alts.append({'name': f"串行double dabble ×{k}位/周期" + (" (当前)" if k == 1 else ""),
+                     'conv_cycles': cycles, 'latency': {w: handshake + c for w, c in cycles.items()},
+                     'refresh_cycles': refresh(cycles), 'luts': luts, 'drm': 0})
+
+    cells = levels = 0
+    cycles = {}
+    for w, d in CONVERTERS.items():
+        c, lv, _ = live_add3_cells(max_in[w], d)
+        cells += c
+        levels = max(levels, lv)
+        cycles[w] = max(1, -(-lv // LUT_LEVELS_PER_CYCLE))
+    alts.append({'name': f"并行组合double dabble ({levels}级, 流水线)",
+                 'conv_cycles': cycles, 'latency': {w: handshake + c for w, c in cycles.items()},
+                 'refresh_cycles': refresh(cycles), 'luts': cells * LUTS_PER_ADD3 + 12, 'drm': 0})
+
+    luts = drm = 0
+    for w, d in CONVERTERS.items():
+        depth = max_in[w] + 1
+        addr_bits = max(1, (depth - 1).bit_length())
+        luts += estimate_case_luts(bcd_encode(np.arange(depth), d), addr_bits)
+        drm += estimate_drm(1 << addr_bits, 4 * d)
+    cycles = {w: 1 for w in CONVERTERS}
+    alts.append({'name': "全分辨率ROM查表 (case LUT / DRM二选一)",
+                 'conv_cycles': cycles, 'latency': {w: handshake + 1 for w in CONVERTERS},
+                 'refresh_cycles': refresh(cycles), 'luts': luts, 'drm': drm})
+
+    # BCD域步进: 与二进制阈值同一周期更新, 不需要转换; 共用一个带进位/借位的BCD加减器
+    digits = max(CONVERTERS.values())
+    alts.append({'name': "BCD域直接加减步进 (步进均为10的幂)",
+                 'conv_cycles': {w: 0 for w in CONVERTERS}, 'latency': {w: 1 for w in CONVERTERS},
+                 'refresh_cycles': len(THRESHOLDS),
+                 'luts': digits * 5 + 4 * digits * 2, 'drm': 0})
+    return alts
+
+#=============================================================================
+# HDMI帧折算
+#=============================================================================
+def frame_delay(latency_cycles, rng, samples, extra_cycles=0):
+    """
+    按键时刻在帧内均匀分布, 求新值完整显示所需时间与跨越的帧数
+
+    新值在更新之后第一次完整扫过阈值显示行时才算显示; 若更新发生在这些行
+    正在扫描的过程中, 该帧的字符会上下撕裂 (半旧半新).
+    """
+    frame = H_TOTAL * V_TOTAL / PIXEL_HZ
+    y0, y1 = (line * H_TOTAL / PIXEL_HZ for line in THRESH_LINES)
+    phase = rng.random(samples) * frame
+    update = phase + (latency_cycles + extra_cycles) / CLK_HZ
+    scan = y0 + np.ceil((update - y0) / frame) * frame
+    shown = scan + (y1 - y0)
+    rel = (update - y0) % frame
+    return {
+        'frame_ms': frame * 1e3,
+        'mean_ms': float((shown - phase).mean() * 1e3),
+        'max_ms': float((shown - phase).max() * 1e3),
+        'max_frames': int(np.floor(shown / frame).max()),
+        'next_frame_prob': float((np.floor(shown / frame) >= 1).mean()),
+        'tear_prob': float((rel < (y1 - y0)).mean()),
+        'conversion_frames': (latency_cycles / CLK_HZ) / frame,
+    }
+
+#=============================================================================
+# 报告
+#=============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="BCD转换延迟模型")
+    parser.add_argument('--samples', type=int, default=2_000_000,
+                        help="32位转换器额外的随机输入数 (另有0~499999穷举)")
+    parser.add_argument('--events', type=int, default=20000, help="随机按键事件数")
+    parser.add_argument('--mean-gap', type=float, default=40.0,
+                        help="随机按键平均间隔 (周期, 压力测试; 人手按键远大于此)")
+    parser.add_argument('--multi-prob', type=float, default=0.01, help="同一周期按下两个键的概率")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--json', help="JSON报告路径")
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    ok = True
+
+    defaults, steps, bcd_literals, taps = parse_rtl()
+    bcd_reset, mismatches = bcd_reset_values(defaults, bcd_literals)
+    print("=== auto_test.v BCD状态机 ===")
+    if mismatches:
+        ok = False
+        for name, value, lit, count in mismatches:
+            print(f"  ❌ {name} 的BCD常量 {lit:X} ({count} 处) 与二进制默认值 {value} 不一致")
+    else:
+        print(f"  ✓ BCD复位/恢复常量与二进制默认值一致 ({sum(map(len, bcd_literals.values()))} 处)")
+
+    print("\n数据通路 (逐位移位加3, 向量化):")
+    datapath = check_datapath(args.samples, rng, taps)
+    for r in datapath:
+        flag = '✓' if r['errors'] == 0 else '❌'
+        ok &= r['errors'] == 0
+        print(f"  {flag} {r['converter']}位→{r['digits']}位BCD: {r['checked']:,} 个输入, "
+              f"{r['errors']:,} 个错误" + (f", 首个 {r['first_error']}" if r['errors'] else ""))
+
+    isolated = isolated_latency(defaults, bcd_reset, steps, taps)
+    print("\n单次按键 → 显示寄存器更新 (周期):")
+    for name, cycles in isolated.items():
+        print(f"  {name:<10}{cycles if cycles is not None else '未更新':>6}")
+    ok &= all(v is not None for v in isolated.values())
+
+    safe = full_refresh(defaults, bcd_reset, steps, taps, 'safe')
+    eager = full_refresh(defaults, bcd_reset, steps, taps, 'eager')
+    if safe['cycles'] is None:
+        print("\n7个阈值依次刷新: ❌ 没有一个显示寄存器得到正确值")
+    else:
+        print(f"\n7个阈值依次刷新: {safe['cycles']} 周期 ({safe['cycles'] / CLK_HZ * 1e6:.2f} us), "
+              f"更新 {safe['updated']}/7")
+    if eager['stale']:
+        print(f"  ⚠️ 在状态机刚检测到触发的空闲周期再按键: bcd_target被覆盖, "
+              f"{', '.join(eager['stale'])} 的显示不更新")
+
+    model = AutoTestBcdModel(defaults, bcd_reset, steps, taps)
+    trace = run_trace(model, random_events(rng, args.events, args.mean_gap, args.multi_prob))
+    print(f"\n随机按键压力测试 ({args.events} 次, 平均间隔 {args.mean_gap:g} 周期):")
+    for width, lat in trace['latencies'].items():
+        if lat:
+            print(f"  {width}位转换: {len(lat)} 次更新, 平均 {np.mean(lat):.2f}, 最坏 {max(lat)} 周期")
+    print(f"  状态机忙时被忽略的按键: {trace['dropped']}, 未显示即被覆盖: {trace['superseded']}")
+    if trace['stale']:
+        print(f"  ⚠️ 结束时显示与二进制阈值不一致: {', '.join(trace['stale'])} "
+              f"(同一周期两个键/背靠背触发时bcd_target竞争)")
+
+    print("\n=== bcd_converter.v (未例化) ===")
+    converter = check_bcd_converter()
+    for r in converter:
+        print(f"  {r['rom']:<9}{r['inputs']:>7} 个输入, 已初始化 {r['initialized_entries']} 条, "
+              f"命中未初始化条目 {r['uninitialized_hits'] / r['inputs']:.1%}, "
+              f"命中已初始化条目的最大误差 {r['max_error']}")
+
+    checked, bad = check_bcd_step(steps)
+    ok &= bad == 0
+    alts = evaluate_alternatives(steps)
+    print(f"\n=== 替代方案 (BCD域步进已验证 {checked:,} 种 取值×步进, {bad} 个错误) ===")
+    print(f"{'方案':<34}{'转换(32/16位)':>14}{'延迟':>10}{'全刷新':>8}{'LUT':>9}{'DRM':>6}")
+    for a in alts:
+        conv = f"{a['conv_cycles'][32]}/{a['conv_cycles'][16]}"
+        lat = f"{a['latency'][32]}/{a['latency'][16]}"
+        print(f"{a['name']:<34}{conv:>14}{lat:>10}{a['refresh_cycles']:>8}{a['luts']:>9}{a['drm']:>6}")
+
+    worst = max(v or 0 for k, v in isolated.items() if k != 'restore')
+    frames = {
+        'current': frame_delay(worst, rng, 1_000_000),
+        'best': frame_delay(min(min(a['latency'].values()) for a in alts), rng, 1_000_000),
+        'from_key_release': frame_delay(worst, rng, 1_000_000, DEBOUNCE_CYCLES),
+    }
+    cur = frames['current']
+    print(f"\n=== HDMI显示 (720p@60Hz, 帧周期 {cur['frame_ms']:.3f} ms) ===")
+    print(f"  BCD转换最坏 {worst} 周期 = {cur['conversion_frames']:.2e} 帧")
+    for key, label in (('current', '当前方案, 从按键脉冲'), ('best', '最快替代方案, 从按键脉冲'),
+                       ('from_key_release', '当前方案, 从松开按键 (含10ms消抖)')):
+        f = frames[key]
+        print(f"  {label}: 平均 {f['mean_ms']:.3f} ms, 最坏 {f['max_ms']:.3f} ms, "
+              f"最多跨 {f['max_frames']} 帧, 撕裂概率 {f['tear_prob']:.2%}")
+    gain_ms = cur['max_ms'] - frames['best']['max_ms']
+    worth = frames['best']['max_frames'] < cur['max_frames']
+    print(f"\n结论: 最快方案只缩短最坏显示延迟 {gain_ms * 1e3:.3f} us, "
+          + ("可减少一帧, 值得重新设计" if worth else
+             "不改变显示帧数 (延迟由扫描位置与消抖决定), 不值得为延迟重新设计"))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'bcd_literal_mismatches': [list(m) for m in mismatches],
+                'datapath': datapath,
+                'isolated_latency_cycles': isolated,
+                'full_refresh': {'safe': safe, 'eager': eager},
+                'stress': {'events': args.events, 'mean_gap': args.mean_gap,
+                           'latency_mean': {w: float(np.mean(v)) if v else None
+                                            for w, v in trace['latencies'].items()},
+                           'latency_max': {w: max(v) if v else None
+                                           for w, v in trace['latencies'].items()},
+                           'dropped': trace['dropped'], 'superseded': trace['superseded'],
+                           'stale': trace['stale']},
+                'bcd_converter': converter,
+                'alternatives': alts,
+                'hdmi': frames,
+                'redesign_worth_it': worth,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ 报告已写入: {args.json}")
+
+    if not ok:
+        print("\n❌ 发现与精确BCD不一致的结果")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+cordic_atan2.v 位精确模型 (NumPy向量化, 分批评估千万级输入)
+
+与RTL逐位一致: 象限预旋转, XY_WIDTH位 x/y 算术右移与加减, Z_WIDTH位角度累加
+(atan_table直接从RTL解析), 输出四舍五入到0.1°并做±180°边界调整;
+所有寄存器按各自位宽补码回绕.
+
+输出:
+    - 默认参数下对 arctan2 的误差直方图, 按输入幅度 (倍频程) 分行
+    - ITERATIONS × WIDTH 扫描: 误差 / 流水线延迟 / 寄存器与加法器位数 / 进位链长度
+    - 角度小数位 FRAC 扫描 (说明内部角度分辨率的取舍)
+
+同一批输入只跑一遍最深的流水线, 每一级的z都可以直接作为"ITERATIONS=该级"
+的结果输出, 所以扫描迭代次数不需要重复计算.
+
+用法:
+    python scripts/cordic_atan2_model.py                       # 默认: 1600万点 + 扫描
+    python scripts/cordic_atan2_model.py --samples 50000000
+    python scripts/cordic_atan2_model.py --widths 12,14,16,18 --iterations 6-20
+    python scripts/cordic_atan2_model.py --check-only          # 只评估RTL默认参数
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+from mem_image import write_if_changed
+
+RTL_FILE = "source/source/cordic_atan2.v"
+OUTPUT_DIR = "ipcore/cordic_atan2"
+
+CHUNK = 1 << 20                 # 每批输入点数
+HIST_STEP = 0.01                # 误差直方图分辨率 (°)
+HIST_RANGE = 1.0                # 直方图范围 ±1° (两端各一个溢出格)
+OUTPUT_LSB = 0.1                # angle_out 单位 (°)
+
+DEFAULT_SAMPLES = 16_000_000
+DEFAULT_SWEEP_SAMPLES = 2_000_000
+DEFAULT_WIDTHS = (10, 12, 14, 16, 18)
+DEFAULT_ITERATIONS = (6, 20)
+DEFAULT_FRACS = (0, 1, 2, 3, 4, 5, 6)
+DEFAULT_SPEC = 0.1              # 指标: 最大误差 ≤ 1个输出LSB
+DEFAULT_OCTAVES = 6             # 指标只统计满量程以下6个倍频程内的输入
+
+#=============================================================================
+# RTL解析
+#=============================================================================
+
+def parse_rtl(path=RTL_FILE):
+    """
+    从cordic_atan2.v解析参数与atan_table
+
+    返回:
+        dict(width, angle_width, iterations, guard, frac, table)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    def param(name):
+        m = re.search(rf'(?:parameter|localparam)\s+{name}\s*=\s*(\d+)', text)
+        if not m:
+            raise ValueError(f"{path} 中找不到参数 {name}")
+        return int(m.group(1))
+
+    depth = re.search(r'atan_table\s*\[\s*0\s*:\s*(\d+)\s*\]', text)
+    entries = dict((int(i), int(v)) for i, v in
+                   re.findall(r'atan_table\[(\d+)\]\s*=\s*(-?\d+)\s*;', text))
+    if not depth or not entries:
+        raise ValueError(f"{path} 中找不到atan_table")
+    depth = int(depth.group(1)) + 1
+    if sorted(entries) != list(range(depth)):
+        raise ValueError(f"atan_table初始化不完整: {sorted(entries)}")
+
+    return {
+        'width': param('WIDTH'),
+        'angle_width': param('ANGLE_WIDTH'),
+        'iterations': param('ITERATIONS'),
+        'guard': param('GUARD'),
+        'xy_frac': param('XY_FRAC'),
+        'frac': param('FRAC'),
+        'table': [entries[i] for i in range(depth)],
+    }
+
+def atan_table(frac, depth):
+    """理想角度表: round(arctan(2^-i) × 10 × 2^frac)"""
+    i = np.arange(depth, dtype=np.float64)
+    return np.round(np.degrees(np.arctan(2.0 ** -i)) * 10 * (1 << frac)).astype(np.int64)
+
+#=============================================================================
+# 位精确数据通路
+#=============================================================================
+
+def wrap(v, bits):
+    """补码回绕到bits位 (与Verilog寄存器赋值一致)"""
+    half = 1 << (bits - 1)
+    return ((v + half) & ((1 << bits) - 1)) - half
+
+def cordic_stages(x, y, cfg, depths):
+    """
+    位精确CORDIC, 一次跑到max(depths)级
+
+    参数:
+        x, y: int64数组, WIDTH位有符号输入
+        cfg: parse_rtl() 格式的配置 (table长度须 ≥ max(depths))
+        depths: 需要输出的迭代次数列表
+
+    返回:
+        {迭代次数: angle_out (int64数组, 0.1°)}
+    """
+    xy_bits = cfg['width'] + cfg['guard'] + cfg['xy_frac']
+    z_bits = cfg['angle_width'] + cfg['frac']
+    frac = cfg['frac']
+    table = cfg['table']
+    x = x << cfg['xy_frac']
+    y = y << cfg['xy_frac']
+    last = max(depths)
+    if last > len(table):
+        raise ValueError(f"ITERATIONS={last} 超出atan_table深度 {len(table)}")
+
+    # 阶段0: 左半平面旋转±90° (在XY_WIDTH位宽下取反)
+    xs, ys = x < 0, y < 0
+    z90 = 900 << frac
+    xi = wrap(np.where(xs, np.where(ys, -y, y), x), xy_bits)
+    yi = wrap(np.where(xs, np.where(ys, x, -x), y), xy_bits)
+    zi = wrap(np.where(xs, np.where(ys, -z90, z90), 0), z_bits)
+
+    out = {}
+    for i in range(last + 1):
+        if i in depths:
+            out[i] = output_stage(zi, cfg)
+        if i == last:
+            break
+        neg = yi < 0
+        x_shifted = yi >> i          # int64右移为算术右移, 同 >>>
+        y_shifted = xi >> i
+        xi, yi, zi = (wrap(np.where(neg, xi - x_shifted, xi + x_shifted), xy_bits),
+                      wrap(np.where(neg, yi + y_shifted, yi - y_shifted), xy_bits),
+                      wrap(np.where(neg, zi - table[i], zi + table[i]), z_bits))
+    return out
+
+def output_stage(z, cfg):
+    """输出级: 四舍五入去掉FRAC位, ±1800边界调整, 截到ANGLE_WIDTH位"""
+    z_bits = cfg['angle_width'] + cfg['frac']
+    frac = cfg['frac']
+    if frac:
+        z = wrap(z + (1 << (frac - 1)), z_bits) >> frac
+    z = np.where(z > 1800, z - 3600, np.where(z < -1800, z + 3600, z))
+    return wrap(z, cfg['angle_width'])
+
+def cordic_atan2(x, y, cfg):
+    """单一配置的angle_out (0.1°)"""
+    return cordic_stages(x, y, cfg, [cfg['iterations']])[cfg['iterations']]
+
+#=============================================================================
+# 输入与误差统计
+#=============================================================================
+
+def random_inputs(rng, count, width):
+    """
+    随机输入: 角度均匀, 幅度按对数均匀 (每个倍频程点数相同), 取整后限幅到WIDTH位
+
+    去掉 (0, 0) 点 (atan2无定义).
+    """
+    lo, hi = -(1 << (width - 1)), (1 << (width - 1)) - 1
+    theta = rng.uniform(-np.pi, np.pi, count)
+    mag = 2.0 ** rng.uniform(0, width - 0.5, count)
+    x = np.clip(np.rint(mag * np.cos(theta)), lo, hi).astype(np.int64)
+    y = np.clip(np.rint(mag * np.sin(theta)), lo, hi).astype(np.int64)
+    keep = (x != 0) | (y != 0)
+    return x[keep], y[keep]
+
+def magnitude_bin(x, y, width):
+    """幅度倍频程: floor(log2|v|), 0..WIDTH-1 (最后一格含满量程对角)"""
+    mag = np.hypot(x, y)
+    return np.clip(np.floor(np.log2(mag)).astype(np.int64), 0, width - 1)
+
+def angle_error(angle, x, y):
+    """angle_out 相对 arctan2 的误差 (°), 回绕到 ±180°"""
+    ref = np.degrees(np.arctan2(y, x))
+    return (angle * OUTPUT_LSB - ref + 180.0) % 360.0 - 180.0
+
+class ErrorStats:
+    """按幅度倍频程累加误差统计与直方图 (可分批累加)"""
+
+    def __init__(self, width):
+        self.width = width
+        steps = int(round(HIST_RANGE / HIST_STEP))
+        self.edges = np.linspace(-HIST_RANGE, HIST_RANGE, 2 * steps + 1)
+        self.bins = len(self.edges) + 1      # 两端溢出格
+        self.hist = np.zeros((width, self.bins), dtype=np.int64)
+        self.count = np.zeros(width, dtype=np.int64)
+        self.sum = np.zeros(width)
+        self.sum_sq = np.zeros(width)
+        self.max_abs = np.zeros(width)
+
+    def add(self, err, mbin):
+        w = self.width
+        self.count += np.bincount(mbin, minlength=w)
+        self.sum += np.bincount(mbin, err, minlength=w)
+        self.sum_sq += np.bincount(mbin, err * err, minlength=w)
+        np.maximum.at(self.max_abs, mbin, np.abs(err))
+        ebin = np.searchsorted(self.edges, err, side='right')
+        self.hist += np.bincount(mbin * self.bins + ebin,
+                                 minlength=w * self.bins).reshape(w, self.bins)
+
+    def summary(self, rows=None):
+        """rows: 参与统计的倍频程 (默认全部)"""
+        rows = np.arange(self.width) if rows is None else np.asarray(rows)
+        n = self.count[rows].sum()
+        if n == 0:
+            return {'count': 0, 'max': 0.0, 'rms': 0.0, 'mean': 0.0, 'p999': 0.0}
+        hist = self.hist[rows].sum(axis=0)
+        return {
+            'count': int(n),
+            'max': float(self.max_abs[rows].max()),
+            'rms': float(np.sqrt(self.sum_sq[rows].sum() / n)),
+            'mean': float(self.sum[rows].sum() / n),
+            'p999': self.percentile_abs(hist, 0.999),
+        }
+
+    def percentile_abs(self, hist, q):
+        """由直方图估算|误差|的q分位 (取格的上边界, 偏保守); 落在溢出格时返回None"""
+        half = (self.bins - 2) // 2
+        mid = half + 1                                  # 第一个 ≥0 的格
+        folded = hist[mid:mid + half] + hist[mid - 1:0:-1]
+        k = int(np.searchsorted(np.cumsum(folded), q * hist.sum()))
+        return round((k + 1) * HIST_STEP, 6) if k < half else None
+
+def evaluate(cfg, depths, samples, rng):
+    """对一组迭代次数分批评估, 返回 {迭代次数: ErrorStats}"""
+    stats = {n: ErrorStats(cfg['width']) for n in depths}
+    done = 0
+    while done < samples:
+        x, y = random_inputs(rng, min(CHUNK, samples - done), cfg['width'])
+        done += CHUNK
+        mbin = magnitude_bin(x, y, cfg['width'])
+        for n, angle in cordic_stages(x, y, cfg, depths).items():
+            stats[n].add(angle_error(angle, x, y), mbin)
+    return stats
+
+def spec_rows(width, octaves):
+    """指标统计范围: 满量程以下octaves个倍频程"""
+    return np.arange(max(width - octaves, 0), width)
+
+#=============================================================================
+# 资源 / 时序估算
+#=============================================================================
+
+def estimate_cost(cfg, iterations):
+    """
+    流水线代价 (与RTL结构对应)
+
+    延迟 = 预处理1 + 初始化1 + 迭代ITERATIONS + 输出1
+    每级: x/y 两个XY_WIDTH位加减 + z一个Z_WIDTH位加减 (每位约1个LUT, 进位链)
+    关键路径: 单级加减的进位链, 与迭代次数无关 (迭代多只增加延迟和面积)
+    """
+    xy_bits = cfg['width'] + cfg['guard'] + cfg['xy_frac']
+    z_bits = cfg['angle_width'] + cfg['frac']
+    stage_bits = 2 * xy_bits + z_bits + 1
+    return {
+        'latency': iterations + 3,
+        'ffs': (iterations + 2) * stage_bits + 2 + cfg['angle_width'] + 1,
+        'adder_luts': iterations * (2 * xy_bits + z_bits) + z_bits + cfg['angle_width'],
+        'carry_bits': max(xy_bits, z_bits),
+    }
+
+def sweep_config(base, width, frac, depth):
+    """扫描用配置: 换WIDTH/FRAC并用理想角度表"""
+    return dict(base, width=width, frac=frac, table=[int(v) for v in atan_table(frac, depth)])
+
+def sweep_iterations(base, widths, iterations, samples, rng, spec, octaves):
+    rows = []
+    for width in widths:
+        cfg = sweep_config(base, width, base['frac'], max(iterations))
+        stats = evaluate(cfg, iterations, samples, rng)
+        for n in iterations:
+            s = stats[n].summary(spec_rows(width, octaves))
+            full = stats[n].summary()
+            rows.append(dict(width=width, iterations=n, frac=base['frac'],
+                             max=s['max'], rms=s['rms'], p999=s['p999'], max_all=full['max'],
+                             passed=s['max'] <= spec, **estimate_cost(cfg, n)))
+    return rows
+
+def sweep_fracs(base, fracs, samples, rng, spec, octaves):
+    rows = []
+    depth = max(base['iterations'], len(base['table']))
+    for frac in fracs:
+        cfg = sweep_config(base, base['width'], frac, depth)
+        stats = evaluate(cfg, [base['iterations']], samples, rng)[base['iterations']]
+        s = stats.summary(spec_rows(base['width'], octaves))
+        rows.append(dict(width=base['width'], iterations=base['iterations'], frac=frac,
+                         max=s['max'], rms=s['rms'], p999=s['p999'], passed=s['max'] <= spec,
+                         **estimate_cost(cfg, base['iterations'])))
+    return rows
+
+#=============================================================================
+# 输出
+#=============================================================================
+
+def format_p999(p):
+    return f"{p:.2f}°" if p is not None else f">{HIST_RANGE:g}°"
+
+def print_octaves(stats):
+    print(f"{'幅度范围':>18}{'点数':>12}{'最大':>10}{'RMS':>10}{'均值':>10}{'99.9%':>9}")
+    for k in range(stats.width):
+        s = stats.summary([k])
+        if s['count']:
+            rng_txt = f"[{1 << k}, {1 << (k + 1)})"
+            print(f"{rng_txt:>18}{s['count']:>12,}{s['max']:>9.3f}°{s['rms']:>9.4f}°"
+                  f"{s['mean']:>+9.4f}°{format_p999(s['p999']):>9}")
+
+def print_sweep(rows):
+    print(f"{'WIDTH':>6}{'ITER':>6}{'FRAC':>6}{'最大':>9}{'RMS':>9}{'99.9%':>8}"
+          f"{'延迟':>6}{'FF':>7}{'加法LUT':>9}{'进位链':>7}")
+    for r in rows:
+        mark = '  ✓' if r['passed'] else ''
+        print(f"{r['width']:>6}{r['iterations']:>6}{r['frac']:>6}{r['max']:>8.3f}°{r['rms']:>8.4f}°"
+              f"{format_p999(r['p999']):>8}{r['latency']:>6}{r['ffs']:>7}{r['adder_luts']:>9}"
+              f"{r['carry_bits']:>7}{mark}")
+
+def histogram_csv(stats):
+    """直方图CSV: 每行一个幅度倍频程, 每列一个误差格 (列名为格下边界, 两端为溢出)"""
+    head = ['magnitude_lo', 'magnitude_hi', f'<{-HIST_RANGE:g}']
+    head += [f"{e:.2f}" for e in stats.edges[:-1]] + [f'>={HIST_RANGE:g}']
+    lines = [','.join(head)]
+    for k in range(stats.width):
+        lines.append(','.join([str(1 << k), str(1 << (k + 1))] + [str(v) for v in stats.hist[k]]))
+    return '\n'.join(lines) + '\n'
+
+def parse_range(text):
+    """'6-20' 或 '8,12,16' → 整数列表"""
+    if '-' in text:
+        lo, hi = text.split('-')
+        return list(range(int(lo), int(hi) + 1))
+    return [int(v) for v in text.split(',')]
+
+def main():
+    parser = argparse.ArgumentParser(description="cordic_atan2 位精确误差模型")
+    parser.add_argument('--samples', type=int, default=DEFAULT_SAMPLES,
+                        help="RTL默认参数的随机输入点数")
+    parser.add_argument('--sweep-samples', type=int, default=DEFAULT_SWEEP_SAMPLES,
+                        help="扫描中每个WIDTH/FRAC的输入点数")
+    parser.add_argument('--widths', default=','.join(map(str, DEFAULT_WIDTHS)),
+                        help="扫描的WIDTH, 如 12,14,16")
+    parser.add_argument('--iterations', default='-'.join(map(str, DEFAULT_ITERATIONS)),
+                        help="扫描的ITERATIONS, 如 6-20")
+    parser.add_argument('--fracs', default=','.join(map(str, DEFAULT_FRACS)),
+                        help="扫描的角度小数位FRAC")
+    parser.add_argument('--spec', type=float, default=DEFAULT_SPEC, help="最大误差指标 (°)")
+    parser.add_argument('--octaves', type=int, default=DEFAULT_OCTAVES,
+                        help="指标统计满量程以下多少个倍频程的输入")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="直方图/报告输出目录")
+    parser.add_argument('--check-only', action='store_true', help="只评估RTL默认参数, 不扫描不写文件")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    rtl = parse_rtl()
+    ideal = [int(v) for v in atan_table(rtl['frac'], len(rtl['table']))]
+    print(f"{RTL_FILE}: WIDTH={rtl['width']}, ANGLE_WIDTH={rtl['angle_width']}, "
+          f"ITERATIONS={rtl['iterations']}, GUARD={rtl['guard']}, FRAC={rtl['frac']}")
+    if rtl['table'] != ideal:
+        print(f"⚠️  atan_table与 round(arctan(2^-i)×10×2^{rtl['frac']}) 不一致")
+        print(f"   RTL: {rtl['table']}")
+        print(f"   理想: {ideal}")
+
+    stats = evaluate(rtl, [rtl['iterations']], args.samples, rng)[rtl['iterations']]
+    rows = spec_rows(rtl['width'], args.octaves)
+    s = stats.summary(rows)
+    full = stats.summary()
+    print(f"\n=== 默认参数误差 ({full['count']:,} 点, 对 arctan2) ===")
+    print_octaves(stats)
+    print(f"\n幅度 ≥ {1 << int(rows[0])}: 最大 {s['max']:.3f}°, RMS {s['rms']:.4f}°, "
+          f"99.9% {format_p999(s['p999'])}  (指标 ±{args.spec:g}°)")
+    print(f"全部输入: 最大 {full['max']:.3f}°, RMS {full['rms']:.4f}°")
+    if args.check_only:
+        if s['max'] > args.spec:
+            print("❌ 未达到指标")
+            sys.exit(1)
+        print("✓ 达到指标")
+        return
+
+    widths = parse_range(args.widths)
+    iterations = parse_range(args.iterations)
+    print(f"\n=== ITERATIONS × WIDTH 扫描 (FRAC={rtl['frac']}, 每个WIDTH {args.sweep_samples:,} 点, "
+          f"指标统计满量程以下{args.octaves}个倍频程) ===")
+    it_rows = sweep_iterations(rtl, widths, iterations, args.sweep_samples, rng,
+                               args.spec, args.octaves)
+    print_sweep(it_rows)
+    for width in widths:
+        ok = [r for r in it_rows if r['width'] == width and r['passed']]
+        print(f"  WIDTH={width}: " + (f"最少 {ok[0]['iterations']} 次迭代达标 (延迟 {ok[0]['latency']} 周期)"
+                                     if ok else "扫描范围内未达标"))
+
+    fracs = parse_range(args.fracs)
+    print(f"\n=== 角度小数位扫描 (WIDTH={rtl['width']}, ITERATIONS={rtl['iterations']}) ===")
+    fr_rows = sweep_fracs(rtl, fracs, args.sweep_samples, rng, args.spec, args.octaves)
+    print_sweep(fr_rows)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    hist_path = os.path.join(args.output_dir, 'cordic_error_hist.csv')
+    report_path = os.path.join(args.output_dir, 'cordic_report.json')
+    report = {
+        'rtl': rtl,
+        'samples': full['count'],
+        'seed': args.seed,
+        'spec_deg': args.spec,
+        'spec_min_magnitude': 1 << int(rows[0]),
+        'error': {'in_spec_range': s, 'all': full,
+                  'octaves': [dict(magnitude_lo=1 << k, **stats.summary([k]))
+                              for k in range(stats.width)]},
+        'sweep_iterations': it_rows,
+        'sweep_frac': fr_rows,
+    }
+    for path, data in ((hist_path, histogram_csv(stats)),
+                       (report_path, json.dumps(report, indent=2, ensure_ascii=False) + '\n')):
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1075 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NumPy ↔ RTL 流式协同仿真: lock_in_amplifier / spectrum_magnitude_calc / dual_channel_fft_controller
+
+Python 侧按块产生激励 (generate_stimulus.generate_chunks) 并同时运行位精确模型得到期望;
+激励打包成定长大端行, 经命名管道 (POSIX) 或普通文件 (--files / Windows) 送入生成的测试平台,
+测试平台在下降沿 $fread 驱动、处理握手, 监视器把输出写成定宽十六进制行, Python 按字节块解析进
+预分配数组 (不逐样本建Python对象) 后与期望比对. 管道模式下激励生成/模型与仿真并行, 记录长度
+不受内存或磁盘限制.
+
+    bench        驱动                                         期望 (模型)
+    lock_in      signal_in + 随机 signal_valid                lock_in_amplifier_model (逐周期, 含cycle)
+    spectrum     fft_dout AXI-Stream, 随机空拍, 遵守 fft_ready  spectrum_chain_model: 前端 → FFT → rtl_magnitude
+    controller   两路FIFO模型 (首字直通, 满则反压写入),          FrontEnd 期望 fft_din; FFT替身回放
+                 fft_din_ready 随机反压, FFT替身回放             fft_numpy 结果, 期望 rtl_magnitude 频谱
+
+说明:
+    - FFT IP 为加密网表, controller 测试平台用替身: 每收满 N 个 fft_din 握手, 等 --fft-latency 拍后
+      连续回放 Python 预先算好的 fft_numpy 结果 (按期望帧计算, 与控制器实际送出的数据无关,
+      送出的数据另行与 FrontEnd 期望比对)
+    - FIFO 字按控制器约定为 code << 6 (data_10bit = fifo_dout[15:6]); 处理顺序假定为
+      CH1帧0, CH2帧0, CH1帧1, ... (两路同时写入, IDLE 优先通道1)
+    - 比对: lock_in 逐记录 (含cycle); spectrum 逐事务; controller fft_din 逐事务,
+      频谱按 (通道, 帧, 地址) 对齐, 分别统计缺失/多余; 逐事务比对不一致时检查是否为整体滞后若干事务
+    - 期望按设计意图, RTL已知缺陷 (spectrum 幅度滞后2拍, controller 每帧丢最后4个频点) 使比对失败的
+      bench 标 xfail: 比对失败记为 xfail, 意外通过记为 xpass, 均不计入退出码 (同 sim_regression.py)
+    - 编译使用 sim_regression.py 的模块闭包与仿真器命令, 闭包哈希不变时复用上次的编译结果
+    - 吞吐: 仿真墙钟时间内的 样本/s 与 时钟/s, 以及模型 (激励生成+期望) 样本/s
+
+输出在 sim/cosim/<bench>/: 测试平台 tb_<bench>_cosim.v, build/ (编译结果/日志/管道), result.json.
+
+用法:
+    python scripts/cosim_stream.py                                  # 三个bench
+    python scripts/cosim_stream.py --bench lock_in --cycles 20000000 --valid-ratio 0.5
+    python scripts/cosim_stream.py --bench controller --frames 8 --ready-ratio 0.5
+    python scripts/cosim_stream.py --model-only                     # 无仿真器: 只生成测试平台/激励并测模型吞吐
+    python scripts/cosim_stream.py --files                          # 激励/输出落盘 (便于调试)
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+import fft_params
+import generate_stimulus as stim
+import lock_in_amplifier_model as lia
+import spectrum_chain_model as scm
+from mem_image import write_if_changed
+from sim_regression import (DEFAULT_TIMEOUT, ModuleIndex, commands, detect_simulator, parse_include_relation,
+                            parse_pds, plan_test, scan_files)
+
+OUTPUT_DIR = "sim/cosim"
+N = fft_params.FFT_POINTS
+ADDR_BITS = N.bit_length() - 1
+FIFO_BITS = 10                  # data_10bit = fifo_dout[15:6]
+RESET_CYCLES = 8
+BLOCK = 1 << 16                 # lock_in 每块时钟数
+QUEUE_BLOCKS = 8                # 每路管道最多缓存的已打包块
+READ_BLOCK = 1 << 20            # 输出每次读取字节数
+READY_BYTES = 8192              # fft_din_ready 图样长度 (字节, 每字节8拍, 循环使用)
+PATH_CHARS = 512                # 测试平台中路径字符串长度
+
+#=============================================================================
+# 行打包 / 记录解析
+#=============================================================================
+
+def pack_rows(rows, nbytes):
+    """整数行 → 每行 nbytes 字节大端 ($fread 按字节从高位装入寄存器)"""
+    return np.asarray(rows, dtype='>u8').view(np.uint8).reshape(-1, 8)[:, 8 - nbytes:].tobytes()
+
+def idle_gaps(rng, n, prob):
+    """每个数据拍之前的空拍数 (每拍以概率 prob 空闲, 几何分布), 8位饱和"""
+    if prob <= 0:
+        return np.zeros(n, dtype=np.int64)
+    return np.minimum(rng.geometric(1.0 - prob, n) - 1, 255).astype(np.int64)
+
+_HEX = np.full(256, -1, dtype=np.int16)
+for _c in '0123456789abcdef':
+    _HEX[ord(_c)] = _HEX[ord(_c.upper())] = int(_c, 16)
+
+class RecordSink:
+    """
+    定宽记录 → 预分配数组
+
+    feed() 解析监视器的十六进制行 (各字段 %h 定宽, 空格分隔, 换行结尾; x/z 记入 unknown),
+    append() 追加模型输出的整块数组. 超出容量的记录只计数 (overflow).
+    """
+
+    def __init__(self, fields, capacity):
+        self.fields = fields                        # [(名称, 位宽, 有符号)]
+        self.digits = [(bits + 3) // 4 for _, bits, _ in fields]
+        self.line = sum(self.digits) + len(fields)
+        self.capacity = capacity
+        self.data = {name: np.zeros(capacity, dtype=np.int64) for name, _, _ in fields}
+        self.unknown = {name: np.zeros(capacity, dtype=bool) for name, _, _ in fields}
+        self.count = 0
+        self.overflow = 0
+        self.tail = b''
+
+    def _take(self, n):
+        take = min(n, self.capacity - self.count)
+        self.overflow += n - take
+        return take
+
+    def feed(self, chunk):
+        buf = self.tail + chunk
+        n = len(buf) // self.line
+        self.tail = buf[n * self.line:]
+        take = self._take(n)
+        if take == 0:
+            return
+        rows = np.frombuffer(buf, dtype=np.uint8, count=take * self.line).reshape(take, self.line)
+        if not (rows[:, -1] == ord('\n')).all():
+            raise ValueError(f"记录格式错误: 期望每行 {self.line} 字节")
+        nib = _HEX[rows]
+        s, col = self.count, 0
+        for (name, bits, signed), d in zip(self.fields, self.digits):
+            part = nib[:, col:col + d]
+            value = np.zeros(take, dtype=np.int64)
+            for k in range(d):
+                value = (value << 4) | np.maximum(part[:, k], 0)
+            self.data[name][s:s + take] = lia.wrap(value, bits) if signed else value
+            self.unknown[name][s:s + take] = (part < 0).any(axis=1)
+            col += d + 1
+        self.count += take
+
+    def append(self, columns):
+        n = len(next(iter(columns.values())))
+        take = self._take(n)
+        for name, _, _ in self.fields:
+            self.data[name][self.count:self.count + take] = columns[name][:take]
+        self.count += take
+
+    def read(self, f):
+        for chunk in iter(lambda: f.read(READ_BLOCK), b''):
+            self.feed(chunk)
+
+    def column(self, name):
+        return self.data[name][:self.count]
+
+#=============================================================================
+# 比对
+#=============================================================================
+
+def compare(got, exp, fields, key=None, lag_fields=None):
+    """
+    got/exp: RecordSink; fields: 比对字段
+    key: None 逐记录顺序比对; 否则 key(sink) → 每条记录的整数键, 按键对齐 (统计缺失/多余)
+    lag_fields: 不一致时检查 got 是否为 exp 整体滞后 1~4 条记录 (只看这些字段)
+    """
+    res = {'expected': exp.count, 'got': got.count, 'overflow': got.overflow + exp.overflow}
+    if key is None:
+        n = min(got.count, exp.count)
+        ig = ie = np.arange(n)
+        res['missing'] = max(exp.count - got.count, 0)
+        res['extra'] = max(got.count - exp.count, 0)
+    else:
+        kg, ke = key(got), key(exp)
+        _, ig, ie = np.intersect1d(kg, ke, return_indices=True)
+        res['missing'] = exp.count - len(ie)
+        res['extra'] = got.count - len(ig)
+    bad = np.zeros(len(ig), dtype=bool)
+    unknown = np.zeros(len(ig), dtype=bool)
+    res['mismatches'] = {}
+    for f in fields:
+        x = got.unknown[f][ig]
+        diff = (got.data[f][ig] != exp.data[f][ie]) & ~x
+        res['mismatches'][f] = int(diff.sum())
+        bad |= diff
+        unknown |= x
+    res['compared'] = len(ig)
+    res['unknown'] = int(unknown.sum())
+    res['first'] = None
+    res['lag'] = None
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        res['first'] = {'index': int(ie[i]),
+                        **{f: [int(got.data[f][ig[i]]), int(exp.data[f][ie[i]])] for f in fields}}
+        n = len(ig)
+        for s in range(1, 5):
+            if key is None and n > s and all(np.array_equal(got.data[f][s:n], exp.data[f][:n - s])
+                                             for f in (lag_fields or fields)):
+                res['lag'] = s
+                break
+    res['ok'] = not bad.any() and res['missing'] == 0 and res['extra'] == 0 and res['overflow'] == 0
+    return res
+
+def channel_args(args, bits):
+    """generate_stimulus.build_channels 所需的参数子集"""
+    return argparse.Namespace(wave=args.wave, freq=args.freq, amp=args.amp, dc=None, duty=0.5, noise=args.noise,
+                              harmonics=args.harmonics, weak=None, ch2=None, phase=args.phase, bits=bits)
+
+#=============================================================================
+# 测试平台公共部分
+#=============================================================================
+
+def tb_prologue(bench, files, drain, extra_ints=()):
+    """
+    模块头: 时钟/复位/cycle 计数, plusargs 打开文件, finish_sim 任务
+
+    files: [(plusarg名, 模式)], 变量名为小写名 + _fd / _path
+    cycle: 复位释放后的上升沿计数; 上升沿进程中为本沿序号, 下降沿进程中为上一沿序号 + 1
+    """
+    ints = ['rows', 'row_cnt = 0', 'drain = 0', 'reset_cnt = 0', 'stalls = 0'] + list(extra_ints)
+    lines = [
+        "`timescale 1ns/1ps",
+        "//=============================================================================",
+        f"// 文件名: tb_{bench.name}_cosim.v",
+        f"// 功能: {bench.module} 流式协同仿真测试平台",
+        f"// 自动生成: scripts/cosim_stream.py --bench {bench.name}, 请勿手动修改",
+        "// 文件路径由 plusargs 给出 (命名管道或普通文件), 运行目录为仓库根目录",
+        "//=============================================================================",
+        "",
+        f"module tb_{bench.name}_cosim;",
+        "",
+        f"localparam RESET_CYCLES = {RESET_CYCLES};",
+        f"localparam DRAIN        = {drain};",
+        "",
+        "reg clk   = 1'b0;",
+        "reg rst_n = 1'b0;",
+        "always #5 clk = ~clk;",
+        "",
+        "reg [31:0] cycle = 32'd0;",
+        "always @(posedge clk) if (rst_n) cycle <= cycle + 32'd1;",
+        "",
+        f"reg [8*{PATH_CHARS}-1:0] " + ", ".join(f"{n.lower()}_path" for n, _ in files) + ";",
+        "integer " + ", ".join(f"{n.lower()}_fd" for n, _ in files) + ";",
+        "integer " + ", ".join(ints) + ";",
+        "",
+        "initial begin",
+        "    if (!$value$plusargs(\"ROWS=%d\", rows)) rows = 0;",
+    ]
+    for name, mode in files:
+        v = name.lower()
+        lines += [f"    if (!$value$plusargs(\"{name}=%s\", {v}_path)) begin",
+                  f"        $display(\"COSIM_ERROR missing +{name}=<path>\");",
+                  "        $finish;",
+                  "    end",
+                  f"    {v}_fd = $fopen({v}_path, \"{mode}\");",
+                  f"    if ({v}_fd == 0) begin",
+                  f"        $display(\"COSIM_ERROR cannot open +{name}\");",
+                  "        $finish;",
+                  "    end"]
+    lines += ["end", "",
+              "task finish_sim;",
+              "    begin",
+              *[f"        $fclose({n.lower()}_fd);" for n, _ in files],
+              "        $display(\"COSIM_DONE cycles=%0d rows=%0d stalls=%0d\", cycle, row_cnt, stalls);",
+              "        $finish;",
+              "    end",
+              "endtask",
+              "",
+              "task short_read;",
+              "    begin",
+              "        $display(\"COSIM_ERROR short read at row %0d\", row_cnt);",
+              "        finish_sim;",
+              "    end",
+              "endtask",
+              ""]
+    return "\n".join(lines) + "\n"
+
+#=============================================================================
+# bench
+#=============================================================================
+
+class LockInBench:
+    """lock_in_amplifier: 每拍一行 {valid, signal_in[15:0]}, 逐记录比对 (含cycle)"""
+
+    name = 'lock_in'
+    module = 'lock_in_amplifier'
+    streams = {'STIM': 3}
+    known_issues = ["i_abs/q_abs/mag_calc 没有复位, 前两条记录的 magnitude/phase 为X (不比对)"]
+    xfail = False
+
+    def __init__(self, args):
+        self.args = args
+        self.rtl = lia.parse_rtl()
+        self.tw = lia.tuning_word(args.freq, self.rtl)
+        self.cycles = args.cycles
+        self.drain = 2 * self.rtl['decimation'] + 16
+        w = self.rtl['output_width']
+        fields = [('cycle', 32, False), ('i_channel', w, True), ('q_channel', w, True),
+                  ('magnitude', w, False), ('phase', 16, False), ('locked', 1, False)]
+        cap = (self.cycles + self.drain) // self.rtl['decimation'] + 16
+        self.sinks = {'OUT': RecordSink(fields, cap)}
+        self.expected = {'OUT': RecordSink(fields, cap)}
+        self.samples = 0
+
+    def plusargs(self):
+        return {'ROWS': self.cycles, 'TW': self.tw, 'GAIN': self.args.gain}
+
+    def blocks(self):
+        args = self.args
+        model = lia.LockInAmplifierModel(self.rtl, self.tw, args.gain)
+        rng = np.random.default_rng([args.seed, 1])
+        ch1 = stim.build_channels(channel_args(args, lia.ADC_BITS))[0]
+        for _, codes, _ in stim.generate_chunks([ch1], self.cycles, lia.ADC_BITS, BLOCK, args.seed):
+            signal = codes[0].astype(np.int64)
+            valid = rng.random(len(signal)) < args.valid_ratio
+            self.samples += len(signal)
+            self.expected['OUT'].append(model.process(signal, valid))
+            yield {'STIM': (valid.astype(np.int64) << 16) | (signal & 0xFFFF)}
+        self.expected['OUT'].append(model.process(np.zeros(self.drain, dtype=np.int64),
+                                                  np.zeros(self.drain, dtype=bool)))
+
+    def compare(self):
+        fields = [f for f, _, _ in self.sinks['OUT'].fields]
+        return {'OUT': compare(self.sinks['OUT'], self.expected['OUT'], fields)}
+
+    def testbench(self):
+        w = self.rtl['output_width']
+        return tb_prologue(self, [('STIM', 'rb'), ('OUT', 'w')], self.drain) + f"""\
+reg  [23:0]         row;
+reg  signed [15:0]  signal_in    = 16'sd0;
+reg                 signal_valid = 1'b0;
+reg  [31:0]         tw;
+reg  [3:0]          gain;
+wire signed [{w - 1}:0]  i_channel, q_channel;
+wire [{w - 1}:0]         magnitude;
+wire [15:0]         phase;
+wire                result_valid, locked;
+
+initial begin
+    if (!$value$plusargs("TW=%d", tw)) tw = 32'd0;
+    if (!$value$plusargs("GAIN=%d", gain)) gain = 4'd0;
+end
+
+lock_in_amplifier dut (
+    .clk            (clk),
+    .rst_n          (rst_n),
+    .signal_in      (signal_in),
+    .signal_valid   (signal_valid),
+    .ref_freq_tuning(tw),
+    .ref_ext_enable (1'b0),
+    .ref_ext_signal (16'sd0),
+    .gain_shift     (gain),
+    .i_channel      (i_channel),
+    .q_channel      (q_channel),
+    .magnitude      (magnitude),
+    .phase          (phase),
+    .result_valid   (result_valid),
+    .locked         (locked)
+);
+
+// 下降沿: 先记录上一沿之后的输出, 再驱动下一沿采样的激励
+always @(negedge clk) begin
+    if (reset_cnt < RESET_CYCLES)
+        reset_cnt = reset_cnt + 1;
+    else begin
+        rst_n = 1'b1;
+        if (result_valid)
+            $fwrite(out_fd, "%h %h %h %h %h %h\\n", cycle - 32'd1, i_channel, q_channel, magnitude, phase, locked);
+        if (row_cnt < rows) begin
+            if ($fread(row, stim_fd) != 3) short_read;
+            row_cnt = row_cnt + 1;
+            signal_valid = row[16];
+            signal_in    = row[15:0];
+        end else begin
+            signal_valid = 1'b0;
+            signal_in    = 16'sd0;
+            drain = drain + 1;
+            if (drain > DRAIN) finish_sim;
+        end
+    end
+end
+
+endmodule
+"""
+
+def fft_words(fe, codes, cfg):
+    """ADC码 (F, N) → (前端输出 fft_din 实部, fft_dout 字) — 前端状态在 fe 中跨帧保持"""
+    x = fe.process(codes)
+    re_, im_, _ = scm.fft_numpy(x, cfg)
+    return x, scm.pack_dout(re_, im_)
+
+def front_end(cfg):
+    return scm.FrontEnd(scm.load_window() if scm.parse_window_enabled() else None, cfg['input_width'])
+
+class SpectrumBench:
+    """spectrum_magnitude_calc: AXI-Stream 源 {空拍数, last, fft_dout}, 逐事务比对地址与幅度"""
+
+    name = 'spectrum'
+    module = 'spectrum_magnitude_calc'
+    streams = {'STIM': 6}
+    known_issues = ["第4级 mag_temp → mag_calc 两级寄存器只给数据, magnitude_valid 取自 valid_d3: "
+                    "magnitude 比 magnitude_valid/magnitude_addr 晚2拍 (连续数据时表现为滞后2个事务)"]
+    xfail = True
+
+    def __init__(self, args):
+        self.args = args
+        self.cfg = scm.parse_idf()
+        self.frames = args.frames
+        fields = [('cycle', 32, False), ('addr', ADDR_BITS, False), ('magnitude', 16, False)]
+        cap = self.frames * N + 16
+        self.sinks = {'OUT': RecordSink(fields, cap)}
+        self.expected = {'OUT': RecordSink(fields, cap)}
+        self.samples = 0
+
+    def plusargs(self):
+        return {'ROWS': self.frames * N}
+
+    def blocks(self):
+        args = self.args
+        rng = np.random.default_rng([args.seed, 2])
+        fe = front_end(self.cfg)
+        ch1 = stim.build_channels(channel_args(args, FIFO_BITS))[0]
+        last = (np.arange(N) == N - 1).astype(np.int64)
+        for _, codes, _ in stim.generate_chunks([ch1], self.frames * N, FIFO_BITS, N, args.seed):
+            _, dout = fft_words(fe, codes[0][None, :], self.cfg)
+            dout = dout[0]
+            self.samples += N
+            self.expected['OUT'].append({'cycle': np.zeros(N, dtype=np.int64), 'addr': np.arange(N),
+                                         'magnitude': scm.rtl_magnitude(dout)})
+            yield {'STIM': (idle_gaps(rng, N, args.gap_prob) << 40) | (last << 32) | dout}
+
+    def compare(self):
+        return {'OUT': compare(self.sinks['OUT'], self.expected['OUT'], ['addr', 'magnitude'],
+                               lag_fields=['magnitude'])}
+
+    def testbench(self):
+        return tb_prologue(self, [('STIM', 'rb'), ('OUT', 'w')], 16, ['gap_left = 0']) + f"""\
+reg  [47:0]         row;
+reg  [31:0]         fft_dout  = 32'd0;
+reg                 fft_valid = 1'b0;
+reg                 fft_last  = 1'b0;
+wire                fft_ready;
+wire [15:0]         magnitude;
+wire [{ADDR_BITS - 1}:0]         magnitude_addr;
+wire                magnitude_valid;
+reg                 have_row  = 1'b0;
+reg                 hs        = 1'b0;
+
+spectrum_magnitude_calc dut (
+    .clk            (clk),
+    .rst_n          (rst_n),
+    .fft_dout       (fft_dout),
+    .fft_valid      (fft_valid),
+    .fft_last       (fft_last),
+    .fft_ready      (fft_ready),
+    .magnitude      (magnitude),
+    .magnitude_addr (magnitude_addr),
+    .magnitude_valid(magnitude_valid)
+);
+
+// 上升沿: 记录握手 (valid && ready) 与反压
+always @(posedge clk) begin
+    hs <= fft_valid & fft_ready;
+    if (rst_n && fft_valid && !fft_ready) stalls = stalls + 1;
+end
+
+// 下降沿: 记录输出; 上一沿已握手或空闲时取下一拍 (先插入行首给出的空拍数)
+always @(negedge clk) begin
+    if (reset_cnt < RESET_CYCLES)
+        reset_cnt = reset_cnt + 1;
+    else begin
+        rst_n = 1'b1;
+        if (magnitude_valid)
+            $fwrite(out_fd, "%h %h %h\\n", cycle - 32'd1, magnitude_addr, magnitude);
+        if (hs) begin
+            fft_valid = 1'b0;
+            fft_last  = 1'b0;
+            fft_dout  = 32'd0;
+        end
+        if (!fft_valid) begin
+            if (!have_row && row_cnt < rows) begin
+                if ($fread(row, stim_fd) != 6) short_read;
+                row_cnt  = row_cnt + 1;
+                have_row = 1'b1;
+                gap_left = row[47:40];
+            end
+            if (have_row) begin
+                if (gap_left > 0)
+                    gap_left = gap_left - 1;
+                else begin
+                    fft_dout  = row[31:0];
+                    fft_last  = row[32];
+                    fft_valid = 1'b1;
+                    have_row  = 1'b0;
+                end
+            end else begin
+                drain = drain + 1;
+                if (drain > DRAIN) finish_sim;
+            end
+        end
+    end
+end
+
+endmodule
+"""
+
+class ControllerBench:
+    """dual_channel_fft_controller: 两路FIFO写入 {空拍数, ch2, ch1}, fft_din_ready 图样, FFT替身回放"""
+
+    name = 'controller'
+    module = 'dual_channel_fft_controller'
+    streams = {'STIM': 5, 'FFT': 4}
+    known_issues = [
+        "频谱幅度复用 spectrum_magnitude_calc, magnitude 比 magnitude_valid 晚2拍 (见 spectrum)",
+        "CHx_RECEIVE 在 fft_dout_last 当拍退出, 而 spectrum_valid 比 fft_dout_valid 晚4拍: "
+        "每帧最后4个频点不会送到 chX_spectrum_* (记为缺失)",
+    ]
+    xfail = True
+
+    def __init__(self, args):
+        self.args = args
+        self.cfg = scm.parse_idf()
+        self.frames = args.frames
+        self.rows = self.frames * N
+        din = [('cycle', 32, False), ('last', 1, False), ('din', 32, False)]
+        spec = [('cycle', 32, False), ('channel', 1, False), ('addr', ADDR_BITS, False), ('data', 16, False)]
+        cap = 2 * self.frames * N + 16
+        self.sinks = {'DIN': RecordSink(din, cap), 'SPEC': RecordSink(spec, cap)}
+        self.expected = {'DIN': RecordSink(din, cap), 'SPEC': RecordSink(spec + [('frame', 16, False)], cap)}
+        self.samples = 0
+        self.ready_path = None
+
+    def setup(self, build):
+        """fft_din_ready 图样 (普通文件, 测试平台一次读入后循环使用)"""
+        rng = np.random.default_rng([self.args.seed, 3])
+        self.ready_path = os.path.join(build, 'ready.bin')
+        bits = rng.random(READY_BYTES * 8) < self.args.ready_ratio
+        with open(self.ready_path, 'wb') as f:
+            f.write(np.packbits(bits).tobytes())
+
+    def plusargs(self):
+        a = self.args
+        write_cycles = self.rows / max(1.0 - a.gap_prob, 1e-3)
+        frame_cycles = N / max(a.ready_ratio, 1e-3) + a.fft_latency + N + 64
+        return {'ROWS': self.rows, 'READY': self.ready_path, 'LATENCY': a.fft_latency,
+                'PLAY_FRAMES': 2 * self.frames,
+                'MAX_CYCLES': int(4 * (write_cycles + 2 * self.frames * frame_cycles)) + 10000}
+
+    def blocks(self):
+        args = self.args
+        rng = np.random.default_rng([args.seed, 2])
+        fe = front_end(self.cfg)
+        width = self.cfg['input_width']
+        channels = stim.build_channels(channel_args(args, FIFO_BITS))
+        last = np.tile((np.arange(N) == N - 1).astype(np.int64), 2)
+        for pos, codes, _ in stim.generate_chunks(channels, self.rows, FIFO_BITS, N, args.seed):
+            c1, c2 = (c.astype(np.int64) for c in codes)
+            x, dout = fft_words(fe, np.stack([c1, c2]), self.cfg)
+            frame = pos // N
+            self.samples += 2 * N
+            self.expected['DIN'].append({'cycle': np.zeros(2 * N, dtype=np.int64), 'last': last,
+                                         'din': x.reshape(-1) & ((1 << width) - 1)})
+            self.expected['SPEC'].append({'cycle': np.zeros(2 * N, dtype=np.int64),
+                                          'channel': np.repeat([0, 1], N), 'addr': np.tile(np.arange(N), 2),
+                                          'data': scm.rtl_magnitude(dout.reshape(-1)),
+                                          'frame': np.full(2 * N, frame)})
+            yield {'STIM': (idle_gaps(rng, N, args.gap_prob) << 32) | ((c2 << 6) << 16) | (c1 << 6),
+                   'FFT': dout.reshape(-1)}
+
+    def compare(self):
+        width = self.cfg['input_width']
+        din = self.sinks['DIN']
+        din.data['din'][:din.count] &= (1 << width) - 1          # IP 只取 fft_din[INPUT_WIDTH-1:0]
+        return {'DIN': compare(din, self.expected['DIN'], ['last', 'din'], lag_fields=['din']),
+                'SPEC': compare(self.sinks['SPEC'], self.expected['SPEC'], ['data'], key=spectrum_key)}
+
+    def testbench(self):
+        return tb_prologue(self, [('STIM', 'rb'), ('FFT', 'rb'), ('DIN', 'w'), ('SPEC', 'w')], 64,
+                           ['gap_left = 0', 'ready_fd', 'ready_bytes = 0', 'latency', 'play_frames', 'max_cycles',
+                            'din_cnt = 0', 'frames_in = 0', 'frames_out = 0', 'lat_cnt = 0', 'play_cnt = 0',
+                            'underflows = 0']) + f"""\
+localparam N = {N};
+
+reg  [39:0]         row;
+reg  [31:0]         prow;
+reg  [8*{PATH_CHARS}-1:0]  ready_path;
+reg  [7:0]          ready_mem [0:{READY_BYTES - 1}];
+reg  [7:0]          ready_byte;
+
+initial begin
+    if (!$value$plusargs("LATENCY=%d", latency)) latency = 64;
+    if (!$value$plusargs("PLAY_FRAMES=%d", play_frames)) play_frames = 0;
+    if (!$value$plusargs("MAX_CYCLES=%d", max_cycles)) max_cycles = 32'h7FFFFFFF;
+    if ($value$plusargs("READY=%s", ready_path)) begin
+        ready_fd = $fopen(ready_path, "rb");
+        if (ready_fd != 0) begin
+            ready_bytes = $fread(ready_mem, ready_fd);
+            $fclose(ready_fd);
+        end
+    end
+end
+
+//-----------------------------------------------------------------------------
+// FIFO 模型: 两路同时写入, 首字直通 (dout 为队首数据), 读空计入 underflows
+//-----------------------------------------------------------------------------
+reg  [15:0]         fifo1 [0:N-1];
+reg  [15:0]         fifo2 [0:N-1];
+reg  [{ADDR_BITS - 1}:0]         wp = 0, rp1 = 0, rp2 = 0;
+reg  [{ADDR_BITS}:0]         cnt1 = 0, cnt2 = 0;
+reg                 wr_en = 1'b0;
+reg  [15:0]         wr1 = 16'd0, wr2 = 16'd0;
+reg                 have_row = 1'b0;
+reg                 playing = 1'b0;
+
+wire                ch1_fifo_rd_en, ch2_fifo_rd_en;
+wire [15:0]         ch1_fifo_dout = fifo1[rp1];
+wire [15:0]         ch2_fifo_dout = fifo2[rp2];
+wire                rd1 = ch1_fifo_rd_en && cnt1 != 0;
+wire                rd2 = ch2_fifo_rd_en && cnt2 != 0;
+
+always @(posedge clk) begin
+    if (wr_en) begin
+        fifo1[wp] <= wr1;
+        fifo2[wp] <= wr2;
+        wp <= wp + 1'b1;
+    end
+    if (rd1) rp1 <= rp1 + 1'b1;
+    if (rd2) rp2 <= rp2 + 1'b1;
+    cnt1 <= cnt1 + {{{ADDR_BITS}'d0, wr_en}} - {{{ADDR_BITS}'d0, rd1}};
+    cnt2 <= cnt2 + {{{ADDR_BITS}'d0, wr_en}} - {{{ADDR_BITS}'d0, rd2}};
+    if (rst_n && ((ch1_fifo_rd_en && cnt1 == 0) || (ch2_fifo_rd_en && cnt2 == 0)))
+        underflows = underflows + 1;
+end
+
+//-----------------------------------------------------------------------------
+// 被测控制器
+//-----------------------------------------------------------------------------
+wire [31:0]         fft_din;
+wire                fft_din_valid, fft_din_last;
+reg                 fft_din_ready  = 1'b1;
+reg  [31:0]         fft_dout       = 32'd0;
+reg                 fft_dout_valid = 1'b0;
+reg                 fft_dout_last  = 1'b0;
+wire [15:0]         ch1_spectrum_data, ch2_spectrum_data;
+wire [{ADDR_BITS - 1}:0]         ch1_spectrum_addr, ch2_spectrum_addr;
+wire                ch1_spectrum_valid, ch2_spectrum_valid;
+
+dual_channel_fft_controller dut (
+    .clk                    (clk),
+    .rst_n                  (rst_n),
+    .ch1_fifo_empty         (cnt1 == 0),
+    .ch1_fifo_rd_en         (ch1_fifo_rd_en),
+    .ch1_fifo_dout          (ch1_fifo_dout),
+    .ch1_fifo_rd_water_level(cnt1),
+    .ch2_fifo_empty         (cnt2 == 0),
+    .ch2_fifo_rd_en         (ch2_fifo_rd_en),
+    .ch2_fifo_dout          (ch2_fifo_dout),
+    .ch2_fifo_rd_water_level(cnt2),
+    .fft_din                (fft_din),
+    .fft_din_valid          (fft_din_valid),
+    .fft_din_last           (fft_din_last),
+    .fft_din_ready          (fft_din_ready),
+    .fft_dout               (fft_dout),
+    .fft_dout_valid         (fft_dout_valid),
+    .fft_dout_last          (fft_dout_last),
+    .ch1_spectrum_data      (ch1_spectrum_data),
+    .ch1_spectrum_addr      (ch1_spectrum_addr),
+    .ch1_spectrum_valid     (ch1_spectrum_valid),
+    .ch2_spectrum_data      (ch2_spectrum_data),
+    .ch2_spectrum_addr      (ch2_spectrum_addr),
+    .ch2_spectrum_valid     (ch2_spectrum_valid),
+    .fft_enable             (1'b1),
+    .work_mode              (2'd1),
+    .ch1_fft_busy           (),
+    .ch2_fft_busy           (),
+    .current_channel        ()
+);
+
+// 上升沿: fft_din 握手记录 (本沿序号), 每 N 个握手为一帧
+always @(posedge clk) begin
+    if (rst_n && fft_din_valid) begin
+        if (fft_din_ready) begin
+            $fwrite(din_fd, "%h %h %h\\n", cycle, fft_din_last, fft_din);
+            if (din_cnt == N - 1) begin
+                din_cnt   = 0;
+                frames_in = frames_in + 1;
+            end else
+                din_cnt = din_cnt + 1;
+        end else
+            stalls = stalls + 1;
+    end
+end
+
+always @(negedge clk) begin
+    if (reset_cnt < RESET_CYCLES)
+        reset_cnt = reset_cnt + 1;
+    else begin
+        rst_n = 1'b1;
+        if (ch1_spectrum_valid)
+            $fwrite(spec_fd, "%h %h %h %h\\n", cycle - 32'd1, 1'b0, ch1_spectrum_addr, ch1_spectrum_data);
+        if (ch2_spectrum_valid)
+            $fwrite(spec_fd, "%h %h %h %h\\n", cycle - 32'd1, 1'b1, ch2_spectrum_addr, ch2_spectrum_data);
+
+        // FIFO写入: 上一沿已写入则取下一行, 空拍数用完且两路都不满时写
+        if (wr_en) begin
+            wr_en    = 1'b0;
+            have_row = 1'b0;
+        end
+        if (!have_row && row_cnt < rows) begin
+            if ($fread(row, stim_fd) != 5) short_read;
+            row_cnt  = row_cnt + 1;
+            have_row = 1'b1;
+            gap_left = row[39:32];
+        end
+        if (have_row) begin
+            if (gap_left > 0)
+                gap_left = gap_left - 1;
+            else if (cnt1 != N && cnt2 != N) begin
+                wr_en = 1'b1;
+                wr1   = row[15:0];
+                wr2   = row[31:16];
+            end
+        end
+
+        // fft_din_ready 图样 (本拍对应沿序号 cycle)
+        if (ready_bytes > 0) begin
+            ready_byte    = ready_mem[(cycle >> 3) % ready_bytes];
+            fft_din_ready = ready_byte[7 - cycle[2:0]];
+        end
+
+        // FFT替身: 收满一帧后等 latency 拍, 连续回放 N 拍
+        fft_dout_valid = 1'b0;
+        fft_dout_last  = 1'b0;
+        fft_dout       = 32'd0;
+        if (!playing && frames_out < frames_in && frames_out < play_frames) begin
+            if (lat_cnt >= latency) begin
+                playing    = 1'b1;
+                play_cnt   = 0;
+                lat_cnt    = 0;
+                frames_out = frames_out + 1;
+            end else
+                lat_cnt = lat_cnt + 1;
+        end
+        if (playing) begin
+            if ($fread(prow, fft_fd) != 4) short_read;
+            fft_dout       = prow;
+            fft_dout_valid = 1'b1;
+            fft_dout_last  = (play_cnt == N - 1);
+            play_cnt       = play_cnt + 1;
+            if (play_cnt == N) playing = 1'b0;
+        end
+
+        if (cycle >= max_cycles) begin
+            $display("COSIM_TIMEOUT frames_in=%0d frames_out=%0d underflows=%0d", frames_in, frames_out, underflows);
+            finish_sim;
+        end
+        if (row_cnt == rows && !have_row && !playing && frames_out == play_frames) begin
+            drain = drain + 1;
+            if (drain > DRAIN) begin
+                $display("COSIM_FIFO underflows=%0d", underflows);
+                finish_sim;
+            end
+        end
+    end
+end
+
+endmodule
+"""
+
+def spectrum_key(sink):
+    """(帧, 通道, 地址) → 整数键; 帧号由同一通道地址回绕计数得到 (期望侧直接给出)"""
+    ch = sink.column('channel')
+    addr = sink.column('addr')
+    if 'frame' in sink.data:
+        frame = sink.column('frame')
+    else:
+        frame = np.zeros(len(ch), dtype=np.int64)
+        for c in (0, 1):
+            idx = np.flatnonzero(ch == c)
+            wraps = np.concatenate([[0], (np.diff(addr[idx]) <= 0).astype(np.int64)])
+            frame[idx] = np.cumsum(wraps)
+    return (frame * 2 + ch) * N + addr
+
+BENCHES = {'lock_in': LockInBench, 'spectrum': SpectrumBench, 'controller': ControllerBench}
+
+#=============================================================================
+# 管道 / 文件搬运
+#=============================================================================
+
+class Feeder(threading.Thread):
+    """一路激励: 从队列取已打包的字节块写入管道或文件; 对端退出后丢弃剩余数据"""
+
+    def __init__(self, path):
+        super().__init__(daemon=True)
+        self.path = path
+        self.queue = queue.Queue(QUEUE_BLOCKS)
+        self.error = None
+        self.aborted = False
+
+    def run(self):
+        f = None
+        try:
+            f = open(self.path, 'wb')
+            while True:
+                block = self.queue.get()
+                if block is None:
+                    break
+                f.write(block)
+        except OSError as e:
+            self.error = e
+            while self.queue.get() is not None:
+                pass
+        finally:
+            if f is not None:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+
+    def put(self, block, proc):
+        """放入队列; 仿真器已退出时解除管道阻塞, 避免生产者死锁"""
+        while True:
+            try:
+                self.queue.put(block, timeout=0.2)
+                return
+            except queue.Full:
+                if proc is not None and proc.poll() is not None:
+                    self.abort()
+
+    def abort(self):
+        if not self.aborted:
+            self.aborted = True
+            unblock(self.path, os.O_RDONLY)
+
+class Reader(threading.Thread):
+    """一路输出: 从管道读入 RecordSink"""
+
+    def __init__(self, path, sink):
+        super().__init__(daemon=True)
+        self.path = path
+        self.sink = sink
+        self.error = None
+
+    def run(self):
+        try:
+            with open(self.path, 'rb') as f:
+                self.sink.read(f)
+        except (OSError, ValueError) as e:
+            self.error = e
+
+    def abort(self):
+        unblock(self.path, os.O_WRONLY)
+
+def unblock(path, mode):
+    """以非阻塞方式打开再关闭命名管道的另一端, 让阻塞在 open() 的线程返回"""
+    try:
+        os.close(os.open(path, mode | os.O_NONBLOCK))
+    except OSError:
+        pass
+
+def produce(bench, feeders, proc):
+    """运行激励生成与期望模型, 把打包后的块送入各路管道, 返回耗时 (s)"""
+    t0 = time.perf_counter()
+    try:
+        for block in bench.blocks():
+            for name, rows in block.items():
+                feeders[name].put(pack_rows(rows, bench.streams[name]), proc)
+    finally:
+        for feeder in feeders.values():
+            feeder.put(None, proc)
+    return time.perf_counter() - t0
+
+#=============================================================================
+# 编译 / 运行
+#=============================================================================
+
+def compile_bench(bench, tb, sim, index, relation, build):
+    """闭包哈希不变且编译结果存在时跳过编译; 返回 (运行命令, 错误说明)"""
+    index.register(tb)
+    test = plan_test({'name': f"cosim/{bench.name}", 'top': f"tb_{bench.name}_cosim", 'kind': 'cosim',
+                      'extra': [], 'vectors': []}, index, relation, sim, {})
+    if test['unresolved'] or test['encrypted']:
+        return None, f"未解析模块 {', '.join(test['unresolved'] + test['encrypted'])}"
+    compile_cmd, run_cmd = commands(test, sim, build)
+    stamp = os.path.join(build, 'compile.hash')
+    if os.path.exists(run_cmd[-1]) and os.path.exists(stamp):
+        with open(stamp, 'r', encoding='utf-8') as f:
+            if f.read().strip() == test['hash']:
+                return run_cmd, None
+    comp = subprocess.run(compile_cmd, capture_output=True, text=True)
+    write_if_changed(os.path.join(build, 'compile.log'), ' '.join(compile_cmd) + "\n\n" + comp.stdout + comp.stderr)
+    if comp.returncode != 0:
+        first = next((l for l in (comp.stderr + comp.stdout).splitlines() if l.strip()), '')
+        return None, f"编译失败: {first[:120]}"
+    write_if_changed(stamp, test['hash'] + "\n")
+    return run_cmd, None
+
+def run_bench(bench, sim, index, relation, args):
+    """生成测试平台 → 编译 → 激励/仿真/收集 → 比对, 返回结果字典"""
+    out_dir = os.path.join(OUTPUT_DIR, bench.name)
+    build = os.path.join(out_dir, 'build')
+    os.makedirs(build, exist_ok=True)
+    tb = os.path.join(out_dir, f"tb_{bench.name}_cosim.v")
+    write_if_changed(tb, bench.testbench())
+    result = {'bench': bench.name, 'module': bench.module, 'testbench': tb, 'simulator': sim['id'] if sim else None}
+    if hasattr(bench, 'setup'):
+        bench.setup(build)
+
+    run_cmd = None
+    if sim is not None and not args.model_only:
+        run_cmd, error = compile_bench(bench, tb, sim, index, relation, build)
+        if error:
+            result.update(status='skip' if error.startswith('未解析') else 'error', note=error)
+            return result
+    pipe = run_cmd is not None and hasattr(os, 'mkfifo') and not args.files
+    ext_in, ext_out = ('.pipe', '.pipe') if pipe else ('.bin', '.txt')
+    in_paths = {name: os.path.join(build, name.lower() + ext_in) for name in bench.streams}
+    out_paths = {name: os.path.join(build, name.lower() + ext_out) for name in bench.sinks}
+    if pipe:
+        for path in list(in_paths.values()) + list(out_paths.values()):
+            if os.path.exists(path):
+                os.remove(path)
+            os.mkfifo(path)
+
+    feeders = {name: Feeder(path) for name, path in in_paths.items()}
+    readers = {name: Reader(path, bench.sinks[name]) for name, path in out_paths.items()}
+    plusargs = [f"+{k}={v}" for k, v in bench.plusargs().items()]
+    plusargs += [f"+{name}={path}" for name, path in list(in_paths.items()) + list(out_paths.items())]
+    log_path = os.path.join(build, 'sim.log')
+
+    proc = None
+    for feeder in feeders.values():
+        feeder.start()
+    if pipe:
+        for reader in readers.values():
+            reader.start()
+    t0 = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        if pipe:
+            proc = subprocess.Popen(run_cmd + plusargs, stdout=log, stderr=subprocess.STDOUT)
+        model_s = produce(bench, feeders, proc)
+        for feeder in feeders.values():
+            feeder.join()
+        if run_cmd is not None and not pipe:
+            t0 = time.perf_counter()
+            proc = subprocess.Popen(run_cmd + plusargs, stdout=log, stderr=subprocess.STDOUT)
+        timed_out = False
+        if proc is not None:
+            try:
+                proc.wait(timeout=args.timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                timed_out = True
+    sim_s = time.perf_counter() - t0
+    if pipe:
+        for reader in readers.values():
+            reader.abort()
+            reader.join(timeout=10)
+    elif proc is not None:
+        for name, path in out_paths.items():
+            with open(path, 'rb') as f:
+                bench.sinks[name].read(f)
+
+    result.update(samples=bench.samples, model_seconds=round(model_s, 3),
+                  model_rate=round(bench.samples / max(model_s, 1e-9)))
+    if proc is None:
+        result.update(status='model', note="未运行仿真")
+        return result
+
+    with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+        log_text = f.read()
+    done = re.search(r'COSIM_DONE(.*)', log_text)
+    stats = {k: int(v) for k, v in re.findall(r'(\w+)=(\d+)', done.group(1))} if done else {}
+    stats.update({k: int(v) for k, v in re.findall(r'(underflows)=(\d+)', log_text)})
+    result.update(sim_seconds=round(sim_s, 3), sim_stats=stats,
+                  sample_rate=round(bench.samples / max(sim_s, 1e-9)),
+                  cycle_rate=round(stats.get('cycles', 0) / max(sim_s, 1e-9)))
+    errors = [line for line in log_text.splitlines() if 'COSIM_ERROR' in line or 'COSIM_TIMEOUT' in line]
+    errors += [f"{n}: {x.error}" for n, x in list(feeders.items()) + list(readers.items()) if x.error]
+    if timed_out:
+        errors.append(f"仿真超过 {args.timeout} s")
+    if not done and not errors:
+        errors.append(f"仿真未正常结束 (退出码 {proc.returncode}), 见 {log_path}")
+    if errors:
+        result.update(status='error', note='; '.join(errors[:3]))
+        return result
+
+    checks = bench.compare()
+    result['checks'] = checks
+    matched = all(c['ok'] for c in checks.values())
+    ok = matched and stats.get('underflows', 0) == 0
+    status = 'pass' if ok else 'fail'
+    if bench.xfail and stats.get('underflows', 0) == 0:
+        status = 'xpass' if matched else 'xfail'   # FIFO读空是测试平台问题, 不属于已知缺陷
+    result.update(status=status, note='')
+    if not ok:
+        result['known_issues'] = bench.known_issues
+    return result
+
+def rate(v):
+    return f"{v / 1e6:.2f}M" if v >= 1e6 else f"{v / 1e3:.1f}k"
+
+def report(result):
+    mark = {'pass': '✓', 'model': '✓', 'skip': '⚠️ ', 'xfail': '⚠️ ', 'xpass': '⚠️ ',
+            'fail': '❌', 'error': '❌'}[result['status']]
+    print(f"{mark} {result['bench']:<11} ({result['module']}) {result['status']}  {result.get('note', '')}")
+    if 'model_rate' in result:
+        print(f"    模型: {result['samples']} 样本 {result['model_seconds']:.2f} s, {rate(result['model_rate'])} 样本/s")
+    if 'sim_seconds' in result:
+        st = result['sim_stats']
+        print(f"    仿真: {result['sim_seconds']:.2f} s, {rate(result['sample_rate'])} 样本/s, "
+              f"{rate(result['cycle_rate'])} 时钟/s, {st.get('cycles', 0)} 拍, 反压 {st.get('stalls', 0)} 拍"
+              + (f", FIFO读空 {st['underflows']} 次" if 'underflows' in st else ""))
+    for name, c in result.get('checks', {}).items():
+        m = ', '.join(f"{f} {n}" for f, n in c['mismatches'].items() if n)
+        bad = '⚠️ ' if result['status'] == 'xfail' else '❌'
+        print(f"    {'✓' if c['ok'] else bad} {name}: 期望 {c['expected']} 条, 收到 {c['got']} 条, "
+              f"比对 {c['compared']} 条" + (f", 不一致 {m}" if m else "")
+              + (f", 缺失 {c['missing']}" if c['missing'] else "") + (f", 多余 {c['extra']}" if c['extra'] else "")
+              + (f", X {c['unknown']}" if c['unknown'] else "") + (f", 溢出 {c['overflow']}" if c['overflow'] else ""))
+        if c['first']:
+            print(f"      首个不一致 (收到, 期望): {c['first']}")
+        if c['lag']:
+            print(f"      收到的数据与期望整体滞后 {c['lag']} 条记录一致")
+    for issue in result.get('known_issues', []):
+        print(f"    已知问题: {issue}")
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="NumPy ↔ RTL 流式协同仿真")
+    parser.add_argument('--bench', action='append', choices=sorted(BENCHES), help="只运行指定bench (可多次给出)")
+    parser.add_argument('--sim', choices=['auto', 'icarus', 'verilator'], default='auto', help="仿真器")
+    parser.add_argument('--lib-dir', action='append', default=[], help="厂商仿真库目录")
+    parser.add_argument('--model-only', action='store_true', help="不仿真: 生成测试平台/激励文件, 测模型吞吐")
+    parser.add_argument('--files', action='store_true', help="激励/输出用普通文件 (默认POSIX下用命名管道)")
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help="每个bench仿真超时 (s)")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--cycles', type=int, default=1 << 20, help="lock_in 激励时钟数")
+    parser.add_argument('--frames', type=int, default=2, help="spectrum/controller 帧数 (每通道)")
+    parser.add_argument('--valid-ratio', type=float, default=0.8, help="lock_in signal_valid 为1的比例")
+    parser.add_argument('--gap-prob', type=float, default=0.2, help="spectrum fft_valid / controller FIFO写入每拍空闲概率")
+    parser.add_argument('--ready-ratio', type=float, default=0.75, help="controller fft_din_ready 为1的比例")
+    parser.add_argument('--fft-latency', type=int, default=64, help="FFT替身: 收满一帧到开始输出的拍数")
+    parser.add_argument('--gain', type=int, default=0, help="lock_in gain_shift")
+    parser.add_argument('--wave', choices=stim.WAVES, default='sine', help="波形")
+    parser.add_argument('--freq', type=float, default=10000.0, help="信号频率 (Hz, lock_in 参考频率相同)")
+    parser.add_argument('--amp', type=float, default=200.0, help="峰值幅度 (ADC码)")
+    parser.add_argument('--noise', type=float, default=4.0, help="高斯噪声RMS (ADC码)")
+    parser.add_argument('--phase', type=float, default=30.0, help="ch2 滞后相位 (度)")
+    parser.add_argument('--harmonics', help="谐波: 次数:相对幅度[:相位°],...")
+    args = parser.parse_args()
+
+    sim = None if args.model_only else detect_simulator(args.sim)
+    if sim is None and not args.model_only:
+        print("⚠️  找不到仿真器 (iverilog+vvp 或 verilator), 只运行模型 (同 --model-only)")
+        args.model_only = True
+    index = ModuleIndex(scan_files(parse_pds(), args.lib_dir))
+    relation = parse_include_relation()
+
+    print(f"=== 协同仿真: 仿真器 {sim['id'] if sim else '无'}, "
+          f"{'命名管道' if hasattr(os, 'mkfifo') and not args.files and not args.model_only else '文件'} ===")
+    results = []
+    for name in args.bench or list(BENCHES):
+        result = run_bench(BENCHES[name](args), sim, index, relation, args)
+        write_if_changed(os.path.join(OUTPUT_DIR, name, 'result.json'),
+                         json.dumps(result, indent=2, ensure_ascii=False) + "\n")
+        report(result)
+        results.append(result)
+    xpassed = [r['bench'] for r in results if r['status'] == 'xpass']
+    if xpassed:
+        print(f"\n⚠️  预期失败的bench通过了: {', '.join(xpassed)}; 确认RTL问题已修复后去掉该bench的 xfail")
+    failed = [r['bench'] for r in results if r['status'] in ('fail', 'error')]
+    if failed:
+        print(f"\n❌ {len(failed)} 个bench未通过: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
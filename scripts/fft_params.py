@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+FFT派生参数 (8192点, 采样率 35000000 Hz)
+自动生成: scripts/generate_fft_params.py, 请勿手动修改 (与 fft_params.vh 同源)
+"""
+
+FFT_POINTS = 8192
+FFT_ADDR_WIDTH = 13
+FFT_HALF_POINTS = 4096
+FFT_SAMPLE_RATE = 35000000
+FFT_FREQ_RES = 4272
+FFT_FREQ_RES_Q16 = 280000000
+FFT_FREQ_RES_Q16_WIDTH = 29
+FFT_FREQ_PRODUCT_WIDTH = 25
+FFT_FREQ_Q16_PRODUCT_WIDTH = 41
+FFT_HZ_TO_BIN_Q32 = 1005268
+FFT_WINDOW_WIDTH = 16
+FFT_WINDOW_SCALE = 32767
+FFT_WINDOW_CG_Q16 = 32764
+FFT_WINDOW_ENBW_Q16 = 98316
+FFT_WINDOW_HALF_FILE = 'source/hann_window_8192_half.hex'
+
+# 误差预算: 常量名 → 精确值/取整误差/相对误差/整个频谱范围内的最坏误差
+ERROR_BUDGET = {
+    'FFT_FREQ_RES': {'value': 4272, 'width': 13, 'exact': 4272.4609375, 'error': -0.4609375, 'relative_error': -0.00010788571428571429, 'worst_case_error': 1887.5390625, 'unit': 'Hz/bin', 'desc': 'bin→Hz整数系数, 最坏误差在bin 4095'},
+    'FFT_FREQ_RES_Q16': {'value': 280000000, 'width': 29, 'exact': 4272.4609375, 'error': 0.0, 'relative_error': 0.0, 'worst_case_error': 0.0, 'unit': 'Hz/bin', 'desc': 'bin→Hz的Q16系数 (用于插值后的分数bin)'},
+    'FFT_HZ_TO_BIN_Q32': {'value': 1005268, 'width': 20, 'exact': 0.00023405714285714286, 'error': 5.2627495356968473e-11, 'relative_error': 2.248489181511104e-07, 'worst_case_error': 0.0009209811687469482, 'unit': 'bin/Hz', 'desc': 'Hz→bin的Q32系数, 最坏误差在Nyquist频率'},
+    'FFT_WINDOW_CG_Q16': {'value': 32764, 'width': 15, 'exact': 0.49993903748912777, 'error': -7.264537778099918e-08, 'relative_error': -1.4530847230064327e-07, 'worst_case_error': 7.264537778099918e-08, 'unit': '', 'desc': 'Hann窗相干增益 (幅度校正用)'},
+    'FFT_WINDOW_ENBW_Q16': {'value': 98316, 'width': 17, 'exact': 1.5001829032139458, 'error': 2.0225480418826857e-07, 'relative_error': 1.3482009677284288e-07, 'worst_case_error': 2.0225480418826857e-07, 'unit': 'bin', 'desc': 'Hann窗等效噪声带宽 (噪声/SNR计算用)'},
+}
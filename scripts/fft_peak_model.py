@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FFT峰值插值 + 谐波/THD扫描 批量模型
+
+对成批单音 (每次调用数千个, 随机频率/初相/谐波含量) 走完 加窗 → FFT → 幅度 → 峰值/谐波 → 频率/THD,
+给出频率估计误差 (相对4272 Hz分辨率) 和THD偏差 (相对真实谐波含量), 并比较窗函数和插值算法.
+
+被建模的RTL:
+    signal_parameter_measure.v (实际综合的路径)
+        - 2B 峰值搜索: bin 1 ~ N/2-1, 初值50, 严格大于才更新; fft_freq_hz = peak_bin × FREQ_RES (无插值)
+        - 2C 谐波扫描: harmN_bin = peak_bin × N (N=2~5), ±harm_search_range 内取最大值,
+          8帧平均后与 max(fft_avg_amp>>5, 50) 比较, 不超过则置0
+        - 5  THD = (H2+H3+H4+H5) × (1024000/基波, 倒数LUT) >> 10, 单位0.1%, 限幅1000
+    fft_peak_detector.v (文件损坏: 两个版本逐行拼接, 未实例化, 不在工程中)
+        - 仅取其中的Q12抛物线插值: offset = (y0-y2)<<12 / (2·(y0+y2-2·y1)), 截断除法, ±1.0限幅,
+          freq = ((peak_bin<<12) + offset) × FREQ_RESOLUTION_Q16[27:0] → [47:28]
+        - 按原样 (三点取自扫描末尾、限幅比较符号、常数截断) 和修正后两种方式建模
+
+稳态假设: 每帧输入相同, 各级滑动平均/历史缓存等于单帧结果; 前端直流估计不建模 (见spectrum_chain_model.py),
+直接送入去直流的10位有符号样本.
+
+插值算法 (δ为相对峰值bin的分数偏移):
+    bin×4272      - signal_parameter_measure 原样
+    q12_rtl       - fft_peak_detector 原样
+    q12_fixed     - 修正后的Q12抛物线 (峰值三点, |num|>|den|限幅, 完整Q16常数)
+    parabolic     - 浮点抛物线 (同一组RTL幅度)
+    gaussian      - 对数抛物线 (ln y)
+    jk_magnitude  - Jacobsen-Kootsookos 幅度式 P·(y2-y0)/(y0+y1+y2), 只需幅度
+    jacobsen      - Jacobsen 复数式 P·Re((X0-X2)/(2X1-X0-X2)), 需保留峰值三点的实部/虚部
+P 由无噪声理想单音按窗函数标定 (矩形窗≈1, Hann≈2).
+
+THD估计:
+    rtl           - signal_parameter_measure 位精确 (2~5次线性和, 噪声阈值, 倒数LUT)
+    linear        - 同一组谐波幅度, 不加阈值, 精确除法 (分离阈值/LUT的影响)
+    rss_peak      - 按插值后的基波频率定位谐波 (±2 bin), 峰值bin幅度平方和开方
+    rss_band      - 基波/各次谐波 ±2 bin 能量和 (精确|X|), 不受栅栏效应影响
+
+用法:
+    python scripts/fft_peak_model.py                           # 4096个单音, rect/hann/blackman-harris
+    python scripts/fft_peak_model.py --tones 20000 --jobs 8
+    python scripts/fft_peak_model.py --windows hann --thd 0:0   # 纯单音, 只看频率误差
+    python scripts/fft_peak_model.py --engine cmodel --tones 256
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import fft_params
+from mem_image import write_if_changed
+from spectrum_chain_model import (CMODEL_LIB, _load_cmodel, fft_cmodel, fft_numpy, load_window,
+                                  pack_dout, parse_idf, rtl_magnitude, wrap)
+
+MEASURE_FILE = "source/source/signal_parameter_measure.v"
+DETECTOR_FILE = "source/source/fft_peak_detector.v"
+OUTPUT_DIR = "ipcore/fft_peak"
+
+N = fft_params.FFT_POINTS
+HALF = N // 2
+FS = fft_params.FFT_SAMPLE_RATE
+BIN_HZ = FS / N
+ADC_BITS = 10
+SPEC_REL = 1e-3                 # "<0.1% 频率" 指标
+SPEC_COVERAGE = 0.99            # 最低达标频率: 该频率以上99%的单音满足指标
+BAND = 2                        # rss_band/rss_peak 的 ±bin 范围
+OFFSET_BINS = np.linspace(-0.5, 0.5, 21)
+THD_EDGES = [0.1, 0.3, 1, 3, 10, 30, 100]   # THD偏差分档 (%)
+
+INTERPOLATORS = {
+    'bin×4272': 'signal_parameter_measure: peak_bin × FREQ_RES',
+    'q12_rtl': 'fft_peak_detector Q12抛物线 (原样)',
+    'q12_fixed': 'Q12抛物线 (修正)',
+    'parabolic': '浮点抛物线',
+    'gaussian': '对数抛物线 (Gaussian)',
+    'jk_magnitude': 'Jacobsen-Kootsookos 幅度式',
+    'jacobsen': 'Jacobsen 复数式',
+}
+THD_ESTIMATORS = {
+    'rtl': 'RTL: 2~5次线性和 + 阈值 + 倒数LUT',
+    'linear': '2~5次线性和, 无阈值, 精确除法',
+    'rss_peak': '插值定位, 峰值bin平方和开方',
+    'rss_band': f'±{BAND} bin 能量和开方',
+}
+
+#=============================================================================
+# RTL 参数解析
+#=============================================================================
+
+def parse_measure(path=MEASURE_FILE):
+    """signal_parameter_measure.v 中的峰值/谐波/THD常数"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+
+    def grab(pattern, desc):
+        m = re.search(pattern, text)
+        if not m:
+            raise ValueError(f"{path} 中找不到 {desc}")
+        return m.groups()
+
+    peak_init, = grab(r"fft_scan_active\s*<=\s*1'b1;\s*\n\s*fft_max_amp\s*<=\s*16'd(\d+);", "峰值搜索初值")
+    search, = grab(r"harm_search_range\s*<=\s*5'd(\d+);", "谐波搜索范围")
+    thr_shift, thr_floor = grab(r"dynamic_noise_threshold\s*<=\s*\(fft_avg_amp\s*>>\s*(\d+)\)\s*>\s*16'd(\d+)",
+                                "动态噪声阈值")
+    thd_min, = grab(r"fft_max_amp\s*>\s*16'd(\d+)\)\s*\n\s*thd_calc_trigger", "THD基波门限")
+    orders = sorted({int(n) for n in re.findall(r"fft_harmonic_(\d+)\}", text)})
+    lut = {int(i): int(v) for i, v in re.findall(r"8'd(\d+):\s*thd_reciprocal\s*<=\s*20'd(\d+);", text)}
+    ladder = [(int(i), int(v)) for i, v in
+              re.findall(r"thd_lut_index\s*>=\s*8'd(\d+)\)\s*\n\s*thd_reciprocal\s*<=\s*20'd(\d+);", text)]
+    default, = grab(r"else\s*\n\s*thd_reciprocal\s*<=\s*20'd(\d+);", "倒数LUT缺省值")
+    small = [(int(a), int(i)) for a, i in
+             re.findall(r"fundamental_power\s*>=\s*32'd(\d+)\)\s*\n\s*thd_lut_index\s*<=\s*8'd(\d+);", text)]
+    small_default, = grab(r"else\s*\n\s*thd_lut_index\s*<=\s*8'd(\d+);", "小幅度索引缺省值")
+    if not orders or not lut or not ladder:
+        raise ValueError(f"{path} 中THD结构与预期不符")
+    return {'peak_init': int(peak_init), 'search': int(search), 'thr_shift': int(thr_shift),
+            'thr_floor': int(thr_floor), 'thd_min': int(thd_min), 'orders': orders,
+            'lut': lut, 'ladder': ladder, 'lut_default': int(default),
+            'small_index': [(a, i) for a, i in small if a < 256], 'small_default': int(small_default)}
+
+def parse_detector(path=DETECTOR_FILE):
+    """fft_peak_detector.v (损坏) 中的插值常数; 读不到时使用原设计值"""
+    cfg = {'freq_q16': 280000000, 'const_bits': 28, 'product_bits': 48, 'start_bin': 10, 'found': False}
+    if not os.path.exists(path):
+        return cfg
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    m = re.search(r"FREQ_RESOLUTION_Q16\s*=\s*32'd(\d+)", text)
+    if m:
+        cfg['freq_q16'] = int(m.group(1))
+        cfg['found'] = True
+    m = re.search(r"FREQ_RESOLUTION_Q16\[(\d+):0\]", text)
+    if m:
+        cfg['const_bits'] = int(m.group(1)) + 1
+    m = re.search(r"reg \[(\d+):0\]\s+freq_product;", text)
+    if m:
+        cfg['product_bits'] = int(m.group(1)) + 1
+    m = re.search(r"spectrum_data > max_amplitude && spectrum_addr >= 13'd(\d+)", text)
+    if m:
+        cfg['start_bin'] = int(m.group(1))
+    return cfg
+
+#=============================================================================
+# 窗函数 / 激励
+#=============================================================================
+
+def make_window(name):
+    """Q15整数窗 (None为矩形); hann 取ROM镜像, blackman-harris 为候选 (不在ROM中)"""
+    if name == 'rect':
+        return None
+    if name == 'hann':
+        return load_window()
+    if name == 'blackman-harris':
+        n = np.arange(N) * 2 * np.pi / N
+        w = 0.35875 - 0.48829 * np.cos(n) + 0.14128 * np.cos(2 * n) - 0.01168 * np.cos(3 * n)
+        return np.rint(w * 32767).astype(np.int64)
+    raise ValueError(f"未知窗函数: {name}")
+
+def apply_window(x, window):
+    """windowed_mult[30:15] 后截到 fft_din[9:0] (与 FrontEnd 相同)"""
+    if window is None:
+        return x
+    return wrap(wrap((x * window[None, :]) >> 15, 16), ADC_BITS)
+
+def tones(rng, count, amplitude, max_order, thd_range, freq_range, noise_rms):
+    """
+    count 个独立单音 (每帧一个): 对数均匀频率/THD, 谐波功率按Dirichlet随机分配到2~max_order次
+
+    超过Nyquist的谐波不注入 (视为被抗混叠滤波器滤除), 真实THD只统计注入的谐波.
+    返回 (10位有符号样本, 基波频率, 各次谐波相对幅度, 削波标志).
+    """
+    f = np.exp(rng.uniform(np.log(freq_range[0]), np.log(freq_range[1]), count))
+    if thd_range[1] > 0:
+        thd = np.exp(rng.uniform(np.log(thd_range[0]), np.log(thd_range[1]), count)) / 100
+    else:
+        thd = np.zeros(count)
+    orders = np.arange(2, max_order + 1)
+    share = rng.dirichlet(np.ones(len(orders)), count) if len(orders) else np.zeros((count, 0))
+    harm = thd[:, None] * np.sqrt(share)
+    harm[orders[None, :] * f[:, None] >= FS / 2] = 0
+    t = np.arange(N, dtype=np.float64)
+    x = np.sin(2 * np.pi * f[:, None] / FS * t + rng.uniform(0, 2 * np.pi, (count, 1)))
+    for j, n in enumerate(orders):
+        x += harm[:, j:j + 1] * np.sin(2 * np.pi * n * f[:, None] / FS * t + rng.uniform(0, 2 * np.pi, (count, 1)))
+    x = amplitude * x + rng.normal(0, noise_rms, x.shape)
+    lim = 1 << (ADC_BITS - 1)
+    clipped = ((x < -lim) | (x > lim - 1)).any(axis=1)
+    return np.clip(np.rint(x), -lim, lim - 1).astype(np.int64), f, harm, clipped
+
+#=============================================================================
+# 峰值搜索 / 插值
+#=============================================================================
+
+def peak_search(mag, start, init):
+    """流式严格大于搜索 (同值取最先出现的bin); 没有超过init的bin时保持 bin 0 / init"""
+    seg = mag[:, start:HALF]
+    idx = seg.argmax(axis=1)
+    val = seg[np.arange(len(seg)), idx]
+    hit = val > init
+    return np.where(hit, idx + start, 0), np.where(hit, val, init)
+
+def neighbours(a, k):
+    """峰值左/中/右三点 (边界处钳位)"""
+    r = np.arange(len(a))
+    return a[r, np.clip(k - 1, 0, N - 1)], a[r, k], a[r, np.clip(k + 1, 0, N - 1)]
+
+def trunc_div(num, den):
+    """Verilog有符号除法: 向零截断"""
+    q = np.abs(num) // np.maximum(np.abs(den), 1)
+    return np.where((num < 0) != (den < 0), -q, q)
+
+def q12_offset(y0, y1, y2, fixed):
+    """offset = (y0-y2)<<12 / (2·(y0+y2-2·y1)), Q12, 限幅±1.0"""
+    num = y0 - y2
+    den = 2 * (y0 + y2 - 2 * y1)
+    if fixed:
+        over = np.abs(num) > np.abs(den)
+        clamp = np.where((num < 0) != (den < 0), -4096, 4096)
+    else:
+        # 原样: 峰值处den<0, num>den几乎总成立 → 结果几乎总是+1.0
+        over = (num > den) | (num < -den)
+        clamp = np.where(num > den, 4096, -4096)
+    q = np.where(over, clamp, trunc_div(num << 12, np.where(den == 0, 1, den)))
+    return wrap(np.where(den == 0, 0, q), 16)
+
+def q12_freq(k, offset, det, fixed):
+    """((peak_bin<<12) + offset) × 系数 >> 28; 原样为28位截断常数和48位乘积"""
+    total = (k << 12) + offset
+    if fixed:
+        return (total * fft_params.FFT_FREQ_RES_Q16) >> 28
+    const = wrap(det['freq_q16'] & ((1 << det['const_bits']) - 1), det['const_bits'])
+    product = wrap(wrap(total, 28) * const, det['product_bits'])
+    return (product >> 28) & 0xFFFFF
+
+def calibrate(window):
+    """无噪声理想单音上标定 jk_magnitude / jacobsen 的比例常数 P (最小二乘)"""
+    d = np.linspace(-0.5, 0.5, 101)
+    w = np.ones(N) if window is None else window / 32767.0
+    x = np.cos(2 * np.pi * (1000 + d)[:, None] * np.arange(N) / N + 0.3) * w[None, :]
+    X = np.fft.fft(x, axis=1)
+    X0, X1, X2 = X[:, 999], X[:, 1000], X[:, 1001]
+    raw = {'jk_magnitude': (np.abs(X2) - np.abs(X0)) / (np.abs(X0) + np.abs(X1) + np.abs(X2)),
+           'jacobsen': np.real((X0 - X2) / (2 * X1 - X0 - X2))}
+    return {k: float((r * d).sum() / (r * r).sum()) for k, r in raw.items()}
+
+def interpolate(mag, re_, im_, k, gain):
+    """浮点插值器: 返回 δ (bin)"""
+    y0, y1, y2 = (v.astype(np.float64) for v in neighbours(mag, k))
+    X = re_ + 1j * im_
+    X0, X1, X2 = neighbours(X, k)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        den = y0 - 2 * y1 + y2
+        out = {'parabolic': 0.5 * (y0 - y2) / den}
+        l0, l1, l2 = (np.log(np.maximum(v, 1)) for v in (y0, y1, y2))
+        out['gaussian'] = 0.5 * (l0 - l2) / (l0 - 2 * l1 + l2)
+        out['jk_magnitude'] = gain['jk_magnitude'] * (y2 - y0) / (y0 + y1 + y2)
+        out['jacobsen'] = gain['jacobsen'] * np.real((X0 - X2) / (2 * X1 - X0 - X2))
+    return {name: np.clip(np.nan_to_num(v), -1, 1) for name, v in out.items()}
+
+#=============================================================================
+# 谐波 / THD
+#=============================================================================
+
+def window_max(a, center, half):
+    """每行 a[center-half : center+half] ∩ [1, N/2-1] 的最大值"""
+    idx = np.clip(center[:, None] + np.arange(-half, half + 1)[None, :], 1, HALF - 1)
+    return a[np.arange(len(a))[:, None], idx].max(axis=1)
+
+def rtl_harmonics(mag, k, meas):
+    """
+    2C: harmN_bin = peak_bin×N (13位回绕), 只有 R < bin < N/2-R 时才搜索
+
+    返回 (各次谐波幅度, 搜索窗是否覆盖基波bin); 覆盖时谐波幅度就是基波幅度.
+    """
+    r = meas['search']
+    out, overlap = [], np.zeros(len(k), dtype=bool)
+    for n in meas['orders']:
+        hb = (n * k) & (N - 1)
+        valid = (hb > r) & (hb < HALF - r)
+        out.append(np.where(valid, window_max(mag, hb, r), 0))
+        overlap |= valid & (np.abs(hb - k) <= r)
+    return np.stack(out, axis=1), overlap
+
+def rtl_thd(harm, amp, meas):
+    """阈值 + 倒数LUT → thd_calc (0.1%); 不触发时RTL保持旧值, 这里按复位值0计"""
+    thr = np.maximum(amp >> meas['thr_shift'], meas['thr_floor'])
+    kept = np.where(harm > thr[:, None], harm, 0)
+    total = kept.sum(axis=1)
+    trigger = (total > 0) & (amp > meas['thd_min'])
+    index = np.full(amp.shape, meas['small_default'])
+    for a, i in sorted(meas['small_index']):
+        index = np.where(amp >= a, i, index)
+    index = np.where(amp >= 256, (amp >> 8) & 0xFF, index)
+    index = np.where(amp > 65280, 255, index)
+    recip = np.full(amp.shape, meas['lut_default'])
+    for i, v in sorted(meas['ladder']):
+        recip = np.where(index >= i, v, recip)
+    for i, v in meas['lut'].items():
+        recip = np.where(index == i, v, recip)
+    product = total * recip
+    thd = np.where(product >> 10 > 1000, 1000, (product >> 10) & 0xFFFF)
+    return np.where(trigger, thd, 0), trigger
+
+def band_power(p, center, half):
+    idx = np.clip(center[:, None] + np.arange(-half, half + 1)[None, :], 0, HALF - 1)
+    return p[np.arange(len(p))[:, None], idx].sum(axis=1)
+
+def alt_thd(mag, power, k, delta, orders):
+    """按插值后的基波位置定位谐波: rss_peak (峰值bin幅度) / rss_band (±BAND能量)"""
+    f0 = k + delta
+    h_peak, h_band = [], []
+    for n in orders:
+        c = np.rint(n * f0).astype(np.int64)
+        inside = c + BAND < HALF
+        c = np.minimum(c, HALF - 1)
+        h_peak.append(np.where(inside, window_max(mag, c, BAND), 0).astype(np.float64))
+        h_band.append(np.where(inside, band_power(power, c, BAND), 0))
+    fund_peak = mag[np.arange(len(mag)), k].astype(np.float64)
+    fund_band = band_power(power, k, BAND)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rss_peak = np.sqrt((np.stack(h_peak, 1) ** 2).sum(1)) / fund_peak
+        rss_band = np.sqrt(np.stack(h_band, 1).sum(1) / fund_band)
+    return 100 * np.nan_to_num(rss_peak), 100 * np.nan_to_num(rss_band)
+
+#=============================================================================
+# 批处理
+#=============================================================================
+
+_CTX = {}
+
+def _init_worker(ctx):
+    _CTX.update(ctx)
+
+def run_chunk(args):
+    """一批单音在所有窗函数下的结果 (进程池工作函数)"""
+    seed, count = args
+    ctx = _CTX
+    rng = np.random.default_rng(seed)
+    x, f, harm, clipped = tones(rng, count, ctx['amplitude'], ctx['max_order'], ctx['thd_range'],
+                                ctx['freq_range'], ctx['noise'])
+    true_bin = f * N / FS
+    res = {'freq': f, 'offset': true_bin - np.rint(true_bin), 'thd_true': 100 * np.sqrt((harm ** 2).sum(1)),
+           'clipped': clipped}
+    meas, det = ctx['meas'], ctx['det']
+    for wname in ctx['windows']:
+        xw = apply_window(x, ctx['window_data'][wname])
+        if ctx['engine'] == 'cmodel':
+            re_, im_, exp = fft_cmodel(xw, ctx['idf'], ctx['jobs'])
+        else:
+            re_, im_, exp = fft_numpy(xw, ctx['idf'])
+        mag = rtl_magnitude(pack_dout(re_, im_))
+        k, amp = peak_search(mag, 1, meas['peak_init'])
+        est = {'bin×4272': k * fft_params.FFT_FREQ_RES}
+
+        # fft_peak_detector: 原样 (三点为扫描末尾的 bin N/2-3..N/2-1, 峰值从bin 10起搜, 初值为DC bin)
+        kd, _ = peak_search(mag, det['start_bin'], -1)
+        kd = np.where(mag[np.arange(count), kd] > mag[:, 0], kd, 0)
+        tail = [mag[:, HALF - 3 + i] for i in range(3)]
+        est['q12_rtl'] = q12_freq(kd, q12_offset(*tail, fixed=False), det, fixed=False)
+        off = q12_offset(*neighbours(mag, k), fixed=True)
+        est['q12_fixed'] = q12_freq(k, off, det, fixed=True)
+        deltas = interpolate(mag, re_, im_, k, ctx['gain'][wname])
+        for name, d in deltas.items():
+            est[name] = (k + d) * BIN_HZ
+        for name, v in est.items():
+            res[f'{wname}/f/{name}'] = v.astype(np.float64)
+
+        h, res[f'{wname}/overlap'] = rtl_harmonics(mag, k, meas)
+        thd, trigger = rtl_thd(h, amp, meas)
+        res[f'{wname}/thd/rtl'] = thd / 10.0
+        res[f'{wname}/thd_trigger'] = trigger
+        with np.errstate(divide='ignore', invalid='ignore'):
+            res[f'{wname}/thd/linear'] = np.nan_to_num(100 * h.sum(1) / amp)
+        power = re_.astype(np.float64) ** 2 + im_.astype(np.float64) ** 2
+        res[f'{wname}/thd/rss_peak'], res[f'{wname}/thd/rss_band'] = alt_thd(
+            mag, power, k, deltas['jacobsen'], range(2, ctx['orders'] + 1))
+        res[f'{wname}/amp'] = amp
+    return res
+
+def run(ctx, tones_total, batch, jobs, seed):
+    """按批切分单音并行计算, 结果按单音拼接"""
+    sizes = [min(batch, tones_total - i) for i in range(0, tones_total, batch)]
+    seeds = np.random.SeedSequence(seed).generate_state(len(sizes)).tolist()
+    work = list(zip(seeds, sizes))
+    if ctx['engine'] == 'cmodel' or jobs <= 1:
+        _init_worker(ctx)
+        parts = [run_chunk(w) for w in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(ctx,)) as pool:
+            parts = list(pool.map(run_chunk, work))
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+#=============================================================================
+# 统计
+#=============================================================================
+
+def spec_min_freq(freq, ok):
+    """最低频率 f0: 频率 ≥ f0 的单音中至少 SPEC_COVERAGE 满足指标"""
+    order = np.argsort(freq)
+    good = ok[order].astype(np.float64)
+    suffix = np.cumsum(good[::-1])[::-1] / np.arange(len(good), 0, -1)
+    bad = np.nonzero(suffix < SPEC_COVERAGE)[0]
+    if len(bad) == len(good):
+        return None
+    return float(freq[order][bad[-1] + 1 if len(bad) else 0])
+
+def freq_stats(res, windows):
+    """每个 (窗, 插值器): 误差 (bin/相对), 0.1%指标达标率和最低达标频率; 按真实分数偏移分档"""
+    f = res['freq']
+    summary, rows = [], []
+    slot = np.clip(np.digitize(res['offset'], OFFSET_BINS) - 1, 0, len(OFFSET_BINS) - 2)
+    for w in windows:
+        for name in INTERPOLATORS:
+            est = res[f'{w}/f/{name}']
+            err = (est - f) / BIN_HZ
+            rel = np.abs(est - f) / f
+            ok = rel < SPEC_REL
+            summary.append({'window': w, 'interpolator': name, 'rms_bin': float(np.sqrt(np.mean(err ** 2))),
+                            'p99_bin': float(np.percentile(np.abs(err), 99)),
+                            'max_bin': float(np.abs(err).max()), 'mean_bin': float(err.mean()),
+                            'spec_pass': float(ok.mean()), 'spec_min_hz': spec_min_freq(f, ok)})
+            for i in range(len(OFFSET_BINS) - 1):
+                sel = slot == i
+                if sel.any():
+                    e = err[sel]
+                    rows.append(f"{w},{name},{(OFFSET_BINS[i] + OFFSET_BINS[i + 1]) / 2:+.3f},"
+                                f"{np.sqrt(np.mean(e ** 2)):.5f},{e.mean():+.5f},{np.abs(e).max():.5f},{int(sel.sum())}")
+    return summary, rows
+
+def thd_stats(res, windows, min_freq):
+    """每个 (窗, THD估计器): 相对真实THD的偏差 (百分点) 和相对误差, 按真实THD分档 (只统计 ≥ min_freq 的单音)"""
+    t = np.where(res['freq'] >= min_freq, res['thd_true'], -1)
+    summary, rows = [], []
+    for w in windows:
+        for name in THD_ESTIMATORS:
+            est = res[f'{w}/thd/{name}']
+            entry = {'window': w, 'estimator': name, 'bands': []}
+            for lo, hi in zip(THD_EDGES[:-1], THD_EDGES[1:]):
+                sel = (t >= lo) & (t < hi)
+                if not sel.any():
+                    continue
+                bias = est[sel] - t[sel]
+                rel = bias / t[sel]
+                band = {'thd_lo': lo, 'thd_hi': hi, 'tones': int(sel.sum()), 'mean_bias_pp': float(bias.mean()),
+                        'rms_pp': float(np.sqrt(np.mean(bias ** 2))), 'median_rel': float(np.median(rel)),
+                        'within_10pct': float((np.abs(rel) < 0.1).mean()), 'zero': float((est[sel] == 0).mean())}
+                entry['bands'].append(band)
+                rows.append(f"{w},{name},{lo:g},{hi:g},{band['tones']},{band['mean_bias_pp']:+.4f},"
+                            f"{band['rms_pp']:.4f},{band['median_rel']:+.4f},{band['within_10pct']:.4f},{band['zero']:.4f}")
+            summary.append(entry)
+    return summary, rows
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def parse_range(text, name):
+    lo, hi = (float(v) for v in text.split(':'))
+    if lo > hi or lo < 0:
+        raise argparse.ArgumentTypeError(f"{name} 范围无效: {text}")
+    return lo, hi
+
+def main():
+    parser = argparse.ArgumentParser(description="FFT峰值插值 + 谐波/THD扫描批量模型")
+    parser.add_argument('--tones', type=int, default=4096, help="单音数 (每个单音一帧)")
+    parser.add_argument('--freq', default=f'20000:{int(FS / 2 / 9)}', help="基波频率范围 Hz (对数均匀)")
+    parser.add_argument('--thd', default='0.1:20', help="真实THD范围 %% (对数均匀), 0:0 为纯单音")
+    parser.add_argument('--thd-min-freq', type=float, default=100000,
+                        help="THD统计的最低基波频率 Hz (更低时RTL谐波搜索窗覆盖基波, 单独报告)")
+    parser.add_argument('--max-order', type=int, default=8, help="注入的最高谐波次数")
+    parser.add_argument('--orders', type=int, default=8, help="rss_peak/rss_band 统计到的谐波次数")
+    parser.add_argument('--amplitude', type=float, default=300.0, help="基波幅度 (ADC码, 满量程512)")
+    parser.add_argument('--noise', type=float, default=0.5, help="噪声RMS (ADC码)")
+    parser.add_argument('--windows', default='rect,hann,blackman-harris', help="窗函数, 逗号分隔")
+    parser.add_argument('--engine', choices=['numpy', 'cmodel'], default='numpy',
+                        help="FFT引擎: NumPy块浮点近似 (快) 或 IP的C模型 (位精确)")
+    parser.add_argument('--batch', type=int, default=256, help="每批单音数")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="进程数")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="报告输出目录")
+    args = parser.parse_args()
+
+    freq_range = parse_range(args.freq, '--freq')
+    thd_range = parse_range(args.thd, '--thd')
+    windows = [w.strip() for w in args.windows.split(',') if w.strip()]
+    if args.engine == 'cmodel':
+        try:
+            _load_cmodel()
+        except OSError as e:
+            print(f"❌ 无法加载C模型 {CMODEL_LIB}: {e}")
+            sys.exit(1)
+
+    meas = parse_measure()
+    det = parse_detector()
+    window_data = {w: make_window(w) for w in windows}
+    gain = {w: calibrate(window_data[w]) for w in windows}
+    print(f"FFT: {N}点, 分辨率 {BIN_HZ:.2f} Hz/bin, 引擎 {args.engine}")
+    print(f"signal_parameter_measure: 峰值初值 {meas['peak_init']}, 谐波 {meas['orders']} 次 ±{meas['search']} bin, "
+          f"阈值 max(基波>>{meas['thr_shift']}, {meas['thr_floor']}), THD基波门限 >{meas['thd_min']}")
+    print(f"fft_peak_detector: FREQ_RESOLUTION_Q16 = {det['freq_q16']}, 取[{det['const_bits'] - 1}:0] → "
+          f"{det['freq_q16'] & ((1 << det['const_bits']) - 1)}, 乘积{det['product_bits']}位"
+          + ("" if det['found'] else " (⚠️ 文件中未找到, 使用原设计值)"))
+    for w in windows:
+        print(f"标定 {w:<16} jk_magnitude P = {gain[w]['jk_magnitude']:.4f}, jacobsen P = {gain[w]['jacobsen']:.4f}")
+
+    ctx = {'amplitude': args.amplitude, 'max_order': args.max_order, 'orders': args.orders,
+           'thd_range': thd_range, 'freq_range': freq_range, 'noise': args.noise, 'windows': windows,
+           'window_data': window_data, 'gain': gain, 'meas': meas, 'det': det, 'idf': parse_idf(),
+           'engine': args.engine, 'jobs': args.jobs}
+    res = run(ctx, args.tones, args.batch, args.jobs, args.seed)
+    clipped = int(res['clipped'].sum())
+    print(f"\n{args.tones} 个单音, {freq_range[0]:g}~{freq_range[1]:g} Hz, THD {thd_range[0]:g}~{thd_range[1]:g}%"
+          + (f", ⚠️ {clipped} 个削波" if clipped else ""))
+
+    fsum, frows = freq_stats(res, windows)
+    print(f"\n=== 频率误差 (bin = {BIN_HZ:.2f} Hz), 指标 <{SPEC_REL:.1%}: 达标率 / 最低达标频率 ({SPEC_COVERAGE:.0%}) ===")
+    print(f"{'窗':<16}{'插值':<14}{'RMS':>9}{'P99':>9}{'最大':>9}{'均值':>10}{'达标率':>8}{'最低频率':>12}")
+    for s in fsum:
+        low = f"{s['spec_min_hz'] / 1e3:.1f}k" if s['spec_min_hz'] is not None else '无'
+        print(f"{s['window']:<16}{s['interpolator']:<14}{s['rms_bin']:>9.4f}{s['p99_bin']:>9.4f}{s['max_bin']:>9.3f}"
+              f"{s['mean_bin']:>+10.4f}{s['spec_pass']:>8.1%}{low:>12}")
+
+    tsum, trows = thd_stats(res, windows, args.thd_min_freq)
+    print(f"\n=== THD偏差 (估计值 - 真实值, 百分点) / 相对误差<10%的比例, 基波 ≥ {args.thd_min_freq / 1e3:g} kHz ===")
+    head = ''.join(f"{f'{lo:g}~{hi:g}%':>16}" for lo, hi in zip(THD_EDGES[:-1], THD_EDGES[1:]))
+    print(f"{'窗':<16}{'估计器':<10}{head}")
+    for s in tsum:
+        cells = {(b['thd_lo'], b['thd_hi']): f"{b['mean_bias_pp']:+.2f}/{b['within_10pct']:.0%}" for b in s['bands']}
+        print(f"{s['window']:<16}{s['estimator']:<10}"
+              + ''.join(f"{cells.get((lo, hi), '-'):>16}" for lo, hi in zip(THD_EDGES[:-1], THD_EDGES[1:])))
+
+    findings = []
+    for w in windows:
+        amp = res[f'{w}/amp']
+        floor = 100 * np.maximum(amp >> meas['thr_shift'], meas['thr_floor']) / np.maximum(amp, 1)
+        overlap = res[f'{w}/overlap']
+        top = float(res['freq'][overlap].max()) if overlap.any() else None
+        findings.append({'window': w, 'median_fundamental': float(np.median(amp)),
+                         'median_threshold_pct': float(np.median(floor)),
+                         'thd_untriggered': float(1 - res[f'{w}/thd_trigger'].mean()),
+                         'harmonic_window_overlap': float(overlap.mean()), 'overlap_max_freq_hz': top})
+        print(f"⚠️  {w}: 基波幅度中位数 {np.median(amp):.0f}, RTL谐波阈值约为基波的 {np.median(floor):.1f}%, "
+              f"{1 - res[f'{w}/thd_trigger'].mean():.1%} 的单音THD未触发计算, "
+              f"{overlap.mean():.1%} 的单音谐波搜索窗覆盖基波"
+              + (f" (最高 {top / 1e3:.1f} kHz, THD读数 {res[f'{w}/thd/rtl'][overlap].mean():.0f}%)" if top else ""))
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    report = {'tones': args.tones, 'engine': args.engine, 'freq_range_hz': freq_range, 'thd_range_pct': thd_range,
+              'max_order': args.max_order, 'thd_min_freq_hz': args.thd_min_freq, 'amplitude': args.amplitude, 'noise_rms': args.noise,
+              'clipped': clipped, 'bin_hz': BIN_HZ, 'spec': {'relative': SPEC_REL, 'coverage': SPEC_COVERAGE},
+              'measure': {k: v for k, v in meas.items() if k not in ('lut', 'ladder', 'small_index')},
+              'detector': det, 'calibration': gain, 'interpolators': INTERPOLATORS,
+              'thd_estimators': THD_ESTIMATORS, 'frequency': fsum, 'thd': tsum, 'rtl_threshold': findings}
+    outputs = [(os.path.join(args.output_dir, 'freq_error_vs_offset.csv'),
+                'window,interpolator,offset_bin,rms_bin,mean_bin,max_bin,tones\n' + '\n'.join(frows) + '\n'),
+               (os.path.join(args.output_dir, 'thd_bias.csv'),
+                'window,estimator,thd_lo,thd_hi,tones,mean_bias_pp,rms_pp,median_rel,within_10pct,zero\n'
+                + '\n'.join(trows) + '\n'),
+               (os.path.join(args.output_dir, 'peak_report.json'),
+                json.dumps(report, indent=2, ensure_ascii=False) + '\n')]
+    print()
+    for path, data in outputs:
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+字符ROM子集生成器
+扫描 hdmi_display_ctrl.v / auto_test.v 中实际用到的字符编码,
+生成只包含这些字符的子集ROM + 字符编码重映射表
+
+原理:
+    所有 *char_code* 信号的赋值右侧按三目运算拆成取值分支:
+        8'd70 / 8'h46 / "F"           → 常量字符
+        digit_to_ascii(x) / 8'd48 + x → '0'-'9' (BCD数字)
+        其他 *char_code* 信号          → 别名, 其取值已单独扫描
+    任何无法确定取值的分支都直接报错, 不会悄悄漏掉字符.
+    字形表 (ASCII 32-126) 之外的编码 (如 176 '°') 没有字形, 会显示为空白, 同样报错;
+    确认可以显示为空白时加 --allow-missing.
+
+输出 (以16×32为例):
+    source/ascii_rom_16x32_subset.hex      - 子集字形表, 槽位0固定为空白
+    source/ascii_rom_16x32_subset_map.hex  - 256项重映射表: char_code → 槽位号
+    source/source/ascii_rom_16x32_subset.v - 包装模块, 接口/延迟与ascii_rom_16x32_full相同
+
+用法:
+    python scripts/font_subset.py
+    python scripts/font_subset.py --extra "+-" --check-only
+    python scripts/font_subset.py --allow-missing          # 字形表之外的编码显示为空白
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+from generate_ascii_font import (ASCII_END, ASCII_START, CHAR_HEIGHT, CHAR_WIDTH, MEM_DIR,
+                                 NUM_CHARS, OUTPUT_DIR, clog2, module_name)
+from mem_image import estimate_drm, read_mem_image, write_if_changed, write_mem_image
+
+# 默认扫描的显示相关RTL
+SCAN_FILES = [
+    "source/source/hdmi_display_ctrl.v",
+    "source/source/auto_test.v",
+]
+DIGIT_CODES = list(range(ord('0'), ord('9') + 1))
+
+# 赋值语句: 左侧为任意含char_code的信号, 且位于语句开头 (排除 if (char_code <= ...) 比较)
+ASSIGN_RE = re.compile(r"(?:^|[;:)]|\bbegin\b|\belse\b)\s*(\w*char_code\w*)\s*<?=(?!=)\s*([^;]+);",
+                       re.MULTILINE)
+CONST_RE = re.compile(r"^(\d*)'([dhb])([0-9a-fA-F_]+)$")
+DIGIT_EXPR_RE = re.compile(r"^(digit_to_ascii\s*\(.*\)|8'd48\s*\+\s*.+|.+\s*\+\s*8'd48)$")
+
+class SubsetError(Exception):
+    """扫描结果无法确定或子集缺少用到的字符"""
+
+def strip_comments(text):
+    """去掉 // 与 /* */ 注释"""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    return re.sub(r"//[^\n]*", "", text)
+
+def strip_parens(expr):
+    """去掉包住整个表达式的外层括号"""
+    expr = expr.strip()
+    while expr.startswith('(') and expr.endswith(')'):
+        depth = 0
+        for i, ch in enumerate(expr):
+            depth += ch == '('
+            depth -= ch == ')'
+            if depth == 0 and i < len(expr) - 1:
+                return expr  # 第一个括号提前闭合, 不是外层括号
+        expr = expr[1:-1].strip()
+    return expr
+
+def split_ternary(expr):
+    """
+    把 cond ? a : b (可嵌套) 拆成取值分支列表 [a, b, ...]
+
+    条件部分中的常量 (如 4'd0) 不是字符编码, 不能计入.
+    """
+    expr = strip_parens(expr)
+    depth = 0
+    question = None
+    nested = 0
+    for i, ch in enumerate(expr):
+        if ch in '([{':
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+        elif depth == 0 and ch == '?':
+            if question is None:
+                question = i
+            else:
+                nested += 1
+        elif depth == 0 and ch == ':' and question is not None:
+            if nested:
+                nested -= 1
+            else:
+                return split_ternary(expr[question + 1:i]) + split_ternary(expr[i + 1:])
+    return [expr]
+
+def const_value(expr):
+    """Verilog常量或单字符字符串, 不是常量时返回None"""
+    expr = expr.replace(' ', '')
+    match = CONST_RE.match(expr)
+    if match:
+        base = {'d': 10, 'h': 16, 'b': 2}[match.group(2)]
+        return int(match.group(3).replace('_', ''), base)
+    if re.fullmatch(r'"[ -~]"', expr):
+        return ord(expr[1])
+    if expr.isdigit():
+        return int(expr)
+    return None
+
+def scan_char_codes(paths):
+    """
+    扫描RTL中所有char_code取值
+
+    返回:
+        used: {字符编码: [(文件, 行号), ...]}
+
+    异常:
+        SubsetError: 存在无法静态确定取值的赋值
+    """
+    used = {}
+    unresolved = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            text = strip_comments(f.read())
+
+        for match in ASSIGN_RE.finditer(text):
+            line = text.count('\n', 0, match.start()) + 1
+            for branch in split_ternary(match.group(2)):
+                branch = strip_parens(branch)
+                value = const_value(branch)
+                if value is not None:
+                    codes = [value]
+                elif DIGIT_EXPR_RE.match(branch):
+                    codes = DIGIT_CODES
+                elif re.fullmatch(r"\w*char_code\w*", branch):
+                    continue  # 别名信号, 其取值单独扫描
+                else:
+                    unresolved.append(f"{path}:{line}: {match.group(1)} <= {branch}")
+                    continue
+                for code in codes:
+                    used.setdefault(code, []).append((path, line))
+
+    if unresolved:
+        raise SubsetError("无法确定以下char_code赋值的取值范围:\n  " + "\n  ".join(unresolved))
+    return used
+
+def build_subset(rom, codes, height):
+    """
+    生成子集ROM与重映射表
+
+    槽位0固定为空白字形: 未使用/非法字符以及字形全空白的字符 (如空格) 都映射到0,
+    因此读取时不再需要 32-126 范围比较.
+
+    返回:
+        subset: 形状((K + 1) * height,)的子集字形表
+        code_map: 长度256的槽位号数组
+    """
+    glyphs = rom.reshape(NUM_CHARS, height)
+    codes = sorted(c for c in codes if ASCII_START <= c <= ASCII_END)
+    visible = [c for c in codes if glyphs[c - ASCII_START].any()]
+
+    subset = np.zeros((len(visible) + 1, height), dtype=rom.dtype)
+    subset[1:] = glyphs[np.array(visible, dtype=int) - ASCII_START]
+    code_map = np.zeros(256, dtype=np.uint8)
+    code_map[visible] = np.arange(1, len(visible) + 1)
+    return subset.reshape(-1), code_map
+
+def verify_subset(rom, subset, code_map, used, height):
+    """
+    一次向量化比对: 所有用到的字符 × 全部行, 子集ROM输出与完整ROM一致
+
+    返回:
+        (比对的组合数, 不一致的字符编码列表)
+    """
+    codes = np.array(sorted(used))[:, None]
+    rows = np.arange(height)[None, :]
+    valid = (codes >= ASCII_START) & (codes <= ASCII_END)
+    full_addr = np.where(valid, (codes - ASCII_START) * height + rows, 0)
+    full = np.where(valid, rom[full_addr], 0)
+    sub = subset[code_map[codes].astype(int) * height + rows]
+    bad = codes[:, 0][(full != sub).any(axis=1)]
+    return full.size, bad.tolist()
+
+def write_subset_wrapper(output_file, rom_path, map_path, width, height, slots, codes):
+    """子集ROM包装模块: 重映射表 + 子集字形表, 接口/读取延迟与完整ROM相同"""
+    name = f"ascii_rom_{width}x{height}_subset"
+    depth = slots * height
+    slot_bits = clog2(slots)
+    row_bits = clog2(height)
+    addr_bits = clog2(depth)
+    chars = ''.join(chr(c) for c in codes if ASCII_START <= c <= ASCII_END)
+    text = f"""//=============================================================================
+// 文件名: {name}.v
+// 功能: 子集ASCII字符ROM ({width}×{height}像素), 只包含显示中用到的字符
+// 字符集 ({len(chars)}个): {chars}
+// 结构: 重映射表 256×{slot_bits}位 + 子集字形表 {slots}槽×{height}行×{width}位 (槽0为空白)
+// 自动生成: font_subset.py
+// 字形数据: {rom_path}, {map_path} ($readmemh)
+//=============================================================================
+
+module {name} #(
+    parameter ROM_FILE = "{rom_path}",  // 仿真时可按工作目录覆盖
+    parameter MAP_FILE = "{map_path}"
+)(
+    input        clk,
+    input  [7:0] char_code,   // ASCII码 (未用到的字符显示空白)
+    input  [{row_bits - 1}:0] char_row,    // 字符行号 (0-{height - 1})
+    output [{width - 1}:0] char_data   // {width}位字符行数据
+);
+
+//=============================================================================
+// ROM存储器
+//=============================================================================
+reg [{slot_bits - 1}:0] code_map [0:255];              // char_code → 槽位号
+reg [{width - 1}:0] subset_rom [0:{depth - 1}];  // {slots}槽 × {height}行
+
+initial begin
+    $readmemh(MAP_FILE, code_map);
+    $readmemh(ROM_FILE, subset_rom);
+end
+
+//=============================================================================
+// ROM读取逻辑 (带流水线, 延迟与{module_name(width, height)}相同)
+// 未用到的字符已在重映射表中指向空白槽, 无需范围比较
+//=============================================================================
+reg [{width - 1}:0] char_data_reg;
+reg [{addr_bits - 1}:0] rom_addr;
+
+always @(posedge clk) begin
+    rom_addr <= code_map[char_code] * {height} + {{{addr_bits - row_bits}'d0, char_row}};
+    char_data_reg <= subset_rom[rom_addr];
+end
+
+assign char_data = char_data_reg;
+
+endmodule
+"""
+    return write_if_changed(output_file, text)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="按实际使用的字符生成子集字符ROM")
+    parser.add_argument('--scan', action='append', metavar='VFILE',
+                        help="要扫描的RTL文件, 可重复指定 (默认hdmi_display_ctrl.v与auto_test.v)")
+    parser.add_argument('--width', type=int, default=CHAR_WIDTH, help="字符宽度")
+    parser.add_argument('--height', type=int, default=CHAR_HEIGHT, help="字符高度")
+    parser.add_argument('--rom', help="完整字形表存储器映像 (默认source/ascii_rom_WxH_full.hex)")
+    parser.add_argument('--chars', help="手工指定子集字符; 缺少任何用到的字符都会报错")
+    parser.add_argument('--extra', default='', help="在扫描结果之外额外保留的字符")
+    parser.add_argument('--allow-missing', action='store_true',
+                        help="允许用到字形表 (ASCII 32-126) 之外的编码, 显示为空白 (默认报错)")
+    parser.add_argument('--check-only', action='store_true', help="只扫描和校验, 不写文件")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="Verilog输出目录")
+    parser.add_argument('--mem-dir', default=MEM_DIR, help="存储器映像输出目录")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    width, height = args.width, args.height
+    print(f"=== 字符ROM子集生成器 ({width}×{height}) ===\n")
+
+    # 1. 扫描用到的字符
+    scan_files = args.scan or SCAN_FILES
+    used = scan_char_codes(scan_files)
+    for path in scan_files:
+        print(f"  扫描: {path}")
+    out_of_range = sorted(c for c in used if not ASCII_START <= c <= ASCII_END)
+    used_chars = ''.join(chr(c) for c in sorted(used) if ASCII_START <= c <= ASCII_END)
+    print(f"  用到的字符 ({len(used_chars)}个): {used_chars}")
+    if out_of_range:
+        where = [f"  {c} ('{chr(c)}'): {used[c][0][0]}:{used[c][0][1]}" for c in out_of_range]
+        if not args.allow_missing:
+            raise SubsetError(f"以下编码超出字形表 ASCII {ASCII_START}-{ASCII_END}, 没有字形 (会显示为空白);\n"
+                              "修改显示字符, 或确认显示为空白后加 --allow-missing:\n" + "\n".join(where))
+        print(f"  ⚠️ 超出ASCII {ASCII_START}-{ASCII_END}的编码 (--allow-missing, 显示为空白):")
+        for line in where:
+            print(f"  {line}")
+
+    # 2. 确定子集, 缺少用到的字符时报错
+    if args.chars is not None:
+        subset_codes = {ord(c) for c in args.chars}
+        missing = sorted(c for c in used if c not in subset_codes
+                         and ASCII_START <= c <= ASCII_END)
+        if missing:
+            where = [f"  '{chr(c)}' ({c}): {used[c][0][0]}:{used[c][0][1]}" for c in missing]
+            raise SubsetError("子集缺少以下用到的字符:\n" + "\n".join(where))
+    else:
+        subset_codes = set(used)
+    subset_codes |= {ord(c) for c in args.extra}
+
+    # 3. 生成子集并校验
+    rom_file = args.rom or os.path.join(MEM_DIR, f"{module_name(width, height)}.hex")
+    rom = read_mem_image(rom_file)
+    if rom.size != NUM_CHARS * height:
+        raise SubsetError(f"{rom_file} 有 {rom.size} 行, 应为 {NUM_CHARS * height} 行")
+    subset, code_map = build_subset(rom, subset_codes, height)
+    slots = subset.size // height
+
+    checked, bad = verify_subset(rom, subset, code_map, used, height)
+    if bad:
+        raise SubsetError(f"子集ROM与完整ROM不一致的字符: {[chr(c) for c in bad]}")
+    print(f"  ✓ 校验通过: {checked} 个 用到的字符 × 行 组合与完整ROM一致")
+
+    full_bits = rom.size * width
+    subset_bits = subset.size * width + 256 * clog2(slots)
+    print(f"\n  完整ROM: {NUM_CHARS}字符, {full_bits} bits ({estimate_drm(rom.size, width)} DRM), "
+          f"地址 {clog2(rom.size)} 位")
+    print(f"  子集ROM: {slots - 1}字符 + 空白槽, {subset_bits} bits "
+          f"({estimate_drm(subset.size, width)} DRM + 重映射表), 地址 {clog2(subset.size)} 位")
+    if args.check_only:
+        return
+
+    # 4. 写出文件
+    name = f"ascii_rom_{width}x{height}_subset"
+    os.makedirs(args.mem_dir, exist_ok=True)
+    os.makedirs(args.output_dir, exist_ok=True)
+    sub_file = os.path.join(args.mem_dir, f"{name}.hex")
+    map_file = os.path.join(args.mem_dir, f"{name}_map.hex")
+    v_file = os.path.join(args.output_dir, f"{name}.v")
+    chars = ''.join(chr(c) for c in sorted(subset_codes) if ASCII_START <= c <= ASCII_END)
+    outputs = [
+        (sub_file, write_mem_image(subset, sub_file, 'hex', width, [
+            f"{name}: {slots} slots x {height} rows x {width} bits, slot 0 = blank",
+            f"addr = code_map[char_code] * {height} + char_row",
+            f"Generated by font_subset.py from {os.path.basename(rom_file)}"])),
+        (map_file, write_mem_image(code_map, map_file, 'hex', clog2(slots), [
+            f"{name} code map: 256 x {clog2(slots)} bits, char_code -> slot",
+            "Generated by font_subset.py"])),
+        (v_file, write_subset_wrapper(v_file, sub_file.replace(os.sep, '/'),
+                                      map_file.replace(os.sep, '/'), width, height,
+                                      slots, sorted(subset_codes))),
+    ]
+
+    print(f"\n✅ 子集ROM生成完成! 字符集: {chars}")
+    for path, written in outputs:
+        state = "已更新" if written else "未变化"
+        print(f"   文件: {path} ({os.path.getsize(path) / 1024:.1f} KB, {state})")
+    print(f"\n📝 在hdmi_display_ctrl.v中将 {module_name(width, height)} 替换为 {name} 即可,")
+    print("   修改显示字符后重新运行本脚本 (新增字符未进入子集时脚本会报错)")
+
+if __name__ == '__main__':
+    try:
+        main()
+    except SubsetError as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
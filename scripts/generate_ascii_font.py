@@ -1,20 +1,77 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-ASCII 16×32字体生成器
+ASCII 点阵字体生成器 (默认16×32)
 自动生成Verilog格式的字符ROM文件
 适用于FPGA HDMI显示项目
+
+输出模式 (--format):
+    hex     - $readmemh存储器映像 + 精简的ascii_rom_WxH_full包装模块 (默认)
+    dat     - Pango .dat初始化文件 + 包装模块 (格式同DPRAM_8192x11/init_param_hex_exmp.dat)
+    verilog - 旧版: 每行一条 rom[i] = ... 的initial块 (兼容保留)
+
+渲染方式:
+    所有字符一次性绘制到同一张画布, 转成 (N, H, W) 的NumPy数组,
+    再用一次 np.packbits 打包成行数据; 字体只加载一次.
+    因此24×48、32×64等大字体以及一次生成多个尺寸都很快.
+
+字形缓存:
+    渲染结果按 (字体文件SHA-256, 字号, 字符尺寸, 字符范围, Pillow版本)
+    缓存在 .cache/font_glyphs/ 下, 输入不变时不再重新渲染.
+    输出文件不含生成时间, 内容未变化时不重写文件,
+    避免下游综合/仿真被无意义地判定为过期.
+
+已提交的字形:
+    仓库中的16×32字形以 source/ascii_rom_16x32_full.hex 为准 (原始来源的case ROM已不在仓库),
+    用 --from-mem 从该映像重新生成包装模块/去重ROM. 渲染结果与已有映像的字形不同时
+    (例如系统字体不同) 默认拒绝覆盖, 确需替换时加 --overwrite.
+
+用法:
+    python scripts/generate_ascii_font.py --from-mem source/ascii_rom_16x32_full.hex   # 由已提交字形重新生成
+    python scripts/generate_ascii_font.py --from-mem source/ascii_rom_16x32_full.hex --check-only  # 校验去重等价性
+    python scripts/generate_ascii_font.py --overwrite    # 用字体渲染 16x32 (hdmi_display_ctrl.v 使用的字号) 并替换
+    python scripts/generate_ascii_font.py --family       # 8x16/16x32/24x48 字体族
+    python scripts/generate_ascii_font.py --font C:/Windows/Fonts/consola.ttf
+    python scripts/generate_ascii_font.py --format dat
+    python scripts/generate_ascii_font.py --size 16x32 --size 32x64
+    python scripts/generate_ascii_font.py --from-rom old_ascii_rom.v   # 复用旧ROM中的字形
+    python scripts/generate_ascii_font.py --from-mem source/ascii_rom_16x32_full.hex --dedup  # 另外生成两级去重ROM
+
+两级去重ROM (--dedup):
+    大部分字形行是空白或重复的 (空格、字符上下留白等).
+    ascii_rom_WxH_dedup 把字形表拆成 "每字符每行的行索引表" + "唯一行图案池",
+    接口 (char_code/char_row/char_data) 与读取延迟与 ascii_rom_WxH_full 相同,
+    生成后从写出的存储器映像读回, 对全部 char_code × char_row 组合一次性比对.
 """
 
+import argparse
+import hashlib
 import os
+import re
 import sys
 
+import numpy as np
+
+from mem_image import estimate_drm, read_mem_image, write_if_changed, write_mem_image
+
 # 配置参数
 CHAR_WIDTH = 16
 CHAR_HEIGHT = 32
 ASCII_START = 32
 ASCII_END = 126
-OUTPUT_FILE = "source/source/ascii_rom_16x32_full.v"
+NUM_CHARS = ASCII_END - ASCII_START + 1
+OUTPUT_DIR = "source/source"
+MEM_DIR = "source"  # 存储器映像放在source目录 (与hann_window_8192.hex一致)
+FONT_SIZE_RATIO = 0.75  # 字号 = 字符高度 × 0.75 (16×32时为24pt)
+FONT_FAMILY = [(8, 16), (16, 32), (24, 48)]  # --family 生成的字体族 (仓库只提交/使用16x32)
+CACHE_DIR = ".cache/font_glyphs"
+RENDER_VERSION = 1  # 渲染算法变化时加1, 使旧缓存失效
+
+FONT_PATHS = [
+    "C:/Windows/Fonts/consola.ttf",  # Windows Consolas
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",  # Linux
+    "/System/Library/Fonts/Monaco.dfont"  # macOS
+]
 
 # 简化版: 使用内置点阵字体数据
 # 如果需要生成真实字体,请安装 Pillow: pip install Pillow
@@ -28,159 +85,586 @@ except ImportError:
     print("⚠️ 未安装Pillow,将使用内置简化字体")
     print("   安装方法: pip install Pillow")
 
-def generate_char_bitmap_pillow(char, font):
-    """使用Pillow生成字符位图"""
-    img = Image.new('1', (CHAR_WIDTH, CHAR_HEIGHT), color=0)
+def module_name(width, height):
+    """ROM模块名 (同时用作存储器映像文件名)"""
+    return f"ascii_rom_{width}x{height}_full"
+
+def clog2(value):
+    """与Verilog $clog2一致, 最小为1位"""
+    return max(1, int(value - 1).bit_length())
+
+def render_glyphs_pillow(codes, font, width, height):
+    """
+    使用Pillow一次性渲染全部字符
+
+    每个字符占画布上一个 3H × 3W 的格子, 字形画在中间的 H × W 区域,
+    溢出部分落在格子边缘, 裁剪后与逐字符小图渲染的结果完全一致.
+
+    返回:
+        glyphs: np.bool_数组, 形状(N, height, width)
+    """
+    n = len(codes)
+    cell_h, cell_w = 3 * height, 3 * width
+    img = Image.new('1', (cell_w, n * cell_h), color=0)
     draw = ImageDraw.Draw(img)
-    
-    # 获取字符边界并居中
-    bbox = draw.textbbox((0, 0), char, font=font)
-    w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    x = (CHAR_WIDTH - w) // 2
-    y = (CHAR_HEIGHT - h) // 2 - 2
-    draw.text((x, y), char, fill=1, font=font)
-    
-    # 转换为Verilog二进制格式
-    bitmap = []
-    for y in range(CHAR_HEIGHT):
-        row = 0
-        for x in range(CHAR_WIDTH):
-            if img.getpixel((x, y)):
-                row |= (1 << (15 - x))
-        bitmap.append(f"16'b{row:016b}")
-    
-    return bitmap
-
-def generate_char_bitmap_builtin(char):
+
+    for i, code in enumerate(codes):
+        char = chr(code)
+        # 获取字符边界并居中
+        bbox = draw.textbbox((0, 0), char, font=font)
+        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        x = (width - w) // 2
+        y = (height - h) // 2 - 2
+        draw.text((width + x, i * cell_h + height + y), char, fill=1, font=font)
+
+    canvas = np.asarray(img, dtype=bool).reshape(n, cell_h, cell_w)
+    return canvas[:, height:2 * height, width:2 * width]
+
+def render_glyphs_builtin(codes, width, height):
     """使用内置简化字体(仅数字和基本符号)"""
     # 这里返回空白字符,实际项目中应该有完整的点阵数据
-    # 或者使用现有的char_rom_16x32.v中的数据
-    bitmap = [f"16'b{'0'*16}" for _ in range(CHAR_HEIGHT)]
-    
-    # 简单示例:为数字0-9生成竖线
-    ascii_code = ord(char)
-    if 48 <= ascii_code <= 57:  # 数字0-9
-        digit = ascii_code - 48
-        for row in range(8, 22):
-            bitmap[row] = "16'b0000001111000000"
-    
-    return bitmap
-
-def main():
-    print(f"=== ASCII 16×32字体ROM生成器 ===\n")
-    
-    # 加载字体
-    font = None
-    if USE_PILLOW:
-        font_paths = [
-            "C:/Windows/Fonts/consola.ttf",  # Windows Consolas
-            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",  # Linux
-            "/System/Library/Fonts/Monaco.dfont"  # macOS
-        ]
-        
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    font = ImageFont.truetype(font_path, 24)
-                    print(f"✅ 加载字体: {font_path}")
-                    break
-                except Exception as e:
-                    print(f"⚠️ 无法加载 {font_path}: {e}")
-        
-        if font is None:
-            print("⚠️ 未找到TrueType字体,使用默认字体")
-            font = ImageFont.load_default()
-    
-    # 生成Verilog文件
-    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        # 写入文件头
-        f.write("""//=============================================================================
-// 文件名: ascii_rom_16x32_full.v
-// 功能: 完整ASCII字符ROM (16×32像素)
+    glyphs = np.zeros((len(codes), height, width), dtype=bool)
+
+    # 简单示例:为数字0-9生成竖线 (16×32时为第8-21行的 0000001111000000)
+    codes = np.asarray(codes)
+    is_digit = (codes >= 48) & (codes <= 57)
+    rows = slice(height // 4, height * 22 // 32)
+    cols = slice(width * 6 // 16, width * 10 // 16)
+    glyphs[is_digit, rows, cols] = True
+
+    return glyphs
+
+def pack_glyphs(glyphs):
+    """
+    将 (N, H, W) 位图一次性打包为行数据
+
+    返回:
+        rom: 形状(N * H,)的无符号整数数组, bit[W-1]为最左像素,
+             dtype按W选择 uint8/uint16/uint32/uint64
+    """
+    n, height, width = glyphs.shape
+    if width > 64:
+        raise ValueError(f"字符宽度 {width} 超过64位")
+
+    packed = np.packbits(glyphs, axis=-1, bitorder='big')  # (N, H, ceil(W/8))
+    nbytes = packed.shape[-1]
+    shifts = np.arange(nbytes - 1, -1, -1, dtype=np.uint64) * np.uint64(8)
+    rows = np.bitwise_or.reduce(packed.astype(np.uint64) << shifts, axis=-1)
+    rows >>= np.uint64(nbytes * 8 - width)  # packbits在低位补零
+
+    dtype = np.min_scalar_type((1 << width) - 1)
+    return rows.reshape(-1).astype(dtype)
+
+def file_sha256(path):
+    """文件内容的SHA-256 (十六进制)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def find_font(font_path=None):
+    """
+    确定字体文件 (只探测一次)
+
+    返回:
+        (font_path, font_hash); 未找到TrueType字体时为 (None, 'pillow-default')
+    """
+    candidates = [font_path] if font_path else FONT_PATHS
+    for path in candidates:
+        if os.path.exists(path):
+            font_hash = file_sha256(path)
+            print(f"✅ 字体文件: {path} (sha256 {font_hash[:12]})")
+            return path, font_hash
+        if font_path:
+            raise FileNotFoundError(f"字体文件不存在: {font_path}")
+
+    print("⚠️ 未找到TrueType字体,使用默认字体")
+    return None, 'pillow-default'
+
+def load_font(font_path, point_size=24):
+    """加载TrueType字体, font_path为None时使用Pillow默认字体"""
+    if font_path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_path, point_size)
+
+def glyph_cache_key(font_hash, point_size, width, height):
+    """缓存键: 字体内容 + 字号 + 字符尺寸 + 字符范围 + 渲染器版本"""
+    import PIL
+    text = (f"{font_hash}|{point_size}pt|{width}x{height}|{ASCII_START}-{ASCII_END}"
+            f"|pillow-{PIL.__version__}|v{RENDER_VERSION}")
+    return hashlib.sha256(text.encode('ascii')).hexdigest()[:32]
+
+def render_glyphs_cached(font_path, font_hash, width, height, cache_dir):
+    """
+    渲染全部字符, 命中缓存时直接读取
+
+    缓存文件为 np.packbits 压缩后的 (N, H, ceil(W/8)) uint8 数组.
+    """
+    codes = np.arange(ASCII_START, ASCII_END + 1)
+    point_size = round(height * FONT_SIZE_RATIO)
+    cache_file = None
+    if cache_dir:
+        key = glyph_cache_key(font_hash, point_size, width, height)
+        cache_file = os.path.join(cache_dir, f"{width}x{height}_{key}.npy")
+        if os.path.exists(cache_file):
+            packed = np.load(cache_file)
+            print(f"  {width}×{height}: 命中字形缓存 {os.path.basename(cache_file)}")
+            return np.unpackbits(packed, axis=-1, count=width).astype(bool)
+
+    font = load_font(font_path, point_size)
+    glyphs = render_glyphs_pillow(codes, font, width, height)
+    print(f"  {width}×{height}: 渲染 {len(codes)} 个字符 ({point_size}pt)")
+
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = cache_file + '.tmp.npy'
+        np.save(tmp_file, np.packbits(glyphs, axis=-1))
+        os.replace(tmp_file, cache_file)  # 原子替换, 并行运行时不会读到半个文件
+    return glyphs
+
+def build_rom_table(width=CHAR_WIDTH, height=CHAR_HEIGHT, font=None, cache_dir=CACHE_DIR):
+    """
+    生成完整字形表
+
+    参数:
+        font: find_font() 的返回值 (font_path, font_hash); None表示使用内置字体
+
+    返回:
+        rom: 形状(NUM_CHARS * height,)的无符号整数数组
+             地址 = (ascii - 32) * height + row, 最高位为最左像素
+    """
+    if font is not None:
+        glyphs = render_glyphs_cached(font[0], font[1], width, height, cache_dir)
+    else:
+        codes = np.arange(ASCII_START, ASCII_END + 1)
+        glyphs = render_glyphs_builtin(codes, width, height)
+    return pack_glyphs(glyphs)
+
+def load_rom_from_verilog(path, width=CHAR_WIDTH, height=CHAR_HEIGHT):
+    """从旧版 rom[i] = W'b...; 格式的Verilog文件中提取字形表 (保持字形不变)"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        text = f.read()
+
+    pattern = rf"rom\[\s*(\d+)\]\s*=\s*{width}'b([01]{{{width}}})\s*;"
+    entries = re.findall(pattern, text)
+    if not entries:
+        raise ValueError(f"{path} 中没有找到 rom[i] = {width}'b...; 形式的ROM数据")
+
+    rom = np.zeros(NUM_CHARS * height, dtype=np.min_scalar_type((1 << width) - 1))
+    addr = np.array([int(a) for a, _ in entries])
+    if addr.max() >= rom.size:
+        raise ValueError(f"{path} 中的ROM地址 {addr.max()} 超出范围 (0-{rom.size - 1})")
+    rom[addr] = [int(bits, 2) for _, bits in entries]
+    print(f"✅ 从 {path} 读取 {len(entries)} 行字形数据")
+    return rom
+
+def load_rom_from_mem(path, width=CHAR_WIDTH, height=CHAR_HEIGHT):
+    """从平坦ROM存储器映像 (hex/dat/bin/npy, 本脚本写出的格式) 读取字形表"""
+    words = read_mem_image(path, width)
+    depth = NUM_CHARS * height
+    if len(words) != depth:
+        raise ValueError(f"{path} 有 {len(words)} 行, {width}×{height} 字形表应为 {depth} 行")
+    if len(words) and int(words.max()) >> width:
+        raise ValueError(f"{path} 中的数据超过 {width} 位")
+    print(f"✅ 从 {path} 读取 {depth} 行字形数据")
+    return words.astype(np.min_scalar_type((1 << width) - 1))
+
+def existing_glyphs(args, width, height):
+    """输出目录中已有的平坦ROM映像 (hex/dat), 返回 (路径, 字形表) 或 (None, None)"""
+    for fmt in ('hex', 'dat'):
+        path = os.path.join(args.mem_dir, f"{module_name(width, height)}.{fmt}")
+        if os.path.exists(path):
+            return path, read_mem_image(path)
+    return None, None
+
+def check_overwrite(rom, width, height, args):
+    """新字形与已有映像不同且未给 --overwrite 时报错, 避免用系统字体覆盖提交的字形"""
+    path, old = existing_glyphs(args, width, height)
+    if path is None or args.overwrite:
+        return
+    if len(old) != len(rom) or (old != rom.astype(np.uint64)).any():
+        changed = int((old != rom.astype(np.uint64)).sum()) if len(old) == len(rom) else len(rom)
+        raise SystemExit(f"❌ {width}×{height}: 新字形与 {path} 有 {changed} 行不同, 未覆盖.\n"
+                         f"   由已提交字形重新生成: --from-mem {path.replace(os.sep, '/')}; "
+                         f"确需替换为新渲染的字形: --overwrite")
+
+def check_dedup(rom, width, height, args):
+    """--check-only: 内存中去重并校验; 已有两级ROM映像时也读回校验, 返回是否全部通过"""
+    pool, index = dedup_rows(rom)
+    checked, mismatched = verify_dedup(rom.astype(np.uint64), pool.astype(np.uint64), index, height)
+    ok = mismatched == 0
+    print(f"  {width}×{height} 两级去重: 唯一行 {len(pool)}/{len(rom)}, "
+          + (f"✓ {checked} 个组合一致" if ok else f"❌ {mismatched}/{checked} 个组合不一致"))
+    name = dedup_module_name(width, height)
+    for fmt in ('hex', 'dat'):
+        index_file = os.path.join(args.mem_dir, f"{name}_index.{fmt}")
+        pool_file = os.path.join(args.mem_dir, f"{name}_pool.{fmt}")
+        if os.path.exists(index_file) and os.path.exists(pool_file):
+            checked, mismatched = verify_dedup(rom.astype(np.uint64), read_mem_image(pool_file),
+                                               read_mem_image(index_file), height)
+            print(f"    {index_file} + {pool_file}: "
+                  + (f"✓ {checked} 个组合一致" if not mismatched else f"❌ {mismatched}/{checked} 个组合不一致"))
+            ok = ok and not mismatched
+    return ok
+
+def flat_rom_comments(width, height, source):
+    """平坦ROM存储器映像的注释头"""
+    return [f"{module_name(width, height)}: ASCII {ASCII_START}-{ASCII_END}, "
+            f"{NUM_CHARS} chars x {height} rows x {width} bits",
+            f"addr = (char_code - {ASCII_START}) * {height} + char_row, "
+            f"bit{width - 1} = leftmost pixel",
+            f"Generated by generate_ascii_font.py, source: {source}"]
+
+def dedup_rows(rom):
+    """
+    两级去重: 唯一行图案池 + 行索引表
+
+    返回:
+        pool: 升序排列的唯一行图案 (全0行若存在则位于0号)
+        index: 与rom等长的行索引, pool[index] == rom
+    """
+    pool, index = np.unique(rom, return_inverse=True)
+    return pool, index.reshape(-1)
+
+def verify_dedup(rom, pool, index, height):
+    """
+    一次向量化比对两级ROM与平坦ROM
+
+    按RTL的寻址方式, 对全部 char_code(0-255) × char_row(0-2^row_bits-1) 组合
+    同时计算两种ROM的输出; 非法字符两者都输出0.
+
+    返回:
+        (比对的组合数, 不一致的组合数)
+    """
+    codes = np.arange(256)[:, None]
+    rows = np.arange(1 << clog2(height))[None, :]
+    valid = (codes >= ASCII_START) & (codes <= ASCII_END)
+    addr = (codes - ASCII_START) * height + rows
+    # char_row超出字符高度时地址落入下一个字符 (两种ROM相同), 末字符越界部分不比较
+    checked = ~valid | (addr < rom.size)
+    addr = np.where(valid & checked, addr, 0)
+
+    flat = np.where(valid, rom[addr], 0)
+    two_level = np.where(valid, pool[index[addr]], 0)
+    mismatch = (flat != two_level) & checked
+    return int(checked.sum()), int(mismatch.sum())
+
+def dedup_module_name(width, height):
+    """两级去重ROM模块名"""
+    return f"ascii_rom_{width}x{height}_dedup"
+
+def verilog_header(width, height, source, mem_path=None):
+    """Verilog文件头注释 (不含生成时间, 保证相同输入得到相同输出)"""
+    data = f"\n// 字形数据: {mem_path} ($readmemh)" if mem_path else ""
+    return f"""//=============================================================================
+// 文件名: {module_name(width, height)}.v
+// 功能: 完整ASCII字符ROM ({width}×{height}像素)
 // 字符范围: ASCII 32-126 (空格到~,共95个字符)
-// 自动生成: generate_ascii_font.py
-// 生成时间: """ + __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """
+// 自动生成: generate_ascii_font.py{data}
+// 字形来源: {source}
 //=============================================================================
+"""
 
-module ascii_rom_16x32_full (
-    input        clk,
+def module_ports(width, height):
+    """端口声明 (16×32时与hdmi_display_ctrl.v中的实例完全兼容)"""
+    row_bits = clog2(height)
+    return f"""    input        clk,
     input  [7:0] char_code,   // ASCII码 (32-126有效)
-    input  [4:0] char_row,    // 字符行号 (0-31)
-    output [15:0] char_data   // 16位字符行数据
+    input  [{row_bits - 1}:0] char_row,    // 字符行号 (0-{height - 1})
+    output [{width - 1}:0] char_data   // {width}位字符行数据
 );
+"""
+
+def read_logic(width, height):
+    """ROM读取逻辑 (带流水线), 16×32时与旧版逐字相同"""
+    depth = NUM_CHARS * height
+    addr_bits = clog2(depth)
+    row_bits = clog2(height)
+    return f"""
+//=============================================================================
+// ROM读取逻辑 (带流水线)
+//=============================================================================
+reg [{width - 1}:0] char_data_reg;
+reg [{addr_bits - 1}:0] rom_addr;
+
+always @(posedge clk) begin
+    // 计算地址: (char_code - 32) * {height} + char_row
+    if (char_code >= 32 && char_code <= 126) begin
+        rom_addr <= (char_code - 32) * {height} + {{{addr_bits - row_bits}'d0, char_row}};
+        char_data_reg <= rom[rom_addr];
+    end else begin
+        char_data_reg <= {width}'h0000;  // 非法字符显示空白
+    end
+end
+
+assign char_data = char_data_reg;
+
+endmodule
+"""
+
+def write_flat_verilog(rom, output_file, width, height, source):
+    """旧版输出: 每行一条 rom[addr] = W'b...; 赋值"""
+    depth = NUM_CHARS * height
+    lines = [verilog_header(width, height, source),
+             f"\nmodule {module_name(width, height)} (\n",
+             module_ports(width, height),
+             f"""
+//=============================================================================
+// ROM存储器: 95个字符 × {height}行 = {depth}行数据
+//=============================================================================
+reg [{width - 1}:0] rom [0:{depth - 1}];
+
+initial begin
+"""]
+
+    glyphs = rom.reshape(NUM_CHARS, height)
+    for index, ascii_code in enumerate(range(ASCII_START, ASCII_END + 1)):
+        char = chr(ascii_code)
 
+        # 转义特殊字符用于注释
+        char_repr = repr(char) if char.isprintable() else f"0x{ascii_code:02X}"
+        lines.append(f"\n    // ASCII {ascii_code} ({index}): {char_repr}\n")
+
+        # 写入ROM数据
+        base = index * height
+        lines.extend(f"    rom[{base + row:4d}] = {width}'b{val:0{width}b};\n"
+                     for row, val in enumerate(glyphs[index].tolist()))
+
+    lines.append("\nend\n")
+    lines.append(read_logic(width, height))
+
+    return write_if_changed(output_file, ''.join(lines))
+
+def write_rom_wrapper(output_file, mem_path, width, height, source):
+    """精简包装模块: 通过$readmemh加载字形表, 接口与读取时序与旧版完全一致"""
+    depth = NUM_CHARS * height
+    text = (verilog_header(width, height, source, mem_path)
+            + f"""
+module {module_name(width, height)} #(
+    parameter INIT_FILE = "{mem_path}"  // 仿真时可按工作目录覆盖
+)(
+"""
+            + module_ports(width, height)
+            + f"""
 //=============================================================================
-// ROM存储器: 95个字符 × 32行 = 3040行数据
+// ROM存储器: 95个字符 × {height}行 = {depth}行数据 (由存储器映像初始化)
 //=============================================================================
-reg [15:0] rom [0:3039];
+reg [{width - 1}:0] rom [0:{depth - 1}];
 
 initial begin
-""")
-        
-        # 生成每个字符
-        char_count = 0
-        for ascii_code in range(ASCII_START, ASCII_END + 1):
-            char = chr(ascii_code)
-            index = ascii_code - ASCII_START
-            
-            # 转义特殊字符用于注释
-            char_repr = repr(char) if char.isprintable() else f"0x{ascii_code:02X}"
-            f.write(f"\n    // ASCII {ascii_code} ({index}): {char_repr}\n")
-            
-            # 生成位图
-            if USE_PILLOW and font:
-                bitmap = generate_char_bitmap_pillow(char, font)
-            else:
-                bitmap = generate_char_bitmap_builtin(char)
-            
-            # 写入ROM数据
-            for row_num, row_data in enumerate(bitmap):
-                addr = index * 32 + row_num
-                f.write(f"    rom[{addr:4d}] = {row_data};\n")
-            
-            char_count += 1
-            if char_count % 10 == 0:
-                print(f"  生成进度: {char_count}/{ASCII_END - ASCII_START + 1} 字符...")
-        
-        # 写入读取逻辑
-        f.write("""
+    $readmemh(INIT_FILE, rom);
 end
+"""
+            + read_logic(width, height))
+    return write_if_changed(output_file, text)
 
+def write_dedup_wrapper(output_file, index_path, pool_path, width, height,
+                        index_bits, pool_size, source):
+    """两级去重ROM包装模块: 行索引表 + 行图案池, 接口与读取延迟与平坦ROM相同"""
+    depth = NUM_CHARS * height
+    addr_bits = clog2(depth)
+    row_bits = clog2(height)
+    name = dedup_module_name(width, height)
+    text = f"""//=============================================================================
+// 文件名: {name}.v
+// 功能: 两级去重ASCII字符ROM ({width}×{height}像素)
+// 字符范围: ASCII 32-126 (空格到~,共95个字符)
+// 结构: 行索引表 {depth}×{index_bits}位 + 唯一行图案池 {pool_size}×{width}位
+// 自动生成: generate_ascii_font.py --dedup
+// 字形数据: {index_path}, {pool_path} ($readmemh)
+// 字形来源: {source}
 //=============================================================================
-// ROM读取逻辑 (带流水线)
+
+module {name} #(
+    parameter INDEX_FILE = "{index_path}",  // 仿真时可按工作目录覆盖
+    parameter POOL_FILE  = "{pool_path}"
+)(
+""" + module_ports(width, height) + f"""
+//=============================================================================
+// 两级ROM存储器
+//=============================================================================
+reg [{index_bits - 1}:0] index_rom [0:{depth - 1}];  // 每字符每行 → 行图案编号
+reg [{width - 1}:0] row_pool  [0:{pool_size - 1}];  // 唯一行图案
+
+initial begin
+    $readmemh(INDEX_FILE, index_rom);
+    $readmemh(POOL_FILE, row_pool);
+end
+
+//=============================================================================
+// ROM读取逻辑 (两级流水, 延迟与{module_name(width, height)}相同)
 //=============================================================================
-reg [15:0] char_data_reg;
-reg [11:0] rom_addr;
+reg [{width - 1}:0] char_data_reg;
+reg [{index_bits - 1}:0] row_index;
 
 always @(posedge clk) begin
-    // 计算地址: (char_code - 32) * 32 + char_row
+    // 第1级: row_index = index_rom[(char_code - 32) * {height} + char_row]
+    // 第2级: char_data = row_pool[row_index]
     if (char_code >= 32 && char_code <= 126) begin
-        rom_addr <= (char_code - 32) * 32 + {7'd0, char_row};
-        char_data_reg <= rom[rom_addr];
+        row_index <= index_rom[(char_code - 32) * {height} + {{{addr_bits - row_bits}'d0, char_row}}];
+        char_data_reg <= row_pool[row_index];
     end else begin
-        char_data_reg <= 16'h0000;  // 非法字符显示空白
+        char_data_reg <= {width}'h0000;  // 非法字符显示空白
     end
 end
 
 assign char_data = char_data_reg;
 
 endmodule
-""")
-    
+"""
+    return write_if_changed(output_file, text)
+
+def generate_dedup_rom(rom, width, height, args, source):
+    """生成两级去重ROM, 从写出的映像读回并与平坦ROM比对, 返回 [(文件, 是否重写), ...]"""
+    name = dedup_module_name(width, height)
+    depth = NUM_CHARS * height
+    pool, index = dedup_rows(rom)
+    index_bits = clog2(len(pool))
+
+    index_file = os.path.join(args.mem_dir, f"{name}_index.{args.format}")
+    pool_file = os.path.join(args.mem_dir, f"{name}_pool.{args.format}")
+    output_file = os.path.join(args.output_dir, f"{name}.v")
+    outputs = [
+        (index_file, write_mem_image(index, index_file, args.format, index_bits, [
+            f"{name} row index: {depth} x {index_bits} bits",
+            f"addr = (char_code - {ASCII_START}) * {height} + char_row, data = row_pool address",
+            f"Generated by generate_ascii_font.py --dedup, source: {source}"])),
+        (pool_file, write_mem_image(pool, pool_file, args.format, width, [
+            f"{name} row pool: {len(pool)} unique rows x {width} bits",
+            f"bit{width - 1} = leftmost pixel",
+            f"Generated by generate_ascii_font.py --dedup, source: {source}"])),
+        (output_file, write_dedup_wrapper(output_file, index_file.replace(os.sep, '/'),
+                                          pool_file.replace(os.sep, '/'), width, height,
+                                          index_bits, len(pool), source)),
+    ]
+
+    # 从文件读回, 校验的是实际交付的映像而不是内存中的数组
+    checked, mismatched = verify_dedup(rom.astype(np.uint64), read_mem_image(pool_file),
+                                       read_mem_image(index_file), height)
+    if mismatched:
+        raise RuntimeError(f"{name}: {mismatched}/{checked} 个查找结果与平坦ROM不一致")
+
+    flat_bits = depth * width
+    dedup_bits = depth * index_bits + len(pool) * width
+    print(f"  {width}×{height} 两级去重: 唯一行 {len(pool)}/{depth}, 索引 {index_bits} 位")
+    print(f"    平坦ROM: {flat_bits} bits ({estimate_drm(depth, width)} DRM)")
+    print(f"    两级ROM: {dedup_bits} bits ({estimate_drm(depth, index_bits)} + "
+          f"{estimate_drm(len(pool), width)} DRM), 节省 {100 * (1 - dedup_bits / flat_bits):.1f}%")
+    print(f"    ✓ 等价性校验通过: {checked} 个 char_code × char_row 组合")
+    return outputs
+
+def parse_size(text):
+    """解析 "16x32" 形式的字符尺寸"""
+    match = re.fullmatch(r"(\d+)[xX×](\d+)", text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"字符尺寸格式应为 WxH, 例如 16x32: {text}")
+    return int(match.group(1)), int(match.group(2))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="ASCII点阵字体ROM生成器")
+    parser.add_argument('--format', choices=['hex', 'dat', 'verilog'], default='hex',
+                        help="输出格式 (默认hex: 存储器映像 + 包装模块)")
+    parser.add_argument('--size', type=parse_size, action='append', metavar='WxH',
+                        help="字符尺寸, 可重复指定以一次生成多个尺寸 (默认16x32)")
+    parser.add_argument('--family', action='store_true', help="生成 8x16/16x32/24x48 字体族 (代替 --size)")
+    parser.add_argument('--font', metavar='TTF', help="TrueType字体文件 (默认按系统探测)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="字形缓存目录")
+    parser.add_argument('--no-cache', action='store_true', help="不读写字形缓存")
+    parser.add_argument('--from-rom', metavar='VFILE',
+                        help="从旧版Verilog ROM文件 (rom[i] = W'b...) 提取字形, 不重新渲染 (仅单一尺寸)")
+    parser.add_argument('--from-mem', metavar='IMAGE',
+                        help="从平坦ROM存储器映像 (如 source/ascii_rom_16x32_full.hex) 读取字形 (仅单一尺寸)")
+    parser.add_argument('--overwrite', action='store_true',
+                        help="允许新字形覆盖输出目录中已有的不同字形映像")
+    parser.add_argument('--check-only', action='store_true',
+                        help="只校验两级去重与平坦ROM等价 (含已有的去重映像), 不写文件")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="Verilog输出目录")
+    parser.add_argument('--mem-dir', default=MEM_DIR, help="存储器映像输出目录")
+    parser.add_argument('--dedup', action='store_true',
+                        help="另外生成两级去重ROM (ascii_rom_WxH_dedup) 并校验等价性")
+    args = parser.parse_args(argv)
+    if args.dedup and args.format == 'verilog':
+        parser.error("--dedup 需要存储器映像输出 (--format hex 或 dat)")
+    if args.family and args.size:
+        parser.error("--family 与 --size 不能同时使用")
+    if args.size is None:
+        args.size = list(FONT_FAMILY) if args.family else [(CHAR_WIDTH, CHAR_HEIGHT)]
+    if args.from_rom and args.from_mem:
+        parser.error("--from-rom 与 --from-mem 不能同时使用")
+    if (args.from_rom or args.from_mem) and len(args.size) != 1:
+        parser.error("--from-rom/--from-mem 只能配合一个 --size 使用")
+    return args
+
+def generate_rom(rom, width, height, args, source):
+    """按输出格式写出一个尺寸的ROM, 返回 [(文件, 是否重写), ...]"""
+    name = module_name(width, height)
+    output_file = os.path.join(args.output_dir, f"{name}.v")
+    check_overwrite(rom, width, height, args)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    if args.format == 'verilog':
+        return [(output_file, write_flat_verilog(rom, output_file, width, height, source))]
+
+    os.makedirs(args.mem_dir, exist_ok=True)
+    mem_file = os.path.join(args.mem_dir, f"{name}.{args.format}")
+    mem_path = mem_file.replace(os.sep, '/')
+    outputs = [(mem_file, write_mem_image(rom, mem_file, args.format, width,
+                                          flat_rom_comments(width, height, source))),
+               (output_file, write_rom_wrapper(output_file, mem_path, width, height, source))]
+    if args.dedup:
+        outputs += generate_dedup_rom(rom, width, height, args, source)
+    return outputs
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"=== ASCII点阵字体ROM生成器 ===\n")
+
+    # 字体只探测一次, 所有尺寸共用
+    font = None
+    if args.from_rom:
+        source = os.path.basename(args.from_rom)
+    elif args.from_mem:
+        source = args.from_mem.replace(os.sep, '/')
+    elif USE_PILLOW:
+        font = find_font(args.font)
+        name = os.path.basename(font[0]) if font[0] else 'Pillow default'
+        source = f"{name} (sha256 {font[1][:16]})"
+    else:
+        source = "builtin"
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    outputs = []
+    ok = True
+    for width, height in args.size:
+        # 生成字形表
+        if args.from_rom:
+            rom = load_rom_from_verilog(args.from_rom, width, height)
+        elif args.from_mem:
+            rom = load_rom_from_mem(args.from_mem, width, height)
+        else:
+            rom = build_rom_table(width, height, font, cache_dir)
+
+        if args.check_only:
+            ok = check_dedup(rom, width, height, args) and ok
+        else:
+            outputs += generate_rom(rom, width, height, args, source)
+
+    if args.check_only:
+        sys.exit(0 if ok else 1)
+
     # 生成完成
-    file_size = os.path.getsize(OUTPUT_FILE)
     print(f"\n✅ 字体ROM生成完成!")
-    print(f"   文件: {OUTPUT_FILE}")
-    print(f"   字符数: {ASCII_END - ASCII_START + 1}")
-    print(f"   文件大小: {file_size / 1024:.1f} KB")
-    print(f"   ROM容量: {(ASCII_END - ASCII_START + 1) * 32 * 2} 字节 (~{(ASCII_END - ASCII_START + 1) * 32 * 2 / 1024:.1f}KB)")
+    for path, written in outputs:
+        state = "已更新" if written else "未变化"
+        print(f"   文件: {path} ({os.path.getsize(path) / 1024:.1f} KB, {state})")
     print("\n📝 后续步骤:")
     print("   1. 在hdmi_display_ctrl.v中将char_rom_16x32替换为ascii_rom_16x32_full")
     print("   2. 将char_code改为8位: reg [7:0] char_code;")
     print("   3. 使用ASCII码: char_code = 8'd70; // 'F'")
     print("   4. 或使用字符常量: char_code = \"F\"; ")
+    if args.format != 'verilog':
+        print(f"   5. 确保 {args.mem_dir}/ 下的存储器映像与工程一同加入编译/仿真 (路径相对工程根目录)")
 
 if __name__ == '__main__':
     main()
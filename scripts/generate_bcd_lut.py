@@ -1,130 +1,374 @@
-# BCD查找表生成脚本
+# BCD查找表编译器 - 由声明式表定义生成 bcd_lut.v
 # 为自动测试参数生成预计算的BCD数值
 # 解决HDMI域除法运算导致的时序违例
+#
+# 每张表只需给出: 输入取值范围、分段量化步进、BCD位数与小数点位置.
+# 编译器用NumPy生成整张ROM, 搜索最窄的乘法移位常量代替除法求地址,
+# 穷举全部输入验证显示值与精确十进制值一致, 再按估算的LUT代价
+# 选择 case编码 (分布式逻辑) 或 DRM推断数组 ($readmemh初始化).
+#
+# 用法:
+#   python scripts/generate_bcd_lut.py                     # 重新生成 source/source/bcd_lut.v
+#   python scripts/generate_bcd_lut.py --check-only        # 只验证并打印资源估算
+#   python scripts/generate_bcd_lut.py --encoding case     # 强制全部使用case编码
 
-def freq_to_bcd(freq_hz):
-    """将频率(Hz)转换为6位BCD"""
-    digits = []
-    for i in range(6):
-        digits.append(freq_hz % 10)
-        freq_hz //= 10
-    return digits[::-1]  # 反转为高位在前
-
-def amp_to_bcd(amp_mv):
-    """将幅度(mV)转换为4位BCD (显示为X.XXXv)"""
-    digits = []
-    for i in range(4):
-        digits.append(amp_mv % 10)
-        amp_mv //= 10
-    return digits[::-1]
-
-def duty_to_bcd(duty_x10):
-    """将占空比(0-1000 = 0-100.0%)转换为4位BCD"""
-    digits = []
-    for i in range(4):
-        digits.append(duty_x10 % 10)
-        duty_x10 //= 10
-    return digits[::-1]
-
-def generate_freq_lut():
-    """生成频率BCD查找表（100Hz步进，0-500kHz）"""
-    print("//=============================================================================")
-    print("// 频率BCD查找表 (100Hz步进，覆盖0-500kHz)")
-    print("// 输入: freq_in[31:0] (Hz)")
-    print("// 输出: freq_bcd[23:0] = {d5[3:0], d4[3:0], d3[3:0], d2[3:0], d1[3:0], d0[3:0]}")
-    print("//=============================================================================")
-    print("always @(*) begin")
-    print("    case (freq_in[31:0])")
-    
-    # 生成关键点（每100Hz一个条目，但只生成常用范围）
-    # 0-1kHz: 每100Hz
-    for freq in range(0, 1100, 100):
-        bcd = freq_to_bcd(freq)
-        bcd_hex = ''.join([f'{d:x}' for d in bcd])
-        print(f"        32'd{freq}: freq_bcd = 24'h{bcd_hex};  // {freq} Hz")
-    
-    # 1kHz-10kHz: 每1kHz
-    for freq in range(1000, 11000, 1000):
-        if freq % 100 != 0:  # 跳过已生成的
-            bcd = freq_to_bcd(freq)
-            bcd_hex = ''.join([f'{d:x}' for d in bcd])
-            print(f"        32'd{freq}: freq_bcd = 24'h{bcd_hex};  // {freq/1000:.1f} kHz")
-    
-    # 10kHz-100kHz: 每10kHz
-    for freq in range(10000, 110000, 10000):
-        if freq % 1000 != 0:
-            bcd = freq_to_bcd(freq)
-            bcd_hex = ''.join([f'{d:x}' for d in bcd])
-            print(f"        32'd{freq}: freq_bcd = 24'h{bcd_hex};  // {freq/1000:.0f} kHz")
-    
-    # 100kHz-500kHz: 每100kHz
-    for freq in range(100000, 510000, 100000):
-        if freq % 10000 != 0:
-            bcd = freq_to_bcd(freq)
-            bcd_hex = ''.join([f'{d:x}' for d in bcd])
-            print(f"        32'd{freq}: freq_bcd = 24'h{bcd_hex};  // {freq/1000:.0f} kHz")
-    
-    print("        default: freq_bcd = 24'h000000;  // 未定义频率，显示0")
-    print("    endcase")
-    print("end\n")
-
-def generate_amp_lut():
-    """生成幅度BCD查找表（10mV步进，0-5V）"""
-    print("//=============================================================================")
-    print("// 幅度BCD查找表 (10mV步进，覆盖0-5000mV)")
-    print("// 输入: amp_in[15:0] (mV)")
-    print("// 输出: amp_bcd[15:0] = {d3[3:0], d2[3:0], d1[3:0], d0[3:0]}")
-    print("// 显示格式: d3.d2d1d0 V (例如 3.145V)")
-    print("//=============================================================================")
-    print("always @(*) begin")
-    print("    case (amp_in[15:0])")
-    
-    # 每100mV生成一个条目（精度足够）
-    for amp_mv in range(0, 5100, 100):
-        bcd = amp_to_bcd(amp_mv)
-        bcd_hex = ''.join([f'{d:x}' for d in bcd])
-        print(f"        16'd{amp_mv}: amp_bcd = 16'h{bcd_hex};  // {amp_mv/1000:.1f}V")
-    
-    print("        default: amp_bcd = 16'h0000;")
-    print("    endcase")
-    print("end\n")
-
-def generate_duty_lut():
-    """生成占空比/THD BCD查找表（0.1%步进，0-100%）"""
-    print("//=============================================================================")
-    print("// 占空比/THD BCD查找表 (0.1%步进，覆盖0-100.0%)")
-    print("// 输入: duty_in[15:0] (0-1000 = 0-100.0%)")
-    print("// 输出: duty_bcd[15:0] = {d3[3:0], d2[3:0], d1[3:0], d0[3:0]}")
-    print("// 显示格式: d2d1.d0 % (例如 50.5%)")
-    print("//=============================================================================")
-    print("always @(*) begin")
-    print("    case (duty_in[15:0])")
-    
-    # 每10生成一个条目（对应1%）
-    for duty_x10 in range(0, 1010, 10):
-        bcd = duty_to_bcd(duty_x10)
-        bcd_hex = ''.join([f'{d:x}' for d in bcd])
-        print(f"        16'd{duty_x10}: duty_bcd = 16'h{bcd_hex};  // {duty_x10/10:.1f}%")
-    
-    print("        default: duty_bcd = 16'h0000;")
-    print("    endcase")
-    print("end\n")
-
-if __name__ == "__main__":
-    print("// 生成的BCD查找表代码")
-    print("// 粘贴到bcd_lut.v模块中\n")
-    
-    generate_freq_lut()
-    generate_amp_lut()
-    generate_duty_lut()
-    
-    # 统计资源使用
-    freq_entries = 10 + 10 + 10 + 5  # 粗略估计
-    amp_entries = 51
-    duty_entries = 101
-    
-    print(f"// 资源估算:")
-    print(f"// 频率LUT: ~{freq_entries}条 × 24位 = {freq_entries * 24} bits")
-    print(f"// 幅度LUT: {amp_entries}条 × 16位 = {amp_entries * 16} bits")
-    print(f"// 占空比LUT: {duty_entries}条 × 16位 = {duty_entries * 16} bits")
-    print(f"// 总计: ~{freq_entries*24 + amp_entries*16 + duty_entries*16} bits = {(freq_entries*24 + amp_entries*16 + duty_entries*16)//8} bytes")
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from mem_image import estimate_drm, write_if_changed, write_mem_image
+
+OUTPUT_FILE = "source/source/bcd_lut.v"
+MEM_DIR = "source"
+MAX_SHIFT = 40       # 常量搜索的最大右移位数
+DRM_LUT_EQUIV = 128  # 一个DRM折合的LUT数, 用于case/数组二选一 (可用--drm-lut-equiv调整)
+
+# 表定义: segments为 (下限, 上限(不含), 步进), 按步进截断显示; 超出上限的输入饱和到最大值
+TABLES = [
+    {'name': 'freq', 'input': 'freq_in', 'in_width': 32, 'digits': 6, 'point': 0, 'unit': 'Hz',
+     'desc': '频率 0-500kHz (0-9.9kHz 100Hz步进, 10-109kHz 1kHz步进, 110-500kHz 10kHz步进)',
+     'segments': [(0, 10000, 100), (10000, 110000, 1000), (110000, 500001, 10000)]},
+    {'name': 'amp', 'input': 'amp_in', 'in_width': 16, 'digits': 4, 'point': 3, 'unit': 'V',
+     'desc': '幅度 0-5000mV (10mV步进), 显示 X.XXX V',
+     'segments': [(0, 5001, 10)]},
+    {'name': 'duty', 'input': 'duty_in', 'in_width': 16, 'digits': 4, 'point': 1, 'unit': '%',
+     'desc': '占空比/THD 0-1000 = 0-100.0% (0.1%步进), 显示 XXX.X %',
+     'segments': [(0, 1001, 1)]},
+]
+
+#=============================================================================
+# 表生成
+#=============================================================================
+def bcd_encode(values, digits):
+    """整数 → BCD (向量化), 最低位数字在最低4位"""
+    values = np.asarray(values, dtype=np.int64)
+    return sum(((values // 10 ** i) % 10) << (4 * i) for i in range(digits))
+
+def bcd_decode(bcd, digits):
+    """BCD → 整数 (向量化)"""
+    bcd = np.asarray(bcd, dtype=np.int64)
+    return sum(((bcd >> (4 * i)) & 0xF) * 10 ** i for i in range(digits))
+
+def clog2(value):
+    """ceil(log2(value)), 至少1位"""
+    return max(1, (value - 1).bit_length())
+
+def max_value(table):
+    return table['segments'][-1][1] - 1
+
+def build_table(table):
+    """
+    生成一张表
+
+    返回:
+        (values, rom): 每个条目对应的显示值与BCD编码
+    """
+    values = []
+    for lo, hi, step in table['segments']:
+        if lo % step:
+            raise ValueError(f"{table['name']}: 分段下限 {lo} 不是步进 {step} 的整数倍")
+        values.append(np.arange(lo, hi, step, dtype=np.int64))
+    values = np.concatenate(values)
+    if values.max() >= 10 ** table['digits']:
+        raise ValueError(f"{table['name']}: {values.max()} 超出 {table['digits']} 位BCD")
+    return values, bcd_encode(values, table['digits'])
+
+def expected_display(table, x):
+    """输入按所在分段的步进截断后的精确值"""
+    x = np.minimum(x, max_value(table))
+    step = np.select([x < hi for _, hi, _ in table['segments']],
+                     [st for _, _, st in table['segments']])
+    return x // step * step
+
+#=============================================================================
+# 地址计算: 乘法移位代替除法
+#=============================================================================
+def search_div_constant(divisor, lo, hi):
+    """
+    搜索 x // divisor 的最窄乘法移位实现: ((x >> pre) * mult) >> shift
+
+    对 lo..hi 的全部x逐一比对 (向量化). divisor含因子2^k时可先右移pre位缩窄乘法器输入.
+    代价 = 输入位宽 × 常量位宽 (乘法器面积), 相同时取移位少的.
+
+    返回:
+        dict(pre, mult, shift, in_bits, mult_bits, product_bits)
+    """
+    x = np.arange(lo, hi + 1, dtype=np.int64)
+    q = x // divisor
+    twos = (divisor & -divisor).bit_length() - 1
+    best = None
+    for pre in range(twos + 1):
+        xs = x >> pre
+        d = divisor >> pre
+        for shift in range(MAX_SHIFT + 1):
+            base = (1 << shift) // d
+            mult = next((m for m in (base, base + 1)
+                         if m and np.array_equal((xs * m) >> shift, q)), None)
+            if mult is None:
+                continue
+            in_bits = int(hi >> pre).bit_length()
+            cand = {'pre': pre, 'mult': mult, 'shift': shift, 'in_bits': in_bits,
+                    'mult_bits': mult.bit_length(),
+                    'product_bits': int((hi >> pre) * mult).bit_length()}
+            key = (in_bits * cand['mult_bits'], shift)
+            if best is None or key < (best['in_bits'] * best['mult_bits'], best['shift']):
+                best = cand
+            break  # 移位再大常量只会更宽
+    if best is None:
+        raise RuntimeError(f"x/{divisor} 在 {lo}-{hi} 上找不到 {MAX_SHIFT} 位以内的乘法移位常量")
+    return best
+
+def address_plan(table):
+    """
+    每个分段的地址计算方案
+
+    返回:
+        列表, 每项 dict(lo, hi, step, offset, src_bits, div): addr = offset + x / step
+        div为None表示步进为1, 直接用输入作地址
+    """
+    plan, base = [], 0
+    for lo, hi, step in table['segments']:
+        plan.append({'lo': lo, 'hi': hi, 'step': step, 'offset': base - lo // step,
+                     'src_bits': int(hi - 1).bit_length(),
+                     'div': None if step == 1 else search_div_constant(step, lo, hi - 1)})
+        base += len(range(lo, hi, step))
+    return plan
+
+def address_model(table, plan, x):
+    """生成的RTL地址逻辑的位精确模型"""
+    addr_bits = clog2(sum(len(range(lo, hi, st)) for lo, hi, st in table['segments']))
+    sat = np.minimum(x, max_value(table))
+    addr = np.zeros_like(x)
+    for seg in reversed(plan):
+        field = sat & ((1 << seg['src_bits']) - 1)
+        c = seg['div']
+        if c is not None:
+            field = (((field >> c['pre']) * c['mult'])
+                     & ((1 << c['product_bits']) - 1)) >> c['shift']
+        addr = np.where(sat < seg['hi'], (seg['offset'] + field) & ((1 << addr_bits) - 1), addr)
+    return addr
+
+def verify_table(table, plan, rom):
+    """
+    穷举 0 ~ 最大值+1 的全部输入 (含饱和), 比较查表显示值与精确值
+
+    返回:
+        (输入个数, 错误个数, 首个错误输入)
+    """
+    x = np.arange(max_value(table) + 2, dtype=np.int64)
+    addr = address_model(table, plan, x)
+    valid = addr < len(rom)
+    shown = np.where(valid, bcd_decode(rom[np.minimum(addr, len(rom) - 1)], table['digits']), -1)
+    bad = shown != expected_display(table, x)
+    return len(x), int(bad.sum()), (int(x[bad][0]) if bad.any() else None)
+
+#=============================================================================
+# 编码选择
+#=============================================================================
+def estimate_case_luts(rom, addr_bits):
+    """
+    case编码的LUT6估算
+
+    每个非常量输出位是addr_bits输入的函数: ceil(深度/64)个LUT6叶子 + 4选1复用树.
+    """
+    bits = int(rom.max()).bit_length()
+    columns = (rom[:, None] >> np.arange(bits)) & 1
+    varying = int((columns.min(axis=0) != columns.max(axis=0)).sum())
+    leaves = -(-len(rom) // 64) if addr_bits > 6 else 1
+    return varying * (leaves + -(-(leaves - 1) // 3))
+
+def choose_encoding(table, rom, force, drm_lut_equiv):
+    """返回 (编码, case的LUT估算, 数组的DRM块数)"""
+    addr_bits = clog2(len(rom))
+    luts = estimate_case_luts(rom, addr_bits)
+    drm = estimate_drm(1 << addr_bits, 4 * table['digits'])
+    if force != 'auto':
+        return force, luts, drm
+    return ('case' if luts <= drm * drm_lut_equiv else 'array'), luts, drm
+
+#=============================================================================
+# Verilog生成
+#=============================================================================
+def format_value(table, value):
+    """条目注释: 按小数点位置显示"""
+    point = table['point']
+    text = str(value) if point == 0 else f"{value / 10 ** point:.{point}f}"
+    return f"{text} {table['unit']}"
+
+def address_verilog(table, plan):
+    """地址计算逻辑 (只有乘法、位切片和比较)"""
+    name, src = table['name'], table['input']
+    top = max_value(table)
+    sat_bits = top.bit_length()
+    addr_bits = clog2(sum(len(range(s['lo'], s['hi'], s['step'])) for s in plan))
+    lines = [
+        f"wire [{sat_bits - 1}:0] {name}_sat = ({src} > {table['in_width']}'d{top}) ? "
+        f"{sat_bits}'d{top} : {src}[{sat_bits - 1}:0];  // 超范围显示最大值",
+    ]
+    terms = []
+    for i, seg in enumerate(plan):
+        c = seg['div']
+        field = f"{name}_sat[{seg['src_bits'] - 1}:{0 if c is None else c['pre']}]"
+        if c is None:
+            quot = field
+        else:
+            wire = f"{name}_mul{i}" if len(plan) > 1 else f"{name}_mul"
+            lines.append(f"// {name}/{seg['step']} = ({name} >> {c['pre']}) * {c['mult']} >> "
+                         f"{c['shift']}  ({seg['lo']}-{seg['hi'] - 1} 精确)")
+            lines.append(f"wire [{c['product_bits'] - 1}:0] {wire} = {field} * "
+                         f"{c['mult_bits']}'d{c['mult']};")
+            quot = f"{wire}[{c['product_bits'] - 1}:{c['shift']}]"
+        terms.append(quot if seg['offset'] == 0
+                     else f"({addr_bits}'d{seg['offset']} + {quot})")
+
+    head = f"wire [{addr_bits - 1}:0] {name}_addr = "
+    arms = [f"({name}_sat < {sat_bits}'d{seg['hi']}) ? {term} :"
+            for seg, term in zip(plan[:-1], terms[:-1])] + [f"{terms[-1]};"]
+    lines.append(head + f"\n{' ' * len(head)}".join(arms))
+    return lines
+
+def table_verilog(table, plan, values, rom, encoding, mem_file):
+    """一张表的完整Verilog (地址计算 + 同步读取), 读取延迟1周期"""
+    name, width = table['name'], 4 * table['digits']
+    addr_bits = clog2(len(rom))
+    out = f"{name}_bcd"
+    top_bcd = int(rom[-1])
+
+    lines = [
+        "//=============================================================================",
+        f"// {table['desc']}",
+        f"// {len(rom)}个条目 × {width}位, {'case编码' if encoding == 'case' else 'DRM数组'}",
+        "//=============================================================================",
+    ]
+    lines += address_verilog(table, plan)
+    lines.append("")
+    if encoding == 'case':
+        lines += [f"reg [{width - 1}:0] {out}_reg;",
+                  "always @(posedge clk) begin",
+                  f"    case ({name}_addr)"]
+        lines += [f"        {addr_bits}'d{i}: {out}_reg <= {width}'h{int(b):0{width // 4}x};"
+                  f"  // {format_value(table, int(v))}"
+                  for i, (v, b) in enumerate(zip(values, rom))]
+        lines += [f"        default: {out}_reg <= {width}'h{top_bcd:0{width // 4}x};",
+                  "    endcase",
+                  "end"]
+    else:
+        lines += [f"reg [{width - 1}:0] {name}_rom [0:{(1 << addr_bits) - 1}];",
+                  f"reg [{width - 1}:0] {out}_reg;",
+                  "",
+                  "initial begin",
+                  f"    $readmemh({name.upper()}_ROM_FILE, {name}_rom);",
+                  "end",
+                  "",
+                  "always @(posedge clk) begin",
+                  f"    {out}_reg <= {name}_rom[{name}_addr];",
+                  "end"]
+    lines += [f"assign {out} = {out}_reg;", ""]
+    return lines
+
+def module_verilog(compiled):
+    """bcd_lut.v 全文"""
+    arrays = [(t, mem) for t, _, _, _, enc, mem in compiled if enc == 'array']
+    lines = [
+        "//=============================================================================",
+        "// 文件名: bcd_lut.v",
+        "// 描述: BCD转换查找表模块 - 无除法运算, 读取延迟1周期",
+        "//       为自动测试参数显示提供预先计算的BCD数值",
+        "//       使用ROM查找表替代除法运算，解决HDMI域时序违例问题",
+        "// 自动生成: scripts/generate_bcd_lut.py, 请勿手动修改",
+        "//",
+        "// 设计思路：",
+        "//   - 地址 = 输入 / 步进, 除法由乘法 + 位切片实现 (常量已穷举验证, 显示零误差)",
+        "//   - 小表用case编码 (分布式逻辑), 大表用$readmemh初始化的DRM数组",
+        "//   - 超出范围的输入饱和到最大值",
+        "//=============================================================================",
+        "",
+    ]
+    if arrays:
+        lines.append("module bcd_lut #(")
+        params = [f'    parameter {t["name"].upper()}_ROM_FILE = "{mem}"' for t, mem in arrays]
+        params[0] += "  // 仿真时可按工作目录覆盖"
+        lines += [p + ("," if i < len(params) - 1 else "") for i, p in enumerate(params)]
+        lines.append(")(")
+    else:
+        lines.append("module bcd_lut (")
+    lines += [
+        "    input  wire         clk,            // 时钟（同步ROM读取）",
+        "    ",
+        "    // 频率BCD转换（支持0-500kHz）",
+        "    input  wire [31:0]  freq_in,        // 输入频率 (Hz)",
+        "    output wire [23:0]  freq_bcd,       // 6位BCD输出 {d5,d4,d3,d2,d1,d0}",
+        "    ",
+        "    // 幅度BCD转换（支持0-5000mV，10mV步进）",
+        "    input  wire [15:0]  amp_in,         // 输入幅度 (mV)",
+        "    output wire [15:0]  amp_bcd,        // 4位BCD输出 {d3,d2,d1,d0}",
+        "    ",
+        "    // 占空比/THD BCD转换（支持0-100.0%，0.1%步进）",
+        "    input  wire [15:0]  duty_in,        // 输入占空比 (0-1000 = 0-100.0%)",
+        "    output wire [15:0]  duty_bcd        // 4位BCD输出 {d3,d2,d1,d0}",
+        ");",
+        "",
+    ]
+    for table, plan, values, rom, encoding, mem in compiled:
+        lines += table_verilog(table, plan, values, rom, encoding, mem)
+    lines += ["endmodule", ""]
+    return '\n'.join(lines)
+
+def compile_tables(force='auto', drm_lut_equiv=DRM_LUT_EQUIV, mem_dir=MEM_DIR):
+    """
+    编译全部表: 生成ROM、搜索地址常量、穷举验证、选择编码
+
+    返回:
+        (compiled, ok): compiled每项为 (table, plan, values, rom, encoding, mem_file)
+    """
+    compiled, ok = [], True
+    print(f"{'表':<6}{'条目':>6}{'地址':>6}{'验证输入':>10}{'错误':>6}"
+          f"{'case LUT':>10}{'DRM':>5}  编码")
+    for table in TABLES:
+        values, rom = build_table(table)
+        plan = address_plan(table)
+        checked, bad, first = verify_table(table, plan, rom)
+        encoding, luts, drm = choose_encoding(table, rom, force, drm_lut_equiv)
+        mem_file = f"{mem_dir}/bcd_{table['name']}_rom.hex"
+        print(f"{table['name']:<6}{len(rom):>6}{clog2(len(rom)):>6}{checked:>10}{bad:>6}"
+              f"{luts:>10}{drm:>5}  {encoding}" + (f"  ⚠️ 首个错误输入 {first}" if bad else ""))
+        ok &= bad == 0
+        compiled.append((table, plan, values, rom, encoding, mem_file))
+    return compiled, ok
+
+def main():
+    parser = argparse.ArgumentParser(description="BCD查找表编译器")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="输出的Verilog文件")
+    parser.add_argument('--mem-dir', default=MEM_DIR, help="DRM数组存储器映像目录 (相对工程根目录)")
+    parser.add_argument('--encoding', choices=['auto', 'case', 'array'], default='auto',
+                        help="表编码方式 (默认按LUT估算自动选择)")
+    parser.add_argument('--drm-lut-equiv', type=int, default=DRM_LUT_EQUIV,
+                        help="一个DRM折合的LUT数")
+    parser.add_argument('--check-only', action='store_true', help="只验证并打印资源估算")
+    args = parser.parse_args()
+
+    print("=== BCD查找表编译 ===\n")
+    compiled, ok = compile_tables(args.encoding, args.drm_lut_equiv, args.mem_dir)
+    if not ok:
+        print("\n❌ 显示值与精确值不一致, 未写出文件")
+        sys.exit(1)
+    print("\n✓ 全部输入的显示值与精确十进制值一致")
+    if args.check_only:
+        return
+
+    outputs = []
+    for table, _, _, rom, encoding, mem_file in compiled:
+        if encoding == 'array':
+            os.makedirs(os.path.dirname(mem_file) or '.', exist_ok=True)
+            depth = 1 << clog2(len(rom))
+            outputs.append((mem_file, write_mem_image(rom, mem_file, 'hex', 4 * table['digits'], [
+                f"bcd_{table['name']}_rom: {len(rom)} entries, padded to {depth} with max value",
+                "Generated by generate_bcd_lut.py"], depth=depth, fill=int(rom[-1]))))
+    outputs.append((args.output, write_if_changed(args.output, module_verilog(compiled))))
+    for path, written in outputs:
+        print(f"{'✓ 写入' if written else '✓ 未变化'}: {path}")
+
+if __name__ == '__main__':
+    main()
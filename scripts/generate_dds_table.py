@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DDS正弦表生成器 (lock_in_amplifier.v 的参考正弦/余弦表)
+
+按地址位数与幅度位宽生成正弦表, 可选1/4周期对称存储 (只存 2^(a-2) 项,
+高两位地址折叠: addr[a-2] 取反低位, addr[a-1] 取负), 并生成:
+    - source/source/dds_sin_lut.vh  sin_lut_func/cos_lut_func (在lock_in_amplifier模块内 `include)
+    - source/source/dds_params.vh   `define 常量 (地址位数、调谐字乘法常数等)
+    - ipcore/dds_table/dds_report.json  扫描结果
+
+表项 sin(2π(i+0.5)/2^a): 相位偏移半个地址, 使1/4周期折叠只需按位取反,
+与完整表逐位相同; 正弦与余弦偏移相同, I/Q正交关系不变 (绝对相位多 180/2^a 度).
+
+对每种 地址位数 × 幅度位宽 用向量化FFT计算:
+    - 幅度量化SFDR: 无相位截断的调谐字, 各种2的幂周期取最坏值
+    - 相位截断杂散: 32位相位累加器取高a位, 对一批奇数调谐字做相干FFT取最坏值
+    - 锁相噪底抬升: 白噪声经全部参考分量混频, 输出噪声 ∝ 参考总功率,
+      信号 ∝ 载波功率, 噪底抬升 = 10·log10(总功率/载波功率)
+自动选出满足 SFDR 与噪底指标、存储位数最少的配置.
+
+调谐字: ref_freq_tuning = round(f × 2^32 / fclk). weak_signal_detector 运行时按
+(ref_frequency × DDS_TW_MULT + 舍入) >> DDS_TW_SHIFT 计算 (代替32位除法),
+脚本穷举0~17.5MHz全部100Hz步进, 选最短的移位使误差小于1 LSB.
+
+用法:
+    python scripts/generate_dds_table.py                          # 扫描并自动选择
+    python scripts/generate_dds_table.py --addr-bits 12 --width 14 --layout quarter
+    python scripts/generate_dds_table.py --ref-freq 12345         # 给出调谐字与频率误差
+    python scripts/generate_dds_table.py --check-only
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+from generate_bcd_lut import estimate_case_luts
+from mem_image import estimate_drm, write_if_changed
+
+LUT_FILE = "source/source/dds_sin_lut.vh"
+PARAMS_FILE = "source/source/dds_params.vh"
+OUTPUT_DIR = "ipcore/dds_table"
+
+CLK_HZ = 35_000_000             # weak_signal_detector 时钟 (clk_adc)
+PHASE_BITS = 32                 # lock_in_amplifier PHASE_WIDTH
+REF_BITS = 16                   # ref_sin/ref_cos 位宽 (Q15, 与混频截位对应)
+ADC_BITS = 11                   # 输入ADC位数
+FREQ_STEP = 100                 # signal_analyzer_top 参考频率步进 (Hz)
+FREQ_MAX = 17_500_000           # 参考频率上限 (Hz)
+
+ADDR_RANGE = (8, 13)
+WIDTH_RANGE = (8, 16)
+TRUNC_EXTRA_BITS = 6            # 相位截断分析: 序列长度 2^(a+6), 覆盖截断的低位
+TRUNC_WORDS = 32                # 每种地址位数分析的调谐字个数
+FFT_BATCH_POINTS = 1 << 22      # 每批FFT的总点数 (控制内存)
+REQ_FFT_POINTS = 1 << 16        # 实际调谐字的加窗FFT点数
+DEFAULT_SFDR = 6.02 * ADC_BITS + 1.76   # 杂散低于ADC量化噪声 (dBc)
+DEFAULT_NOISE_RISE = 0.01       # 噪底抬升上限 (dB)
+
+#=============================================================================
+# 正弦表
+#=============================================================================
+
+def amplitude(width):
+    return (1 << (width - 1)) - 1
+
+def build_table(addr_bits, width, quarter):
+    """存储的表项: 1/4周期 2^(a-2) 项非负数, 或完整周期 2^a 项有符号数"""
+    n = 1 << addr_bits
+    depth = n // 4 if quarter else n
+    i = np.arange(depth, dtype=np.float64)
+    return np.rint(amplitude(width) * np.sin(2 * np.pi * (i + 0.5) / n)).astype(np.int64)
+
+def lut_output(table, addr_bits, width, quarter, addr=None):
+    """
+    按RTL函数逐位计算 sin_lut_func(addr) (REF_BITS位有符号)
+
+    1/4周期: idx = addr[a-2] ? ~addr[a-3:0] : addr[a-3:0]; addr[a-1] 为1时取负
+    """
+    n = 1 << addr_bits
+    addr = np.arange(n, dtype=np.int64) if addr is None else np.asarray(addr, dtype=np.int64) & (n - 1)
+    if quarter:
+        low = addr & (n // 4 - 1)
+        idx = np.where(addr & (n // 4), (n // 4 - 1) ^ low, low)
+        mag = table[idx] << (REF_BITS - width)
+        out = np.where(addr & (n // 2), -mag, mag)
+    else:
+        out = table[addr] << (REF_BITS - width)
+    half = 1 << (REF_BITS - 1)
+    return ((out + half) & ((1 << REF_BITS) - 1)) - half
+
+def memory_bits(addr_bits, width, quarter):
+    depth = (1 << addr_bits) // (4 if quarter else 1)
+    return depth * (width - 1 if quarter else width)     # 1/4周期只存非负幅度
+
+def estimate_resources(addr_bits, width, quarter):
+    """单个ROM (sin或cos各一个) 的LUT/DRM估算, 折叠逻辑按 a-2 个异或 + REF_BITS位取负"""
+    table = build_table(addr_bits, width, quarter)
+    depth_bits = addr_bits - (2 if quarter else 0)
+    rom = table if quarter else table & ((1 << width) - 1)
+    luts = estimate_case_luts(rom.astype(np.int64), depth_bits)
+    fold = (addr_bits - 2 + REF_BITS) if quarter else 0
+    return {'rom_luts': luts, 'fold_luts': fold, 'luts': luts + fold,
+            'drm': estimate_drm(len(table), width - (1 if quarter else 0))}
+
+#=============================================================================
+# 频谱分析 (向量化FFT)
+#=============================================================================
+
+def spectrum_metrics(power, carrier):
+    """
+    power: (批, 频点) 单边功率谱; carrier: 每行载波频点
+
+    返回: (SFDR dBc, 噪底抬升 dB), 每行一个
+    """
+    rows = np.arange(len(power))
+    pc = power[rows, carrier]
+    spur = power.copy()
+    spur[rows, carrier] = 0
+    sfdr = 10 * np.log10(pc / np.maximum(spur.max(axis=1), 1e-300))
+    rise = 10 * np.log10(power.sum(axis=1) / pc)
+    return sfdr, rise
+
+def rfft_power(x):
+    """实序列功率谱 (单边, 非DC/奈奎斯特频点乘2)"""
+    p = np.abs(np.fft.rfft(x, axis=-1)) ** 2
+    p[..., 1:-1] *= 2
+    return p
+
+def amplitude_spectrum(output, rng, count=TRUNC_WORDS):
+    """
+    幅度量化的最坏SFDR/噪底抬升: 调谐字 k × 2^(32-p) (p ≤ a, k为奇数), 无相位截断
+
+    一个完整地址周期 (p = a) 的量化误差分散到全部谐波上; 周期短时误差集中在少数频点,
+    杂散反而更高, 所以对 p = 3..a 都取最坏值.
+    """
+    addr_bits = int(len(output)).bit_length() - 1
+    worst_sfdr, worst_rise = np.inf, 0.0
+    for p in range(3, addr_bits + 1):
+        points = 1 << p
+        ks = np.arange(1, points, 2, dtype=np.int64)
+        if len(ks) > count:
+            ks = np.unique(np.concatenate([[1], rng.choice(ks, count - 1, replace=False)]))
+        n = np.arange(points, dtype=np.int64)
+        addr = ((ks[:, None] * n[None, :]) & (points - 1)) << (addr_bits - p)
+        carrier = np.where(ks < points // 2, ks, points - ks)       # 镜像到第一奈奎斯特区
+        sfdr, rise = spectrum_metrics(rfft_power(output[addr].astype(np.float64)), carrier)
+        worst_sfdr = min(worst_sfdr, float(sfdr.min()))
+        worst_rise = max(worst_rise, float(rise.max()))
+    return worst_sfdr, worst_rise
+
+def truncation_words(rng, addr_bits, count=TRUNC_WORDS):
+    """相位截断分析的调谐字: k × 2^(32-m), k为奇数 (序列周期恰为2^m, 相干无泄漏)"""
+    m = addr_bits + TRUNC_EXTRA_BITS
+    fixed = [1, 3, (1 << TRUNC_EXTRA_BITS) + 1, (1 << (m - 1)) - 1]
+    rand = rng.integers(0, 1 << (m - 2), count - len(fixed)) * 2 + 1
+    return m, np.unique(np.concatenate([fixed, rand]).astype(np.int64))
+
+def truncation_spectrum(output, addr_bits, ks, m):
+    """
+    相位截断 + 幅度量化的最坏SFDR/噪底抬升
+
+    output: 表的全部地址输出 (None 表示理想幅度, 只看相位截断)
+    """
+    points = 1 << m
+    n = np.arange(points, dtype=np.int64)
+    worst_sfdr, worst_rise = np.inf, 0.0
+    rows = max(1, FFT_BATCH_POINTS // points)
+    for s in range(0, len(ks), rows):
+        k = ks[s:s + rows]
+        addr = ((k[:, None] * n[None, :]) & (points - 1)) >> (m - addr_bits)
+        if output is None:
+            x = np.sin(2 * np.pi * (addr + 0.5) / (1 << addr_bits))
+        else:
+            x = output[addr].astype(np.float64)
+        sfdr, rise = spectrum_metrics(rfft_power(x), k)
+        worst_sfdr = min(worst_sfdr, float(sfdr.min()))
+        worst_rise = max(worst_rise, float(rise.max()))
+    return worst_sfdr, worst_rise
+
+def requested_spectrum(output, addr_bits, tw, points=REQ_FFT_POINTS):
+    """实际调谐字: 4项Blackman-Harris窗FFT, 按峰值比估算 (SFDR dBc, 载波频点)"""
+    n = np.arange(points, dtype=np.int64)
+    acc = (n * tw) & ((1 << PHASE_BITS) - 1)
+    x = output[acc >> (PHASE_BITS - addr_bits)].astype(np.float64)
+    win = _blackman_harris(points)
+    p = rfft_power(x * win)
+    carrier = int(np.argmax(p[1:])) + 1
+    guard = 4                                       # 窗主瓣半宽 (频点)
+    spur = p.copy()
+    spur[max(carrier - guard, 0):carrier + guard + 1] = 0
+    spur[:guard + 1] = 0
+    return float(10 * np.log10(p[carrier] / max(spur.max(), 1e-300))), carrier
+
+def _blackman_harris(points):
+    a = (0.35875, 0.48829, 0.14128, 0.01168)
+    t = 2 * np.pi * np.arange(points) / points
+    return a[0] - a[1] * np.cos(t) + a[2] * np.cos(2 * t) - a[3] * np.cos(3 * t)
+
+#=============================================================================
+# 调谐字
+#=============================================================================
+
+def exact_tuning_word(freq, clk=CLK_HZ):
+    """round(f × 2^32 / fclk)"""
+    return int((int(round(freq)) * (1 << PHASE_BITS) * 2 + clk) // (2 * clk))
+
+def achieved_freq(tw, clk=CLK_HZ):
+    return tw * clk / (1 << PHASE_BITS)
+
+def legacy_tuning_word(freq, clk=CLK_HZ):
+    """weak_signal_detector.v 原算法: (ref_frequency << 16) / (clk_frequency >> 16), 32位截断"""
+    return (((np.asarray(freq, dtype=np.int64) << 16) & 0xFFFFFFFF) // (int(clk) >> 16)) & 0xFFFFFFFF
+
+def choose_tw_multiplier(clk=CLK_HZ, fmax=FREQ_MAX, step=FREQ_STEP):
+    """
+    最短的移位 s 使 (f × M + 2^(s-1)) >> s 在 0..fmax (步进step) 上与理想值 f×2^32/fclk 相差小于1 LSB
+
+    与 round() 逐点相同需要约40位移位 (70位乘积), 放宽到1 LSB (fclk/2^32 ≈ 8 mHz) 后乘积只需55位左右.
+
+    返回: dict(mult, shift, mult_width, product_width, checked, max_error_lsb, mismatches)
+    """
+    freq = np.arange(0, fmax + 1, step, dtype=np.int64)
+    exact = (freq * (1 << PHASE_BITS) * 2 + clk) // (2 * clk)
+    for shift in range(8, 32):
+        mult = ((1 << (PHASE_BITS + shift)) * 2 + clk) // (2 * clk)
+        tw = (freq * mult + (1 << (shift - 1))) >> shift
+        err = tw * clk - freq * (1 << PHASE_BITS)         # 以 1/fclk LSB 为单位
+        if np.abs(err).max() < clk:
+            return {'mult': mult, 'shift': shift, 'mult_width': mult.bit_length(),
+                    'product_width': (int(fmax) * mult + (1 << (shift - 1))).bit_length(),
+                    'checked': len(freq), 'max_error_lsb': float(np.abs(err).max() / clk),
+                    'mismatches': int((tw != exact).sum())}
+    raise ValueError("找不到满足精度的调谐字乘法常数")
+
+def legacy_tw_error(clk=CLK_HZ, fmax=FREQ_MAX, step=FREQ_STEP):
+    """原除法算法相对精确调谐字的最大频率误差 (Hz) 与首个溢出频率"""
+    freq = np.arange(step, fmax + 1, step, dtype=np.int64)
+    err = (legacy_tuning_word(freq, clk) - (freq * (1 << PHASE_BITS) * 2 + clk) // (2 * clk)) \
+        * clk / (1 << PHASE_BITS)
+    bad = np.flatnonzero(np.abs(err) > clk / (1 << PHASE_BITS) * 1000)
+    return {'max_error_hz_below_overflow': float(np.abs(err[:bad[0]] if len(bad) else err).max()),
+            'overflow_from_hz': int(freq[bad[0]]) if len(bad) else None}
+
+#=============================================================================
+# 扫描与选择
+#=============================================================================
+
+def evaluate(addr_bits, width, quarter, rng, trunc_cache):
+    table = build_table(addr_bits, width, quarter)
+    out = lut_output(table, addr_bits, width, quarter)
+    amp_sfdr, amp_rise = amplitude_spectrum(out, rng)
+    m, ks = trunc_cache.setdefault(('words', addr_bits), truncation_words(rng, addr_bits))
+    if ('ideal', addr_bits) not in trunc_cache:
+        trunc_cache[('ideal', addr_bits)] = truncation_spectrum(None, addr_bits, ks, m)
+    sfdr, rise = truncation_spectrum(out, addr_bits, ks, m)
+    return dict(addr_bits=addr_bits, width=width, layout='quarter' if quarter else 'full',
+                entries=len(table), memory_bits=memory_bits(addr_bits, width, quarter),
+                amplitude_sfdr=amp_sfdr, truncation_sfdr=trunc_cache[('ideal', addr_bits)][0],
+                sfdr=min(sfdr, amp_sfdr), noise_rise=max(rise, amp_rise),
+                **estimate_resources(addr_bits, width, quarter))
+
+def sweep(addr_range, width_range, quarter, rng):
+    cache = {}
+    return [evaluate(a, w, quarter, rng, cache)
+            for a in range(addr_range[0], addr_range[1] + 1)
+            for w in range(width_range[0], width_range[1] + 1)]
+
+def choose(rows, sfdr_spec, rise_spec):
+    ok = [r for r in rows if r['sfdr'] >= sfdr_spec and r['noise_rise'] <= rise_spec]
+    if not ok:
+        return None
+    return min(ok, key=lambda r: (r['memory_bits'], r['luts']))
+
+#=============================================================================
+# Verilog输出
+#=============================================================================
+
+def format_params(cfg, tw):
+    a, w = cfg['addr_bits'], cfg['width']
+    lines = [
+        "//=============================================================================",
+        "// 文件名: dds_params.vh",
+        f"// 功能: DDS参考表与调谐字参数 (时钟 {CLK_HZ} Hz)",
+        "// 自动生成: scripts/generate_dds_table.py, 请勿手动修改",
+        '// 使用: `include "dds_params.vh"',
+        "//=============================================================================",
+        "",
+        "`ifndef DDS_PARAMS_VH",
+        "`define DDS_PARAMS_VH",
+        "",
+        f"`define DDS_ADDR_BITS               {a}",
+        f"`define DDS_AMP_WIDTH               {w}",
+        f"`define DDS_QUARTER_WAVE            {1 if cfg['layout'] == 'quarter' else 0}",
+        f"`define DDS_CLK_HZ                  {CLK_HZ}",
+        f"`define DDS_TW_MULT                 {tw['mult_width']}'d{tw['mult']}",
+        f"`define DDS_TW_SHIFT                {tw['shift']}",
+        f"`define DDS_TW_PRODUCT_WIDTH        {max(tw['product_width'], PHASE_BITS + tw['shift'])}",
+        "",
+        "// ref_freq_tuning = (ref_hz * DDS_TW_MULT + 2^(DDS_TW_SHIFT-1)) >> DDS_TW_SHIFT",
+        f"//   ≈ ref_hz * 2^32 / {CLK_HZ}, 0~{FREQ_MAX} Hz 每{FREQ_STEP}Hz穷举 ({tw['checked']} 点),",
+        f"//   与理想值最大偏差 {tw['max_error_lsb']:.3f} LSB ({tw['max_error_lsb'] * CLK_HZ / (1 << PHASE_BITS) * 1000:.2f} mHz)",
+        f"// 正弦表: 2^{a} 点/周期, {w} 位幅度, "
+        + ("1/4周期对称存储" if cfg['layout'] == 'quarter' else "完整周期存储")
+        + f" ({cfg['entries']} 项, {cfg['memory_bits']} 位)",
+        f"//   最坏SFDR {cfg['sfdr']:.1f} dBc (幅度量化 {cfg['amplitude_sfdr']:.1f}, "
+        f"相位截断 {cfg['truncation_sfdr']:.1f}), 锁相噪底抬升 {cfg['noise_rise']:.2e} dB",
+        "",
+        "`endif",
+        "",
+    ]
+    return "\n".join(lines)
+
+def format_lut(table, cfg):
+    """sin_lut_func/cos_lut_func (在模块内部 `include)"""
+    a, w = cfg['addr_bits'], cfg['width']
+    quarter = cfg['layout'] == 'quarter'
+    shift = REF_BITS - w
+    idx_bits = a - 2 if quarter else a
+    rom_bits = w - 1 if quarter else w
+    lines = [
+        "//=============================================================================",
+        "// 文件名: dds_sin_lut.vh",
+        f"// 功能: DDS正弦/余弦表 (2^{a}点/周期, {w}位幅度"
+        + (", 1/4周期对称存储)" if quarter else ", 完整周期存储)"),
+        "// 自动生成: scripts/generate_dds_table.py, 请勿手动修改",
+        '// 使用: 在模块内部 `include "dds_sin_lut.vh" (需先 `include "dds_params.vh")',
+        "//",
+        f"// 表项 = round({amplitude(w)} * sin(2*pi*(i+0.5)/{1 << a})), 相位偏移半个地址",
+        f"// 输出为{REF_BITS}位有符号数 (Q15, 低{shift}位补0)",
+        "//=============================================================================",
+        "",
+        f"function [{rom_bits - 1}:0] dds_sin_rom;",
+        f"    input [{idx_bits - 1}:0] idx;",
+        "    begin",
+        "        case (idx)",
+    ]
+    mask = (1 << rom_bits) - 1
+    digits = (rom_bits + 3) // 4
+    for i, v in enumerate(table):
+        lines.append(f"            {idx_bits}'d{i}: dds_sin_rom = {rom_bits}'h{int(v) & mask:0{digits}X};")
+    lines += [
+        f"            default: dds_sin_rom = {rom_bits}'h{0:0{digits}X};",
+        "        endcase",
+        "    end",
+        "endfunction",
+        "",
+        "function signed [15:0] sin_lut_func;",
+        "    input [`DDS_ADDR_BITS-1:0] addr;",
+    ]
+    if quarter:
+        pad = f", {{{shift}{{1'b0}}}}" if shift else ""
+        lines += [
+            "    reg [`DDS_ADDR_BITS-3:0] idx;",
+            "    reg [15:0]               mag;",
+            "    begin",
+            "        // 第2/4象限地址镜像 (按位取反), 第3/4象限取负",
+            "        idx = addr[`DDS_ADDR_BITS-2] ? ~addr[`DDS_ADDR_BITS-3:0] : addr[`DDS_ADDR_BITS-3:0];",
+            f"        mag = {{1'b0, dds_sin_rom(idx){pad}}};",
+            "        sin_lut_func = addr[`DDS_ADDR_BITS-1] ? -mag : mag;",
+            "    end",
+        ]
+    else:
+        body = f"$signed(dds_sin_rom(addr)) <<< {shift}" if shift else "dds_sin_rom(addr)"
+        lines += [
+            "    begin",
+            f"        sin_lut_func = {body};",
+            "    end",
+        ]
+    lines += [
+        "endfunction",
+        "",
+        "// 余弦 = sin(x + 90度)",
+        "function signed [15:0] cos_lut_func;",
+        "    input [`DDS_ADDR_BITS-1:0] addr;",
+        "    begin",
+        "        cos_lut_func = sin_lut_func(addr + (1 << (`DDS_ADDR_BITS-2)));",
+        "    end",
+        "endfunction",
+        "",
+    ]
+    return "\n".join(lines)
+
+def read_lut(lut_path=LUT_FILE, params_path=PARAMS_FILE):
+    """
+    读回生成的表 (供模型使用)
+
+    返回:
+        dict(addr_bits, width, quarter, table, output, tw_mult, tw_shift)
+        output: sin_lut_func 对全部地址的取值
+    """
+    with open(params_path, 'r', encoding='utf-8') as f:
+        params = dict((k, v) for k, v in re.findall(r"`define[ \t]+(DDS_\w+)[ \t]+(\S+)", f.read()))
+    with open(lut_path, 'r', encoding='utf-8') as f:
+        entries = re.findall(r"(\d+)'d(\d+):\s*dds_sin_rom\s*=\s*(\d+)'h([0-9A-Fa-f]+);", f.read())
+    a = int(params['DDS_ADDR_BITS'])
+    w = int(params['DDS_AMP_WIDTH'])
+    quarter = params['DDS_QUARTER_WAVE'] == '1'
+    rom_bits = int(entries[0][2])
+    raw = np.zeros(len(entries), dtype=np.int64)
+    for _, i, _, v in entries:
+        raw[int(i)] = int(v, 16)
+    table = raw if quarter else ((raw + (1 << (rom_bits - 1))) & ((1 << rom_bits) - 1)) - (1 << (rom_bits - 1))
+    return {'addr_bits': a, 'width': w, 'quarter': quarter, 'table': table,
+            'output': lut_output(table, a, w, quarter),
+            'tw_mult': int(params['DDS_TW_MULT'].split("'d")[-1]),
+            'tw_shift': int(params['DDS_TW_SHIFT'])}
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def print_sweep(rows, chosen, sfdr_spec, rise_spec):
+    print(f"{'地址':>4}{'位宽':>5}{'项数':>7}{'存储位':>8}{'幅度SFDR':>10}{'截断SFDR':>10}"
+          f"{'最坏SFDR':>10}{'噪底抬升':>11}{'LUT':>7}{'DRM':>5}")
+    for r in rows:
+        ok = r['sfdr'] >= sfdr_spec and r['noise_rise'] <= rise_spec
+        mark = '  ← 选用' if r is chosen else ('  ✓' if ok else '')
+        print(f"{r['addr_bits']:>4}{r['width']:>5}{r['entries']:>7}{r['memory_bits']:>8}"
+              f"{r['amplitude_sfdr']:>9.1f} {r['truncation_sfdr']:>9.1f} {r['sfdr']:>9.1f} "
+              f"{r['noise_rise']:>10.1e}{r['luts']:>7}{r['drm']:>5}{mark}")
+
+def report_frequency(freq, cfg_output, addr_bits, tw_const):
+    tw = exact_tuning_word(freq)
+    runtime = (int(round(freq)) * tw_const['mult'] + (1 << (tw_const['shift'] - 1))) >> tw_const['shift']
+    legacy = int(legacy_tuning_word(int(round(freq))))
+    f_act = achieved_freq(tw)
+    sfdr, _ = requested_spectrum(cfg_output, addr_bits, tw)
+    print(f"\n参考频率 {freq:g} Hz: 调谐字 0x{tw:08X} ({tw}) → {f_act:.6f} Hz, "
+          f"误差 {f_act - freq:+.6f} Hz ({(f_act - freq) / freq:+.2e})")
+    print(f"  运行时乘法结果 0x{runtime:08X} " + ("(一致)" if runtime == tw else f"(差 {runtime - tw:+d} LSB)")
+          + f", 原除法算法 0x{legacy:08X} → {achieved_freq(legacy) - freq:+.3f} Hz")
+    print(f"  该频率下加窗FFT估算SFDR {sfdr:.1f} dBc")
+
+def main():
+    parser = argparse.ArgumentParser(description="DDS正弦表生成器")
+    parser.add_argument('--addr-bits', type=int, help="地址位数 (不给则扫描自动选择)")
+    parser.add_argument('--width', type=int, help="幅度位宽 (不给则扫描自动选择)")
+    parser.add_argument('--layout', choices=['quarter', 'full'], default='quarter',
+                        help="存储方式: 1/4周期对称 或 完整周期")
+    parser.add_argument('--sfdr', type=float, default=DEFAULT_SFDR, help="最坏SFDR指标 (dBc)")
+    parser.add_argument('--noise-rise', type=float, default=DEFAULT_NOISE_RISE,
+                        help="锁相噪底抬升上限 (dB)")
+    parser.add_argument('--ref-freq', type=float, action='append',
+                        help="报告该参考频率的调谐字与误差 (可多次给出)")
+    parser.add_argument('--seed', type=int, default=1, help="相位截断分析的随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="报告输出目录")
+    parser.add_argument('--check-only', action='store_true', help="只分析现有表, 不写文件")
+    args = parser.parse_args()
+
+    quarter = args.layout == 'quarter'
+    rng = np.random.default_rng(args.seed)
+
+    if args.check_only:
+        cur = read_lut()
+        cfg = evaluate(cur['addr_bits'], cur['width'], cur['quarter'], rng, {})
+        built = build_table(cur['addr_bits'], cur['width'], cur['quarter'])
+        print(f"{LUT_FILE}: 2^{cfg['addr_bits']} 点, {cfg['width']} 位, {cfg['layout']}, "
+              f"{cfg['entries']} 项 / {cfg['memory_bits']} 位")
+        print(f"  最坏SFDR {cfg['sfdr']:.1f} dBc, 噪底抬升 {cfg['noise_rise']:.2e} dB")
+        ok = np.array_equal(built, cur['table'])
+        print(("✓ 表项与生成算法一致" if ok else "❌ 表项与生成算法不一致"))
+        for f in args.ref_freq or []:
+            report_frequency(f, cur['output'], cur['addr_bits'],
+                             {'mult': cur['tw_mult'], 'shift': cur['tw_shift']})
+        sys.exit(0 if ok else 1)
+
+    addr_range = (args.addr_bits,) * 2 if args.addr_bits else ADDR_RANGE
+    width_range = (args.width,) * 2 if args.width else WIDTH_RANGE
+    rows = sweep(addr_range, width_range, quarter, rng)
+    chosen = choose(rows, args.sfdr, args.noise_rise)
+    print(f"=== 正弦表扫描 ({args.layout}, 指标: 最坏SFDR ≥ {args.sfdr:.1f} dBc, "
+          f"噪底抬升 ≤ {args.noise_rise:g} dB) ===")
+    print_sweep(rows, chosen, args.sfdr, args.noise_rise)
+    if chosen is None:
+        if len(rows) != 1:
+            print("❌ 扫描范围内没有满足指标的配置")
+            sys.exit(1)
+        chosen = rows[0]
+        print("⚠️  指定配置未达到指标, 仍按指定配置生成")
+
+    full = evaluate(chosen['addr_bits'], chosen['width'], False, rng, {}) if quarter else chosen
+    print(f"\n选用: 2^{chosen['addr_bits']} 点/周期, {chosen['width']} 位, {chosen['layout']}: "
+          f"{chosen['entries']} 项, {chosen['memory_bits']} 位 "
+          f"(完整周期需 {full['memory_bits']} 位), 每个ROM约 {chosen['luts']} LUT")
+
+    tw = choose_tw_multiplier()
+    legacy = legacy_tw_error()
+    print(f"\n调谐字: (f × {tw['mult']} + 2^{tw['shift'] - 1}) >> {tw['shift']}, "
+          f"{tw['mult_width']}位常数, 乘积{tw['product_width']}位")
+    print(f"  {tw['checked']} 个频率与理想值最大偏差 {tw['max_error_lsb']:.3f} LSB, "
+          f"{tw['mismatches']} 个与 round() 差1")
+    print(f"  原除法算法: 溢出前最大误差 {legacy['max_error_hz_below_overflow']:.3f} Hz, "
+          f"{legacy['overflow_from_hz']} Hz 起 ref_frequency<<16 溢出")
+
+    table = build_table(chosen['addr_bits'], chosen['width'], quarter)
+    output = lut_output(table, chosen['addr_bits'], chosen['width'], quarter)
+    for f in args.ref_freq or [1000]:
+        report_frequency(f, output, chosen['addr_bits'], tw)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    report = {'chosen': chosen, 'sweep': rows, 'tuning_word': tw, 'legacy_tuning_word': legacy,
+              'spec': {'sfdr_dbc': args.sfdr, 'noise_rise_db': args.noise_rise}}
+    outputs = [(LUT_FILE, format_lut(table, chosen)),
+               (PARAMS_FILE, format_params(chosen, tw)),
+               (os.path.join(args.output_dir, 'dds_report.json'),
+                json.dumps(report, indent=2, ensure_ascii=False) + '\n')]
+    print()
+    for path, data in outputs:
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
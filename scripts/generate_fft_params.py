@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FFT参数生成器 (按FFT点数与采样率生成全部派生常量与表)
+
+由FFT点数N与采样率fs一次性生成:
+    - Hann窗前半表 source/hann_window_{N}_half.hex (对称存储, 与generate_hann_window.py一致)
+    - Verilog头文件 source/source/fft_params.vh (`define, RTL通过 `include 使用)
+    - Python模块 scripts/fft_params.py (供Python模型/测试平台 import)
+每个取整后的常量都给出误差预算: 精确值、取整值、单位误差、
+在整个频谱范围 (bin 0 ~ N/2-1) 上的最坏误差, 以及所需位宽.
+
+换用16K/32K点FFT时只需重新运行本脚本, 再按提示重新生成固定尺寸的IP核.
+
+用法:
+    python scripts/generate_fft_params.py                      # 8192点, 35MHz (当前工程)
+    python scripts/generate_fft_params.py -N 16384
+    python scripts/generate_fft_params.py -N 32768 --sample-rate 35000000 --check-only
+"""
+
+import argparse
+from fractions import Fraction
+
+import numpy as np
+
+from generate_window import make_window, quantize
+from mem_image import write_if_changed, write_mem_image
+
+DEFAULT_POINTS = 8192
+DEFAULT_SAMPLE_RATE = 35_000_000
+WINDOW_BITS = 16  # Q15窗系数 (与hann_window_8192.hex相同)
+MEM_DIR = "source"
+HEADER_FILE = "source/source/fft_params.vh"
+PY_MODULE = "scripts/fft_params.py"
+
+# 随FFT点数变化、但本脚本无法重新生成的IP/模块 (换点数后需手动处理)
+FIXED_SIZE_IPS = [
+    "ipcore FFT核 (8192点AXI4-Stream FFT)",
+    "dpram_8192x11 (时域/频谱缓存DPRAM)",
+    "异步FIFO水位宽度 (ch*_fifo_rd_water_level[13:0])",
+    "signal_analyzer_top.v 中的13位地址线",
+]
+
+def budget_entry(name, exact, value, scale, unit, span, desc):
+    """
+    单个取整常量的误差预算
+
+    参数:
+        exact: 精确值 (Fraction, 已乘以scale)
+        value: 取整后的整数
+        scale: 定点缩放 (2^frac_bits)
+        unit: 常量的物理单位
+        span: 最坏情况下常量被乘的倍数 (如最大bin号)
+    """
+    err = Fraction(value) / scale - exact / scale
+    return {
+        'name': name,
+        'value': value,
+        'width': max(1, int(value).bit_length()),
+        'exact': float(exact / scale),
+        'error': float(err),
+        'relative_error': float(err / (exact / scale)) if exact else 0.0,
+        'worst_case_error': float(abs(err) * span),
+        'unit': unit,
+        'desc': desc,
+    }
+
+def compute_params(N, fs):
+    """
+    计算全部派生常量与误差预算
+
+    返回:
+        (params, budget, window_half)
+        params: 常量名 → 整数/字符串
+        budget: 误差预算列表
+        window_half: 前半窗表 (uint16)
+    """
+    if N < 16 or N & (N - 1):
+        raise ValueError(f"FFT点数须为2的幂: N={N}")
+
+    addr_width = N.bit_length() - 1
+    max_bin = N // 2 - 1
+    res = Fraction(fs, N)  # Hz/bin, 精确值
+
+    freq_res = round(res)
+    freq_res_q16 = round(res * (1 << 16))
+    hz_to_bin_q32 = round(Fraction(N, fs) * (1 << 32))
+
+    # 窗函数: 与RTL中ROM的内容完全一致 (量化后的系数)
+    window_q, _ = quantize(make_window('hann', N), WINDOW_BITS)
+    window_scale = (1 << (WINDOW_BITS - 1)) - 1
+    window_half = window_q[:N // 2].astype(np.uint16)
+    if not np.array_equal(window_q[N // 2:][::-1], window_q[:N // 2]):
+        raise RuntimeError("量化后的窗不对称, 不能使用前半表")
+    cg = Fraction(int(window_q.sum()), N * window_scale)
+    enbw = Fraction(N * int((window_q ** 2).sum()), int(window_q.sum()) ** 2)
+    cg_q16 = round(cg * (1 << 16))
+    enbw_q16 = round(enbw * (1 << 16))
+
+    params = {
+        'FFT_POINTS': N,
+        'FFT_ADDR_WIDTH': addr_width,
+        'FFT_HALF_POINTS': N // 2,
+        'FFT_SAMPLE_RATE': fs,
+        'FFT_FREQ_RES': freq_res,
+        'FFT_FREQ_RES_Q16': freq_res_q16,
+        'FFT_FREQ_RES_Q16_WIDTH': freq_res_q16.bit_length(),
+        'FFT_FREQ_PRODUCT_WIDTH': (max_bin * freq_res).bit_length(),
+        'FFT_FREQ_Q16_PRODUCT_WIDTH': (max_bin * freq_res_q16).bit_length(),
+        'FFT_HZ_TO_BIN_Q32': hz_to_bin_q32,
+        'FFT_WINDOW_WIDTH': WINDOW_BITS,
+        'FFT_WINDOW_SCALE': window_scale,
+        'FFT_WINDOW_CG_Q16': cg_q16,
+        'FFT_WINDOW_ENBW_Q16': enbw_q16,
+        'FFT_WINDOW_HALF_FILE': f"{MEM_DIR}/hann_window_{N}_half.hex",
+    }
+
+    budget = [
+        budget_entry('FFT_FREQ_RES', res, freq_res, 1, 'Hz/bin', max_bin,
+                     f"bin→Hz整数系数, 最坏误差在bin {max_bin}"),
+        budget_entry('FFT_FREQ_RES_Q16', res * (1 << 16), freq_res_q16, 1 << 16, 'Hz/bin',
+                     max_bin, "bin→Hz的Q16系数 (用于插值后的分数bin)"),
+        budget_entry('FFT_HZ_TO_BIN_Q32', Fraction(N, fs) * (1 << 32), hz_to_bin_q32, 1 << 32,
+                     'bin/Hz', Fraction(fs, 2), "Hz→bin的Q32系数, 最坏误差在Nyquist频率"),
+        budget_entry('FFT_WINDOW_CG_Q16', cg * (1 << 16), cg_q16, 1 << 16, '',
+                     1, "Hann窗相干增益 (幅度校正用)"),
+        budget_entry('FFT_WINDOW_ENBW_Q16', enbw * (1 << 16), enbw_q16, 1 << 16, 'bin',
+                     1, "Hann窗等效噪声带宽 (噪声/SNR计算用)"),
+    ]
+    return params, budget, window_half
+
+def format_header(params, budget):
+    """Verilog头文件 (`define, 带include保护)"""
+    N, fs = params['FFT_POINTS'], params['FFT_SAMPLE_RATE']
+    lines = [
+        "//=============================================================================",
+        "// 文件名: fft_params.vh",
+        f"// 功能: FFT派生参数 ({N}点, 采样率 {fs} Hz)",
+        "// 自动生成: scripts/generate_fft_params.py, 请勿手动修改",
+        "// 使用: `include \"fft_params.vh\"",
+        "//=============================================================================",
+        "",
+        "`ifndef FFT_PARAMS_VH",
+        "`define FFT_PARAMS_VH",
+        "",
+    ]
+    for name, value in params.items():
+        text = f'"{value}"' if isinstance(value, str) else str(value)
+        lines.append(f"`define {name:<28}{text}")
+
+    lines += ["", "// 误差预算 (取整常量 / 精确值):"]
+    for b in budget:
+        exact = f"{b['exact']:.10g} {b['unit']}".rstrip()
+        lines.append(f"//   {b['name']:<22}{b['value']:>12}  精确 {exact}, "
+                     f"误差 {b['error']:+.3g} ({b['relative_error']:+.2e}), "
+                     f"最坏 {b['worst_case_error']:.3g}, {b['width']}位")
+    lines += ["", "`endif", ""]
+    return '\n'.join(lines)
+
+def format_py_module(params, budget):
+    """Python常量模块"""
+    N, fs = params['FFT_POINTS'], params['FFT_SAMPLE_RATE']
+    lines = [
+        "# -*- coding: utf-8 -*-",
+        '"""',
+        f"FFT派生参数 ({N}点, 采样率 {fs} Hz)",
+        "自动生成: scripts/generate_fft_params.py, 请勿手动修改 (与 fft_params.vh 同源)",
+        '"""',
+        "",
+    ]
+    for name, value in params.items():
+        lines.append(f"{name} = {value!r}")
+    lines += ["", "# 误差预算: 常量名 → 精确值/取整误差/相对误差/整个频谱范围内的最坏误差",
+              "ERROR_BUDGET = {"]
+    for b in budget:
+        fields = ', '.join(f"{key!r}: {b[key]!r}" for key in
+                           ('value', 'width', 'exact', 'error', 'relative_error',
+                            'worst_case_error', 'unit', 'desc'))
+        lines.append(f"    {b['name']!r}: {{{fields}}},")
+    lines += ["}", ""]
+    return '\n'.join(lines)
+
+def print_budget(params, budget):
+    """终端摘要"""
+    N, fs = params['FFT_POINTS'], params['FFT_SAMPLE_RATE']
+    print(f"FFT参数: {N}点, 采样率 {fs} Hz, 分辨率 {fs / N:.6f} Hz/bin, "
+          f"地址 {params['FFT_ADDR_WIDTH']} 位")
+    print(f"\n{'常量':<22}{'取整值':>12}{'精确值':>18}{'相对误差':>12}{'最坏误差':>12}{'位宽':>6}")
+    for b in budget:
+        print(f"{b['name']:<22}{b['value']:>12}{b['exact']:>18.10g}"
+              f"{b['relative_error']:>12.2e}{b['worst_case_error']:>12.4g}{b['width']:>6}")
+    print(f"\n  bin×FFT_FREQ_RES 乘积位宽: {params['FFT_FREQ_PRODUCT_WIDTH']}")
+    print(f"  bin×FFT_FREQ_RES_Q16 乘积位宽: {params['FFT_FREQ_Q16_PRODUCT_WIDTH']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="FFT参数生成器")
+    parser.add_argument('-N', '--points', type=int, default=DEFAULT_POINTS, help="FFT点数")
+    parser.add_argument('--sample-rate', type=int, default=DEFAULT_SAMPLE_RATE, help="采样率 (Hz)")
+    parser.add_argument('--header', default=HEADER_FILE, help="Verilog头文件路径")
+    parser.add_argument('--py-module', default=PY_MODULE, help="Python模块路径")
+    parser.add_argument('--check-only', action='store_true', help="只打印误差预算, 不写文件")
+    args = parser.parse_args()
+
+    params, budget, window_half = compute_params(args.points, args.sample_rate)
+    print_budget(params, budget)
+    if args.check_only:
+        return
+
+    outputs = [
+        (params['FFT_WINDOW_HALF_FILE'],
+         write_mem_image(window_half, params['FFT_WINDOW_HALF_FILE'], 'hex', WINDOW_BITS,
+                         upper=True)),
+        (args.header, write_if_changed(args.header, format_header(params, budget))),
+        (args.py_module, write_if_changed(args.py_module, format_py_module(params, budget))),
+    ]
+    print()
+    for path, written in outputs:
+        print(f"{'✓ 写入' if written else '✓ 未变化'}: {path}")
+
+    if args.points != DEFAULT_POINTS:
+        print(f"\n⚠️ 以下IP/模块尺寸固定为{DEFAULT_POINTS}点, 需手动重新生成或修改:")
+        for item in FIXED_SIZE_IPS:
+            print(f"   - {item}")
+
+if __name__ == '__main__':
+    main()
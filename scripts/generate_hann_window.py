@@ -4,24 +4,102 @@
 Hann窗系数生成器
 生成8192点Hann窗系数，用于FFT频谱分析
 输出格式：16位定点数 (Q15格式)
+
+用法:
+    python scripts/generate_hann_window.py               # 完整8192点表
+    python scripts/generate_hann_window.py --symmetric   # 另外生成前半表 + 镜像读取模块
 """
 
+import argparse
 import numpy as np
 import os
 
-def generate_hann_window(N=8192, output_dir='ipcore/hann_window'):
+from mem_image import write_mem_image
+
+def write_tables(base, values, title, desc):
+    """写出COE/MIF/HEX三种格式 (base为不含扩展名的路径)"""
+    comments = [title, "Generated by generate_hann_window.py",
+                "Format: 16-bit unsigned Q15 (0x0000 - 0x7FFF)", desc]
+    write_mem_image(values, base + '.coe', 'coe', 16, comments)
+    write_mem_image(values, base + '.mif', 'mif', 16, comments)
+    write_mem_image(values, base + '.hex', 'hex', 16, upper=True)
+
+def mirror_address(addr, N):
+    """
+    对称窗的镜像地址: addr < N/2 ? addr : N-1-addr
+
+    N为2的幂时 N-1-addr 的低位就是 ~addr, 硬件上只需一级异或:
+        half_addr = addr[k-2:0] ^ {(k-1){addr[k-1]}}
+    """
+    half = N // 2
+    upper = (addr >> (N.bit_length() - 2)) & 1  # addr的最高位
+    return (addr & (half - 1)) ^ (upper * (half - 1))
+
+def verify_symmetric(window_full, window_half):
+    """
+    逐点校验镜像读取结果与完整表一致 (向量化, 覆盖全部N个地址)
+
+    返回:
+        不一致的地址数组 (为空表示位精确一致)
+    """
+    N = len(window_full)
+    addr = np.arange(N)
+    mirrored = window_half[mirror_address(addr, N)]
+    return np.nonzero(mirrored != window_full)[0]
+
+def write_symmetric_rom_module(path, N, init_file):
+    """生成前半表 + 镜像地址读取的ROM模块 (读取延迟1周期, 与整表ROM相同)"""
+    addr_bits = N.bit_length() - 1
+    half = N // 2
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"""//=============================================================================
+// 文件名: hann_window_rom_sym.v
+// 功能: {N}点Hann窗系数ROM (对称存储, 只存前{half}点)
+// 自动生成: generate_hann_window.py --symmetric
+// 读取: addr < {half} ? rom[addr] : rom[{N - 1}-addr]
+//       {N - 1}-addr 的低{addr_bits - 1}位即 ~addr, 只需一级异或, 不用减法器
+//=============================================================================
+
+module hann_window_rom_sym #(
+    parameter INIT_FILE = "{init_file}"  // 仿真时可按工作目录覆盖
+)(
+    input                   clk,
+    input      [{addr_bits - 1}:0]      addr,    // 0-{N - 1}
+    output reg [15:0]       coeff    // Q15窗系数, 1周期延迟
+);
+
+reg  [15:0] half_rom [0:{half - 1}];
+wire [{addr_bits - 2}:0] half_addr = addr[{addr_bits - 2}:0] ^ {{{addr_bits - 1}{{addr[{addr_bits - 1}]}}}};
+
+initial begin
+    $readmemh(INIT_FILE, half_rom);
+end
+
+always @(posedge clk) begin
+    coeff <= half_rom[half_addr];
+end
+
+endmodule
+""")
+
+def generate_hann_window(N=8192, output_dir='ipcore/hann_window', symmetric=False):
     """
     生成Hann窗系数
     
     参数:
         N: 窗长度 (8192点)
         output_dir: 输出目录
+        symmetric: 另外生成前半表及镜像读取模块 (N须为2的幂)
     
     输出文件:
         hann_window_8192.coe - Xilinx COE格式
         hann_window_8192.mif - Altera MIF格式
         hann_window_8192.hex - 通用HEX格式
+        hann_window_8192_half.coe/.mif/.hex - 前半表 (symmetric)
+        hann_window_rom_sym.v - 镜像地址读取模块 (symmetric)
     """
+    if symmetric and (N < 2 or N & (N - 1)):
+        raise ValueError(f"对称模式要求N为2的幂: N={N}")
     
     # 创建输出目录
     os.makedirs(output_dir, exist_ok=True)
@@ -48,51 +126,32 @@ def generate_hann_window(N=8192, output_dir='ipcore/hann_window'):
     print(f"  中心值: {window[N//2]:.6f} (原始) -> {window_q15[N//2]} (Q15)")
     print(f"  首尾值: {window[0]:.6f} (原始) -> {window_q15[0]} (Q15)")
     
-    # 生成Xilinx COE格式 (用于Block Memory Generator)
-    coe_file = os.path.join(output_dir, 'hann_window_8192.coe')
-    with open(coe_file, 'w') as f:
-        f.write("; Hann Window Coefficients - 8192 points\n")
-        f.write("; Generated by generate_hann_window.py\n")
-        f.write("; Format: 16-bit unsigned Q15 (0x0000 - 0x7FFF)\n")
-        f.write("; Window formula: w(n) = 0.5 - 0.5*cos(2*pi*n/(N-1))\n")
-        f.write(";\n")
-        f.write("memory_initialization_radix=16;\n")
-        f.write("memory_initialization_vector=\n")
-        for i, val in enumerate(window_uint16):
-            if i == len(window_uint16) - 1:
-                f.write(f"{val:04X};")  # 最后一个以分号结尾
-            else:
-                f.write(f"{val:04X},")
-                if (i + 1) % 16 == 0:
-                    f.write("\n")  # 每16个值换行
-        f.write("\n")
-    print(f"\n生成Xilinx COE格式: {coe_file}")
-    
-    # 生成Altera MIF格式 (用于Gowin FPGA)
-    mif_file = os.path.join(output_dir, 'hann_window_8192.mif')
-    with open(mif_file, 'w') as f:
-        f.write("-- Hann Window Coefficients - 8192 points\n")
-        f.write("-- Generated by generate_hann_window.py\n")
-        f.write("-- Format: 16-bit unsigned Q15 (0x0000 - 0x7FFF)\n")
-        f.write("-- Window formula: w(n) = 0.5 - 0.5*cos(2*pi*n/(N-1))\n")
-        f.write("\n")
-        f.write("WIDTH=16;\n")
-        f.write("DEPTH=8192;\n")
-        f.write("ADDRESS_RADIX=DEC;\n")
-        f.write("DATA_RADIX=HEX;\n")
-        f.write("\n")
-        f.write("CONTENT BEGIN\n")
-        for i, val in enumerate(window_uint16):
-            f.write(f"    {i:5d} : {val:04X};\n")
-        f.write("END;\n")
-    print(f"生成Altera MIF格式: {mif_file}")
-    
-    # 生成通用HEX格式（每行一个值，用于Verilog $readmemh）
-    hex_file = os.path.join(output_dir, 'hann_window_8192.hex')
-    with open(hex_file, 'w') as f:
-        for val in window_uint16:
-            f.write(f"{val:04X}\n")
-    print(f"生成通用HEX格式: {hex_file}")
+    formula = "Window formula: w(n) = 0.5 - 0.5*cos(2*pi*n/(N-1))"
+
+    # 生成COE (Xilinx) / MIF (Altera/Gowin) / HEX ($readmemh) 三种格式
+    base = os.path.join(output_dir, f'hann_window_{N}')
+    write_tables(base, window_uint16, f"Hann Window Coefficients - {N} points", formula)
+    print(f"\n生成Xilinx COE格式: {base}.coe")
+    print(f"生成Altera MIF格式: {base}.mif")
+    print(f"生成通用HEX格式: {base}.hex")
+
+    # 对称存储: 只写前N/2点, 读取时镜像地址
+    if symmetric:
+        window_half = window_uint16[:N // 2]
+        bad = verify_symmetric(window_uint16, window_half)
+        if len(bad):
+            raise RuntimeError(f"镜像读取与完整表不一致: {len(bad)}个地址, 首个 {bad[0]}")
+        print(f"\n✓ 镜像读取校验通过: 全部{N}个系数位精确一致")
+
+        half_title = f"Hann Window Coefficients - first {N // 2} of {N} points (symmetric)"
+        half_desc = f"Read: addr < {N // 2} ? rom[addr] : rom[{N - 1}-addr]"
+        half_base = os.path.join(output_dir, f'hann_window_{N}_half')
+        write_tables(half_base, window_half, half_title, half_desc)
+        print(f"生成前半表: {half_base}.coe/.mif/.hex ({N // 2}点, ROM减半)")
+
+        sym_file = os.path.join(output_dir, 'hann_window_rom_sym.v')
+        write_symmetric_rom_module(sym_file, N, f"source/hann_window_{N}_half.hex")
+        print(f"生成镜像读取模块: {sym_file}")
     
     # 生成Verilog参数定义文件（用于小型查找表实现）
     # 由于8192点太大，这里生成对称索引版本的说明
@@ -171,8 +230,14 @@ def generate_hann_window(N=8192, output_dir='ipcore/hann_window'):
     
     print(f"\n✓ Hann窗系数生成完成！")
     print(f"  输出目录: {output_dir}")
-    print(f"  文件数量: 5个")
+    print(f"  文件数量: {9 if symmetric else 5}个")
     print(f"\n下一步：在Gowin FPGA中使用MIF文件初始化Block RAM")
 
 if __name__ == '__main__':
-    generate_hann_window()
+    parser = argparse.ArgumentParser(description="Hann窗系数生成器")
+    parser.add_argument('-N', '--points', type=int, default=8192, help="窗长度")
+    parser.add_argument('--output-dir', default='ipcore/hann_window', help="输出目录")
+    parser.add_argument('--symmetric', action='store_true',
+                        help="另外生成前半表与镜像地址读取模块 (窗ROM减半)")
+    args = parser.parse_args()
+    generate_hann_window(args.points, args.output_dir, args.symmetric)
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+倒数查找表生成器 + 插值除法误差图 (reciprocal_lut.v)
+
+由参数化公式生成 recip_rom 并写出 reciprocal_lut.v 与存储器映像:
+    recip[i] = R(2^Q / (i * 2^(16-k))),  i = 0 .. 2^k  (共 2^k+1 项, 末项用于插值边界)
+    前 2^k 项写入 $readmemh 映像, 由同步读取推断为一个双口DRM (base/next各用一个读口);
+    末项只在最高区间作为 next 使用, 写成常量 RECIP_LAST, 避免深度超过 2^k 多占一块DRM.
+    i=0 及超出位宽的项饱和到 2^W-1; R为取整方式 (round/floor/ceil/minimax).
+    minimax: 1/x 的弦在曲线上方, 把每项按其右侧区间最大弦误差的一半压低, 使插值误差正负对称.
+
+再对全部65536个除数 × 一组代表性被除数, 向量化地逐位模拟 waveform_feature_extractor.v
+COMPUTE2~COMPUTE4 的 查表 → 插值 → 乘法 通路, 得到最大/平均相对误差图,
+自动选择满足 ±1% 指标的最小表.
+
+通路 (与RTL逐位一致):
+    index  = divisor[15:16-k]
+    offset = divisor低(16-k)位对齐到8位 (recip_offset端口)
+    interp = (base + ((next - base) * offset >>> 8)) mod 2^16
+    result = (dividend * interp) >> 15, 超出结果位宽时饱和
+    Q=24时 result = dividend * 512 / divisor (与原表的缩放一致)
+
+误差指标只在 除数 >= --min-divisor 且 理想结果在 [--min-quotient, 2^结果位宽) 内统计;
+更小的结果仅整数截断误差就超过1%.
+
+用法:
+    python scripts/generate_reciprocal_lut.py                 # 自动选表, 写出 reciprocal_lut.v/映像与误差图
+    python scripts/generate_reciprocal_lut.py --index-bits 8 --rounding round
+    python scripts/generate_reciprocal_lut.py --check-only    # 只评估当前 reciprocal_lut.v
+"""
+
+import argparse
+import json
+import os
+import re
+import warnings
+
+import numpy as np
+
+from mem_image import estimate_drm, read_mem_image, write_if_changed, write_mem_image
+
+OUTPUT_FILE = "source/source/reciprocal_lut.v"
+MEM_FILE = "source/reciprocal_rom.hex"  # 与bcd_lut/ascii_rom的映像同放source目录
+OUTPUT_DIR = "ipcore/reciprocal_lut"
+DIVISOR_BITS = 16
+OFFSET_BITS = 8          # recip_offset端口位宽 (插值 >>> 8)
+PRODUCT_SHIFT = 15       # COMPUTE4: (dividend * interp) >>> 15
+DEFAULT_Q = 24           # 与原表 recip[i] = 2^16/(i+1) 的缩放一致
+DEFAULT_WIDTH = 16
+DEFAULT_SPEC = 0.01
+DEFAULT_MIN_DIVISOR = 256    # 原表注释的有效范围: 1/256 ~ 1/65535
+DEFAULT_MIN_QUOTIENT = 256   # Q8.8的1.0; 更小的结果整数截断误差已接近1%
+RESULT_BITS = 16
+INDEX_BITS_RANGE = range(4, 13)
+ROUNDING = ('round', 'floor', 'ceil', 'minimax')
+DIVIDEND_POINTS = 48     # 代表性被除数: 2^4 ~ 2^16 对数均匀
+MAP_ROWS = 256           # 误差图按除数高8位分行
+
+#=============================================================================
+# 表生成
+#=============================================================================
+def build_table(index_bits, q=DEFAULT_Q, width=DEFAULT_WIDTH, rounding='round'):
+    """生成 2^k+1 项倒数表 (uint64)"""
+    h = 1 << (DIVISOR_BITS - index_bits)
+    i = np.arange((1 << index_bits) + 1)
+    d = (i * h).astype(np.float64)
+    with np.errstate(divide='ignore'):
+        exact = np.where(i > 0, 2.0 ** q / np.maximum(d, 1), np.inf)
+    if rounding == 'minimax':
+        # 区间[a, a+h]上线性插值的最大相对误差 (在 x=sqrt(a(a+h)) 处): (sqrt(b)-sqrt(a))^2/sqrt(ab)
+        a, b = d, d + h
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chord = np.where(i > 0, (np.sqrt(b) - np.sqrt(a)) ** 2 / np.sqrt(a * b), 0)
+        chord[-1] = 0
+        exact = exact * (1 - chord / 2)
+        rounding = 'round'
+    func = {'round': np.round, 'floor': np.floor, 'ceil': np.ceil}[rounding]
+    limit = (1 << width) - 1
+    return np.minimum(func(np.minimum(exact, limit)), limit).astype(np.uint64)
+
+def parse_rtl_table(path=OUTPUT_FILE):
+    """读取现有reciprocal_lut.v引用的映像 + RECIP_LAST, 还原 2^k+1 项表 (不存在时返回None)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    mem = re.search(r'parameter\s+RECIP_ROM_FILE\s*=\s*"([^"]+)"', text)
+    last = re.search(r"localparam\s+\[\d+:0\]\s+RECIP_LAST\s*=\s*\d+'h([0-9A-Fa-f]+);", text)
+    if not mem or not last or not os.path.exists(mem.group(1)):
+        return None
+    return np.append(read_mem_image(mem.group(1)), np.uint64(int(last.group(1), 16)))
+
+#=============================================================================
+# 通路模型 (向量化)
+#=============================================================================
+def align_offset(remainder, index_bits):
+    """除数低(16-k)位 → 8位插值偏移 (recip_offset): 不足8位左移补零, 超过8位取高8位"""
+    ob = DIVISOR_BITS - index_bits
+    if ob <= OFFSET_BITS:
+        return remainder << (OFFSET_BITS - ob)
+    return remainder >> (ob - OFFSET_BITS)
+
+def reciprocal_path(table, index_bits, divisors):
+    """查表 + 插值, 返回16位interp (int64)"""
+    ob = DIVISOR_BITS - index_bits
+    idx = divisors >> ob
+    offset = align_offset(divisors & ((1 << ob) - 1), index_bits)
+    base = table[idx].astype(np.int64)
+    diff = table[idx + 1].astype(np.int64) - base
+    return (base + ((diff * offset) >> OFFSET_BITS)) & 0xFFFF
+
+def error_maps(table, index_bits, q, dividends, min_divisor, min_quotient):
+    """
+    全部除数 × 被除数的相对误差
+
+    返回:
+        (rel, valid, overflow): (65535, len(dividends)) 的相对误差、
+        是否在指标范围内、理想结果是否超出位宽 (除数0由RTL单独处理, 不计)
+    """
+    divisors = np.arange(1, 1 << DIVISOR_BITS, dtype=np.int64)
+    interp = reciprocal_path(table, index_bits, divisors)
+    full = (dividends[None, :] * interp[:, None]) >> PRODUCT_SHIFT
+    ideal = dividends[None, :] * 2.0 ** (q - PRODUCT_SHIFT) / divisors[:, None]
+    overflow = ideal >= (1 << RESULT_BITS)
+    result = np.minimum(full, (1 << RESULT_BITS) - 1)  # RTL超出位宽时饱和
+    rel = np.abs(result - ideal) / ideal
+    valid = (divisors[:, None] >= min_divisor) & (ideal >= min_quotient) & ~overflow
+    return rel, valid, overflow
+
+def summarize(rel, valid):
+    """指标范围内的最大/平均相对误差"""
+    return {'max_rel_error': float(rel[valid].max()), 'mean_rel_error': float(rel[valid].mean())}
+
+def binned_maps(rel, valid):
+    """按除数高8位聚合为 (256, 被除数) 的最大/平均误差图, 无有效点处为NaN"""
+    masked = np.where(valid, rel, np.nan)
+    padded = np.vstack([np.full((1, rel.shape[1]), np.nan), masked])  # 补回除数0
+    blocks = padded.reshape(MAP_ROWS, -1, rel.shape[1])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # 整块无有效点 → NaN
+        return np.nanmax(blocks, axis=1), np.nanmean(blocks, axis=1)
+
+def first_passing_divisor(rel, valid, spec):
+    """从该除数起到65535, 指标范围内全部满足spec的最小除数"""
+    bad = (valid & (rel > spec)).any(axis=1)
+    if not bad.any():
+        return 1
+    return int(np.nonzero(bad)[0].max()) + 2
+
+def describe_passing(divisor):
+    if divisor >= 1 << DIVISOR_BITS:
+        return "任何除数区间都不满足指标"
+    return f"除数 ≥ {divisor} 时满足指标"
+
+def estimate_resources(table, width):
+    """同步读取的双口DRM块数 (每个实例, 末项为常量不占存储)"""
+    return estimate_drm(len(table) - 1, width)
+
+#=============================================================================
+# 搜索
+#=============================================================================
+def sweep(q, width, spec, min_divisor, min_quotient, dividends):
+    """全部 (表大小, 取整方式) 组合的误差与资源"""
+    results = []
+    for k in INDEX_BITS_RANGE:
+        for rounding in ROUNDING:
+            table = build_table(k, q, width, rounding)
+            rel, valid, _ = error_maps(table, k, q, dividends, min_divisor, min_quotient)
+            s = summarize(rel, valid)
+            results.append({
+                'index_bits': k, 'entries': len(table), 'rounding': rounding,
+                'max_rel_error': s['max_rel_error'], 'mean_rel_error': s['mean_rel_error'],
+                'min_passing_divisor': first_passing_divisor(rel, valid, spec),
+                'drm': estimate_resources(table, width),
+                'pass': s['max_rel_error'] <= spec,
+            })
+    return results
+
+def choose(results):
+    """满足指标的最小表; 同样大小取最大误差最小者"""
+    passing = [r for r in results if r['pass']]
+    if not passing:
+        return None
+    return min(passing, key=lambda r: (r['entries'], r['max_rel_error']))
+
+#=============================================================================
+# Verilog生成
+#=============================================================================
+def format_verilog(table, index_bits, q, width, rounding, summary, mem_file):
+    """生成 reciprocal_lut.v (表内容在mem_file中)"""
+    ob = DIVISOR_BITS - index_bits
+    h = 1 << ob
+    digits = (width + 3) // 4
+    last = len(table) - 1
+    if ob <= OFFSET_BITS:
+        pad = OFFSET_BITS - ob
+        offset_expr = (f"{{divisor[{ob - 1}:0], {pad}'d0}}" if pad else f"divisor[{ob - 1}:0]")
+    else:
+        offset_expr = f"divisor[{ob - 1}:{ob - OFFSET_BITS}]"
+
+    lines = [
+        "//=============================================================================",
+        "// 文件名: reciprocal_lut.v",
+        "// 描述: 倒数查找表 (Reciprocal Look-Up Table)",
+        "// 功能: 为除法运算提供倒数近似，配合线性插值使用",
+        "// 自动生成: scripts/generate_reciprocal_lut.py, 请勿手动修改",
+        "//",
+        "// 算法说明:",
+        f"//   - 输入: {DIVISOR_BITS}位除数 (divisor)",
+        f"//   - 表项: recip[i] = {rounding}(2^{q} / (i * {h})), i = 0..{last}",
+        f"//           (i=0及超过{width}位的项饱和到{(1 << width) - 1})",
+        f"//   - 存储: 前{last}项在{mem_file} ($readmemh), 双口DRM同步读取;",
+        f"//           第{last}项只作最高区间的recip_next, 为常量RECIP_LAST",
+        "//   - 延迟: 1周期 (地址寄存一拍后输出, 三个输出对齐)",
+        "//",
+        "// 使用方法:",
+        f"//   1. recip_base = recip[divisor[15:{ob}]], recip_next = 下一项",
+        f"//   2. 线性插值: recip = recip_base + ((recip_next - recip_base) * recip_offset) >>> {OFFSET_BITS}",
+        f"//   3. 计算除法: quotient = (dividend * recip) >> {PRODUCT_SHIFT}"
+        f" = dividend * 2^{q - PRODUCT_SHIFT} / divisor",
+        "//",
+        f"// 精度 (除数 >= {summary['min_divisor']}, 结果 >= {summary['min_quotient']}, 全部除数穷举):",
+        f"//   最大相对误差 {summary['max_rel_error']:.3%}, 平均 {summary['mean_rel_error']:.3%}",
+        "//=============================================================================",
+        "",
+        "module reciprocal_lut #(",
+        f'    parameter RECIP_ROM_FILE = "{mem_file}"  // 仿真时可按工作目录覆盖',
+        ")(",
+        "    input  wire        clk,          // 时钟（同步ROM读取）",
+        f"    input  wire [{DIVISOR_BITS - 1}:0] divisor,      // 除数输入",
+        f"    output wire [{width - 1}:0] recip_base,   // 基础倒数值 (对应 divisor[15:{ob}])",
+        f"    output wire [{width - 1}:0] recip_next,   // 下一个倒数值 (用于插值)",
+        f"    output wire [{OFFSET_BITS - 1}:0]  recip_offset  // 插值偏移 (区间内位置, 满量程256)",
+        ");",
+        "",
+        f"localparam [{width - 1}:0] RECIP_LAST = {width}'h{int(table[last]):0{digits}X};"
+        f"  // recip[{last}] = 2^{q} / {last * h}",
+        "",
+        f"reg [{width - 1}:0] recip_rom [0:{last - 1}];",
+        "",
+        "initial begin",
+        "    $readmemh(RECIP_ROM_FILE, recip_rom);",
+        "end",
+        "",
+        "//=============================================================================",
+        "// 查表逻辑 (同步读取, 推断为双口DRM)",
+        "//=============================================================================",
+        f"wire [{index_bits - 1}:0] lut_index = divisor[{DIVISOR_BITS - 1}:{ob}];",
+        f"wire [{index_bits - 1}:0] lut_index_next = lut_index + 1'b1;  // 最高区间回绕到0, 由last_bin换成RECIP_LAST",
+        "",
+        f"reg [{width - 1}:0] recip_base_reg;",
+        f"reg [{width - 1}:0] recip_next_reg;",
+        f"reg [{OFFSET_BITS - 1}:0]  recip_offset_reg;",
+        "reg        last_bin;",
+        "",
+        "always @(posedge clk) begin",
+        "    recip_base_reg   <= recip_rom[lut_index];",
+        "    recip_next_reg   <= recip_rom[lut_index_next];",
+        f"    recip_offset_reg <= {offset_expr};",
+        "    last_bin         <= &lut_index;",
+        "end",
+        "",
+        "assign recip_base   = recip_base_reg;",
+        "assign recip_next   = last_bin ? RECIP_LAST : recip_next_reg;",
+        "assign recip_offset = recip_offset_reg;",
+        "",
+        "endmodule",
+        "",
+    ]
+    return "\n".join(lines)
+
+#=============================================================================
+# 报告
+#=============================================================================
+def print_sweep(results, chosen, spec):
+    print(f"{'表项':>6}{'取整':>9}{'最大误差':>10}{'平均误差':>10}{'达标起始除数':>14}{'DRM/实例':>10}")
+    for r in results:
+        mark = '  ← 选用' if r is chosen else ('  ✓' if r['pass'] else '')
+        print(f"{r['entries']:>6}{r['rounding']:>9}{r['max_rel_error']:>10.3%}"
+              f"{r['mean_rel_error']:>10.3%}{r['min_passing_divisor']:>14}{r['drm']:>10}{mark}")
+    if chosen is None:
+        print(f"\n⚠️ 没有组合满足 ±{spec:.1%}")
+
+def write_maps(output_dir, max_map, mean_map, dividends):
+    """误差图写成CSV: 每行一个除数区间 (高8位), 每列一个被除数"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for name, data in (('max', max_map), ('mean', mean_map)):
+        header = "divisor_hi," + ",".join(str(int(d)) for d in dividends)
+        rows = [f"{i}," + ",".join('' if np.isnan(v) else f"{v:.6g}" for v in row)
+                for i, row in enumerate(data)]
+        path = os.path.join(output_dir, f"recip_error_{name}.csv")
+        write_if_changed(path, "\n".join([header] + rows) + "\n")
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="倒数查找表生成器 + 插值除法误差图")
+    parser.add_argument('--index-bits', type=int, help="表地址位数k (表项2^k+1); 默认自动选择")
+    parser.add_argument('--rounding', choices=ROUNDING, help="取整方式; 默认自动选择")
+    parser.add_argument('-q', '--q', type=int, default=DEFAULT_Q,
+                        help="倒数小数位 (recip = 2^Q/divisor); 改变后结果缩放随之改变")
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH, help="表项位宽")
+    parser.add_argument('--spec', type=float, default=DEFAULT_SPEC, help="最大相对误差指标")
+    parser.add_argument('--min-divisor', type=int, default=DEFAULT_MIN_DIVISOR,
+                        help="指标适用的最小除数")
+    parser.add_argument('--min-quotient', type=int, default=DEFAULT_MIN_QUOTIENT,
+                        help="指标适用的最小理想结果")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="输出的Verilog文件")
+    parser.add_argument('--mem-file', default=MEM_FILE, help="表内容存储器映像 ($readmemh路径, 相对工程根目录)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="误差图/报告目录")
+    parser.add_argument('--check-only', action='store_true', help="只评估现有reciprocal_lut.v")
+    args = parser.parse_args()
+
+    dividends = np.unique(np.round(np.logspace(4, DIVISOR_BITS, DIVIDEND_POINTS, base=2,
+                                               endpoint=False)).astype(np.int64))
+    print("=== 倒数查找表 + 插值除法 ===")
+    print(f"指标: 最大相对误差 ≤ {args.spec:.1%} (除数 ≥ {args.min_divisor}, "
+          f"结果 ≥ {args.min_quotient}, {len(dividends)} 个被除数 × 65535 个除数)\n")
+
+    current = parse_rtl_table(args.output)
+    if current is not None:
+        k_cur = (len(current) - 1).bit_length() - 1
+        rel, valid, _ = error_maps(current, k_cur, args.q, dividends,
+                                   args.min_divisor, args.min_quotient)
+        s = summarize(rel, valid)
+        print(f"现有 {args.output}: {len(current)} 项, 最大误差 {s['max_rel_error']:.3%}, "
+              f"平均 {s['mean_rel_error']:.3%}, "
+              + describe_passing(first_passing_divisor(rel, valid, args.spec)) + "\n")
+    if args.check_only:
+        return
+
+    results = sweep(args.q, args.width, args.spec, args.min_divisor, args.min_quotient, dividends)
+    if args.index_bits is not None or args.rounding is not None:
+        candidates = [r for r in results
+                      if (args.index_bits is None or r['index_bits'] == args.index_bits)
+                      and (args.rounding is None or r['rounding'] == args.rounding)]
+        chosen = choose(candidates) or min(candidates, key=lambda r: r['max_rel_error'])
+    else:
+        chosen = choose(results)
+    print_sweep(results, chosen, args.spec)
+    if chosen is None:
+        chosen = min(results, key=lambda r: r['max_rel_error'])
+        print(f"   改用误差最小的组合: {chosen['entries']} 项, {chosen['rounding']}")
+
+    k, rounding = chosen['index_bits'], chosen['rounding']
+    table = build_table(k, args.q, args.width, rounding)
+    rel, valid, overflow = error_maps(table, k, args.q, dividends,
+                                      args.min_divisor, args.min_quotient)
+    summary = {
+        'index_bits': k, 'entries': len(table), 'rounding': rounding, 'q': args.q,
+        'width': args.width, 'spec': args.spec, 'min_divisor': args.min_divisor,
+        'min_quotient': args.min_quotient,
+        'max_rel_error': chosen['max_rel_error'], 'mean_rel_error': chosen['mean_rel_error'],
+        'min_passing_divisor': chosen['min_passing_divisor'],
+        'overflow_fraction': float(overflow.mean()), 'drm_per_instance': chosen['drm'],
+    }
+
+    written = write_if_changed(args.output, format_verilog(table, k, args.q, args.width,
+                                                           rounding, summary, args.mem_file))
+    mem_written = write_mem_image(table[:-1], args.mem_file, 'hex', args.width, [
+        f"reciprocal_lut: recip[i] = {rounding}(2^{args.q} / (i * {1 << (DIVISOR_BITS - k)})), "
+        f"i = 0..{len(table) - 2}",
+        "generated by scripts/generate_reciprocal_lut.py"])
+    max_map, mean_map = binned_maps(rel, valid)
+    maps = write_maps(args.output_dir, max_map, mean_map, dividends)
+    report = os.path.join(args.output_dir, 'recip_report.json')
+    write_if_changed(report, json.dumps({'chosen': summary, 'sweep': results,
+                                         'dividends': dividends.tolist()}, indent=2) + "\n")
+
+    print(f"\n选用: {len(table)} 项 ({k}位地址), {rounding}, Q{args.q}, "
+          f"最大误差 {chosen['max_rel_error']:.3%}, 平均 {chosen['mean_rel_error']:.3%}")
+    print(f"{'✓ 写入' if written else '✓ 未变化'}: {args.output}")
+    print(f"{'✓ 写入' if mem_written else '✓ 未变化'}: {args.mem_file} "
+          f"({len(table) - 1}×{args.width}, {chosen['drm']} DRM/实例)")
+    for path in maps + [report]:
+        print(f"✓ 误差图/报告: {path}")
+
+if __name__ == '__main__':
+    main()
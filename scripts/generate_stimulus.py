@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+双通道ADC激励生成器 (测试平台用 $readmemh / $fread 向量)
+
+按 35MSPS (clk_adc) 生成两路 10/11 位ADC码, 分块向量化计算并通过 numpy.memmap
+直接写入输出文件, 秒级长度 (每通道 3500 万点) 的记录也只需几秒, 内存占用只与块长有关.
+仿真中整段向量一次 $readmemh / $fread 读入, 不再在Verilog里逐点循环合成波形.
+
+每个通道:
+    波形     sine / square / triangle / saw, 相位 u=0 处均为上升过中点 (便于相位差对齐)
+    占空比   square 为高电平比例, triangle 为上升段比例 (0.5 为对称三角波), saw 忽略
+    谐波     次数:相对幅度[:相位°], 叠加在基波上 (相对基波幅度, 相位随通道时延同步移动)
+    噪声     高斯白噪声, 单位为ADC码RMS, 两通道独立
+    弱信号   频率:幅度[:通道], 正弦叠加 (可低于噪声, 用于 weak_signal_detector 等)
+ch2 相对 ch1 滞后 --phase 度 (ch1 超前, 与 phase_diff_model.py 约定一致), 按时延实现,
+k 次谐波相应滞后 k×phase. 码值四舍五入后饱和到 [0, 2^bits-1], 饱和点可输出 OTR 位.
+
+块起点相位用分数精确计算 (Fraction), 块内相对相位用float64, 长记录相位不漂移;
+噪声按通道各用一个随机数流, 输出与块长无关 (--check 验证).
+
+输出格式:
+    hex - $readmemh, 每行定宽十六进制 (文件大小预先确定, 按块写入 memmap)
+    bin - $fread, 每个数据 ceil(位宽/8) 字节大端 ($fread 按此读入存储器);
+          注意与 mem_image 的 bin (1/2/4/8字节小端, 供Python读取) 不同
+    npy - NumPy .npy (open_memmap), 码值 int16; 供 param_measure_model.py 等模型 --input 读取
+布局:
+    separate - 每通道一个文件 (<name>_ch1.*, <name>_ch2.*)
+    packed   - 一个文件, 每个数据 {otr2, ch2, otr1, ch1} (npy 为 (N, 2) 数组)
+--signed 输出以中点为零的补码 (如 ai_signal_recognizer 的有符号输入).
+
+同时写出 <name>.json: 参数、文件、位宽、统计 (饱和点数/最值/RMS) 与Verilog读入示例.
+
+用法:
+    python scripts/generate_stimulus.py                                        # 1kHz正弦, 10ms
+    python scripts/generate_stimulus.py --wave square --freq 10000 --duty 0.3 --phase 45
+    python scripts/generate_stimulus.py --freq 1000 --noise 20 --weak 12345:2 --seconds 2 --format bin
+    python scripts/generate_stimulus.py --wave triangle --harmonics 3:0.1,5:0.02:90 --ch2 wave=sine,amp=200
+    python scripts/generate_stimulus.py --bits 11 --signed --layout packed --otr --amp 1100
+    python scripts/generate_stimulus.py --check
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from mem_image import hex_columns, join_columns, read_mem_image, to_words, write_if_changed
+
+OUTPUT_DIR = "sim/stimulus"
+SAMPLE_HZ = 35_000_000          # clk_adc
+WAVES = ('sine', 'square', 'triangle', 'saw')
+FORMATS = ('hex', 'bin', 'npy')
+DEFAULT_CHUNK = 1 << 20
+CH2_KEYS = {'wave': str, 'freq': float, 'amp': float, 'dc': float, 'duty': float, 'noise': float}
+
+#=============================================================================
+# 参数解析
+#=============================================================================
+
+def parse_harmonics(text):
+    """'3:0.1,5:0.02:90' → [(次数, 相对幅度, 相位°), ...]"""
+    result = []
+    for item in filter(None, (text or '').split(',')):
+        parts = item.split(':')
+        if len(parts) not in (2, 3):
+            raise ValueError(f"谐波格式应为 次数:相对幅度[:相位]: {item}")
+        order = int(parts[0])
+        if order < 2:
+            raise ValueError(f"谐波次数须 ≥ 2: {item}")
+        result.append((order, float(parts[1]), float(parts[2]) if len(parts) == 3 else 0.0))
+    return result
+
+def parse_weak(items):
+    """['12345:2', '20000:1.5:2'] → [(频率, 幅度, 通道集合), ...]"""
+    result = []
+    for item in items or []:
+        parts = item.split(':')
+        if len(parts) not in (2, 3):
+            raise ValueError(f"弱信号格式应为 频率:幅度[:通道]: {item}")
+        chans = {1, 2} if len(parts) == 2 else {int(parts[2])}
+        if not chans <= {1, 2}:
+            raise ValueError(f"通道只能是1或2: {item}")
+        result.append((float(parts[0]), float(parts[1]), chans))
+    return result
+
+def parse_overrides(text):
+    """--ch2 'wave=sine,amp=200' → {'wave': 'sine', 'amp': 200.0}"""
+    result = {}
+    for item in filter(None, (text or '').split(',')):
+        key, _, value = item.partition('=')
+        if key not in CH2_KEYS:
+            raise ValueError(f"--ch2 只支持 {', '.join(CH2_KEYS)}: {item}")
+        result[key] = CH2_KEYS[key](value)
+    return result
+
+def build_channels(args):
+    """命令行参数 → 两个通道的配置字典"""
+    base = {'wave': args.wave, 'freq': args.freq, 'amp': args.amp,
+            'dc': (1 << (args.bits - 1)) if args.dc is None else args.dc,
+            'duty': args.duty, 'noise': args.noise, 'harmonics': parse_harmonics(args.harmonics)}
+    weak = parse_weak(args.weak)
+    ch1 = dict(base, delay=0.0, weak=[(f, a) for f, a, c in weak if 1 in c])
+    ch2 = dict(base, **parse_overrides(args.ch2))
+    ch2.update(delay=args.phase / 360.0, weak=[(f, a) for f, a, c in weak if 2 in c])
+    for ch in (ch1, ch2):
+        if ch['wave'] not in WAVES:
+            raise ValueError(f"未知波形 {ch['wave']} (可选 {', '.join(WAVES)})")
+        if not 0.0 < ch['duty'] < 1.0:
+            raise ValueError(f"占空比须在 (0, 1) 内: {ch['duty']}")
+    return [ch1, ch2]
+
+#=============================================================================
+# 波形生成
+#=============================================================================
+
+def cycle_phase(freq, start, n, sample_hz, offset=0.0):
+    """样本 start..start+n-1 的周期内相位 u∈[0,1); 块起点精确计算, 长记录不漂移"""
+    origin = float((Fraction(start) * Fraction(freq) / sample_hz + Fraction(offset)) % 1)
+    return (origin + np.arange(n, dtype=np.float64) * (freq / sample_hz)) % 1.0
+
+def wave_shape(wave, u, duty):
+    """归一化波形 (峰值±1), u=0 为上升过零"""
+    if wave == 'sine':
+        return np.sin(2 * np.pi * u)
+    if wave == 'square':
+        return np.where(u < duty, 1.0, -1.0)
+    if wave == 'triangle':
+        v = (u + duty / 2) % 1.0
+        return np.where(v < duty, -1.0 + 2.0 * v / duty, 1.0 - 2.0 * (v - duty) / (1.0 - duty))
+    return 2.0 * ((u + 0.5) % 1.0) - 1.0
+
+def channel_chunk(ch, start, n, sample_hz, rng):
+    """一个通道一块的模拟值 (ADC码, 未量化)"""
+    x = np.full(n, float(ch['dc']))
+    x += ch['amp'] * wave_shape(ch['wave'], cycle_phase(ch['freq'], start, n, sample_hz, -ch['delay']),
+                                ch['duty'])
+    for order, rel, phase in ch['harmonics']:
+        u = cycle_phase(order * ch['freq'], start, n, sample_hz, phase / 360.0 - order * ch['delay'])
+        x += ch['amp'] * rel * np.sin(2 * np.pi * u)
+    for freq, amp in ch['weak']:
+        x += amp * np.sin(2 * np.pi * cycle_phase(freq, start, n, sample_hz))
+    if ch['noise']:
+        x += rng.normal(0.0, ch['noise'], n)
+    return x
+
+def quantize(x, bits):
+    """四舍五入并饱和 → (码值 int16, 饱和标志)"""
+    code = np.rint(x)
+    top = (1 << bits) - 1
+    otr = (code < 0) | (code > top)
+    return np.clip(code, 0, top).astype(np.int16), otr
+
+def generate_chunks(channels, total, bits, chunk, seed, sample_hz=SAMPLE_HZ):
+    """按块产生 (起点, [ch1码, ch2码], [ch1饱和, ch2饱和])"""
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(channels))]
+    for pos in range(0, total, chunk):
+        n = min(chunk, total - pos)
+        out = [quantize(channel_chunk(ch, pos, n, sample_hz, rng), bits) for ch, rng in zip(channels, rngs)]
+        yield pos, [c for c, _ in out], [o for _, o in out]
+
+#=============================================================================
+# memmap 输出
+#=============================================================================
+
+class StimulusWriter:
+    """
+    一个输出文件: 预先按总点数确定文件大小, 之后每块直接写入 memmap 对应位置
+
+    hex: 注释头 + 定宽行; bin: ceil(width/8) 字节大端; npy: open_memmap.
+    """
+
+    def __init__(self, path, fmt, width, total, columns=1, comments=()):
+        self.path, self.fmt, self.width, self.total = path, fmt, width, total
+        if fmt == 'npy':
+            shape = (total, columns) if columns > 1 else (total,)
+            self.mm = np.lib.format.open_memmap(path, mode='w+', dtype=np.int16, shape=shape)
+            return
+        if fmt == 'hex':
+            header = ''.join(f"// {line}\n" for line in comments).encode('ascii')
+            self.row = (width + 3) // 4 + 1
+        else:
+            header = b''
+            self.row = (width + 7) // 8
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.truncate(len(header) + total * self.row)
+        self.mm = np.memmap(path, dtype=np.uint8, mode='r+', offset=len(header), shape=(total, self.row))
+
+    def write(self, pos, values):
+        """values: npy 为码值 (N,) 或 (N, 2); hex/bin 为 uint64 数据字"""
+        if self.fmt == 'npy':
+            self.mm[pos:pos + len(values)] = values
+        elif self.fmt == 'hex':
+            self.mm[pos:pos + len(values)] = join_columns(hex_columns(values, self.width), b'\n')
+        else:
+            shifts = np.arange(self.row - 1, -1, -1, dtype=np.uint64) * np.uint64(8)
+            self.mm[pos:pos + len(values)] = ((values[:, None] >> shifts) & np.uint64(0xFF)).astype(np.uint8)
+
+    def close(self):
+        self.mm.flush()
+        del self.mm
+
+def data_words(code, otr, bits, signed, with_otr):
+    """码值 (+OTR) → 数据字; signed 时以中点为零按补码截取"""
+    value = code.astype(np.int64) - (1 << (bits - 1)) if signed else code
+    words = to_words(value, bits)
+    if with_otr:
+        words |= otr.astype(np.uint64) << np.uint64(bits)
+    return words
+
+def output_files(name, fmt, layout):
+    ext = '.' + fmt
+    if layout == 'packed':
+        return [name + ext]
+    return [f"{name}_ch1{ext}", f"{name}_ch2{ext}"]
+
+def write_stimulus(channels, args, total, output_dir):
+    """生成并写出全部文件, 返回统计信息"""
+    bits, chw = args.bits, args.bits + int(args.otr)
+    files = output_files(args.name, args.format, args.layout)
+    paths = [os.path.join(output_dir, f) for f in files]
+    comments = [f"generate_stimulus.py: {total} samples @ {args.sample_rate} Hz, {bits}-bit "
+                f"{'signed' if args.signed else 'offset binary'}, otr={'on' if args.otr else 'off'}",
+                f"seed {args.seed}, ch2 lags ch1 by {args.phase:g} deg"]
+    if args.layout == 'packed':
+        comments.append(f"word = {{{'otr2, ' if args.otr else ''}ch2[{bits - 1}:0], "
+                        f"{'otr1, ' if args.otr else ''}ch1[{bits - 1}:0]}}")
+        writers = [StimulusWriter(paths[0], args.format, 2 * chw, total, 2, comments)]
+    else:
+        writers = [StimulusWriter(p, args.format, chw, total, 1, comments + [f"channel {i + 1}"])
+                   for i, p in enumerate(paths)]
+
+    stats = [{'clipped': 0, 'min': None, 'max': None, 'sum': 0.0, 'sum_sq': 0.0} for _ in channels]
+    for pos, codes, otrs in generate_chunks(channels, total, bits, args.chunk, args.seed, args.sample_rate):
+        for st, code, otr in zip(stats, codes, otrs):
+            st['clipped'] += int(otr.sum())
+            st['min'] = int(code.min()) if st['min'] is None else min(st['min'], int(code.min()))
+            st['max'] = int(code.max()) if st['max'] is None else max(st['max'], int(code.max()))
+            st['sum'] += float(code.sum(dtype=np.float64))
+            st['sum_sq'] += float(np.square(code, dtype=np.float64).sum())
+        if args.format == 'npy':
+            vals = [c - (1 << (bits - 1)) if args.signed else c for c in codes]
+            if args.layout == 'packed':
+                writers[0].write(pos, np.stack(vals, axis=1))
+            else:
+                for w, v in zip(writers, vals):
+                    w.write(pos, v)
+            continue
+        words = [data_words(c, o, bits, args.signed, args.otr) for c, o in zip(codes, otrs)]
+        if args.layout == 'packed':
+            writers[0].write(pos, (words[1] << np.uint64(chw)) | words[0])
+        else:
+            for w, word in zip(writers, words):
+                w.write(pos, word)
+    for w in writers:
+        w.close()
+
+    for st in stats:
+        mean = st['sum'] / total
+        st['mean'] = round(mean, 3)
+        st['ac_rms'] = round(float(np.sqrt(max(st['sum_sq'] / total - mean * mean, 0.0))), 3)
+        del st['sum'], st['sum_sq']
+    return files, stats
+
+#=============================================================================
+# Verilog 读入示例
+#=============================================================================
+
+def verilog_snippet(files, args, total):
+    """测试平台读入向量的示例代码"""
+    chw = args.bits + int(args.otr)
+    if args.format == 'npy':
+        return []
+    if args.layout == 'packed':
+        decls = [('stim_mem', 2 * chw, files[0])]
+    else:
+        decls = [(f'ch{i + 1}_mem', chw, f) for i, f in enumerate(files)]
+    lines = [f"reg [{w - 1}:0] {mem} [0:{total - 1}];" for mem, w, _ in decls]
+    if args.format == 'hex':
+        lines += [f'initial $readmemh("{f}", {mem});' for mem, _, f in decls]
+    else:
+        lines += ["integer stim_fd, stim_n;", "initial begin"]
+        for mem, w, f in decls:
+            lines += [f'    stim_fd = $fopen("{f}", "rb");',
+                      f'    stim_n = $fread({mem}, stim_fd);      // 返回 {total * ((w + 7) // 8)} 字节',
+                      '    $fclose(stim_fd);']
+        lines.append("end")
+    return lines
+
+#=============================================================================
+# 自检
+#=============================================================================
+
+def read_back(path, fmt, width, total):
+    """读回输出文件: npy 为码值, hex/bin 为 uint64 数据字"""
+    if fmt == 'npy':
+        return np.load(path)
+    if fmt == 'hex':
+        return read_mem_image(path)
+    raw = np.fromfile(path, dtype=np.uint8).reshape(total, -1).astype(np.uint64)
+    shifts = np.arange(raw.shape[1] - 1, -1, -1, dtype=np.uint64) * np.uint64(8)
+    return (raw << shifts).sum(axis=1, dtype=np.uint64)
+
+def tone_phase(code, freq, sample_hz):
+    """整周期内 IQ 解调得到的基波相位 (度) 与幅度"""
+    n = np.arange(len(code))
+    ref = np.exp(-2j * np.pi * freq / sample_hz * n)
+    z = 2.0 * np.mean((code - code.mean()) * ref)
+    return np.degrees(np.angle(z)), abs(z)
+
+def check(args):
+    """块长无关性 / 长记录相位 / 各格式读回 / 相位差与弱信号幅度"""
+    import tempfile
+    ok = True
+
+    def report(good, text):
+        nonlocal ok
+        ok &= bool(good)
+        print(("✓ " if good else "❌ ") + text)
+
+    args.harmonics, args.weak, args.ch2 = '3:0.1,5:0.05:30', ['1234567:3', '777777:5:2'], 'wave=triangle,duty=0.3'
+    args.wave, args.freq, args.noise, args.phase, args.amp = 'sine', 350000.0, 4.0, 60.0, 500.0
+    channels = build_channels(args)
+    total = 100_003
+    whole = list(generate_chunks(channels, total, args.bits, 1 << 20, args.seed))[0][1]
+    parts = [c for _, c, _ in generate_chunks(channels, total, args.bits, 4099, args.seed)]
+    same = all(np.array_equal(whole[i], np.concatenate([p[i] for p in parts])) for i in range(2))
+    report(same, f"块长 4099 与整块生成逐点相同 ({total} 点, 含噪声/谐波/弱信号)")
+
+    start, freq = 35 * SAMPLE_HZ + 17, 1234567.891
+    u = cycle_phase(freq, start, 1000, SAMPLE_HZ, 0.125)
+    exact = np.array([float((Fraction(start + k) * Fraction(freq) / SAMPLE_HZ + Fraction(0.125)) % 1)
+                      for k in range(1000)])
+    err = np.abs((u - exact + 0.5) % 1.0 - 0.5).max()
+    naive = np.abs(((start + np.arange(1000)) * freq / SAMPLE_HZ + 0.125) % 1.0 - exact)
+    report(err < 1e-9, f"35 s 处相位误差 {err:.1e} 周期 (直接 float64 计算为 {np.minimum(naive, 1 - naive).max():.1e})")
+
+    period = SAMPLE_HZ // 1000
+    args.harmonics, args.weak, args.ch2, args.noise, args.freq = '', ['50000:2'], '', 8.0, 1000.0
+    codes = list(generate_chunks(build_channels(args), 20 * period, args.bits, 1 << 20, args.seed))[0][1]
+    p1, a1 = tone_phase(codes[0], 1000.0, SAMPLE_HZ)
+    p2, _ = tone_phase(codes[1], 1000.0, SAMPLE_HZ)
+    diff = (p1 - p2 + 180.0) % 360.0 - 180.0
+    _, weak_amp = tone_phase(codes[0], 50000.0, SAMPLE_HZ)
+    report(abs(diff - 60.0) < 0.05 and abs(a1 - 500.0) < 0.5,
+           f"ch1 超前 ch2 {diff:.3f}° (设定60°), 基波幅度 {a1:.2f} 码")
+    report(abs(weak_amp - 2.0) < 0.1, f"噪声8码RMS下弱信号幅度 {weak_amp:.3f} 码 (设定2码)")
+
+    args.noise, args.weak, args.amp = 4.0, [], 560.0           # 部分饱和, 覆盖OTR
+    channels = build_channels(args)
+    total = 50_001
+    codes, otrs = list(generate_chunks(channels, total, args.bits, 1 << 20, args.seed))[0][1:]
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            for layout in ('separate', 'packed'):
+                for signed, otr in ((False, False), (True, True)):
+                    args.format, args.layout, args.signed, args.otr, args.chunk = fmt, layout, signed, otr, 7777
+                    args.name = f"chk_{fmt}_{layout}_{int(signed)}"
+                    files, stats = write_stimulus(channels, args, total, tmp)
+                    chw = args.bits + int(otr)
+                    if fmt == 'npy':
+                        want = [c - (1 << (args.bits - 1)) if signed else c for c in codes]
+                        want = [np.stack(want, axis=1)] if layout == 'packed' else want
+                    else:
+                        words = [data_words(c, o, args.bits, signed, otr) for c, o in zip(codes, otrs)]
+                        want = [(words[1] << np.uint64(chw)) | words[0]] if layout == 'packed' else words
+                    width = 2 * chw if layout == 'packed' else chw
+                    got = [read_back(os.path.join(tmp, f), fmt, width, total) for f in files]
+                    good = all(np.array_equal(g, w) for g, w in zip(got, want))
+                    report(good, f"{fmt:<3} {layout:<8} {'补码' if signed else '偏移码'}"
+                                 f"{'+OTR' if otr else ''}: 读回一致, 饱和 {stats[0]['clipped']}/{stats[1]['clipped']} 点")
+    return ok
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="双通道ADC激励生成器 (memmap分块写出测试平台向量)")
+    parser.add_argument('--wave', choices=WAVES, default='sine', help="波形")
+    parser.add_argument('--freq', type=float, default=1000.0, help="基波频率 (Hz)")
+    parser.add_argument('--amp', type=float, default=400.0, help="峰值幅度 (ADC码)")
+    parser.add_argument('--dc', type=float, help="直流 (ADC码, 默认中点)")
+    parser.add_argument('--duty', type=float, default=0.5, help="方波占空比 / 三角波上升段比例")
+    parser.add_argument('--harmonics', help="谐波: 次数:相对幅度[:相位°],... (如 3:0.1,5:0.02:90)")
+    parser.add_argument('--noise', type=float, default=0.0, help="高斯噪声RMS (ADC码, 两通道独立)")
+    parser.add_argument('--weak', action='append', help="弱信号 频率:幅度[:通道] (可多次给出)")
+    parser.add_argument('--phase', type=float, default=0.0, help="ch2 相对 ch1 滞后的相位 (度)")
+    parser.add_argument('--ch2', help="ch2 单独设置: wave=..,freq=..,amp=..,dc=..,duty=..,noise=..")
+    parser.add_argument('--bits', type=int, choices=[10, 11], default=10, help="ADC位数")
+    parser.add_argument('--signed', action='store_true', help="输出以中点为零的补码")
+    parser.add_argument('--otr', action='store_true', help="每通道数据上方附加饱和 (OTR) 位")
+    parser.add_argument('--sample-rate', type=int, default=SAMPLE_HZ, help="采样率 (Hz)")
+    parser.add_argument('--seconds', type=float, default=0.01, help="记录时长 (s)")
+    parser.add_argument('--samples', type=int, help="记录点数 (优先于 --seconds)")
+    parser.add_argument('--format', choices=FORMATS, default='hex', help="输出格式")
+    parser.add_argument('--layout', choices=['separate', 'packed'], default='separate', help="通道布局")
+    parser.add_argument('--name', default='stim', help="输出文件名前缀")
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help="每块点数")
+    parser.add_argument('--seed', type=int, default=1, help="噪声随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="输出目录")
+    parser.add_argument('--check', action='store_true', help="自检 (块长无关/相位精度/读回一致)")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check(args) else 1)
+
+    try:
+        channels = build_channels(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    total = args.samples if args.samples is not None else int(round(args.seconds * args.sample_rate))
+    if total <= 0:
+        print("❌ 记录点数须大于0")
+        sys.exit(1)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"=== 双通道激励: {total:,} 点 @ {args.sample_rate / 1e6:g} MSPS ({total / args.sample_rate:g} s), "
+          f"{args.bits} 位{'补码' if args.signed else '偏移码'}, {args.format} / {args.layout} ===")
+    for i, ch in enumerate(channels):
+        extra = ''.join(f", {k}次谐波 {r:g}" for k, r, _ in ch['harmonics'])
+        extra += ''.join(f", 弱信号 {f:g}Hz/{a:g}码" for f, a in ch['weak'])
+        print(f"  ch{i + 1}: {ch['wave']} {ch['freq']:g} Hz, 幅度 {ch['amp']:g}, 直流 {ch['dc']:g}, "
+              f"占空比 {ch['duty']:g}, 噪声 {ch['noise']:g}{extra}"
+              + (f", 滞后 {args.phase:g}°" if i else ''))
+
+    t0 = time.time()
+    files, stats = write_stimulus(channels, args, total, args.output_dir)
+    elapsed = time.time() - t0
+    for f in files:
+        size = os.path.getsize(os.path.join(args.output_dir, f))
+        print(f"✓ 写入: {os.path.join(args.output_dir, f)} ({size / 2**20:.1f} MiB)")
+    print(f"  用时 {elapsed:.2f} s ({2 * total / max(elapsed, 1e-9) / 1e6:.1f} M点/s)")
+    for i, st in enumerate(stats):
+        print(f"  ch{i + 1}: 码值 {st['min']}~{st['max']}, 均值 {st['mean']:.2f}, 交流RMS {st['ac_rms']:.2f}"
+              + (f"  ⚠️  饱和 {st['clipped']:,} 点" if st['clipped'] else ''))
+
+    snippet = verilog_snippet(files, args, total)
+    if snippet:
+        print("\n测试平台读入:")
+        for line in snippet:
+            print("    " + line)
+
+    chw = args.bits + int(args.otr)
+    word_width = 2 * chw if args.layout == 'packed' else chw
+    manifest = {
+        'generator': 'generate_stimulus.py',
+        'samples': total,
+        'sample_rate': args.sample_rate,
+        'bits': args.bits,
+        'signed': args.signed,
+        'otr': args.otr,
+        'format': args.format,
+        'layout': args.layout,
+        'word_width': word_width,
+        'bytes_per_word': (word_width + 7) // 8 if args.format == 'bin' else None,
+        'files': files,
+        'seed': args.seed,
+        'ch2_lag_deg': args.phase,
+        'channels': channels,
+        'stats': stats,
+        'verilog': snippet,
+    }
+    path = os.path.join(args.output_dir, f"{args.name}.json")
+    if write_if_changed(path, json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"):
+        print(f"✓ 写入: {path}")
+    else:
+        print(f"  未变化: {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+窗函数族生成器 + 频谱质量评估
+支持 Hann / Hamming / Blackman-Harris / Flat-top, 可选窗长度与系数位宽
+
+对每个 (窗函数, 长度, 位宽) 组合, 全部向量化、无需显示器地计算:
+    - 峰值旁瓣电平 (PSL, dB)
+    - 扫描损耗 (scalloping loss, 半个bin处的幅度损失, dB)
+    - 等效噪声带宽 (ENBW, bin)
+    - 相干增益 (coherent gain)
+    - 量化误差 (相对浮点窗的最大/均方根误差, LSB)
+结果写入JSON报告, 用于在 fft_peak_detector.v 的幅度精度与窗ROM大小之间取舍.
+
+系数格式:
+    与 hann_window_8192.hex 相同: scale = 2^(bits-1) - 1 (16位时为32767)
+    非负窗按无符号存储; flat-top有负系数, 按补码有符号存储 (乘法需改为有符号)
+
+用法:
+    python scripts/generate_window.py                       # 4种窗 × 8192点 × 12/14/16/18位
+    python scripts/generate_window.py -N 8192 16384 --bits 14 16
+    python scripts/generate_window.py --window flattop --bits 16 --emit
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from mem_image import write_mem_image
+
+# 余弦和窗系数: w(n) = sum_k (-1)^k * a_k * cos(2*pi*k*n/(N-1)), 对称形式 (与Hann窗ROM一致)
+WINDOW_COEFFS = {
+    'hann':            [0.5, 0.5],
+    'hamming':         [0.54, 0.46],
+    'blackman_harris': [0.35875, 0.48829, 0.14128, 0.01168],
+    'flattop':         [0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368],
+}
+DEFAULT_POINTS = [8192]
+DEFAULT_BITS = [12, 14, 16, 18]
+PAD_FACTOR = 16  # 旁瓣搜索的补零倍数
+MAX_FFT_BYTES = 256 << 20  # 一次rfft的最大内存, 超出时分批
+OUTPUT_DIR = 'ipcore/window_family'
+
+# 位宽推荐门限: 相对浮点窗, PSL劣化不超过1dB且相干增益误差不超过0.01%
+PSL_TOLERANCE_DB = 1.0
+CG_TOLERANCE = 1e-4
+
+def make_window(name, N):
+    """浮点窗函数 (不做归一化, hann与hann_window_8192.hex逐点一致)"""
+    a = np.asarray(WINDOW_COEFFS[name])
+    k = np.arange(len(a))[:, None]
+    n = np.arange(N)[None, :]
+    signs = (-1.0) ** np.arange(len(a))
+    return (signs * a) @ np.cos(2 * np.pi * k * n / (N - 1))
+
+def quantize(window, bits):
+    """
+    量化为定点整数: round(w * (2^(bits-1) - 1))
+
+    返回:
+        (有符号整数系数, 是否需要有符号存储)
+    """
+    scale = (1 << (bits - 1)) - 1
+    q = np.round(window * scale).astype(np.int64)
+    return q, bool((q < 0).any())
+
+def spectral_metrics(windows):
+    """
+    一次性计算一组等长窗的频谱指标
+
+    参数:
+        windows: 形状(K, N)的浮点数组
+
+    返回:
+        dict, 每个值为长度K的数组
+    """
+    K, N = windows.shape
+    n = np.arange(N)
+    total = windows.sum(axis=1)
+
+    coherent_gain = total / N
+    enbw = N * (windows ** 2).sum(axis=1) / total ** 2
+    half_bin = np.abs(windows @ np.exp(-1j * np.pi * n / N))
+    scalloping_db = 20 * np.log10(half_bin / np.abs(total))
+
+    # 峰值旁瓣: 补零FFT, 从DC向外找第一个低于-20dB的极小点作为主瓣边界,
+    # 其外的最大值即PSL (-20dB门限避免把flat-top主瓣顶部的波纹当成零点)
+    nfft = N * PAD_FACTOR
+    batch = max(1, MAX_FFT_BYTES // (nfft * 16))
+    psl_db = np.empty(K)
+    for start in range(0, K, batch):
+        mag = np.abs(np.fft.rfft(windows[start:start + batch], nfft, axis=1))
+        peak = mag.max(axis=1, keepdims=True)
+        null = (np.diff(mag, axis=1) > 0) & (mag[:, :-1] < 0.1 * peak)
+        first_null = null.argmax(axis=1)
+        outside = np.arange(mag.shape[1])[None, :] > first_null[:, None]
+        sidelobe = np.where(outside, mag, 0).max(axis=1)
+        psl_db[start:start + batch] = 20 * np.log10(sidelobe / peak[:, 0])
+
+    return {
+        'coherent_gain': coherent_gain,
+        'enbw_bins': enbw,
+        'scalloping_loss_db': scalloping_db,
+        'worst_case_processing_loss_db': -scalloping_db + 10 * np.log10(enbw),
+        'peak_sidelobe_db': psl_db,
+    }
+
+def evaluate(names, points, bits_list):
+    """
+    评估全部组合
+
+    同一长度的浮点窗与所有位宽的量化窗堆成一个矩阵, 一次计算频谱指标.
+
+    返回:
+        报告条目列表 (每项为可JSON序列化的dict)
+    """
+    entries = []
+    for N in points:
+        rows, meta = [], []
+        for name in names:
+            window = make_window(name, N)
+            rows.append(window)
+            meta.append((name, None, window, None, False))
+            for bits in bits_list:
+                q, signed = quantize(window, bits)
+                scale = (1 << (bits - 1)) - 1
+                rows.append(q / scale)
+                meta.append((name, bits, window, q, signed))
+
+        metrics = spectral_metrics(np.vstack(rows))
+        float_index = {}
+        for i, (name, bits, window, q, signed) in enumerate(meta):
+            entry = {'window': name, 'points': N, 'bits': bits}
+            entry.update({key: float(val[i]) for key, val in metrics.items()})
+            if bits is None:
+                float_index[name] = i
+            else:
+                scale = (1 << (bits - 1)) - 1
+                err = q - window * scale  # 单位: LSB
+                ref = float_index[name]
+                entry.update({
+                    'signed': signed,
+                    'quant_max_error_lsb': float(np.abs(err).max()),
+                    'quant_rms_error_lsb': float(np.sqrt((err ** 2).mean())),
+                    'coherent_gain_error': float(metrics['coherent_gain'][i]
+                                                 / metrics['coherent_gain'][ref] - 1),
+                    'psl_degradation_db': float(metrics['peak_sidelobe_db'][i]
+                                                - metrics['peak_sidelobe_db'][ref]),
+                    'rom_bits': N * bits,
+                    'rom_bits_symmetric': N // 2 * bits,
+                })
+            entries.append(entry)
+    return entries
+
+def recommend(entries):
+    """每个 (窗函数, 长度) 满足门限的最小位宽"""
+    best = {}
+    for e in entries:
+        if e['bits'] is None:
+            continue
+        ok = (e['psl_degradation_db'] <= PSL_TOLERANCE_DB
+              and abs(e['coherent_gain_error']) <= CG_TOLERANCE)
+        key = (e['window'], e['points'])
+        if ok and (key not in best or e['bits'] < best[key]['bits']):
+            best[key] = e
+    return best
+
+def print_report(entries, best):
+    """终端摘要表"""
+    print(f"{'窗函数':<16}{'点数':>7}{'位宽':>6}{'PSL(dB)':>10}{'扫描损耗(dB)':>14}"
+          f"{'ENBW(bin)':>11}{'相干增益':>10}{'量化误差max/rms(LSB)':>24}")
+    for e in entries:
+        bits = 'float' if e['bits'] is None else str(e['bits'])
+        quant = ('' if e['bits'] is None
+                 else f"{e['quant_max_error_lsb']:.3f}/{e['quant_rms_error_lsb']:.3f}")
+        print(f"{e['window']:<16}{e['points']:>7}{bits:>6}{e['peak_sidelobe_db']:>10.2f}"
+              f"{e['scalloping_loss_db']:>14.3f}{e['enbw_bins']:>11.3f}"
+              f"{e['coherent_gain']:>10.4f}{quant:>24}")
+
+    print(f"\n推荐位宽 (PSL劣化≤{PSL_TOLERANCE_DB}dB, 相干增益误差≤{CG_TOLERANCE:.2%}):")
+    for (name, N), e in sorted(best.items()):
+        print(f"  {name:<16}{N:>7}点: {e['bits']}位, ROM {e['rom_bits'] // 1024} Kbit "
+              f"(对称存储 {e['rom_bits_symmetric'] // 1024} Kbit), "
+              f"扫描损耗 {e['scalloping_loss_db']:.3f} dB")
+
+def emit_tables(names, points, bits_list, output_dir):
+    """写出窗系数HEX ($readmemh)"""
+    files = []
+    for N in points:
+        for name in names:
+            window = make_window(name, N)
+            for bits in bits_list:
+                q, _ = quantize(window, bits)
+                path = os.path.join(output_dir, f"{name}_window_{N}_q{bits}.hex")
+                write_mem_image(q, path, 'hex', bits, upper=True)  # 负系数按补码写出
+                files.append(path)
+    return files
+
+def main():
+    parser = argparse.ArgumentParser(description="窗函数族生成器 + 频谱质量评估")
+    parser.add_argument('--window', nargs='+', choices=sorted(WINDOW_COEFFS),
+                        default=list(WINDOW_COEFFS), help="窗函数 (默认全部)")
+    parser.add_argument('-N', '--points', nargs='+', type=int, default=DEFAULT_POINTS,
+                        help="窗长度")
+    parser.add_argument('--bits', nargs='+', type=int, default=DEFAULT_BITS,
+                        help="系数位宽 (含符号位, 16位即Q15)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="报告/系数输出目录")
+    parser.add_argument('--report', help="JSON报告路径 (默认 <output-dir>/window_report.json)")
+    parser.add_argument('--emit', action='store_true', help="同时写出各组合的系数HEX文件")
+    args = parser.parse_args()
+
+    print("=== 窗函数族频谱质量评估 ===\n")
+    entries = evaluate(args.window, args.points, args.bits)
+    best = recommend(entries)
+    print_report(entries, best)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    report = args.report or os.path.join(args.output_dir, 'window_report.json')
+    with open(report, 'w', encoding='utf-8') as f:
+        json.dump({
+            'pad_factor': PAD_FACTOR,
+            'criteria': {'psl_degradation_db': PSL_TOLERANCE_DB,
+                         'coherent_gain_error': CG_TOLERANCE},
+            'recommended': {f"{name}_{N}": e['bits'] for (name, N), e in sorted(best.items())},
+            'entries': entries,
+        }, f, indent=2)
+    print(f"\n✓ 报告已写入: {report}")
+
+    if args.emit:
+        files = emit_tables(args.window, args.points, args.bits, args.output_dir)
+        print(f"✓ 写出 {len(files)} 个系数文件到 {args.output_dir}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+黄金向量导出 + 自检测试平台生成 (RTL回归: 通过/失败计数代替人工看日志)
+
+每个测试 (bench) 由 Python 黄金模型给出:
+    - 激励: 每拍一行, DUT各输入端口打包成 ≤64 位的数据字 ($readmemh)
+    - 期望: 每个输出事务一行 (输出有效 strobe 为1的拍, 或固定延迟的每一拍)
+并生成 tb_<bench>_golden.v: 复位后每个时钟下降沿从激励存储器驱动输入,
+上升沿在 strobe (或固定延迟的内部有效位) 为1时与期望存储器逐个比对,
+只打印前 MAX_REPORT 个不一致, 结束时输出一行
+    GOLDEN_RESULT <bench> PASS|FAIL checked=<比对数> errors=<错误数> expected=<期望数>
+供回归脚本统计; 输出事务数与期望数不同也计为错误.
+
+测试:
+    cordic_atan2        cordic_atan2_model 位精确模型, 全范围/边界输入, valid 随机间隔
+    phase_diff_calc_v4  phase_diff_model 的 v4 互相关 + CORDIC + IIR 模型, valid 按顶层保持25拍,
+                        每拍 both_ready 一次IIR更新, 每次更新一个 phase_valid 事务
+    spectrum_magnitude  spectrum_chain_model.rtl_magnitude + 地址计数, fft_valid 随机间隔
+    bcd_lut             generate_bcd_lut 的表定义 (分段步进截断 + 饱和) 精确十进制, 固定1拍延迟
+    waveform_classifier 决策树逐拍模型 (阻塞赋值的 classify_result/score 跨次保持, 与RTL一致)
+
+黄金模型均为仓库中已有的位精确模型 (分类器除外, 其模型在本脚本中), 期望值与RTL应逐位一致;
+已知的RTL问题在清单 (bench.json) 的 known_issues 中说明. 模型复现了该问题的测试照常通过;
+期望值按设计意图而RTL有缺陷的测试在清单中标 "xfail": true, sim_regression.py 记为 xfail (不计失败).
+
+输出到 sim/golden/<bench>/: stim*.hex, expected*.hex, tb_<bench>_golden.v, bench.json.
+测试平台里的向量路径为相对仓库根目录, 可用参数 VEC_DIR 覆盖; 仿真在仓库根目录运行.
+
+用法:
+    python scripts/golden_vectors.py                          # 生成全部测试
+    python scripts/golden_vectors.py --bench cordic_atan2 --cycles 100000
+    python scripts/golden_vectors.py --list
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from cordic_atan2_model import cordic_atan2, parse_rtl as parse_cordic
+from generate_bcd_lut import TABLES as BCD_TABLES, bcd_encode, expected_display
+from mem_image import to_words, write_if_changed, write_mem_image
+from phase_diff_model import parse_v4, v4_angles, v4_smooth, v4_updates
+from spectrum_chain_model import pack_dout, rtl_magnitude
+
+OUTPUT_DIR = "sim/golden"
+RTL_DIR = "source/source"
+DEFAULT_CYCLES = 20000
+WORD_BITS = 64                  # 每个存储器数据字的最大位宽 (mem_image 上限)
+RESET_CYCLES = 4
+MAX_REPORT = 20
+
+#=============================================================================
+# 测试定义
+#=============================================================================
+# 每个 builder(rng, cycles) 返回 dict:
+#   module, rtl (源文件), data (仿真时读取的数据文件), params (模块参数, Verilog表达式)
+#   inputs [(端口, 位宽)], stim {端口: 每拍数组}, ties {端口: 常量表达式}
+#   outputs [(端口, 位宽, 有符号)], expected {端口: 每个事务数组}
+#   strobe 输出有效端口 或 None; latency 无strobe时的固定延迟 (拍)
+#   extra_outputs [(端口, 位宽)] 不比对的输出; drain 激励结束后等待的拍数; known_issues 说明
+#   xfail 期望值按设计意图, RTL的已知问题使测试预期失败
+#   reset 复位端口 (默认 rst_n, 无复位端口的模块为 None)
+
+def random_valid(rng, cycles, p):
+    return (rng.random(cycles) < p).astype(np.int64)
+
+def bench_cordic(rng, cycles):
+    """全范围 + 小幅度 + 坐标轴/极值输入"""
+    cfg = parse_cordic()
+    w = cfg['width']
+    lo, hi = -(1 << (w - 1)), (1 << (w - 1)) - 1
+    x = rng.integers(lo, hi + 1, cycles)
+    y = rng.integers(lo, hi + 1, cycles)
+    small = rng.random(cycles) < 0.3
+    x[small] >>= rng.integers(0, w - 1, small.sum())
+    y[small] >>= rng.integers(0, w - 1, small.sum())
+    corners = np.array([0, 1, -1, lo, hi])
+    pick = rng.random(cycles) < 0.05
+    x[pick] = rng.choice(corners, pick.sum())
+    y[pick] = rng.choice(corners, pick.sum())
+    valid = random_valid(rng, cycles, 0.7)
+    angle = cordic_atan2(x[valid > 0], y[valid > 0], cfg)
+    return {
+        'module': 'cordic_atan2', 'rtl': ['cordic_atan2.v'], 'data': [],
+        'params': {'WIDTH': w, 'ANGLE_WIDTH': cfg['angle_width'], 'ITERATIONS': cfg['iterations']},
+        'inputs': [('x_in', w), ('y_in', w), ('valid_in', 1)],
+        'stim': {'x_in': x, 'y_in': y, 'valid_in': valid}, 'ties': {},
+        'outputs': [('angle_out', cfg['angle_width'], True)], 'expected': {'angle_out': angle},
+        'strobe': 'valid_out', 'latency': None, 'extra_outputs': [],
+        'drain': cfg['iterations'] + 16, 'known_issues': [], 'xfail': False,
+    }
+
+def bench_phase_diff_v4(rng, cycles):
+    """
+    顶层用法: ch1/ch2 同时 valid 保持 valid_cycles 拍, 之后空闲 (间隔大于流水线深度);
+    输入为极坐标随机复数, 幅度对数均匀 (覆盖 cross 右移0~16位全部归一化档位)
+    """
+    v4 = parse_v4()
+    hold, gap = v4['valid_cycles'], 48
+    count = max(1, cycles // (hold + gap))
+    amp = np.exp(rng.uniform(np.log(2), np.log(32000), (2, count)))
+    ang = rng.uniform(-np.pi, np.pi, (2, count))
+    re_ = np.clip(np.round(amp * np.cos(ang)), -32768, 32767).astype(np.int64)
+    im_ = np.clip(np.round(amp * np.sin(ang)), -32768, 32767).astype(np.int64)
+    angle, mag, _ = v4_angles(re_[0], im_[0], re_[1], im_[1], v4['cordic'])
+
+    updates = v4_updates(hold)
+    phase, _ = v4_smooth(np.repeat(angle, updates)[None, :], v4['smooth_factor'], 1)
+    valid = np.tile(np.r_[np.ones(hold, dtype=np.int64), np.zeros(gap, dtype=np.int64)], count)
+    stim = {}
+    for ch in (0, 1):
+        stim[f'ch{ch + 1}_re'] = np.repeat(re_[ch], hold + gap)
+        stim[f'ch{ch + 1}_im'] = np.repeat(im_[ch], hold + gap)
+        stim[f'ch{ch + 1}_valid'] = valid
+    return {
+        'module': 'phase_diff_calc_v4', 'rtl': ['phase_diff_calc_v4.v', 'cordic_atan2.v'], 'data': [],
+        'params': {},
+        'inputs': [('ch1_re', 16), ('ch1_im', 16), ('ch1_valid', 1),
+                   ('ch2_re', 16), ('ch2_im', 16), ('ch2_valid', 1)],
+        'stim': stim, 'ties': {'enable': "1'b1", 'smooth_factor': f"4'd{v4['smooth_factor']}"},
+        'outputs': [('phase_diff', 16, True), ('phase_confidence', 8, False)],
+        'expected': {'phase_diff': phase[0], 'phase_confidence': np.repeat(mag, updates)},
+        'strobe': 'phase_valid', 'latency': None, 'extra_outputs': [],
+        'drain': gap,
+        'known_issues': [],
+        'xfail': False,
+    }
+
+def bench_spectrum_magnitude(rng, cycles):
+    """fft_dout: 10位符号扩展为主, 加全16位与 -32768/饱和边界; 每8192个有效数据一个 fft_last"""
+    re_ = rng.integers(-512, 512, cycles)
+    im_ = rng.integers(-512, 512, cycles)
+    wide = rng.random(cycles) < 0.2
+    re_[wide] = rng.integers(-32768, 32768, wide.sum())
+    im_[wide] = rng.integers(-32768, 32768, wide.sum())
+    pick = rng.random(cycles) < 0.02
+    re_[pick] = rng.choice([-32768, 32767, 21845, -21846, 0], pick.sum())
+    dout = pack_dout(re_, im_)
+    valid = random_valid(rng, cycles, 0.8)
+    index = np.cumsum(valid) - 1
+    last = valid * ((index % 8192) == 8191)
+    return {
+        'module': 'spectrum_magnitude_calc', 'rtl': ['spectrum_magnitude_calc.v'], 'data': [],
+        'params': {},
+        'inputs': [('fft_dout', 32), ('fft_valid', 1), ('fft_last', 1)],
+        'stim': {'fft_dout': dout, 'fft_valid': valid, 'fft_last': last}, 'ties': {},
+        'outputs': [('magnitude', 16, False), ('magnitude_addr', 13, False)],
+        'expected': {'magnitude': rtl_magnitude(dout[valid > 0]),
+                     'magnitude_addr': index[valid > 0] % 8192},
+        'strobe': 'magnitude_valid', 'latency': None, 'extra_outputs': [('fft_ready', 1)],
+        'drain': 16,
+        'known_issues': ["第4级 mag_temp → mag_calc 两级寄存器只给数据, magnitude_valid 取自 valid_d3: "
+                         "magnitude 比 magnitude_valid/magnitude_addr 晚2拍; 期望值按设计意图 (不含滞后), 标为xfail"],
+        'xfail': True,
+    }
+
+def bench_bcd_lut(rng, cycles):
+    """各表: 范围内均匀 + 分段边界 ±1 + 超范围饱和; 同步读出, 固定1拍延迟"""
+    stim, expected, inputs, outputs = {}, {}, [], []
+    for table in BCD_TABLES:
+        top = table['segments'][-1][1] - 1
+        width = table['in_width']
+        edges = np.array(sorted({v + d for lo, hi, _ in table['segments'] for v in (lo, hi - 1) for d in (-1, 0, 1)
+                                 if v + d >= 0} | {top + 1, (1 << width) - 1}), dtype=np.int64)
+        x = rng.integers(0, top + 1, cycles)
+        over = rng.random(cycles) < 0.05
+        x[over] = rng.integers(top + 1, 1 << min(width, 62), over.sum())
+        pick = rng.random(cycles) < 0.1
+        x[pick] = rng.choice(edges, pick.sum())
+        port = table['input']
+        out = f"{table['name']}_bcd"
+        inputs.append((port, width))
+        outputs.append((out, 4 * table['digits'], False))
+        stim[port] = x
+        expected[out] = bcd_encode(expected_display(table, x), table['digits'])
+    return {
+        'module': 'bcd_lut', 'rtl': ['bcd_lut.v'], 'data': ['source/bcd_duty_rom.hex'],
+        'params': {'DUTY_ROM_FILE': '"source/bcd_duty_rom.hex"'},
+        'inputs': inputs, 'stim': stim, 'ties': {},
+        'outputs': outputs, 'expected': expected,
+        'strobe': None, 'latency': 1, 'extra_outputs': [], 'drain': 4, 'known_issues': [], 'xfail': False,
+        'reset': None,
+    }
+
+#-----------------------------------------------------------------------------
+# waveform_classifier 逐拍模型
+#-----------------------------------------------------------------------------
+CLASSIFIER_FEATURES = ['zcr', 'crest_factor', 'form_factor', 'mean_value', 'std_dev',
+                       'thd', 'spectral_centroid', 'spectral_spread']
+TYPE_UNKNOWN, TYPE_SINE, TYPE_SQUARE, TYPE_TRIANGLE, TYPE_SAWTOOTH, TYPE_NOISE = range(6)
+
+def classify(f, state):
+    """
+    waveform_classifier.v 一次 features_valid 的决策树
+
+    classify_result/score 为阻塞赋值的寄存器: 规则1~3 进入分支但匹配数不足时保持上一次的值.
+    mean_value 条件中 -16'd100 是无符号 65436, (mean < 100) && (mean > 65436) 恒为假.
+    """
+    result, score = state
+    thd, cf, ff, zcr = f['thd'], f['crest_factor'], f['form_factor'], f['zcr']
+    match = 0
+    if thd < 8:
+        match += 2 if 350 <= cf <= 400 else 0
+        match += 2 if 270 <= ff <= 300 else 0
+        if match >= 3:
+            result, score = TYPE_SINE, 90 + match * 2
+    elif thd >= 30 and zcr < 2048:
+        match = 2 + (2 if cf <= 280 else 0)
+        if match >= 3:
+            result, score = TYPE_SQUARE, 85 + match * 2
+    elif 10 <= thd <= 25:
+        match += 2 if 420 <= cf <= 480 else 0
+        match += 2 if 280 <= ff <= 320 else 0
+        if match >= 2:
+            result, score = TYPE_TRIANGLE, 80 + match * 3
+    elif thd >= 20 and cf >= 400 and zcr >= 1024:
+        result, score = TYPE_SAWTOOTH, 75
+    elif thd >= 60 or zcr >= 8192:
+        result, score = TYPE_NOISE, 70
+    else:
+        result, score = TYPE_UNKNOWN, 50
+    if f['spectral_spread'] < 256 and result != TYPE_NOISE:
+        score = score + 5 if score < 95 else 100
+    if f['mean_value'] < 100 and f['mean_value'] > (-100 & 0xFFFF):
+        score = score + 2 if score < 98 else 100
+    return (result, score), (result, min(score, 100))
+
+def bench_classifier(rng, cycles):
+    """特征取值集中在各阈值附近, features_valid 随机"""
+    ranges = {'zcr': (0, 12000), 'crest_factor': (240, 520), 'form_factor': (250, 340),
+              'mean_value': (0, 65536), 'std_dev': (0, 65536), 'thd': (0, 90),
+              'spectral_centroid': (0, 65536), 'spectral_spread': (0, 600)}
+    stim = {k: rng.integers(lo, hi, cycles) for k, (lo, hi) in ranges.items()}
+    near = rng.random(cycles) < 0.3
+    stim['mean_value'][near] = rng.choice([0, 99, 100, 65436, 65437, 65535], near.sum())
+    valid = random_valid(rng, cycles, 0.4)
+    stim['features_valid'] = valid
+    state = (TYPE_UNKNOWN, 0)
+    types, confs = [], []
+    for i in np.flatnonzero(valid):
+        state, (t, c) = classify({k: int(stim[k][i]) for k in CLASSIFIER_FEATURES}, state)
+        types.append(t)
+        confs.append(c)
+    return {
+        'module': 'waveform_classifier', 'rtl': ['waveform_classifier.v'], 'data': [], 'params': {},
+        'inputs': [(k, 16) for k in CLASSIFIER_FEATURES] + [('features_valid', 1)],
+        'stim': stim, 'ties': {},
+        'outputs': [('waveform_type', 3, False), ('confidence', 8, False)],
+        'expected': {'waveform_type': np.array(types, dtype=np.int64),
+                     'confidence': np.array(confs, dtype=np.int64)},
+        'strobe': 'classification_valid', 'latency': None, 'extra_outputs': [], 'drain': 4,
+        'known_issues': ["均值置信度修正 (mean_value > -16'd100) 按无符号比较恒不成立, +2 分永远不生效"],
+        'xfail': False,
+    }
+
+BENCHES = {
+    'cordic_atan2': bench_cordic,
+    'phase_diff_calc_v4': bench_phase_diff_v4,
+    'spectrum_magnitude': bench_spectrum_magnitude,
+    'bcd_lut': bench_bcd_lut,
+    'waveform_classifier': bench_classifier,
+}
+
+#=============================================================================
+# 打包与存储器文件
+#=============================================================================
+
+def pack_groups(ports):
+    """端口按顺序分组, 每组总位宽 ≤ WORD_BITS; 组内第一个端口在最高位"""
+    groups, cur, width = [], [], 0
+    for port in ports:
+        if cur and width + port[1] > WORD_BITS:
+            groups.append(cur)
+            cur, width = [], 0
+        cur.append(port)
+        width += port[1]
+    if cur:
+        groups.append(cur)
+    return groups
+
+def pack_words(group, columns):
+    """一组端口的列 → uint64 数据字 (各列按补码截取到端口位宽)"""
+    word = None
+    for name, width in group:
+        w = to_words(np.asarray(columns[name], dtype=np.int64), width)
+        word = w if word is None else (word << np.uint64(width)) | w
+    return word
+
+def write_vectors(bench, name, out_dir):
+    """写激励/期望存储器文件, 返回 [(文件名, 分组, 深度)]"""
+    files = []
+    for kind, ports, columns in (('stim', bench['inputs'], bench['stim']),
+                                 ('expected', [(p, w) for p, w, _ in bench['outputs']], bench['expected'])):
+        groups = pack_groups(ports)
+        for gi, group in enumerate(groups):
+            fname = f"{kind}{gi if len(groups) > 1 else ''}.hex"
+            words = pack_words(group, columns)
+            width = sum(w for _, w in group)
+            fields = ', '.join(f"{p}[{w - 1}:0]" if w > 1 else p for p, w in group)
+            write_mem_image(words, os.path.join(out_dir, fname), 'hex', width,
+                            [f"golden_vectors.py {name}: {kind} {{{fields}}}, {len(words)} words"])
+            files.append((fname, kind, group, len(words)))
+    return files
+
+#=============================================================================
+# 测试平台生成
+#=============================================================================
+
+def decl(width, name, kind='reg'):
+    return f"{kind} [{width - 1}:0] {name}" if width > 1 else f"{kind}        {name}"
+
+def field_slices(group):
+    """组内各端口在数据字中的 [hi:lo]"""
+    total = sum(w for _, w in group)
+    pos, result = total, []
+    for port, width in group:
+        result.append((port, width, pos - 1, pos - width))
+        pos -= width
+    return result
+
+def testbench_verilog(bench, name, files, out_dir):
+    """生成自检测试平台 (Verilog-2001, Icarus/Verilator/ModelSim 通用)"""
+    stim = [f for f in files if f[1] == 'stim']
+    exp = [f for f in files if f[1] == 'expected']
+    n_stim, n_exp = stim[0][3], exp[0][3]
+    tb = f"tb_{name}_golden"
+    signed = {p: s for p, _, s in bench['outputs']}
+    L = []
+    add = L.append
+    add("//" + "=" * 77)
+    add(f"// 文件名: {tb}.v")
+    add(f"// 描述: {bench['module']} 黄金向量自检测试平台")
+    add("// 由 scripts/golden_vectors.py 自动生成, 请勿手工修改")
+    add("// 激励逐拍驱动, 输出事务与Python黄金模型逐个比对, 只报告不一致")
+    for issue in bench['known_issues']:
+        add(f"// 已知问题: {issue}")
+    if bench['xfail']:
+        add("// 预期失败 (xfail): 期望值按设计意图, 上述问题修复前比对不通过")
+    add("//" + "=" * 77)
+    add("")
+    add("`timescale 1ns/1ps")
+    add("")
+    add(f"module {tb};")
+    add("")
+    add(f'parameter VEC_DIR    = "{out_dir.replace(os.sep, "/")}/";')
+    add(f"parameter N_STIM     = {n_stim};")
+    add(f"parameter N_EXP      = {n_exp};")
+    add(f"parameter MAX_REPORT = {MAX_REPORT};")
+    add(f"parameter DRAIN      = {bench['drain']};")
+    if bench['latency']:
+        add(f"parameter LATENCY    = {bench['latency']};")
+    add("")
+    add("reg clk = 1'b0;")
+    add("reg rst_n = 1'b0;")
+    add("always #5 clk = ~clk;")
+    add("")
+    add("// 向量存储器")
+    for fname, _, group, depth in files:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        add(f"{decl(sum(w for _, w in group), mem)} [0:{depth - 1}];")
+    add("")
+    add("// DUT 端口")
+    for port, width in bench['inputs']:
+        add(decl(width, port) + ";")
+    for port, width, _ in bench['outputs']:
+        add(decl(width, port, 'wire') + ";")
+    if bench['strobe']:
+        add(decl(1, bench['strobe'], 'wire') + ";")
+    for port, width in bench['extra_outputs']:
+        add(decl(width, port, 'wire') + ";")
+    add("")
+
+    params = ', '.join(f".{k}({v})" for k, v in bench['params'].items())
+    add(f"{bench['module']} " + (f"#({params}) " if params else "") + "dut (")
+    conns = [('clk', 'clk')]
+    if bench.get('reset', 'rst_n'):
+        conns.append((bench.get('reset', 'rst_n'), 'rst_n'))
+    conns += [(p, p) for p, _ in bench['inputs']]
+    conns += list(bench['ties'].items())
+    conns += [(p, p) for p, _, _ in bench['outputs']]
+    if bench['strobe']:
+        conns.append((bench['strobe'], bench['strobe']))
+    conns += [(p, p) for p, _ in bench['extra_outputs']]
+    width = max(len(p) for p, _ in conns)
+    for i, (port, sig) in enumerate(conns):
+        add(f"    .{port:<{width}} ({sig})" + ("," if i < len(conns) - 1 else ""))
+    add(");")
+    add("")
+
+    in_groups = [(os.path.splitext(f)[0] + "_mem", g) for f, _, g, _ in stim]
+    add("// 激励: 下降沿驱动, 避免与DUT采样竞争")
+    add("integer cyc;")
+    add("reg     driving = 1'b0;")
+    add("reg     done = 1'b0;")
+    add("initial begin")
+    for fname, _, _, _ in files:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        add(f'    $readmemh({{VEC_DIR, "{fname}"}}, {mem});')
+    for port, _ in bench['inputs']:
+        add(f"    {port} = 0;")
+    add(f"    repeat ({RESET_CYCLES}) @(posedge clk);")
+    add("    @(negedge clk) rst_n = 1'b1;")
+    add("    for (cyc = 0; cyc < N_STIM; cyc = cyc + 1) begin")
+    for mem, group in in_groups:
+        lhs = ', '.join(p for p, _ in group)
+        add(f"        {{{lhs}}} = {mem}[cyc];")
+    add("        driving = 1'b1;")
+    add("        @(negedge clk);")
+    add("    end")
+    for port, _ in bench['inputs']:
+        add(f"    {port} = 0;")
+    add("    driving = 1'b0;")
+    add("    repeat (DRAIN) @(negedge clk);")
+    add("    done = 1'b1;")
+    add("end")
+    add("")
+
+    if bench['strobe']:
+        check = bench['strobe']
+    else:
+        add("// 无输出有效信号: 驱动标志延迟 LATENCY 拍作为比对时刻")
+        add("reg [LATENCY-1:0] check_pipe = 0;")
+        add("always @(posedge clk) check_pipe <= {check_pipe, driving};")
+        add("")
+        check = "check_pipe[LATENCY-1]"
+
+    add("// 比对: 上升沿采样寄存器输出 (DUT本沿的非阻塞更新尚未生效)")
+    add("integer n_out = 0;")
+    add("integer n_err = 0;")
+    for fname, _, group, _ in exp:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        add(f"{decl(sum(w for _, w in group), 'want_' + mem)};")
+    add("reg     bad;")
+    add("always @(posedge clk) begin")
+    add(f"    if (rst_n && !done && {check}) begin")
+    add("        if (n_out >= N_EXP) begin")
+    add("            n_err = n_err + 1;")
+    add("            if (n_err <= MAX_REPORT)")
+    add(f'                $display("[GOLDEN] {name}: unexpected extra output #%0d @%0t", n_out, $time);')
+    add("        end else begin")
+    for fname, _, group, _ in exp:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        add(f"            want_{mem} = {mem}[n_out];")
+    cmp = []
+    for fname, _, group, _ in exp:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        cmp.append(f"(want_{mem} !== {{{', '.join(p for p, _ in group)}}})")
+    add(f"            bad = {' || '.join(cmp)};")
+    add("            if (bad) begin")
+    add("                n_err = n_err + 1;")
+    add("                if (n_err <= MAX_REPORT) begin")
+    add(f'                    $display("[GOLDEN] {name}: mismatch #%0d @%0t", n_out, $time);')
+    for fname, _, group, _ in exp:
+        mem = os.path.splitext(fname)[0] + "_mem"
+        for port, w, hi, lo in field_slices(group):
+            want = f"want_{mem}[{hi}:{lo}]" if w > 1 else f"want_{mem}[{hi}]"
+            if signed.get(port):
+                want, got = f"$signed({want})", f"$signed({port})"
+            else:
+                got = port
+            add(f'                    $display("    {port:<18} expected %0d  got %0d", {want}, {got});')
+    add("                end")
+    add("            end")
+    add("        end")
+    add("        n_out = n_out + 1;")
+    add("    end")
+    add("end")
+    add("")
+    add("initial begin")
+    add("    wait (done);")
+    add("    if (n_out != N_EXP) begin")
+    add(f'        $display("[GOLDEN] {name}: %0d outputs, expected %0d", n_out, N_EXP);')
+    add("        if (n_out < N_EXP) n_err = n_err + (N_EXP - n_out);")
+    add("    end")
+    add("    if (n_err == 0)")
+    add(f'        $display("GOLDEN_RESULT {name} PASS checked=%0d errors=0 expected=%0d", n_out, N_EXP);')
+    add("    else")
+    add(f'        $display("GOLDEN_RESULT {name} FAIL checked=%0d errors=%0d expected=%0d", n_out, n_err, N_EXP);')
+    add("    $finish;")
+    add("end")
+    add("")
+    add("endmodule")
+    return "\n".join(L) + "\n"
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def build(name, rng, cycles, output_dir):
+    """生成一个测试的向量、测试平台与清单, 返回清单"""
+    bench = BENCHES[name](rng, cycles)
+    n_stim = len(next(iter(bench['stim'].values())))
+    n_exp = len(next(iter(bench['expected'].values())))
+    if n_exp == 0:
+        raise ValueError(f"{name}: 激励没有产生任何期望输出")
+    out_dir = os.path.join(output_dir, name)
+    os.makedirs(out_dir, exist_ok=True)
+    files = write_vectors(bench, name, out_dir)
+    tb_file = os.path.join(out_dir, f"tb_{name}_golden.v")
+    changed = write_if_changed(tb_file, testbench_verilog(bench, name, files, out_dir))
+    manifest = {
+        'bench': name,
+        'module': bench['module'],
+        'top': f"tb_{name}_golden",
+        'testbench': tb_file.replace(os.sep, '/'),
+        'rtl': [f"{RTL_DIR}/{f}" for f in bench['rtl']],
+        'data': bench['data'],
+        'vectors': [os.path.join(out_dir, f).replace(os.sep, '/') for f, _, _, _ in files],
+        'stim_cycles': n_stim,
+        'expected_transactions': n_exp,
+        'compare': f"strobe {bench['strobe']}" if bench['strobe'] else f"latency {bench['latency']}",
+        'known_issues': bench['known_issues'],
+        'xfail': bench['xfail'],
+    }
+    write_if_changed(os.path.join(out_dir, 'bench.json'), json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+    return manifest, changed
+
+def main():
+    parser = argparse.ArgumentParser(description="黄金向量导出与自检测试平台生成")
+    parser.add_argument('--bench', action='append', choices=list(BENCHES), help="只生成指定测试 (可多次给出)")
+    parser.add_argument('--cycles', type=int, default=DEFAULT_CYCLES, help="每个测试的激励拍数 (约)")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="输出目录")
+    parser.add_argument('--list', action='store_true', help="列出测试")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, fn in BENCHES.items():
+            print(f"  {name:<20} {fn.__doc__.strip().splitlines()[0]}")
+        return
+
+    names = args.bench or list(BENCHES)
+    print(f"=== 黄金向量: {len(names)} 个测试, 每个约 {args.cycles:,} 拍, 种子 {args.seed} ===")
+    seeds = np.random.SeedSequence(args.seed).spawn(len(BENCHES))
+    ok = True
+    for name in names:
+        rng = np.random.default_rng(seeds[list(BENCHES).index(name)])
+        try:
+            manifest, changed = build(name, rng, args.cycles, args.output_dir)
+        except ValueError as e:
+            print(f"❌ {name}: {e}")
+            ok = False
+            continue
+        print(f"✓ {name:<20} {manifest['stim_cycles']:>7,} 拍激励, {manifest['expected_transactions']:>7,} 个期望事务 "
+              f"({manifest['compare']}) → {manifest['testbench']}" + ("" if changed else " (未变化)")
+              + (" [xfail]" if manifest['xfail'] else ""))
+        for issue in manifest['known_issues']:
+            print(f"   ⚠️  {issue}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+    main()
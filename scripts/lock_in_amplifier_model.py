@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lock_in_amplifier.v 流式位精确模型 (分块处理, 内存占用与记录长度无关)
+
+逐周期等价于RTL: DDS相位累加器 → 高DDS_ADDR_BITS位地址查正/余弦表 (从生成的dds_sin_lut.vh读回)
+→ 增益移位 → I/Q混频取[46:15] → 2^LPF_ORDER点积分-梳状滑动平均
+→ 每8个时钟抽取一次 → 幅度/相位近似 → 16点幅度历史锁定检测.
+各级寄存器流水 (包括输出级 i_abs/q_abs/mag_calc 的一拍滞后) 与RTL相同,
+全部状态在块之间传递, 所以按任意块长切分得到的结果完全一致.
+
+时序约定 (与测试平台对应):
+    第t个输入 (signal_in, signal_valid, ref_ext_signal) 在第t个时钟上升沿被采样;
+    输出记录的 cycle 为 result_valid 变为1的那个上升沿, 记录中的
+    i_channel/q_channel/magnitude/phase/locked 为该沿之后的寄存器值.
+    对应RTL转储: always @(posedge clk) if (result_valid)
+                     $fwrite(fd, "%0d %0d %0d %0d %0d %0d\\n", cycle, i_channel,
+                             q_channel, magnitude, phase, locked);
+    (cycle 为复位释放后的上升沿计数, 从0开始; i_abs/q_abs/mag_calc 没有复位,
+     仿真中前两个记录的 magnitude/phase 为X, 模型按上电为0处理)
+
+用法:
+    python scripts/lock_in_amplifier_model.py                          # 1秒35MSPS, 10kHz, SNR -40dB
+    python scripts/lock_in_amplifier_model.py --seconds 5 --snr -40 --output lia.csv
+    python scripts/lock_in_amplifier_model.py --input adc.npy --output lia.csv
+    python scripts/lock_in_amplifier_model.py --compare rtl_dump.txt   # 与RTL转储逐记录比对
+"""
+
+import argparse
+import re
+import sys
+
+import numpy as np
+
+from generate_dds_table import LUT_FILE, PARAMS_FILE, read_lut
+
+RTL_FILE = "source/source/lock_in_amplifier.v"
+
+CLK_HZ = 35_000_000             # weak_signal_detector 的 clk_adc
+ADC_BITS = 11                   # signal_analyzer_top: {5'd0, ch_data_11b}
+CHUNK = 1 << 20                 # 每块时钟周期数
+LOCK_HISTORY = 16               # mag_history 深度
+
+RECORD_FIELDS = ('cycle', 'i_channel', 'q_channel', 'magnitude', 'phase', 'locked')
+
+#=============================================================================
+# RTL解析
+#=============================================================================
+
+def parse_rtl(path=RTL_FILE):
+    """
+    解析参数默认值、抽取因子, 并读回 `include 的正弦表
+
+    返回:
+        dict(data_width, phase_width, lpf_order, output_width, decimation,
+             addr_bits, sin_table, tw_mult, tw_shift)
+        sin_table: 2^addr_bits 项int64, 即 sin_lut_func(addr) 对全部地址的取值
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    def param(name):
+        m = re.search(rf'(?:parameter|localparam)\s+{name}\s*=\s*(\d+)', text)
+        if not m:
+            raise ValueError(f"{path} 中找不到参数 {name}")
+        return int(m.group(1))
+
+    if 'dds_sin_lut.vh' not in text:
+        raise ValueError(f"{path} 没有 `include dds_sin_lut.vh")
+    lut = read_lut(LUT_FILE, PARAMS_FILE)
+
+    return {
+        'data_width': param('DATA_WIDTH'),
+        'phase_width': param('PHASE_WIDTH'),
+        'lpf_order': param('LPF_ORDER'),
+        'output_width': param('OUTPUT_WIDTH'),
+        'decimation': param('DECIMATION_FACTOR'),
+        'addr_bits': lut['addr_bits'],
+        'sin_table': lut['output'],
+        'tw_mult': lut['tw_mult'],
+        'tw_shift': lut['tw_shift'],
+    }
+
+def wrap(v, bits):
+    """补码回绕到bits位"""
+    half = 1 << (bits - 1)
+    return ((v + half) & ((1 << bits) - 1)) - half
+
+def tuning_word(ref_hz, rtl):
+    """weak_signal_detector.v 的算法: (ref_frequency × DDS_TW_MULT + 舍入) >> DDS_TW_SHIFT, 32位"""
+    shift = rtl['tw_shift']
+    return ((int(ref_hz) * rtl['tw_mult'] + (1 << (shift - 1))) >> shift) & 0xFFFFFFFF
+
+#=============================================================================
+# 流式模型
+#=============================================================================
+
+class LockInAmplifierModel:
+    """
+    lock_in_amplifier 的逐周期位精确模型, 状态在 process() 调用之间保持
+
+    参数:
+        rtl: parse_rtl() 的结果
+        ref_freq_tuning: 频率调谐字 (32位)
+        gain_shift: 数字增益 0-15
+        ref_ext_enable: True 时用 ref_ext_signal 作为I/Q两路参考
+    """
+
+    def __init__(self, rtl, ref_freq_tuning, gain_shift=0, ref_ext_enable=False):
+        self.rtl = rtl
+        self.tw = int(ref_freq_tuning) & ((1 << rtl['phase_width']) - 1)
+        self.gain = int(gain_shift)
+        self.ext = bool(ref_ext_enable)
+        self.taps = 1 << rtl['lpf_order']
+        self.acc_bits = rtl['output_width'] + rtl['lpf_order']
+        self.out_bits = rtl['output_width']
+        self.mix_msb = rtl['data_width'] + 30
+
+        self.cycle = 0                  # 已处理的时钟周期数
+        self.samples = 0                # 已接收的有效样本数 (= DDS累加次数)
+        self.phase_acc = 0
+        self.integ = np.zeros(2, dtype=np.int64)                          # I/Q积分器
+        self.integ_hist = np.zeros((2, self.taps), dtype=np.int64)       # 最近taps个积分器旧值
+        self.filter_valid_edge = None   # filter_valid 置1的时钟沿
+        self.next_decim = None          # 下一个抽取沿
+        self.comb_edges = np.zeros(0, dtype=np.int64)                    # 尚需使用的梳状输出 (沿, I, Q)
+        self.comb_vals = np.zeros((2, 0), dtype=np.int64)
+        self.abs_prev = np.zeros(2, dtype=np.int64)                      # i_abs/q_abs (上电为0)
+        self.mag_calc = 0
+        self.magnitude = 0
+        self.mag_hist = np.zeros(LOCK_HISTORY, dtype=np.int64)           # 最近16个已写入的幅度
+        self.lock = 0
+
+    def mixer(self, signal, ref_ext):
+        """有效样本 → 积分器输入 mixer[46:15] (I, Q)"""
+        n = len(signal)
+        pw = self.rtl['phase_width']
+        if self.ext:
+            ref_sin = ref_cos = wrap(ref_ext, self.rtl['data_width'])
+        else:
+            # 第k个样本用累加k次后的相位 (ref_sin/ref_cos比signal_gain晚采样一拍的相位)
+            acc = (self.phase_acc + np.arange(n, dtype=np.uint64) * np.uint64(self.tw)) \
+                & np.uint64((1 << pw) - 1)
+            bits = self.rtl['addr_bits']
+            addr = (acc >> np.uint64(pw - bits)).astype(np.int64)
+            table = self.rtl['sin_table']
+            ref_sin = table[addr]
+            ref_cos = table[(addr + (1 << (bits - 2))) & ((1 << bits) - 1)]
+        self.phase_acc = (self.phase_acc + n * self.tw) & ((1 << pw) - 1)
+        signal = wrap(signal, self.rtl['data_width'])
+        gained = wrap(signal << self.gain, self.rtl['data_width'] + 16)
+        shift = self.mix_msb - self.acc_bits + 1
+        mix = np.stack([gained * ref_cos, gained * ref_sin])
+        return wrap(mix >> shift, self.acc_bits)
+
+    def integrate(self, mix):
+        """积分-梳状: 返回每次更新后的 i_comb/q_comb"""
+        n = mix.shape[1]
+        if n == 0:
+            return mix
+        sums = np.cumsum(mix, axis=1)
+        before = wrap(self.integ[:, None] + np.concatenate(
+            [np.zeros((2, 1), dtype=np.int64), sums[:, :-1]], axis=1), self.acc_bits)
+        self.integ = wrap(self.integ + sums[:, -1], self.acc_bits)
+        hist = np.concatenate([self.integ_hist, before], axis=1)
+        comb = wrap(before - hist[:, :n], self.acc_bits)
+        self.integ_hist = hist[:, -self.taps:]
+        return comb
+
+    def process(self, signal, valid=None, ref_ext=None):
+        """
+        处理一块逐周期输入
+
+        参数:
+            signal: 每个时钟的 signal_in (整数数组)
+            valid: 每个时钟的 signal_valid (None表示全部有效)
+            ref_ext: 每个时钟的 ref_ext_signal (ref_ext_enable 时需要)
+
+        返回:
+            dict, 字段见 RECORD_FIELDS, 每项为本块内产生的输出记录数组
+        """
+        signal = np.asarray(signal, dtype=np.int64)
+        length = len(signal)
+        t0 = self.cycle
+        idx = np.arange(length) if valid is None else np.flatnonzero(valid)
+        if self.ext and ref_ext is None:
+            raise ValueError("ref_ext_enable 时需要 ref_ext 序列")
+        ref = None if ref_ext is None else np.asarray(ref_ext, dtype=np.int64)[idx]
+
+        # 第k个有效样本在第c个沿被采样, 第c+2个沿更新积分器/梳状寄存器
+        comb = self.integrate(self.mixer(signal[idx], ref))
+        edges = t0 + idx.astype(np.int64) + 2
+        k = self.samples + np.arange(len(idx))
+        if self.filter_valid_edge is None and len(idx) and k[-1] >= self.taps:
+            self.filter_valid_edge = int(edges[self.taps - self.samples])
+            self.next_decim = self.filter_valid_edge + self.rtl['decimation']
+        self.samples += len(idx)
+        self.cycle += length
+        self.comb_edges = np.concatenate([self.comb_edges, edges])
+        self.comb_vals = np.concatenate([self.comb_vals, comb], axis=1)
+
+        # 抽取沿d取d-1沿之后的梳状值, d+1沿输出记录; 只输出本块之内的记录
+        if self.next_decim is None or self.next_decim + 1 >= self.cycle:
+            return empty_records()
+        decim = np.arange(self.next_decim, self.cycle - 1, self.rtl['decimation'], dtype=np.int64)
+        self.next_decim = int(decim[-1]) + self.rtl['decimation']
+        pos = np.searchsorted(self.comb_edges, decim - 1, side='right') - 1
+        vals = self.comb_vals[:, pos]
+        keep = pos[-1]
+        self.comb_edges = self.comb_edges[keep:]
+        self.comb_vals = self.comb_vals[:, keep:]
+        return self.output_stage(decim + 1, wrap(vals >> self.rtl['lpf_order'], self.out_bits))
+
+    def output_stage(self, cycles, filtered):
+        """幅度/相位/锁定: 逐记录复现RTL的非阻塞赋值滞后"""
+        bits = self.out_bits
+        mask = (1 << bits) - 1
+        absval = np.abs(filtered) & mask
+        prev = np.concatenate([self.abs_prev[:, None], absval[:, :-1]], axis=1)
+        ia, qa = prev
+        mag_calc = np.where(ia > qa, ia + (qa >> 1), qa + (ia >> 1)) & mask
+        magnitude = np.concatenate([[self.mag_calc], mag_calc[:-1]])
+
+        i_f, q_f = filtered
+        top = bits - 14
+        phase = np.select(
+            [(i_f >= 0) & (q_f >= 0), (i_f < 0) & (q_f >= 0), (i_f < 0) & (q_f < 0)],
+            [qa >> top, 0x4000 - (ia >> top), 0x8000 + (qa >> top)],
+            0xC000 - (ia >> top)) & 0xFFFF
+
+        # 第r条记录的锁定判断在下一沿完成: 窗口为前16个写入的幅度 + 本次幅度
+        window = np.concatenate([self.mag_hist, magnitude])
+        view = np.lib.stride_tricks.sliding_window_view(window, LOCK_HISTORY + 1)
+        decision = ((view.max(axis=1) - view.min(axis=1)) < (magnitude >> 3)).astype(np.int64)
+        locked = np.concatenate([[self.lock], decision[:-1]])
+
+        self.abs_prev = absval[:, -1].copy()
+        self.mag_calc = int(mag_calc[-1])
+        self.magnitude = int(magnitude[-1])
+        self.mag_hist = window[-LOCK_HISTORY:]
+        self.lock = int(decision[-1])
+        return {'cycle': cycles, 'i_channel': i_f, 'q_channel': q_f,
+                'magnitude': magnitude, 'phase': phase, 'locked': locked}
+
+def empty_records():
+    return {name: np.zeros(0, dtype=np.int64) for name in RECORD_FIELDS}
+
+def stream(model, chunks):
+    """
+    生成器: 逐块送入 (signal, valid, ref_ext) 元组, 逐块产出输出记录
+
+    chunks 可以是任意长的生成器, 内存占用只与块长有关.
+    """
+    for chunk in chunks:
+        out = model.process(*chunk)
+        if len(out['cycle']):
+            yield out
+
+#=============================================================================
+# 激励源
+#=============================================================================
+
+def synthetic_chunks(rng, cycles, clk_hz, freq, amplitude, snr_db, adc_bits=ADC_BITS,
+                     valid_every=1, chunk=CHUNK, phase_deg=0.0):
+    """
+    合成ADC数据 (按块生成): 偏移二进制 adc_bits 位, 高位补0 (同顶层 {5'd0, data_11b})
+
+    噪声为高斯白噪声, 功率按 snr_db (相对正弦功率 A²/2) 给定.
+    """
+    full = 1 << adc_bits
+    noise_rms = amplitude / np.sqrt(2) * 10 ** (-snr_db / 20)
+    w = 2 * np.pi * freq / clk_hz
+    for t0 in range(0, cycles, chunk):
+        t = np.arange(t0, min(t0 + chunk, cycles), dtype=np.float64)
+        x = full / 2 + amplitude * np.sin(w * t + np.radians(phase_deg)) \
+            + rng.normal(0, noise_rms, len(t))
+        code = np.clip(np.rint(x), 0, full - 1).astype(np.int64)
+        valid = None if valid_every == 1 else (t.astype(np.int64) % valid_every) == 0
+        yield code, valid, None
+
+def file_chunks(path, chunk=CHUNK):
+    """从 .npy (memmap) 或原始int16 .bin 逐块读取 signal_in, 每个时钟有效"""
+    data = np.load(path, mmap_mode='r') if path.endswith('.npy') else np.memmap(path, dtype='<i2', mode='r')
+    for t0 in range(0, len(data), chunk):
+        yield np.asarray(data[t0:t0 + chunk], dtype=np.int64), None, None
+
+#=============================================================================
+# 统计 / 转储 / 比对
+#=============================================================================
+
+class RecordStats:
+    """流式统计 (常数内存): 稳定后I/Q均值与方差、幅度、锁定比例"""
+
+    def __init__(self, skip):
+        self.skip = skip            # 丢弃前skip条记录 (滤波器与历史窗口填充)
+        self.seen = 0
+        self.n = 0
+        self.sums = np.zeros(5)     # I, Q, I², Q², magnitude
+        self.locked = 0
+
+    def add(self, rec):
+        start = max(self.skip - self.seen, 0)
+        self.seen += len(rec['cycle'])
+        if start >= len(rec['cycle']):
+            return
+        i = rec['i_channel'][start:].astype(np.float64)
+        q = rec['q_channel'][start:].astype(np.float64)
+        self.n += len(i)
+        self.sums += [i.sum(), q.sum(), (i * i).sum(), (q * q).sum(),
+                      rec['magnitude'][start:].sum()]
+        self.locked += int(rec['locked'][start:].sum())
+
+    def summary(self):
+        if self.n == 0:
+            return None
+        mi, mq, si, sq, mm = self.sums / self.n
+        var = max(si - mi * mi, 0) + max(sq - mq * mq, 0)
+        amp = np.hypot(mi, mq)
+        return {'records': self.n, 'i_mean': mi, 'q_mean': mq, 'amplitude': amp,
+                'noise_rms': np.sqrt(var),
+                'snr_db': 20 * np.log10(amp / np.sqrt(var)) if var > 0 and amp > 0 else float('inf'),
+                'phase_deg': float(np.degrees(np.arctan2(mq, mi))),
+                'magnitude_mean': mm, 'locked_ratio': self.locked / self.n}
+
+def write_records(f, rec):
+    """RTL转储同格式: 每行 cycle i q magnitude phase locked"""
+    np.savetxt(f, np.column_stack([rec[k] for k in RECORD_FIELDS]), fmt='%d')
+
+def read_dump(path):
+    """逐块读取RTL转储 (空格分隔的6列十进制, x/X 记为 -1)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        rows = []
+        for line in f:
+            parts = line.split()
+            if len(parts) < len(RECORD_FIELDS) or not parts[0].lstrip('-').isdigit():
+                continue
+            rows.append([-1 if 'x' in p.lower() else int(p) for p in parts[:len(RECORD_FIELDS)]])
+            if len(rows) == CHUNK:
+                yield np.array(rows, dtype=np.int64)
+                rows = []
+        if rows:
+            yield np.array(rows, dtype=np.int64)
+
+class DumpComparer:
+    """逐记录比对模型输出与RTL转储 (转储中的X不参与比较)"""
+
+    def __init__(self, path):
+        self.reader = read_dump(path)
+        self.buf = np.zeros((0, len(RECORD_FIELDS)), dtype=np.int64)
+        self.checked = 0
+        self.mismatches = 0
+        self.first = None
+        self.exhausted = False
+
+    def add(self, rec):
+        model = np.column_stack([rec[k] for k in RECORD_FIELDS])
+        while len(self.buf) < len(model) and not self.exhausted:
+            nxt = next(self.reader, None)
+            if nxt is None:
+                self.exhausted = True
+            else:
+                self.buf = np.concatenate([self.buf, nxt])
+        n = min(len(model), len(self.buf))
+        dump, self.buf = self.buf[:n], self.buf[n:]
+        bad = ((dump != model[:n]) & (dump != -1)).any(axis=1)
+        if bad.any() and self.first is None:
+            j = int(np.flatnonzero(bad)[0])
+            self.first = (self.checked + j, model[j].tolist(), dump[j].tolist())
+        self.checked += n
+        self.mismatches += int(bad.sum())
+
+def reference_spectrum(table):
+    """参考表一个地址周期内的谐波分布: 返回 (主谐波次数, 基波能量占比)"""
+    spec = np.abs(np.fft.rfft(table.astype(np.float64))) ** 2
+    spec[0] = 0
+    return int(np.argmax(spec)), float(spec[1] / spec.sum()) if spec.sum() else 0.0
+
+def main():
+    parser = argparse.ArgumentParser(description="lock_in_amplifier 流式位精确模型")
+    parser.add_argument('--seconds', type=float, default=1.0, help="合成记录长度 (秒)")
+    parser.add_argument('--clk', type=float, default=CLK_HZ, help="时钟频率 (Hz)")
+    parser.add_argument('--ref-freq', type=float, default=10_000, help="参考频率 (Hz)")
+    parser.add_argument('--signal-freq', type=float, help="输入正弦频率 (默认同参考频率)")
+    parser.add_argument('--tuning-word', type=lambda s: int(s, 0),
+                        help="直接给定调谐字 (默认按weak_signal_detector的公式计算)")
+    parser.add_argument('--amplitude', type=float, default=4.0, help="正弦幅度 (ADC码)")
+    parser.add_argument('--snr', type=float, default=-40.0, help="输入信噪比 (dB)")
+    parser.add_argument('--gain', type=int, default=4, help="gain_shift (weak_signal_detector复位值为4)")
+    parser.add_argument('--valid-every', type=int, default=1, help="每N个时钟一个有效样本")
+    parser.add_argument('--chunk', type=int, default=CHUNK, help="每块时钟周期数")
+    parser.add_argument('--input', help="输入样本文件 (.npy 或 int16 .bin), 代替合成信号")
+    parser.add_argument('--output', help="输出记录文件 (RTL转储同格式)")
+    parser.add_argument('--compare', help="RTL转储文件, 逐记录比对")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    args = parser.parse_args()
+
+    rtl = parse_rtl()
+    tw = args.tuning_word if args.tuning_word is not None else tuning_word(args.ref_freq, rtl)
+    ref_hz = args.clk * tw / 2 ** rtl['phase_width']
+    harmonic, fund_ratio = reference_spectrum(rtl['sin_table'])
+    print(f"{RTL_FILE}: DATA_WIDTH={rtl['data_width']}, LPF_ORDER={rtl['lpf_order']}, "
+          f"OUTPUT_WIDTH={rtl['output_width']}, 抽取 {rtl['decimation']}")
+    print(f"调谐字 0x{tw:08X} → DDS频率 {ref_hz:.3f} Hz (要求 {args.ref_freq:g} Hz, "
+          f"误差 {ref_hz - args.ref_freq:+.3f} Hz)")
+    if harmonic != 1:
+        print(f"⚠️  正弦表一个地址周期内主分量为 {harmonic} 次谐波, 基波只占 {fund_ratio:.1%} 能量: "
+              f"参考信号实际在 {harmonic * ref_hz:.3f} Hz")
+
+    model = LockInAmplifierModel(rtl, tw, args.gain)
+    if args.input:
+        chunks = file_chunks(args.input, args.chunk)
+        source = args.input
+    else:
+        cycles = int(args.seconds * args.clk)
+        freq = args.signal_freq if args.signal_freq is not None else ref_hz
+        chunks = synthetic_chunks(np.random.default_rng(args.seed), cycles, args.clk, freq,
+                                  args.amplitude, args.snr, valid_every=args.valid_every,
+                                  chunk=args.chunk)
+        source = (f"合成 {cycles:,} 周期, {freq:.3f} Hz, 幅度 {args.amplitude:g} 码, "
+                  f"SNR {args.snr:g} dB")
+    print(f"输入: {source}")
+
+    # 跳过滤波器填充 + 锁定历史窗口
+    stats = RecordStats(skip=LOCK_HISTORY + 2 + (1 << rtl['lpf_order']) // rtl['decimation'])
+    comparer = DumpComparer(args.compare) if args.compare else None
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    total = 0
+    try:
+        for rec in stream(model, chunks):
+            total += len(rec['cycle'])
+            stats.add(rec)
+            if out:
+                write_records(out, rec)
+            if comparer:
+                comparer.add(rec)
+    finally:
+        if out:
+            out.close()
+
+    print(f"\n处理 {model.cycle:,} 个时钟, {model.samples:,} 个样本, 输出 {total:,} 条记录")
+    s = stats.summary()
+    if s:
+        print(f"稳定后 {s['records']:,} 条: I均值 {s['i_mean']:.1f}, Q均值 {s['q_mean']:.1f}, "
+              f"幅度 {s['amplitude']:.1f}, 噪声RMS {s['noise_rms']:.1f}")
+        print(f"  单条记录信噪比 {s['snr_db']:.1f} dB, 相位 {s['phase_deg']:.2f}°, "
+              f"magnitude均值 {s['magnitude_mean']:.1f}, locked {s['locked_ratio']:.1%}")
+        if not args.input:
+            peak = np.abs(rtl['sin_table']).max() / 2 ** 15
+            print(f"  理想正交参考下的I/Q幅度: {args.amplitude * (1 << args.gain) * peak / 2:.1f}")
+    if out:
+        print(f"✓ 输出记录: {args.output}")
+    if comparer:
+        if comparer.checked == 0:
+            print("❌ 转储中没有可比对的记录")
+            sys.exit(1)
+        print(f"\n比对 {comparer.checked:,} 条记录, {comparer.mismatches} 条不一致")
+        if comparer.first:
+            j, m, d = comparer.first
+            print(f"❌ 第一处不一致 (第{j}条): 模型 {m} / RTL {d}")
+            sys.exit(1)
+        print("✓ 与RTL转储一致")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+存储器映像写出库 (各表生成脚本共用)
+
+输入为NumPy整数数组 + 位宽 (+ 可选深度), 整张表一次性向量化格式化,
+拼成一个bytes后一次写入; 内容与现有文件相同时不重写 (保持时间戳).
+32K/64K点窗表、旋转因子大小的表也只需毫秒级时间.
+
+支持格式 (write_mem_image 的 fmt):
+    hex - $readmemh格式, 每行一个十六进制数据, 可带 // 注释
+          (注释只用ASCII, 避免综合工具按GBK解析出错)
+    dat - Pango IP初始化格式, 每行一个十六进制数据, 不带注释
+          (格式同DPRAM_8192x11/init_param_hex_exmp.dat)
+    coe - Xilinx COE格式 (Block Memory Generator), 每行16个数据
+    mif - Altera/Gowin MIF格式
+    bin - 原始二进制, 每个数据按能容纳width位的1/2/4/8字节小端存放
+    npy - NumPy .npy, 供Python模型/测试平台直接加载
+
+用法:
+    from mem_image import write_mem_image, read_mem_image
+    write_mem_image(table, 'source/xxx.hex', 'hex', 16, ["comment"])
+"""
+
+import io
+import os
+
+import numpy as np
+
+FORMATS = ('hex', 'dat', 'coe', 'mif', 'bin', 'npy')
+COE_WORDS_PER_LINE = 16
+
+_HEX_LOWER = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+_HEX_UPPER = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+def write_if_changed(path, data):
+    """内容与现有文件相同时不重写 (保持时间戳), 返回是否写入"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def to_words(values, width, depth=None, fill=0):
+    """
+    转成uint64数据字并检查位宽, 按depth补齐
+
+    有符号数按补码截取到width位 (与Verilog一致); 超出width位的非负数报错.
+    """
+    if not 1 <= width <= 64:
+        raise ValueError(f"位宽须在1-64之间: {width}")
+    values = np.asarray(values)
+    if values.ndim != 1:
+        values = values.reshape(-1)
+    mask = np.uint64((1 << width) - 1)
+
+    if values.dtype.kind == 'i':
+        if len(values) and values.min() < -(1 << (width - 1)):
+            raise ValueError(f"数据 {values.min()} 超出 {width} 位有符号范围")
+        words = values.astype(np.int64).view(np.uint64) & mask
+        if len(values) and width < 64 and values.max() >= (1 << width):
+            raise ValueError(f"数据 {values.max()} 超出 {width} 位范围")
+    elif values.dtype.kind in 'ub':
+        words = values.astype(np.uint64)
+        if len(words) and (words > mask).any():
+            raise ValueError(f"数据 {words.max()} 超出 {width} 位范围")
+    else:
+        raise TypeError(f"存储器映像只接受整数数组, 而不是 {values.dtype}")
+
+    if depth is not None:
+        if len(words) > depth:
+            raise ValueError(f"数据长度 {len(words)} 超过深度 {depth}")
+        words = np.concatenate([words, np.full(depth - len(words), fill, dtype=np.uint64)])
+    return words
+
+def hex_columns(words, width, upper=False):
+    """数据字 → (N, ceil(width/4)) 的ASCII十六进制字符矩阵"""
+    digits = (width + 3) // 4
+    shifts = np.arange(digits - 1, -1, -1, dtype=np.uint64) * np.uint64(4)
+    nibbles = (words[:, None] >> shifts) & np.uint64(0xF)
+    return (_HEX_UPPER if upper else _HEX_LOWER)[nibbles]
+
+def dec_columns(values, digits):
+    """非负整数 → (N, digits) 的右对齐十进制字符矩阵 (前导空格)"""
+    values = np.asarray(values, dtype=np.uint64)
+    powers = np.uint64(10) ** np.arange(digits - 1, -1, -1, dtype=np.uint64)
+    chars = (values[:, None] // powers % np.uint64(10)).astype(np.uint8) + ord('0')
+    leading = values[:, None] < powers
+    leading[:, -1] = False
+    chars[leading] = ord(' ')
+    return chars
+
+def join_columns(*parts):
+    """
+    按列拼接字符矩阵与常量字符串, 得到每行的字节
+
+    参数:
+        parts: (N, k) 的uint8矩阵或bytes常量 (对每行相同)
+    """
+    rows = next(len(p) for p in parts if isinstance(p, np.ndarray))
+    cols = [p if isinstance(p, np.ndarray)
+            else np.broadcast_to(np.frombuffer(p, dtype=np.uint8), (rows, len(p)))
+            for p in parts]
+    return np.hstack(cols)
+
+def _lines(comments, prefix):
+    return ''.join(f"{prefix} {line}\n" if line else f"{prefix}\n" for line in comments)
+
+def format_hex(words, width, comments=(), upper=False):
+    """hex/dat: 每行一个数据"""
+    body = join_columns(hex_columns(words, width, upper), b'\n').tobytes()
+    return _lines(comments, '//').encode('ascii') + body
+
+def format_coe(words, width, comments=(), upper=True):
+    """COE: 逗号分隔, 每16个换行, 最后一个以分号结尾"""
+    chars = join_columns(hex_columns(words, width, upper), b',\n')
+    keep = np.ones(chars.shape, dtype=bool)
+    keep[:, -1] = (np.arange(1, len(words) + 1) % COE_WORDS_PER_LINE) == 0
+    if len(words):
+        chars[-1, -2] = ord(';')
+        keep[-1, -1] = True
+    head = (_lines(comments, ';') + ";\n"
+            "memory_initialization_radix=16;\n"
+            "memory_initialization_vector=\n")
+    return head.encode('ascii') + chars[keep].tobytes()
+
+def format_mif(words, width, comments=(), upper=True):
+    """MIF: 十进制地址 : 十六进制数据"""
+    addr_digits = max(5, len(str(max(len(words) - 1, 0))))
+    body = join_columns(b'    ', dec_columns(np.arange(len(words)), addr_digits), b' : ',
+                        hex_columns(words, width, upper), b';\n').tobytes()
+    head = (_lines(comments, '--') + "\n"
+            f"WIDTH={width};\n"
+            f"DEPTH={len(words)};\n"
+            "ADDRESS_RADIX=DEC;\n"
+            "DATA_RADIX=HEX;\n"
+            "\n"
+            "CONTENT BEGIN\n")
+    return head.encode('ascii') + body + b"END;\n"
+
+def bin_dtype(width):
+    """bin格式每个数据的存储类型 (小端, 1/2/4/8字节)"""
+    nbytes = (width + 7) // 8
+    return np.dtype(f'<u{next(n for n in (1, 2, 4, 8) if n >= nbytes)}')
+
+def format_image(words, fmt, width, comments=(), upper=None):
+    """按格式生成文件内容 (bytes); upper=None时coe/mif用大写, hex/dat用小写"""
+    if fmt in ('hex', 'dat'):
+        return format_hex(words, width, comments if fmt == 'hex' else (), bool(upper))
+    if fmt == 'coe':
+        return format_coe(words, width, comments, upper is not False)
+    if fmt == 'mif':
+        return format_mif(words, width, comments, upper is not False)
+    if fmt == 'bin':
+        return words.astype(bin_dtype(width)).tobytes()
+    if fmt == 'npy':
+        buf = io.BytesIO()
+        np.save(buf, words.astype(np.min_scalar_type((1 << width) - 1)))
+        return buf.getvalue()
+    raise ValueError(f"不支持的存储器映像格式: {fmt} (可选 {', '.join(FORMATS)})")
+
+def write_mem_image(values, path, fmt, width, comments=(), depth=None, upper=None, fill=0):
+    """
+    写出存储器映像 (一次性格式化, 一次写入, 内容不变时不重写)
+
+    参数:
+        values: 整数数组 (有符号数按补码写出)
+        path: 输出文件
+        fmt: hex / dat / coe / mif / bin / npy
+        width: 数据位宽
+        comments: 注释行 (hex/coe/mif有效, 只用ASCII)
+        depth: 存储器深度, 不足部分用fill补齐
+        upper: 十六进制大小写 (默认 hex/dat小写, coe/mif大写)
+
+    返回:
+        是否写入了文件
+    """
+    words = to_words(values, width, depth, fill)
+    return write_if_changed(path, format_image(words, fmt, width, comments, upper))
+
+def estimate_drm(depth, width):
+    """
+    估算PGL50H DRM (18Kb) 块数
+
+    DRM可配置为 16K×1 / 8K×2 / 4K×4 / 2K×9 / 1K×18 / 512×36, 取块数最少的配置.
+    """
+    configs = [(16384, 1), (8192, 2), (4096, 4), (2048, 9), (1024, 18), (512, 36)]
+    return min(-(-depth // d) * -(-width // w) for d, w in configs)
+
+def read_mem_image(path, width=None):
+    """
+    读回存储器映像为uint64数组
+
+    .npy按NumPy格式读取; .bin需给出width; 其余按hex/dat文本读取 (跳过//注释).
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        return np.load(path).astype(np.uint64)
+    if ext == '.bin':
+        if width is None:
+            raise ValueError("读取.bin映像需要指定width")
+        return np.fromfile(path, dtype=bin_dtype(width)).astype(np.uint64)
+    with open(path, 'r', encoding='utf-8') as f:
+        words = [line.split('//')[0].strip() for line in f]
+    return np.array([int(w, 16) for w in words if w], dtype=np.uint64)
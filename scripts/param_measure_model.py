@@ -0,0 +1,627 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+signal_parameter_measure 时域测量 流式位精确模型 (频率/幅度/占空比)
+
+RTL 在100MHz clk域工作, 每 TIME_100MS 个周期 (100ms, 约350万个35MHz样本) 结束一个测量窗口.
+整段录音通过 numpy.memmap 按固定块读入, 计数器/迟滞状态/流水线寄存器跨块保持,
+内存占用与录音长度无关, 输出每个窗口结束时的寄存器值.
+
+建模的RTL行为 (signal_parameter_measure.v):
+    - 跨时钟域: sample_clk 经三级同步检测上升沿, 检测沿锁存 sample_data_latch;
+      若下一个 sample_clk 上升沿先于检测沿到达, 读到的是下一个样本 (按 --phase-ns 的时钟相位逐样本计算)
+    - 过零: data_d1 (比同步数据再晚一个样本) 与 threshold_hyst_high/low 做迟滞比较, 窗口结束时状态清零;
+      过零脉冲下一拍计数, 落在 measure_done 沿上的丢失
+    - 峰峰值: sample_data_sync 的 max/min, 提前两拍锁存; 阈值 = (max+min)>>1 按10位计算 (和≥1024时回绕)
+    - 占空比: sample_data_sync 与迟滞阈值比较 (严格大于), 状态跨窗口保持; 1000·high/total 用 total>>14 查倒数表
+    - 频率 (过零次数×10) / 幅度 (×3300>>10×3) / 占空比 的流水线、4/8次滑动平均、输出寄存器,
+      包括各级对上一窗口数据的采样关系
+    - 假设 measure_en 常为1, 无FFT完成脉冲 (fft_done_pulse 强制刷新不触发)
+
+实现: 样本按块向量化处理 (迟滞比较压缩为事件序列, 窗口内阈值不变);
+慢速流水线只在每个窗口边界前后逐周期推进 (其余时间寄存器保持不变).
+--check 用逐周期的直接翻译 (含跨时钟域采样) 在缩短的窗口上与流式模型逐窗口比对.
+
+用法:
+    python scripts/param_measure_model.py --input capture.npy                  # .npy (memmap读取)
+    python scripts/param_measure_model.py --input capture.bin --dtype uint16 --channels 2 --channel 1
+    python scripts/param_measure_model.py --synth sine:12345:400:512 --seconds 10
+    python scripts/param_measure_model.py --synth square:1000:0.3 --seconds 3600 --noise 2
+    python scripts/param_measure_model.py --check
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from math import gcd
+
+import numpy as np
+
+from mem_image import write_if_changed
+
+RTL_FILE = "source/source/signal_parameter_measure.v"
+OUTPUT_DIR = "ipcore/param_measure"
+
+CLK_HZ = 100_000_000            # clk_100m
+SAMPLE_HZ = 35_000_000          # clk_adc
+DATA_BITS = 10
+SETTLE = 24                     # 窗口边界后慢速流水线推进的周期数 (各级约10拍内稳定)
+CHUNK = 1 << 22                 # 每块样本数
+
+#=============================================================================
+# RTL 常数
+#=============================================================================
+
+def parse_rtl(path=RTL_FILE):
+    """测量窗口长度、占空比倒数表及几个关键常数 (与预期结构不符时报错)"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    m = re.search(r"localparam\s+TIME_100MS\s*=\s*([\d_]+);", text)
+    if not m:
+        raise ValueError(f"{path} 中找不到 TIME_100MS")
+    window = int(m.group(1).replace('_', ''))
+    lut = dict((int(i), int(v)) for i, v in re.findall(r"8'd(\d+):\s*reciprocal_lut\s*=\s*16'd(\d+);", text))
+    if sorted(lut) != list(range(256)):
+        raise ValueError(f"{path} 中 reciprocal_lut 不是完整的256项")
+    for pattern, desc in [(r"amp_mult\[25:10\]\s*\*\s*16'd3", "幅度 ×3 补偿"),
+                          (r"\{22'd0, amp_diff\}\s*\*\s*32'd3300", "幅度 ×3300"),
+                          (r"total_cnt_latch\s*>=\s*32'd16384", "占空比最小计数"),
+                          (r"duty_product_d1\[45:30\]", "占空比 >>30"),
+                          (r"freq_temp\s*\*\s*32'd6554", "kHz 系数"),
+                          (r"freq_temp\s*\*\s*32'd66\)", "MHz 系数")]:
+        if not re.search(pattern, text):
+            raise ValueError(f"{path} 中找不到{desc}, 模型需要同步更新")
+    return {'window': window, 'duty_lut': [lut[i] for i in range(256)]}
+
+#=============================================================================
+# 慢速流水线 (窗口边界附近逐周期推进)
+#=============================================================================
+
+class SlowPath:
+    """
+    只在窗口边界附近变化的寄存器: 锁存、阈值、频率/幅度/占空比流水线、滑动平均、输出寄存器
+
+    step() 为一个 clk 上升沿: 输入均为沿之前的值, 按非阻塞赋值语义整体更新.
+    """
+
+    def __init__(self, duty_lut):
+        self.lut = duty_lut
+        self.r = {
+            'zc_latch': 0,
+            'freq_temp': 0, 'freq_trig': 0, 'unit': 0, 'freq_product': 0, 'freq_mult_done': 0, 'unit_d1': 0,
+            'freq_result': 0, 'freq_result_done': 0, 'unit_d2': 0, 'unit_d3': 0,
+            'freq_sum': 0, 'freq_hist': (0, 0, 0, 0), 'freq_ptr': 0, 'freq_filtered': 0, 'freq_calc': 0,
+            'max_latch': 0, 'min_latch': 1023, 'amp_trig': 0, 'amp_diff': 0, 'amp_pv0': 0, 'amp_mult': 0,
+            'amp_pv1': 0, 'amp_result': 0, 'amplitude_calc': 0, 'md_d1': 0,
+            'amp_sum': 0, 'amp_hist': (0, 0, 0, 0), 'amp_ptr': 0, 'amp_filtered': 0,
+            'threshold': 512, 'hyst_high': 520, 'hyst_low': 504, 'hysteresis': 8,
+            'high_latch': 0, 'total_latch': 0, 'duty_trig': 0,
+            'duty_num': 0, 'duty_den': 0, 'duty_index': 0, 'duty_pv0': 0, 'duty_recip': 0, 'duty_pv1': 0,
+            'duty_product': 0, 'duty_product_d1': 0, 'duty_result': 0, 'duty_calc': 0, 'duty_pv2': 0,
+            'duty_pv_d1': 0, 'duty_sum': 0, 'duty_hist': (0,) * 8, 'duty_ptr': 0, 'duty_filtered': 0,
+            'freq_out': 0, 'freq_is_khz': 0, 'freq_is_mhz': 0, 'amplitude_out': 0, 'duty_out': 0,
+        }
+
+    def step(self, md, amp_trig, max_val, min_val, zc_cnt, high_cnt, total_cnt):
+        o = self.r
+        n = dict(o)
+
+        # 过零计数锁存 / 频率 Stage 1~6
+        if md:
+            n['zc_latch'] = zc_cnt
+            n['freq_temp'] = o['zc_latch']
+        n['freq_trig'] = md
+        if o['freq_trig']:
+            t = o['freq_temp']
+            n['unit'] = 2 if t >= 100000 else 1 if t >= 1000 else 0
+        n['freq_mult_done'] = o['freq_trig']
+        n['unit_d1'] = o['unit']
+        if o['freq_trig']:
+            t = o['freq_temp']
+            n['freq_product'] = [(t * 10) & 0xFFFFFFFF, t * 6554, t * 66][o['unit']] & ((1 << 49) - 1)
+        n['freq_result_done'] = o['freq_mult_done']
+        n['unit_d2'] = o['unit_d1']
+        if o['freq_mult_done']:
+            p = o['freq_product']
+            n['freq_result'] = p & 0xFFFF if o['unit_d1'] == 0 else (p >> 16) & 0xFFFF
+        n['unit_d3'] = o['unit_d2']
+        if o['unit_d2'] != o['unit_d3']:
+            n['freq_sum'], n['freq_ptr'], n['freq_filtered'], n['freq_hist'] = 0, 0, 0, (0, 0, 0, 0)
+        elif o['freq_result_done']:
+            s = (o['freq_sum'] - o['freq_hist'][o['freq_ptr']] + o['freq_result']) & 0x3FFFF
+            n['freq_sum'] = s
+            n['freq_hist'] = tuple(o['freq_result'] if i == o['freq_ptr'] else v for i, v in enumerate(o['freq_hist']))
+            n['freq_ptr'] = (o['freq_ptr'] + 1) & 3
+            n['freq_filtered'] = (s >> 2) & 0xFFFF
+        n['freq_calc'] = o['freq_filtered']
+
+        # 幅度: 提前两拍锁存 → 差值 → ×3300 → [25:10]×3 → amplitude_calc → 4次平均
+        if amp_trig:
+            n['max_latch'], n['min_latch'] = max_val, min_val
+        n['amp_trig'] = amp_trig
+        n['amp_pv0'] = o['amp_trig']
+        if o['amp_trig']:
+            n['amp_diff'] = o['max_latch'] - o['min_latch'] if o['max_latch'] >= o['min_latch'] else 0
+        n['amp_pv1'] = o['amp_pv0']
+        if o['amp_pv0']:
+            n['amp_mult'] = o['amp_diff'] * 3300
+        if o['amp_pv1']:
+            n['amp_result'] = (((o['amp_mult'] >> 10) & 0xFFFF) * 3) & 0xFFFF
+        n['amplitude_calc'] = o['amp_result']
+        n['md_d1'] = md
+        if md and not o['md_d1'] and o['amplitude_calc'] != 0:
+            s = (o['amp_sum'] - o['amp_hist'][o['amp_ptr']] + o['amplitude_calc']) & 0x3FFFF
+            n['amp_sum'] = s
+            n['amp_hist'] = tuple(o['amplitude_calc'] if i == o['amp_ptr'] else v for i, v in enumerate(o['amp_hist']))
+            n['amp_ptr'] = (o['amp_ptr'] + 1) & 3
+            n['amp_filtered'] = (s >> 2) & 0xFFFF
+
+        # 自适应阈值: 10位表达式, max+min≥1024 时回绕
+        if md:
+            mx, mn = o['max_latch'], o['min_latch']
+            mid = ((mx + mn) & 0x3FF) >> 1
+            hyst = (mx - mn) >> 5 if mx > mn and mx - mn > 256 else 8
+            n['threshold'] = mid
+            n['hysteresis'] = hyst
+            n['hyst_high'] = (mid + hyst) & 0x3FF
+            n['hyst_low'] = 0 if mid < hyst else mid - hyst
+
+        # 占空比: 锁存 → 分子/查表索引 → 倒数 → 乘法 → 打拍 → >>30 → 限幅 → 8次平均
+        if md:
+            n['high_latch'], n['total_latch'] = high_cnt, total_cnt
+        n['duty_trig'] = md
+        ok = o['duty_trig'] and o['total_latch'] >= 16384
+        n['duty_pv0'] = int(ok)
+        if ok:
+            n['duty_num'] = (o['high_latch'] * 1000) & ((1 << 40) - 1)
+            n['duty_den'] = o['total_latch']
+            idx = o['total_latch'] >> 14
+            n['duty_index'] = 1 if idx == 0 else 255 if idx >= 255 else idx
+        n['duty_pv1'] = o['duty_pv0']
+        n['duty_recip'] = self.lut[o['duty_index']]
+        n['duty_pv2'] = o['duty_pv1']
+        n['duty_product'] = (o['duty_num'] * o['duty_recip']) & ((1 << 64) - 1)
+        n['duty_product_d1'] = o['duty_product']
+        n['duty_result'] = (o['duty_product_d1'] >> 30) & 0xFFFF
+        if o['duty_pv2']:
+            n['duty_calc'] = 1000 if o['duty_result'] > 1000 else o['duty_result']
+        n['duty_pv_d1'] = o['duty_pv2']
+        if o['duty_pv2'] and not o['duty_pv_d1']:
+            s = (o['duty_sum'] - o['duty_hist'][o['duty_ptr']] + o['duty_calc']) & 0x7FFFF
+            n['duty_sum'] = s
+            n['duty_hist'] = tuple(o['duty_calc'] if i == o['duty_ptr'] else v for i, v in enumerate(o['duty_hist']))
+            n['duty_ptr'] = (o['duty_ptr'] + 1) & 7
+            n['duty_filtered'] = (s >> 3) & 0xFFFF
+
+        # 输出寄存器 (measure_done 时采样)
+        if md:
+            n['freq_out'] = o['freq_calc']
+            n['freq_is_mhz'] = int(o['unit'] == 2)
+            n['freq_is_khz'] = int(o['unit'] == 1)
+            n['amplitude_out'] = o['amp_filtered']
+            n['duty_out'] = o['duty_filtered']
+        self.r = n
+
+    def outputs(self):
+        o = self.r
+        return {k: o[k] for k in ('freq_out', 'freq_is_khz', 'freq_is_mhz', 'amplitude_out', 'duty_out')}
+
+#=============================================================================
+# 迟滞比较 (向量化)
+#=============================================================================
+
+def hysteresis(v, high, low, state, strict):
+    """
+    低电平状态: v≥high (strict时 v>high) 置1; 高电平状态: v<low 清0
+
+    返回 (每个样本之后的状态中为1的个数, 0→1 的样本位置, 最终状态).
+    high>low 时只需看最后一次置位/清零事件; 阈值回绕导致某些值同时满足两个条件时, 这些样本逐个翻转状态.
+    """
+    set_ = v > high if strict else v >= high
+    clr = v < low
+    n = len(v)
+    if n == 0:
+        return 0, np.zeros(0, dtype=np.int64), state
+    both = set_ & clr
+    if not both.any():
+        # 状态只可能在置位段/清零段的第一个样本处改变, 只取各段起点 (噪声下事件很密时省去逐样本处理)
+        starts = [np.flatnonzero(m[1:] > m[:-1]) + 1 for m in (set_, clr)]
+        starts = [np.concatenate([[0], e]) if m[0] else e for m, e in zip((set_, clr), starts)]
+        ev = np.concatenate(starts)
+        if ev.size == 0:
+            return n if state else 0, np.zeros(0, dtype=np.int64), state
+        val = np.concatenate([np.ones(len(starts[0]), dtype=bool), np.zeros(len(starts[1]), dtype=bool)])
+        order = np.argsort(ev, kind='stable')
+        ev, val = ev[order], val[order]
+        runs = np.concatenate([[0], np.flatnonzero(val[1:] != val[:-1]) + 1])   # 事件值相同的连续段只看第一个
+        pos, rv = ev[runs], val[runs]
+        length = np.diff(pos, append=n)
+        high_cnt = int(length[rv].sum()) + (int(pos[0]) if state else 0)
+        rises = pos[rv] if not state or not rv[0] else pos[rv][1:]
+        return high_cnt, rises, bool(rv[-1])
+    force = set_ ^ clr
+    toggles = np.cumsum(both)
+    last = np.maximum.accumulate(np.where(force, np.arange(n), -1))
+    has = last >= 0
+    k = np.where(has, last, 0)
+    base = np.where(has, set_[k], state)
+    st = base ^ ((toggles - np.where(has, toggles[k], 0)) & 1).astype(bool)
+    prev = np.concatenate([[state], st[:-1]])
+    return int(st.sum()), np.flatnonzero(st & ~prev), bool(st[-1])
+
+#=============================================================================
+# 流式模型
+#=============================================================================
+
+class ParamMeasureModel:
+    """
+    feed() 依次送入ADC样本块 (任意长度), 每完成一个测量窗口在 windows 中追加一条记录
+
+    时间单位为 1/(clk·sample/gcd) 秒: clk 周期 Pc 单位, 样本周期 Ps 单位, 第 i 个 sample_clk 上升沿在 Ps·i + phase.
+    第 i 个样本在 clk 沿 a_i = (Ps·i + phase)//Pc + 3 处被处理 (d1 看到高电平后再两级),
+    读到的 sample_data_latch 为该沿之前最后一个 sample_clk 上升沿锁存的样本.
+    """
+
+    def __init__(self, rtl, clk_hz=CLK_HZ, sample_hz=SAMPLE_HZ, phase=0, window=None):
+        g = gcd(clk_hz, sample_hz)
+        self.pc, self.ps = sample_hz // g, clk_hz // g
+        self.phase = phase % self.ps
+        self.window = window or rtl['window']
+        if self.window < 2 * SETTLE:
+            raise ValueError(f"窗口长度 {self.window} 周期过短")
+        self.slow = SlowPath(rtl['duty_lut'])
+        for _ in range(SETTLE):                     # 复位后流水线稳定
+            self.slow.step(0, 0, 0, 1023, 0, 0, 0)
+        self.base = 0                               # tail[0] 的全局样本序号
+        self.tail = np.zeros(0, dtype=np.int32)
+        self.next_action = 0
+        self.carry = np.zeros(2, dtype=np.int32)    # 上两个动作读到的样本 (复位值0)
+        self.m = 1                                  # 下一个 measure_done 沿 D = window·m + 1
+        self._reset_window()
+        self.duty_state = False
+        self.windows = []
+        self.samples = 0
+
+    def _reset_window(self):
+        self.zc_state = False
+        self.zc_cnt = 0
+        self.max_val, self.min_val = 0, 1023
+        self.high_cnt = self.total_cnt = 0
+        self.actions = 0
+
+    def action_edge(self, i):
+        return (self.ps * i + self.phase) // self.pc + 3
+
+    def latched_index(self, a):
+        """clk 沿 a 之前最后一个 sample_clk 上升沿的样本序号"""
+        return (self.pc * a - self.phase - 1) // self.ps
+
+    def first_action(self, d):
+        """动作沿 ≥ d 的第一个样本序号"""
+        return -((self.phase - self.pc * (d - 3)) // self.ps)
+
+    def feed(self, chunk):
+        chunk = np.asarray(chunk).astype(np.int32) & ((1 << DATA_BITS) - 1)
+        self.samples += len(chunk)
+        buf = np.concatenate([self.tail, chunk]) if len(self.tail) else chunk
+        last = self.base + len(buf) - 1
+        i0 = self.next_action
+        i1 = last + 1                               # j_i ≥ i, 往回找最后一个数据已到的动作
+        while i1 > i0 and self.latched_index(self.action_edge(i1 - 1)) > last:
+            i1 -= 1
+        n = i1 - i0
+        if n > 0:
+            # a_(i+Pc) = a_i + Ps, 所以 j_i - i 以 Pc 为周期: 按 Pc 路步进切片取样 (跨时钟域竞争读到下一个样本)
+            y = np.empty(n, dtype=np.int32)
+            for r in range(min(self.pc, n)):
+                start = self.latched_index(self.action_edge(i0 + r)) - self.base
+                cnt = len(range(r, n, self.pc))
+                y[r::self.pc] = buf[start:start + (cnt - 1) * self.pc + 1:self.pc]
+            u = np.concatenate([self.carry, y])
+            self.carry = u[-2:]
+            self._process(i0, u[1:-1], u[:-2])
+            self.next_action = i1
+        keep_from = min(len(buf), max(0, self.latched_index(self.action_edge(self.next_action)) - self.base))
+        self.tail = buf[keep_from:].copy()
+        self.base += keep_from
+
+    def _process(self, i0, sync, d1):
+        """第 i0 个样本起的一段动作; sync/d1: 各动作沿之前的 sample_data_sync / data_d1"""
+        n = len(sync)
+        pos = 0
+        while pos < n:
+            d = self.window * self.m + 1
+            first = self.first_action(d)
+            end = min(max(first - i0, pos), n)
+            if end > pos:
+                lo = i0 + pos
+                self._segment(sync[pos:end], d1[pos:end],
+                              self.first_action(d - 1) - lo, self.first_action(d - 2) - lo)
+            if end == n:
+                break
+            self._boundary(d)
+            pos = end + (1 if self.action_edge(first) == d else 0)   # measure_done 沿上的样本被忽略
+
+    def _segment(self, sync, d1, zc_lim, amp_lim):
+        """同一窗口内的一段动作 (阈值不变); zc_lim/amp_lim: 过零脉冲能计入 / max/min能被锁存的动作数"""
+        s = self.slow.r
+        _, rises, self.zc_state = hysteresis(d1, s['hyst_high'], s['hyst_low'], self.zc_state, strict=False)
+        self.zc_cnt += int(np.searchsorted(rises, zc_lim)) if zc_lim > 0 else 0
+        if amp_lim > 0:
+            self.max_val = max(self.max_val, int(sync[:amp_lim].max()))
+            self.min_val = min(self.min_val, int(sync[:amp_lim].min()))
+        high, _, self.duty_state = hysteresis(sync, s['hyst_high'], s['hyst_low'], self.duty_state, strict=True)
+        self.high_cnt += high
+        self.total_cnt += len(sync)
+        self.actions += len(sync)
+
+    def _boundary(self, d):
+        """沿 d-2 (幅度锁存) ~ d (measure_done) ~ d+SETTLE 逐周期推进慢速流水线"""
+        used = {k: self.slow.r[k] for k in ('threshold', 'hyst_high', 'hyst_low')}
+        self.slow.step(0, 1, self.max_val, self.min_val, 0, 0, 0)
+        self.slow.step(0, 0, self.max_val, self.min_val, 0, 0, 0)
+        self.slow.step(1, 0, 0, 1023, self.zc_cnt, self.high_cnt, self.total_cnt)
+        for _ in range(SETTLE):
+            self.slow.step(0, 0, 0, 1023, 0, 0, 0)
+        r = self.slow.r
+        self.windows.append({'window': self.m - 1, 'end_s': d / CLK_HZ, 'samples': self.actions,
+                             'zero_cross': self.zc_cnt, 'max': self.max_val, 'min': self.min_val,
+                             'high_cnt': self.high_cnt, 'total_cnt': self.total_cnt,
+                             **used, **self.slow.outputs(),
+                             'next_threshold': r['threshold'], 'next_hyst_high': r['hyst_high'],
+                             'next_hyst_low': r['hyst_low']})
+        self.m += 1
+        self._reset_window()
+
+#=============================================================================
+# 逐周期参考实现 (--check)
+#=============================================================================
+
+def reference(x, cycles, rtl, clk_hz=CLK_HZ, sample_hz=SAMPLE_HZ, phase=0, window=None):
+    """直接翻译RTL的逐周期仿真 (含 sample_clk 同步), 只用于短记录比对"""
+    g = gcd(clk_hz, sample_hz)
+    pc, ps = sample_hz // g, clk_hz // g
+    phase %= ps
+    window = window or rtl['window']
+    slow = SlowPath(rtl['duty_lut'])
+    d1 = d2 = d3 = 0
+    valid_d1 = valid_d2 = 0
+    sync = data_d1 = 0
+    time_cnt, md = 0, 0
+    zc, zc_state, zc_cnt = 0, 0, 0
+    max_val, min_val = 0, 1023
+    high_cnt = total_cnt = duty_state = 0
+    windows, counts = [], {}
+    for n in range(1, cycles + 1):
+        t = pc * n
+        level = 0 < (t - phase) % ps <= ps // 2 if t > phase else 0      # sample_clk 在沿之前的电平
+        k = (t - phase - 1) // ps if t > phase else -1                      # 已锁存的样本
+        latch = int(x[k]) & 0x3FF if k >= 0 else 0
+        valid_latch = int(k >= 0)
+        posedge = d2 and not d3
+        action = posedge and valid_d2
+        amp_trig = time_cnt == window - 2
+        hh, hl = slow.r['hyst_high'], slow.r['hyst_low']
+
+        if md:
+            counts = {'zero_cross': zc_cnt, 'max': max_val, 'min': min_val, 'high_cnt': high_cnt,
+                      'total_cnt': total_cnt}
+        slow.step(md, amp_trig, max_val, min_val, zc_cnt, high_cnt, total_cnt)
+
+        n_zc, n_state = zc, zc_state
+        if md:
+            n_zc, n_state = 0, 0
+        elif action:
+            if not zc_state:
+                n_zc = int(data_d1 >= hh)
+                n_state = n_zc
+            else:
+                n_zc = 0
+                n_state = 0 if data_d1 < hl else 1
+        else:
+            n_zc = 0
+        if md:
+            n_cnt = 0
+        else:
+            n_cnt = zc_cnt + zc
+        if md:
+            n_max, n_min = 0, 1023
+        elif action:
+            n_max, n_min = max(max_val, sync), min(min_val, sync)
+        else:
+            n_max, n_min = max_val, min_val
+        n_high, n_total, n_duty = high_cnt, total_cnt, duty_state
+        if md:
+            n_high = n_total = 0
+        elif action:
+            n_total += 1
+            if not duty_state:
+                if sync > hh:
+                    n_duty, n_high = 1, high_cnt + 1
+            elif sync < hl:
+                n_duty = 0
+            else:
+                n_high = high_cnt + 1
+        if md:
+            windows.append({**counts, **slow.outputs()})
+        n_md = int(time_cnt >= window - 1)
+        n_time = 0 if n_md else time_cnt + 1
+
+        if action:
+            data_d1 = sync
+        if posedge:
+            sync = latch
+        d3, d2, d1 = d2, d1, int(level)
+        valid_d2, valid_d1 = valid_d1, valid_latch
+        zc, zc_state, zc_cnt = n_zc, n_state, n_cnt
+        max_val, min_val = n_max, n_min
+        high_cnt, total_cnt, duty_state = n_high, n_total, n_duty
+        md, time_cnt = n_md, n_time
+    return windows
+
+#=============================================================================
+# 数据源
+#=============================================================================
+
+def open_capture(path, dtype, channels, channel):
+    """.npy 用 np.load(mmap_mode='r'), 其它按原始二进制 memmap; 多通道为交织存储"""
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+    else:
+        data = np.memmap(path, dtype=np.dtype(dtype), mode='r')
+        if channels > 1:
+            data = data[:len(data) // channels * channels].reshape(-1, channels)
+    if data.ndim == 2:
+        data = data[:, channel]
+    return data
+
+def capture_chunks(data, chunk):
+    for pos in range(0, len(data), chunk):
+        yield np.asarray(data[pos:pos + chunk])
+
+def synth_chunks(spec, seconds, noise, seed, chunk, sample_hz=SAMPLE_HZ):
+    """sine:频率[:幅度[:直流]] / square:频率[:占空比[:幅度[:直流]]], 按块生成10位码"""
+    parts = spec.split(':')
+    kind, freq = parts[0], float(parts[1])
+    vals = [float(v) for v in parts[2:]]
+    total = int(round(seconds * sample_hz))
+    rng = np.random.default_rng(seed)
+    for pos in range(0, total, chunk):
+        n = np.arange(pos, min(pos + chunk, total), dtype=np.float64)
+        cyc = (n * freq / sample_hz) % 1.0
+        if kind == 'sine':
+            amp, dc = (vals + [400, 511][len(vals):])[:2]
+            x = dc + amp * np.sin(2 * np.pi * cyc)
+        elif kind == 'square':
+            duty, amp, dc = (vals + [0.5, 400, 511][len(vals):])[:3]
+            x = dc + np.where(cyc < duty, amp, -amp)
+        else:
+            raise ValueError(f"未知波形: {kind}")
+        if noise:
+            x = x + rng.normal(0, noise, len(x))
+        yield np.clip(np.rint(x), 0, (1 << DATA_BITS) - 1).astype(np.int16)
+
+def decode_freq(w):
+    """freq_out + 单位标志 → Hz"""
+    if w['freq_is_mhz']:
+        return w['freq_out'] * 10000.0
+    if w['freq_is_khz']:
+        return w['freq_out'] * 100.0
+    return float(w['freq_out'])
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def check(rtl, args):
+    """缩短窗口, 流式模型 vs 逐周期参考, 覆盖阈值回绕/方波/噪声/时钟相位"""
+    window = 60000                                  # 每窗约21000样本, 占空比路径 (≥16384) 生效
+    windows = 5
+    cycles = window * windows + 8
+    n_samples = cycles * SAMPLE_HZ // CLK_HZ + 8
+    cases = [('sine:12345:400:400', 0.0, 0), ('sine:250000:300:600', 0.0, 3),
+             ('square:7777:0.3:300:500', 0.0, 11), ('sine:31000:200:480', 6.0, 17),
+             ('square:1500000:0.5:100:500', 0.0, 5), ('sine:3000:511:511', 1.0, 19)]
+    ok = True
+    for spec, noise, phase in cases:
+        x = np.concatenate(list(synth_chunks(spec, n_samples / SAMPLE_HZ, noise, args.seed, 1 << 20)))
+        ref = reference(x, cycles, rtl, phase=phase, window=window)
+        model = ParamMeasureModel(rtl, phase=phase, window=window)
+        for pos in range(0, len(x), 7919):         # 故意用不整齐的块长
+            model.feed(x[pos:pos + 7919])
+        keys = list(ref[0].keys())
+        got = [{k: w[k] for k in keys} for w in model.windows[:len(ref)]]
+        same = got == ref and len(model.windows) >= len(ref)
+        ok &= same
+        last = ref[-1]
+        print(("✓" if same else "❌") + f" {spec:<28} 噪声{noise:<4g} 相位{phase:>3}: {len(ref)} 个窗口, "
+              f"末窗 过零{last['zero_cross']} max/min {last['max']}/{last['min']} "
+              f"freq_out {last['freq_out']} amp {last['amplitude_out']} duty {last['duty_out']}")
+        if not same:
+            for idx, (g, r) in enumerate(zip(got, ref)):
+                if g != r:
+                    print(f"   窗口{idx}: 模型 {g}\n          参考 {r}")
+                    break
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="signal_parameter_measure 时域测量流式位精确模型")
+    parser.add_argument('--input', help="ADC码录音 (.npy 或原始二进制, memmap读取)")
+    parser.add_argument('--dtype', default='uint16', help="原始二进制的数据类型")
+    parser.add_argument('--channels', type=int, default=1, help="原始二进制的交织通道数")
+    parser.add_argument('--channel', type=int, default=0, help="使用的通道")
+    parser.add_argument('--synth', help="合成输入: sine:频率[:幅度[:直流]] 或 square:频率[:占空比[:幅度[:直流]]]")
+    parser.add_argument('--seconds', type=float, default=1.0, help="合成输入时长 (s)")
+    parser.add_argument('--noise', type=float, default=0.0, help="合成输入噪声RMS (ADC码)")
+    parser.add_argument('--phase-ns', type=float, default=5.0, help="首个 sample_clk 上升沿相对 clk 沿的时间 (ns)")
+    parser.add_argument('--chunk', type=int, default=CHUNK, help="每块样本数")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--check', action='store_true', help="与逐周期参考实现比对后退出")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="输出目录")
+    args = parser.parse_args()
+
+    rtl = parse_rtl()
+    if args.check:
+        sys.exit(0 if check(rtl, args) else 1)
+    if not args.input and not args.synth:
+        parser.error("需要 --input 或 --synth")
+
+    g = gcd(CLK_HZ, SAMPLE_HZ)
+    phase = int(round(args.phase_ns * 1e-9 * CLK_HZ * SAMPLE_HZ / g))
+    model = ParamMeasureModel(rtl, phase=phase)
+    if args.input:
+        data = open_capture(args.input, args.dtype, args.channels, args.channel)
+        chunks, source = capture_chunks(data, args.chunk), args.input
+    else:
+        chunks = synth_chunks(args.synth, args.seconds, args.noise, args.seed, args.chunk)
+        source = f"合成 {args.synth}, {args.seconds:g} s, 噪声 {args.noise:g}"
+    race = sum(model.latched_index(model.action_edge(k)) - k for k in range(model.pc)) / model.pc
+    print(f"窗口: {model.window:,} 个clk周期 ({model.window / CLK_HZ * 1e3:g} ms), 时钟 {CLK_HZ / 1e6:g}/{SAMPLE_HZ / 1e6:g} MHz, "
+          f"相位 {phase}/{model.ps}")
+    if race:
+        print(f"⚠️  跨时钟域: {race:.1%} 的样本在检测沿前已被下一个样本覆盖 (读到 x[i+1])")
+    start = time.time()
+    elapsed = 0.0                                   # 只计模型本身 (不含读盘/合成)
+    for chunk in chunks:
+        t0 = time.time()
+        model.feed(chunk)
+        elapsed += time.time() - t0
+    audio = model.samples / SAMPLE_HZ
+    print(f"{source}: {model.samples:,} 个样本 ({audio:.2f} s), {len(model.windows)} 个完整窗口, "
+          f"模型耗时 {elapsed:.2f} s ({audio / max(elapsed, 1e-9):.1f}× 实时), 总耗时 {time.time() - start:.2f} s")
+
+    wrapped = [w for w in model.windows if w['max'] + w['min'] >= 1 << DATA_BITS]
+    if wrapped:
+        print(f"⚠️  {len(wrapped)} 个窗口 max+min ≥ 1024: 阈值按10位回绕为 {wrapped[0]['next_threshold']}, "
+              f"下一窗口的过零/占空比失效")
+    for w in model.windows[-3:]:
+        print(f"  窗口{w['window']:>5}: 过零 {w['zero_cross']:>8} max/min {w['max']:>4}/{w['min']:<4} "
+              f"阈值 {w['hyst_low']}~{w['hyst_high']}  → freq_out {w['freq_out']} "
+              f"({decode_freq(w):g} Hz) amplitude_out {w['amplitude_out']} mV duty_out {w['duty_out'] / 10:g}%")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    out = io.StringIO()
+    if model.windows:
+        writer = csv.DictWriter(out, fieldnames=list(model.windows[0].keys()) + ['freq_hz'], lineterminator='\n')
+        writer.writeheader()
+        for w in model.windows:
+            writer.writerow({**w, 'freq_hz': decode_freq(w)})
+    report = {'source': source, 'samples': model.samples, 'seconds': audio, 'windows': len(model.windows),
+              'window_cycles': model.window, 'phase_units': phase, 'phase_period_units': model.ps,
+              'cdc_next_sample_fraction': race, 'elapsed_s': elapsed, 'realtime_factor': audio / max(elapsed, 1e-9),
+              'threshold_wrap_windows': len(wrapped),
+              'last': model.windows[-1] if model.windows else None}
+    outputs = [(os.path.join(args.output_dir, 'measure_windows.csv'), out.getvalue()),
+               (os.path.join(args.output_dir, 'measure_report.json'),
+                json.dumps(report, indent=2, ensure_ascii=False) + '\n')]
+    print()
+    for path, data in outputs:
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
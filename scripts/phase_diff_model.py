@@ -0,0 +1,806 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相位差测量位精确模型与精度扫描 (phase_diff_time_domain.v / phase_diff_calc_v4.v, 进程池并行)
+
+phase_diff_time_domain (顶层实际使用, clk_adc 35MHz, 输入为10位码的高8位):
+    - 过零: ch*_data_d1 与 ZERO_THRESHOLD±HYSTERESIS 迟滞比较, 上升过零打一拍成 ch*_zero_cross
+    - 周期: 过零时 MIN_PERIOD ≤ 计数 ≤ MAX_PERIOD 才锁存 (计数比实际周期少1), 否则保持旧值
+    - 配对: 先过零的通道置 leading, 另一通道过零时快照本通道计数, 两通道都过零后下一拍计算
+    - 输出: time_diff × scale_factor >> 10, scale_factor 按 avg_period 分四档查表;
+      calc_valid 持续5拍, 各级流水线寄存器 (含非阻塞赋值的旧值采样) 逐拍复现, 输出 phase_valid 脉冲串
+    过零事件向量化提取, 配对与输出流水线只在事件附近逐拍推进; --check 与逐拍直接翻译比对.
+
+phase_diff_calc_v4 (顶层中已注释掉, FFT基波复数输入):
+    - 16×16 互相关, 按 max(|re|,|im|) 最高有效位右移0~16位到16位, cordic_atan2 (cordic_atan2_model 位精确),
+      IIR 平滑 (>>> (16 - smooth_factor), 边界修正覆盖当拍更新), phase_diff 输出上一拍的 phase_smooth
+    - 每次测量 valid 保持的拍数决定IIR连续更新次数 (顶层状态机25拍; testbench单拍 → 2拍)
+    - 扫描中基波取自 NumPy块浮点FFT (峰值bin 与 顶层固定的 bin 234); 默认理想前端 (减帧均值),
+      --v4-frontend rtl 改用 spectrum_chain_model 前端 (中点输入时 dc_sum 回绕, 见该脚本)
+
+扫描: 频率 × 相位差 × 噪声 × 幅度, 每个 (频率, 噪声, 幅度) 一个任务, 全部相位差作为一批记录;
+记录中两通道同幅度, 初相随机. 输出误差曲面并对超出指标 (默认1°) 的角落归因:
+无过零 / 噪声抖动 / 周期门限 / 符号 / 缩放系数 / 过零时刻.
+
+用法:
+    python scripts/phase_diff_model.py                               # 默认扫描
+    python scripts/phase_diff_model.py --freq 1000,35000 --phase=-90,10,90 --noise 0 --amp 480
+    python scripts/phase_diff_model.py --check                       # 与逐拍参考实现比对, 重放testbench用例
+    python scripts/phase_diff_model.py --no-v4 --periods 4 --jobs 4
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import fft_params
+from cordic_atan2_model import cordic_atan2, parse_rtl as parse_cordic
+from mem_image import write_if_changed
+from param_measure_model import hysteresis
+from spectrum_chain_model import FrontEnd, fft_numpy, load_window, parse_idf, parse_window_enabled, wrap
+
+RTL_TIME = "source/source/phase_diff_time_domain.v"
+RTL_V4 = "source/source/phase_diff_calc_v4.v"
+TB_V4 = "source/source/tb_phase_diff_calc_v4.v"
+TOP_FILE = "source/source/signal_analyzer_top.v"
+OUTPUT_DIR = "ipcore/phase_diff"
+
+SAMPLE_HZ = 35_000_000
+ADC_BITS = 10
+N = fft_params.FFT_POINTS
+CALC_HOLD = 4                   # calc_counter 初值: calc_valid 在计算沿之后保持 1+4 拍
+OUT_LAST = 7                    # 计算沿之后第3~7拍输出 phase_valid
+
+DEFAULT_FREQS = "100,250,500,1000,2000,3500,7000,15000,30000,35000"
+DEFAULT_PHASES = "-175,-120,-60,-10,-1,1,10,60,120,175"
+DEFAULT_NOISE = "0,2,8,24"
+DEFAULT_AMPS = "16,48,160,480"
+
+#=============================================================================
+# RTL 解析
+#=============================================================================
+
+def parse_time_rtl(path=RTL_TIME):
+    """phase_diff_time_domain.v 参数、复位值与 scale_factor 分档"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    def find(pattern, desc):
+        m = re.search(pattern, text)
+        if not m:
+            raise ValueError(f"{path} 中找不到{desc}")
+        return int(m.group(1).replace('_', ''))
+
+    cfg = {name.lower(): find(rf"parameter\s+{name}\s*=\s*(?:\d+'d)?([\d_]+)\s*;", name)
+           for name in ('MIN_PERIOD', 'MAX_PERIOD', 'ZERO_THRESHOLD', 'HYSTERESIS')}
+    cfg['period_reset'] = find(r"ch1_period <= 20'd(\d+);", "ch1_period 复位值")
+    cfg['avg_reset'] = find(r"avg_period <= 20'd(\d+);", "avg_period 复位值")
+    cfg['scale_reset'] = find(r"scale_factor <= 32'd(\d+);\s*//\s*默认值", "scale_factor 复位值")
+    bands = re.findall(r"avg_period < 20'd(\d+)\)\s*(?://[^\n]*)?\s*scale_factor <= 32'd(\d+);", text)
+    last = re.search(r"else\s*//[^\n]*\n\s*scale_factor <= 32'd(\d+);", text)
+    if not bands or not last:
+        raise ValueError(f"{path} 中找不到 scale_factor 分档")
+    cfg['bands'] = [(int(p), int(s)) for p, s in bands]
+    cfg['scale_last'] = int(last.group(1))
+    if not re.search(r"phase_calc_step1 >> 10", text):
+        raise ValueError(f"{path} 中 phase_calc_step2 不是 >> 10, 模型需要同步更新")
+    return cfg
+
+def parse_v4(top=TOP_FILE):
+    """顶层对 phase_diff_calc_v4 的用法: smooth_factor, valid 保持拍数, 固定基波bin"""
+    with open(top, 'r', encoding='utf-8') as f:
+        text = f.read()
+    sf = re.search(r"\.smooth_factor\s*\(4'd(\d+)\)", text)
+    hold = re.search(r"fundamental_valid_cnt < 5'd(\d+)", text)
+    fixed = re.search(r"fft_out_cnt == 13'd(\d+)\)\s*begin\s*(?://[^\n]*\s*)*ch1_fundamental_re <=", text)
+    if not sf or not hold or not fixed:
+        raise ValueError(f"{top} 中找不到 phase_diff_calc_v4 的驱动逻辑")
+    return {'smooth_factor': int(sf.group(1)), 'valid_cycles': int(hold.group(1)), 'fixed_bin': int(fixed.group(1)),
+            'cordic': parse_cordic()}
+
+#=============================================================================
+# phase_diff_time_domain: 事件级模型
+#=============================================================================
+
+def rise_edges(codes, cfg):
+    """
+    10位码 → ch*_zero_cross 被置1的时钟沿序号
+
+    第 n 个时钟沿处理 data_d1 = x[n-2] (第1个沿为复位值128), 迟滞状态从复位 (below) 开始.
+    """
+    x8 = np.asarray(codes) >> (ADC_BITS - 8)
+    thr, hyst = cfg['zero_threshold'], cfg['hysteresis']
+    _, rises, _ = hysteresis(x8, thr + hyst, thr - hyst, False, strict=True)
+    return rises + 2
+
+def period_latches(rise, cfg):
+    """每次过零时的周期计数 (上次过零以来的拍数-1, MAX_PERIOD饱和), 返回被门限接受的 (沿, 值)"""
+    prev = np.concatenate([[0], rise[:-1]])
+    cand = np.minimum(rise - 1 - prev, cfg['max_period'])
+    ok = (cand >= cfg['min_period']) & (cand <= cfg['max_period'])
+    return rise[ok].tolist(), cand[ok].tolist()
+
+class TimeDomainRecord:
+    """单条双通道记录的 phase_diff_time_domain 仿真结果"""
+
+    def __init__(self, ch1, ch2, cfg):
+        self.cfg = cfg
+        self.edges = len(ch1)                                # 记录覆盖的时钟沿 1..edges
+        self.rise = [r[r <= self.edges] for r in (rise_edges(ch1, cfg), rise_edges(ch2, cfg))]
+        self.r = [r.tolist() for r in self.rise]
+        self.latch = [period_latches(r, cfg) for r in self.rise]
+        self.rounds = self._pair()
+        self.pulses = self._output()
+        self.results = self._results()
+
+    def cnt_before(self, ch, n):
+        """第 ch 通道 period_cnt 在沿 n 之前的值"""
+        k = bisect_right(self.r[ch], n - 1) - 1
+        last = self.r[ch][k] if k >= 0 else 0
+        return min(n - 1 - last, self.cfg['max_period'])
+
+    def period_before(self, ch, n):
+        edges, vals = self.latch[ch]
+        k = bisect_right(edges, n - 1) - 1
+        return vals[k] if k >= 0 else self.cfg['period_reset']
+
+    def _pair(self):
+        """
+        过零配对: 计算沿 c 清除标志后, 两通道第一个 > c 的过零脉冲组成下一轮
+
+        (先到的置 leading, 同拍到达时后写的 ch2_leading 生效; 已置标志的通道的后续脉冲被忽略)
+        """
+        e = [[v + 1 for v in r if v < self.edges] for r in self.r]   # 计算块看到 zero_cross 的沿
+        rounds = []
+        c = 0
+        while True:
+            i = [bisect_right(e[0], c), bisect_right(e[1], c)]
+            a = e[0][i[0]] if i[0] < len(e[0]) else None
+            b = e[1][i[1]] if i[1] < len(e[1]) else None
+            if a is None and b is None:
+                break
+            if b is None or (a is not None and a < b):
+                first, lead1, other, snap_ch = a, True, b, 0     # ch2 过零时快照 ch1 计数
+            else:
+                first, lead1, other, snap_ch = b, False, a, 1
+                if a == b:
+                    other = a
+            if other is None or other + 1 > self.edges:
+                rounds.append({'first': first, 'calc': None, 'lead1': lead1})
+                break
+            c = other + 1
+            rounds.append({'first': first, 'calc': c, 'lead1': lead1,
+                           'time_diff': self.cnt_before(snap_ch, other),
+                           'avg_period': (self.period_before(0, c) + self.period_before(1, c)) >> 1})
+        return rounds
+
+    def _scale(self, avg):
+        for limit, scale in self.cfg['bands']:
+            if avg < limit:
+                return scale
+        return self.cfg['scale_last']
+
+    def _output(self):
+        """输出流水线: 只在各计算沿之后的 c+1 ~ c+7 拍逐拍推进, 其余时间寄存器保持"""
+        cfg = self.cfg
+        done = [r for r in self.rounds if r['calc'] is not None]
+        calc = [r['calc'] for r in done]
+        first = [r['first'] for r in self.rounds]
+        inf = float('inf')
+
+        def calc_valid(m):                                   # 沿 m 之后的 calc_valid
+            k = bisect_right(calc, m) - 1
+            return k >= 0 and m - calc[k] <= CALC_HOLD
+
+        def lead1(m):
+            k = bisect_right(first, m) - 1
+            if k < 0:
+                return False
+            r = self.rounds[k]
+            return r['lead1'] and m < (r['calc'] if r['calc'] is not None else inf)
+
+        def regs(m):                                         # 沿 m 之后的 time_diff / avg_period
+            k = bisect_right(calc, m) - 1
+            return (done[k]['time_diff'], done[k]['avg_period']) if k >= 0 else (0, cfg['avg_reset'])
+
+        s = {'scale': cfg['scale_reset'], 'step1': 0, 'step2': 0, 'td_d1': 0, 'avg_d1': cfg['avg_reset'],
+             'period_diff': 0, 'phase': 0, 'conf': 0}
+        pulses = []
+        edges = sorted({n for c in calc for n in range(c + 1, min(c + OUT_LAST, self.edges) + 1)})
+        for n in edges:
+            o = dict(s)
+            if calc_valid(n - 1):
+                td, avg = regs(n - 1)
+                s['scale'] = self._scale(avg)
+                s['step1'] = (td * o['scale']) & 0xFFFFFFFF          # 乘法用上一次的 scale_factor
+                s['td_d1'], s['avg_d1'] = td, avg
+            if calc_valid(n - 2):
+                s['step2'] = o['step1'] >> 10
+            if calc_valid(n - 3):
+                td, avg = o['td_d1'], o['avg_d1']
+                if td > avg - (avg >> 4):
+                    s['phase'] = 0
+                elif lead1(n - 2):                                    # ch1_leading_d1
+                    s['phase'] = 1800 if o['step2'] > 1800 else o['step2'] & 0xFFFF
+                else:
+                    s['phase'] = -1800 if o['step2'] > 1800 else -(o['step2'] & 0xFFFF)
+                s['period_diff'] = abs(self.period_before(0, n) - self.period_before(1, n))
+                pd = o['period_diff']
+                s['conf'] = (255 if pd < avg >> 7 else 200 if pd < avg >> 6 else
+                             150 if pd < avg >> 5 else 100 if pd < avg >> 4 else 50)
+                pulses.append((n, s['phase'], s['conf']))
+        return pulses
+
+    def _results(self):
+        """每次计算的最终输出 (该计算的 phase_valid 脉冲串中最后一拍)"""
+        out = []
+        pe = [p[0] for p in self.pulses]
+        done = [r for r in self.rounds if r['calc'] is not None]
+        for k, r in enumerate(done):
+            hi = r['calc'] + OUT_LAST
+            if k + 1 < len(done):
+                hi = min(hi, done[k + 1]['calc'] + 2)
+            j = bisect_right(pe, hi) - 1
+            if j >= 0 and pe[j] >= r['calc'] + 3:
+                out.append(dict(r, phase=self.pulses[j][1], conf=self.pulses[j][2], edge=pe[j]))
+        return out
+
+def time_domain_model(ch1, ch2, cfg):
+    """ch1/ch2: (B, n) 或 (n,) 10位码 → 每条记录一个 TimeDomainRecord"""
+    ch1, ch2 = np.atleast_2d(ch1), np.atleast_2d(ch2)
+    return [TimeDomainRecord(a, b, cfg) for a, b in zip(ch1, ch2)]
+
+#=============================================================================
+# phase_diff_time_domain: 逐拍参考实现 (--check)
+#=============================================================================
+
+def reference_time_domain(ch1, ch2, cfg):
+    """逐拍直接翻译RTL (adc_valid 恒为1), 返回 phase_valid 脉冲 [(沿, phase_diff, confidence)]"""
+    hi, lo = cfg['zero_threshold'] + cfg['hysteresis'], cfg['zero_threshold'] - cfg['hysteresis']
+    mn, mx = cfg['min_period'], cfg['max_period']
+    ch = [{'d1': 128, 'above': 0, 'zc': 0, 'cnt': 0, 'period': cfg['period_reset']} for _ in range(2)]
+    c = {'time_diff': 0, 'avg': cfg['avg_reset'], 'snap1': 0, 'snap2': 0, 'has1': 0, 'has2': 0,
+         'lead1': 0, 'lead2': 0, 'counter': 0, 'valid': 0}
+    p = {'step1': 0, 'step2': 0, 'scale': cfg['scale_reset'], 'td_d1': 0, 'avg_d1': cfg['avg_reset'],
+         'l1_d1': 0, 'l1_d2': 0, 'v_d1': 0, 'v_d2': 0, 'pdiff': 0, 'phase': 0, 'valid': 0, 'conf': 0}
+    x = [np.asarray(ch1) >> (ADC_BITS - 8), np.asarray(ch2) >> (ADC_BITS - 8)]
+    pulses = []
+    for n in range(1, len(x[0]) + 1):
+        oc = [dict(v) for v in ch]
+        nch = [dict(v) for v in ch]
+        for i in range(2):
+            o, w = oc[i], nch[i]
+            w['d1'] = int(x[i][n - 1])
+            if o['d1'] > hi:
+                w['above'] = 1
+            elif o['d1'] < lo:
+                w['above'] = 0
+            if not o['above'] and o['d1'] > hi:
+                w['zc'] = 1
+                if mn <= o['cnt'] <= mx:
+                    w['period'] = o['cnt']
+                w['cnt'] = 0
+            else:
+                w['zc'] = 0
+                if o['cnt'] < mx:
+                    w['cnt'] = o['cnt'] + 1
+
+        o, w = c, dict(c)
+        if oc[0]['zc'] and not o['has1']:
+            w['snap1'] = oc[1]['cnt']
+            w['has1'] = 1
+            if not o['has2']:
+                w['lead1'], w['lead2'] = 1, 0
+        if oc[1]['zc'] and not o['has2']:
+            w['snap2'] = oc[0]['cnt']
+            w['has2'] = 1
+            if not o['has1']:
+                w['lead2'], w['lead1'] = 1, 0
+        if o['has1'] and o['has2']:
+            w['time_diff'] = o['snap2'] if o['lead1'] else o['snap1']
+            w['avg'] = ((oc[0]['period'] + oc[1]['period']) & 0xFFFFF) >> 1
+            w['counter'], w['valid'] = CALC_HOLD, 1
+            w['has1'] = w['has2'] = w['lead1'] = w['lead2'] = 0
+        elif o['counter'] > 0:
+            w['counter'], w['valid'] = o['counter'] - 1, 1
+        else:
+            w['valid'] = 0
+
+        q, r = p, dict(p)
+        r['v_d1'], r['v_d2'] = o['valid'], q['v_d1']
+        r['l1_d1'], r['l1_d2'] = o['lead1'], q['l1_d1']
+        if o['valid']:
+            avg = o['avg']
+            r['scale'] = next((s for lim, s in cfg['bands'] if avg < lim), cfg['scale_last'])
+            r['step1'] = (o['time_diff'] * q['scale']) & 0xFFFFFFFF
+            r['td_d1'], r['avg_d1'] = o['time_diff'], avg
+        if q['v_d1']:
+            r['step2'] = q['step1'] >> 10
+        if q['v_d2']:
+            if q['td_d1'] > q['avg_d1'] - (q['avg_d1'] >> 4):
+                r['phase'], r['conf'] = 0, 0
+            elif q['l1_d1']:
+                r['phase'] = 1800 if q['step2'] > 1800 else q['step2'] & 0xFFFF
+            else:
+                r['phase'] = -1800 if q['step2'] > 1800 else -(q['step2'] & 0xFFFF)
+            r['pdiff'] = abs(oc[0]['period'] - oc[1]['period'])
+            a = q['avg_d1']
+            pd = q['pdiff']
+            r['conf'] = (255 if pd < a >> 7 else 200 if pd < a >> 6 else
+                         150 if pd < a >> 5 else 100 if pd < a >> 4 else 50)
+            r['valid'] = 1
+            pulses.append((n, r['phase'], r['conf']))
+        else:
+            r['valid'] = 0
+        ch, c, p = nch, w, r
+    return pulses
+
+#=============================================================================
+# phase_diff_calc_v4
+#=============================================================================
+
+def v4_angles(re1, im1, re2, im2, cordic_cfg):
+    """
+    阶段2~5 (每次测量独立): 互相关 → 归一化 → CORDIC
+
+    返回 (cordic_angle 0.1°, signal_magnitude, 右移位数); 右移后 |x|,|y| < 2^15.
+    """
+    re1, im1, re2, im2 = (np.asarray(v, dtype=np.int64) for v in (re1, im1, re2, im2))
+    cross_re = wrap(re1 * re2 + im1 * im2, 32)
+    cross_im = wrap(re1 * im2 - im1 * re2, 32)
+
+    def ones(v):                                             # v[30:0] ^ {31{v[31]}}
+        return np.where(v < 0, ~v, v) & 0x7FFFFFFF
+
+    def top8(v):                                             # v[31] ? -v[31:24] : v[31:24] (8位)
+        t = (v >> 24) & 0xFF
+        return np.where(v < 0, -t & 0xFF, t)
+
+    top = np.frexp((ones(cross_re) | ones(cross_im)).astype(np.float64))[1] - 1   # 最高有效位位置 (0 → -1)
+    shift = np.maximum(top - 14, 0)
+    x = wrap(cross_re >> shift, 16)
+    y = wrap(cross_im >> shift, 16)
+    mag = (top8(cross_re) + top8(cross_im)) & 0xFF
+    shape = x.shape
+    angle = cordic_atan2(x.reshape(-1), y.reshape(-1), cordic_cfg).reshape(shape)
+    return angle, mag, shift
+
+def v4_updates(valid_cycles):
+    """ch*_valid 保持 L 拍时 both_ready 的拍数 (ready 要等 both_ready 才清除, 单拍 valid 也得到2拍)"""
+    return max(valid_cycles, 2)
+
+def v4_smooth(angles, smooth_factor, updates):
+    """
+    IIR 阶段与输出寄存器, angles: (B, K) 每次测量的 CORDIC 角度
+
+    每次测量连续 updates 次更新; phase_diff 在每次更新时取更新前的 phase_smooth,
+    phase_smooth 越界时边界修正覆盖当拍的IIR更新. 返回每次测量脉冲串结束后的 (phase_diff, phase_smooth).
+    """
+    angles = np.atleast_2d(np.asarray(angles, dtype=np.int64))
+    smooth = np.zeros(angles.shape[0], dtype=np.int64)
+    out = np.zeros_like(angles)
+    out_smooth = np.zeros_like(angles)
+    phase = smooth.copy()
+    for k in range(angles.shape[1]):
+        a = angles[:, k]
+        for _ in range(updates):
+            phase = smooth
+            d = wrap(a - smooth, 16)
+            if smooth_factor == 0:
+                new = a
+            else:
+                err = np.where(d > 1800, wrap(d - 3600, 16), np.where(d < -1800, wrap(d + 3600, 16), d))
+                new = wrap(smooth + (err >> (16 - smooth_factor)), 16)
+            smooth = np.where(smooth > 1800, smooth - 3600, np.where(smooth < -1800, smooth + 3600, new))
+        out[:, k] = phase
+        out_smooth[:, k] = smooth
+    return out, out_smooth
+
+def replay_tb(path, cordic_cfg):
+    """
+    重放 tb_phase_diff_calc_v4.v 的手选用例 (valid 单拍 → 每例2次IIR更新)
+
+    testbench 在 wait(phase_valid) 后再等一个沿读取 phase_diff, 读到的是第一拍写入的值,
+    即本例之前的 phase_smooth.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    seq, sf = [], 0
+    pattern = (r"smooth_factor\s*=\s*4'd(\d+);|repeat\((\d+)\)\s*begin\s*test_phase_diff\(([^)]*)\);\s*end"
+               r"|test_phase_diff\(([^)]*)\);")
+    for m in re.finditer(pattern, text):
+        if m.group(1):
+            sf = int(m.group(1))
+            continue
+        args = [float(v) for v in (m.group(3) or m.group(4)).split(',')]
+        seq += [(args, sf)] * (int(m.group(2)) if m.group(2) else 1)
+    if not seq:
+        raise ValueError(f"{path} 中找不到 test_phase_diff 用例")
+    rows = []
+    prev = 0
+    for (p1, p2, amp), sf in seq:
+        def vec(deg):
+            rad = deg * 3.14159265 / 180.0
+            return int(np.trunc(amp * np.cos(rad))), int(np.trunc(amp * np.sin(rad)))
+        (r1, i1), (r2, i2) = vec(p1), vec(p2)
+        angle, mag, shift = v4_angles(r1, i1, r2, i2, cordic_cfg)
+        angle = int(angle)
+        # 从上一例的 phase_smooth 继续
+        s = prev
+        phase = s
+        for _ in range(v4_updates(1)):
+            phase = s
+            d = int(wrap(angle - s, 16))
+            if sf == 0:
+                new = angle
+            else:
+                err = d - 3600 if d > 1800 else d + 3600 if d < -1800 else d
+                new = int(wrap(s + (err >> (16 - sf)), 16))
+            s = s - 3600 if s > 1800 else s + 3600 if s < -1800 else new
+        expected = p2 - p1
+        expected = expected - 360 if expected > 180 else expected + 360 if expected < -180 else expected
+        read = prev
+        err = read / 10 - expected
+        err = err - 360 if err > 180 else err + 360 if err < -180 else err
+        rows.append({'ch1_deg': p1, 'ch2_deg': p2, 'amplitude': amp, 'smooth_factor': sf, 'expected': expected,
+                     'cross_shift': int(shift), 'cordic_angle': angle / 10, 'phase_diff_after': phase / 10,
+                     'tb_reads': read / 10, 'tb_error': round(err, 2), 'tb_pass': abs(err) < 0.2})
+        prev = s
+    return rows
+
+def fft_frames(codes, frames, idf, window, frontend):
+    """
+    单通道记录前 frames 帧 → fft_dout 实/虚部 (frames, N), 每帧对应一次测量
+
+    frontend='rtl': spectrum_chain_model 的前端 (直流估计器状态跨帧保持; 中点附近的输入 dc_sum 16位回绕);
+    frontend='ideal': 减去帧均值后按RTL加窗截位, 只评估 phase_diff_calc_v4 本身.
+    FFT为NumPy块浮点近似 (输出为10位符号扩展).
+    """
+    x = np.asarray(codes[:frames * N], dtype=np.int64).reshape(frames, N)
+    if frontend == 'rtl':
+        x = FrontEnd(window=window, input_width=idf['input_width']).process(x)
+    else:
+        x = x - np.rint(x.mean(axis=1, keepdims=True)).astype(np.int64)
+        if window is not None:
+            x = wrap((x * window[None, :]) >> 15, 16)
+        x = wrap(x, idf['input_width'])
+    re_, im_, _ = fft_numpy(x, idf)
+    return re_, im_
+
+#=============================================================================
+# 激励与单点评估
+#=============================================================================
+
+def record_length(freq, periods, v4_frames):
+    return max(int(np.ceil(periods * SAMPLE_HZ / freq)) + 8, v4_frames * N)
+
+def make_record(rng, freq, delta_deg, amp, noise, dc, n):
+    """ch1 = dc + A·sin(ωt + θ + Δ), ch2 = dc + A·sin(ωt + θ): ch1 超前 Δ; θ 随机"""
+    t = np.arange(n, dtype=np.float64) * (2 * np.pi * freq / SAMPLE_HZ)
+    theta = rng.uniform(0, 2 * np.pi)
+    out = []
+    for extra in (np.radians(delta_deg), 0.0):
+        x = dc + amp * np.sin(t + theta + extra)
+        if noise:
+            x += rng.normal(0, noise, n)
+        out.append(np.clip(np.rint(x), 0, (1 << ADC_BITS) - 1).astype(np.int16))
+    return out
+
+def wrap_deg(v):
+    return (np.asarray(v, dtype=np.float64) + 180.0) % 360.0 - 180.0
+
+def classify(row, spec):
+    """超出指标时的主要原因"""
+    if row['td_n'] == 0:
+        return 'no_result'
+    if row['td_max_err'] < spec:
+        return ''
+    if row['rises_per_period'] > 1.5:
+        return 'chatter'
+    if row['period_err'] > 0.01:
+        return 'period_gate'
+    if row['sign_flip'] > 0:
+        return 'sign'
+    if row['td_exact_max_err'] < spec:
+        return 'scale'
+    return 'timing'
+
+def evaluate_record(rec, freq, delta, ctx):
+    """TimeDomainRecord → 一行统计 (跳过前 warmup 次计算)"""
+    res = rec.results[ctx['warmup']:]
+    row = {'td_n': len(res)}
+    true_period = SAMPLE_HZ / freq
+    rises = len(rec.rise[0]) / max(ctx['n'] / true_period, 1)
+    row['rises_per_period'] = rises
+    if not res:
+        row.update(td_mean_err=np.nan, td_max_err=np.nan, td_exact_max_err=np.nan, sign_flip=np.nan,
+                   period_err=np.nan, conf_mean=np.nan)
+        return row
+    out = np.array([r['phase'] for r in res], dtype=np.float64) / 10
+    err = wrap_deg(out - delta)
+    # 相同 time_diff / avg_period, 精确除法与正确符号: 只剩过零时刻与配对本身的误差
+    exact = np.array([r['time_diff'] * 360.0 / r['avg_period'] * (1 if r['lead1'] else -1) for r in res])
+    exact_err = wrap_deg(exact - delta)
+    avg = np.array([r['avg_period'] for r in res], dtype=np.float64)
+    row.update(td_mean_err=float(err.mean()), td_max_err=float(np.abs(err).max()),
+               td_exact_max_err=float(np.abs(exact_err).max()),
+               sign_flip=float(np.mean((np.sign(out) != np.sign(delta)) & (np.abs(out) > 0.5) & (abs(delta) > 0.5))),
+               period_err=float(np.abs(avg - (true_period - 1)).max() / true_period),
+               conf_mean=float(np.mean([r['conf'] for r in res])))
+    return row
+
+#=============================================================================
+# 进程池任务
+#=============================================================================
+
+_CTX = None
+
+def _init_worker(ctx):
+    global _CTX
+    _CTX = ctx
+
+def run_point(task):
+    """(点序号, 频率, 噪声, 幅度, 相位列表, 种子) → 每个相位一行"""
+    index, freq, noise, amp, phases, seed = task
+    ctx = _CTX
+    rng = np.random.default_rng(seed)
+    n = record_length(freq, ctx['periods'], ctx['v4_frames'])
+    ctx = dict(ctx, n=n)
+    rows = []
+    v4_in = []
+    for delta in phases:
+        ch1, ch2 = make_record(rng, freq, delta, amp, noise, ctx['dc'], n)
+        rec = time_domain_model(ch1, ch2, ctx['time_cfg'])[0]
+        row = {'freq': freq, 'phase': delta, 'noise': noise, 'amp': amp}
+        row.update(evaluate_record(rec, freq, delta, ctx))
+        row['cause'] = classify(row, ctx['spec'])
+        rows.append(row)
+        if ctx['v4_frames']:
+            v4_in.append([fft_frames(c, ctx['v4_frames'], ctx['idf'], ctx['window'], ctx['v4_frontend'])
+                          for c in (ch1, ch2)])
+    if ctx['v4_frames']:
+        v4_rows(rows, v4_in, ctx)
+    return index, rows
+
+def v4_rows(rows, v4_in, ctx):
+    """phase_diff_calc_v4 按 ch2 - ch1 输出, 期望值为 -Δ"""
+    v4 = ctx['v4']
+    for row, ((re1, im1), (re2, im2)) in zip(rows, v4_in):
+        expected = -row['phase']
+        mag = np.abs(re1[:, 1:N // 2] + 1j * im1[:, 1:N // 2]).sum(axis=0)
+        peak = int(np.argmax(mag)) + 1
+        for name, b in (('v4', peak), ('v4_bin%d' % v4['fixed_bin'], v4['fixed_bin'])):
+            angle, _, _ = v4_angles(re1[:, b], im1[:, b], re2[:, b], im2[:, b], v4['cordic'])
+            row[f'{name}_raw_err'] = float(np.abs(wrap_deg(angle / 10 - expected)).max())
+            if name == 'v4':
+                ideal = np.degrees(np.angle((re2[:, b] + 1j * im2[:, b]) * np.conj(re1[:, b] + 1j * im1[:, b])))
+                row['v4_bin'] = peak
+                row['v4_ideal_err'] = float(np.abs(wrap_deg(ideal - expected)).max())
+                out, _ = v4_smooth(angle[None, :], v4['smooth_factor'], v4_updates(v4['valid_cycles']))
+                row['v4_out_err'] = float(abs(wrap_deg(out[0, -1] / 10 - expected)))
+
+#=============================================================================
+# 输出
+#=============================================================================
+
+def csv_text(header, rows):
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator='\n')
+    w.writerow(header)
+    for r in rows:
+        w.writerow([f"{v:.4g}" if isinstance(v, float) else v for v in r])
+    return buf.getvalue()
+
+def surface(rows, x, y, value, where=None):
+    """rows 按 (y, x) 透视, 取 value 的最大值 (NaN 表示无结果)"""
+    rows = [r for r in rows if where is None or where(r)]
+    xs = sorted({r[x] for r in rows})
+    ys = sorted({r[y] for r in rows})
+    table = {}
+    for r in rows:
+        v = r.get(value, np.nan)
+        k = (r[y], r[x])
+        table[k] = v if k not in table or np.isnan(table[k]) else max(table[k], v) if not np.isnan(v) else table[k]
+    return csv_text([f"{y}\\{x}"] + xs, [[yv] + [table.get((yv, xv), np.nan) for xv in xs] for yv in ys])
+
+def parse_list(text, conv=float):
+    """'a:b:step' 或逗号分隔列表"""
+    if ':' in text:
+        a, b, s = (float(v) for v in text.split(':'))
+        return [conv(v) for v in np.arange(a, b + s / 2, s)]
+    return [conv(v) for v in text.split(',')]
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def check(cfg, v4):
+    """事件级模型 vs 逐拍参考; testbench 用例重放"""
+    ok = True
+    rng = np.random.default_rng(7)
+    cases = [(35000, 30, 480, 0), (35000, -0.3, 480, 0), (5000, -100, 300, 6), (1000, 170, 200, 2),
+             (20000, 60, 40, 24), (3500, 0, 480, 0), (70000, 45, 480, 0)]
+    for freq, delta, amp, noise in cases:
+        n = int(4.5 * SAMPLE_HZ / freq) + 8
+        ch1, ch2 = make_record(rng, freq, delta, amp, noise, 512, n)
+        ref = reference_time_domain(ch1, ch2, cfg)
+        rec = time_domain_model(ch1, ch2, cfg)[0]
+        same = rec.pulses == ref
+        ok &= same
+        last = ref[-1] if ref else None
+        print(("✓" if same else "❌") + f" {freq:>6} Hz Δ{delta:>7g}° 幅度{amp:>4} 噪声{noise:>3}: {n:,} 拍, "
+              f"{len(ref)} 个 phase_valid 脉冲, 末值 {last[1] / 10 if last else '-'}°"
+              + (f" (置信度 {last[2]})" if last else ""))
+        if not same:
+            for a, b in zip(rec.pulses, ref):
+                if a != b:
+                    print(f"   首个差异: 模型 {a}  参考 {b}")
+                    break
+            else:
+                print(f"   脉冲数不同: 模型 {len(rec.pulses)}  参考 {len(ref)}")
+
+    print(f"\n--- tb_phase_diff_calc_v4 用例重放 (每例 {v4_updates(1)} 次IIR更新) ---")
+    rows = replay_tb(TB_V4, v4['cordic'])
+    for r in rows:
+        print(f"  ch1 {r['ch1_deg']:>6g}° ch2 {r['ch2_deg']:>6g}° A={r['amplitude']:>5g} sf={r['smooth_factor']:<2} "
+              f"期望 {r['expected']:>6.1f}°  CORDIC {r['cordic_angle']:>6.1f}°"
+              + (f" (右移{r['cross_shift']})" if r['cross_shift'] else "")
+              + f"  本例后 {r['phase_diff_after']:>6.1f}°  tb读到 {r['tb_reads']:>6.1f}° "
+              + ("✓" if r['tb_pass'] else "❌"))
+    return ok, rows
+
+def main():
+    parser = argparse.ArgumentParser(description="相位差测量位精确模型与精度扫描")
+    parser.add_argument('--freq', default=DEFAULT_FREQS, help="信号频率 (Hz)")
+    parser.add_argument('--phase', default=DEFAULT_PHASES, help="相位差 Δ (°, ch1 超前为正)")
+    parser.add_argument('--noise', default=DEFAULT_NOISE, help="噪声RMS (10位ADC码)")
+    parser.add_argument('--amp', default=DEFAULT_AMPS, help="正弦峰值幅度 (10位ADC码)")
+    parser.add_argument('--dc', type=float, default=512, help="直流偏置 (10位ADC码)")
+    parser.add_argument('--periods', type=float, default=8, help="每条记录的信号周期数")
+    parser.add_argument('--warmup', type=int, default=2, help="每条记录丢弃的前几次计算 (周期寄存器初始化)")
+    parser.add_argument('--spec', type=float, default=1.0, help="精度指标 (°)")
+    parser.add_argument('--v4-frames', type=int, default=4, help="phase_diff_calc_v4 每条记录的FFT帧数")
+    parser.add_argument('--v4-frontend', choices=['ideal', 'rtl'], default='ideal',
+                        help="phase_diff_calc_v4 的FFT前端: ideal=减帧均值, rtl=RTL直流估计器")
+    parser.add_argument('--no-v4', action='store_true', help="不评估 phase_diff_calc_v4")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="进程数 (默认全部CPU核)")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--check', action='store_true', help="与逐拍参考实现比对并重放testbench用例后退出")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="输出目录")
+    args = parser.parse_args()
+
+    cfg = parse_time_rtl()
+    v4 = parse_v4()
+    if args.check:
+        ok, _ = check(cfg, v4)
+        sys.exit(0 if ok else 1)
+
+    freqs, phases = parse_list(args.freq), parse_list(args.phase)
+    noises, amps = parse_list(args.noise), parse_list(args.amp)
+    v4_frames = 0 if args.no_v4 else args.v4_frames
+    ctx = {'time_cfg': cfg, 'v4': v4, 'v4_frames': v4_frames, 'periods': args.periods, 'warmup': args.warmup,
+           'spec': args.spec, 'dc': args.dc, 'idf': parse_idf(), 'v4_frontend': args.v4_frontend,
+           'window': load_window() if parse_window_enabled() else None}
+    points = [(f, nz, a) for f in freqs for nz in noises for a in amps]
+    seeds = np.random.SeedSequence(args.seed).spawn(len(points))
+    tasks = [(i, f, nz, a, phases, s) for i, ((f, nz, a), s) in enumerate(zip(points, seeds))]
+    total = len(points) * len(phases)
+    print(f"=== 相位差精度扫描: {len(freqs)} 频率 × {len(phases)} 相位 × {len(noises)} 噪声 × {len(amps)} 幅度 "
+          f"= {total:,} 条记录, 每条 {args.periods:g} 个周期 ===")
+    print(f"phase_diff_time_domain: 门限 {cfg['zero_threshold']}±{cfg['hysteresis']} (8位), "
+          f"周期门限 {cfg['min_period']}~{cfg['max_period']}, scale分档 {cfg['bands']} / {cfg['scale_last']}")
+    if v4_frames:
+        print(f"phase_diff_calc_v4: smooth_factor={v4['smooth_factor']}, 每次测量 {v4_updates(v4['valid_cycles'])} "
+              f"次IIR更新, 每条记录 {v4_frames} 帧 (峰值bin 与 固定bin {v4['fixed_bin']}), {args.v4_frontend} 前端")
+
+    results = [None] * len(points)
+    start = time.time()
+    done = 0
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(ctx,)) as pool:
+        for index, rows in pool.map(run_point, tasks):
+            results[index] = rows
+            done += 1
+            if done * 10 // len(tasks) != (done - 1) * 10 // len(tasks):
+                print(f"  {done}/{len(tasks)} ({time.time() - start:.0f} s)")
+    rows = [r for rs in results for r in rs]
+    elapsed = time.time() - start
+    print(f"✓ 完成: {elapsed:.1f} s")
+
+    spec = args.spec
+    measured = [r for r in rows if r['td_n']]
+    passed = [r for r in measured if r['td_max_err'] < spec]
+    causes = {}
+    for r in rows:
+        if r['cause']:
+            causes[r['cause']] = causes.get(r['cause'], 0) + 1
+    print(f"\n--- phase_diff_time_domain: {len(passed)}/{len(rows)} 条记录最大误差 < {spec:g}° "
+          f"({len(rows) - len(measured)} 条无输出) ---")
+    names = {'no_result': '无过零/无输出', 'chatter': '噪声抖动 (多次过零)', 'period_gate': '周期门限 (周期寄存器未更新)',
+             'sign': '符号错误', 'scale': '缩放系数分档', 'timing': '过零时刻/配对'}
+    for k, v in sorted(causes.items(), key=lambda kv: -kv[1]):
+        print(f"  {names[k]:<24}{v:>6}")
+
+    clean = [r for r in rows if r['noise'] == min(noises) and r['amp'] == max(amps)]
+    print(f"\n最大误差 (°) vs 频率, 噪声 {min(noises):g} / 幅度 {max(amps):g}:")
+    print(f"{'频率':>8}{'RTL':>9}{'精确除法':>10}{'符号错':>8}{'周期误差':>10}" +
+          (f"{'v4输出':>9}{'v4 CORDIC':>11}{'v4理想':>9}" if v4_frames else ""))
+    for f in freqs:
+        sub = [r for r in clean if r['freq'] == f]
+        if not sub:
+            continue
+        mx = lambda key: np.nanmax([r.get(key, np.nan) for r in sub]) if any(
+            not np.isnan(r.get(key, np.nan)) for r in sub) else np.nan
+        print(f"{f:>8g}{mx('td_max_err'):>9.2f}{mx('td_exact_max_err'):>10.2f}{mx('sign_flip'):>8.2f}"
+              f"{mx('period_err'):>10.2%}" +
+              (f"{mx('v4_out_err'):>9.1f}{mx('v4_raw_err'):>11.1f}{mx('v4_ideal_err'):>9.2f}" if v4_frames else ""))
+
+    findings = []
+    sign = [r for r in measured if r['sign_flip'] > 0]
+    if sign:
+        findings.append(f"{len(sign)} 条记录符号错误: 计算沿清除 ch1_leading, 输出级读 ch1_leading_d1 时已为0, "
+                        f"ch1 超前也输出负相位")
+    scale = [r for r in measured if r['cause'] == 'scale']
+    if scale:
+        findings.append(f"{len(scale)} 条记录只因 scale_factor 分档超差: 系数只在 avg_period = 10000/35000/70000/140000 "
+                        f"时精确, 其它频率按比例偏差 (如7kHz: 370 vs 3686400/5000=737)")
+    gate = sorted({r['freq'] for r in measured if r['cause'] == 'period_gate' and r['noise'] == 0})
+    if gate:
+        findings.append(f"无噪声时周期门限失效的频率 {gate} Hz: 周期计数比实际少1, 35kHz 时为 {SAMPLE_HZ // 35000 - 1} "
+                        f"< MIN_PERIOD={cfg['min_period']}, 周期寄存器停在复位值 {cfg['period_reset']}")
+    noisy = sum(r['cause'] == 'period_gate' and r['noise'] > 0 for r in measured)
+    if noisy:
+        findings.append(f"{noisy} 条有噪声记录因抖动过零使周期超出门限被拒收 (周期寄存器保持旧值)")
+    none = sorted({r['amp'] for r in rows if r['cause'] == 'no_result'})
+    if none:
+        findings.append(f"幅度 {none} 码无输出: 8位迟滞门限 >{cfg['zero_threshold'] + cfg['hysteresis']} / "
+                        f"<{cfg['zero_threshold'] - cfg['hysteresis']} 对应10位码约 ±{4 * cfg['hysteresis'] + 4}")
+    chat = sorted({(r['noise'], r['amp']) for r in rows if r['cause'] == 'chatter'})
+    if chat:
+        findings.append(f"噪声/幅度组合 {chat} 过零抖动: 迟滞 ±{cfg['hysteresis']} LSB(8位) 不足以抑制噪声")
+    if v4_frames:
+        findings.append("phase_diff_calc_v4: 与时域模块符号约定相反 (ch2 - ch1)")
+    for f in findings:
+        print("⚠️  " + f)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    keys = list(rows[0].keys())
+    for r in rows:
+        for k in r:
+            if k not in keys:
+                keys.append(k)
+    outputs = [
+        ('phase_sweep.csv', csv_text(keys, [[r.get(k, '') for k in keys] for r in rows])),
+        ('error_surface_freq_phase.csv', surface(clean, 'freq', 'phase', 'td_max_err')),
+        ('error_surface_freq_noise.csv', surface(rows, 'freq', 'noise', 'td_max_err')),
+        ('error_surface_freq_amp.csv', surface(rows, 'freq', 'amp', 'td_max_err')),
+    ]
+    if v4_frames:
+        outputs.append(('error_surface_v4_freq_phase.csv', surface(clean, 'freq', 'phase', 'v4_raw_err')))
+    worst = sorted((r for r in measured if r['cause']), key=lambda r: -r['td_max_err'])[:20]
+    report = {
+        'spec_deg': spec, 'records': len(rows), 'measured': len(measured), 'passed': len(passed),
+        'causes': causes, 'elapsed_s': elapsed,
+        'config': {'time_domain': cfg, 'v4': {k: v for k, v in v4.items() if k != 'cordic'},
+                   'periods': args.periods, 'warmup': args.warmup, 'v4_frames': v4_frames,
+                   'v4_frontend': args.v4_frontend},
+        'findings': findings,
+        'worst': worst,
+        'no_result_corners': sorted({(r['freq'], r['noise'], r['amp']) for r in rows if r['cause'] == 'no_result'}),
+    }
+    outputs.append(('phase_report.json', json.dumps(report, indent=2, ensure_ascii=False, default=float) + '\n'))
+    print()
+    for name, data in outputs:
+        path = os.path.join(args.output_dir, name)
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并行仿真回归 (Icarus / Verilator), 按源文件闭包与向量哈希跳过未变化的测试
+
+代替 sim/behav/run_behav_compile.tcl (Pango 生成: 写死 E:/Odyssey_proj 路径, 列有已删除的
+char_rom_16x32.v / phase_diff_calc.v, 只为一个顶层串行编译全部文件):
+    - 文件来源: Odyssey.pds 的设计文件与IP源文件, compile/include_relation.txt 的包含关系 (PDS编译时生成, 可无),
+      以及 source/ ipcore/ 下全部 .v (不在工程中的模块与测试平台); --lib-dir 追加厂商仿真库
+    - 每个测试只编译其顶层实际例化到的模块 (去注释后解析例化, 递归求闭包) 与 `include 的头文件
+    - 测试: 手写测试平台 (tb_*.v / *_tb.v / *testbench*.v) 与 golden_vectors.py 生成的
+      sim/golden/*/bench.json
+    - 线程池并行, 每个测试一个编译+运行子进程; 默认并行数为CPU核数
+    - 哈希 = 仿真器版本 + 编译选项 + 闭包内每个源文件/头文件/数据文件的内容 (含黄金向量);
+      与上次通过时相同则跳过, 失败的测试每次都重跑
+    - 判定: 黄金向量测试看 GOLDEN_RESULT 行; 其它看退出码与 FAIL/ERROR 字样
+      清单标 "xfail": true 的测试 (RTL已知问题) 比对失败记为 xfail, 意外通过记为 xpass, 均不计失败
+
+加密IP (ipcore/fft_8192/rtl/synplify/*.vp, IEEE 1735) 与厂商原语 (GTP_*) 开源仿真器无法编译,
+闭包中有未解析模块的测试记为 skip 并列出模块名.
+
+运行目录为仓库根目录 (测试平台与RTL中的 $readmemh 路径均相对仓库根目录).
+编译/运行日志与汇总在 sim/regression/, 缓存为 sim/regression/cache.json.
+
+用法:
+    python scripts/golden_vectors.py && python scripts/sim_regression.py     # 生成黄金向量并回归
+    python scripts/sim_regression.py --list                                 # 只列出测试/闭包/缓存状态
+    python scripts/sim_regression.py --sim verilator --jobs 8 --test 'golden/*'
+    python scripts/sim_regression.py --force --timeout 1200
+    python scripts/sim_regression.py --lib-dir <Pango仿真库目录>
+"""
+
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from mem_image import write_if_changed
+
+PDS_FILE = "Odyssey.pds"
+INCLUDE_RELATION = "compile/include_relation.txt"
+GOLDEN_DIR = "sim/golden"
+BUILD_DIR = "sim/regression"
+CACHE_FILE = "sim/regression/cache.json"
+SCAN_DIRS = ("source", "ipcore")
+SKIP_DIRS = ("example_design", "pnr")          # IP自带示例/布局副本, 模块名与正式文件重复
+SOURCE_EXTS = ('.v', '.sv', '.vp')
+DATA_EXTS = ('.hex', '.mem', '.dat', '.bin', '.coe', '.mif', '.txt')
+TB_PATTERN = re.compile(r'(^tb_.*|.*_tb|.*testbench.*)\.s?v$')
+DEFINES = ('SIMULATION', 'SIM')
+DEFAULT_TIMEOUT = 600
+
+VERILOG_KEYWORDS = set("""
+    always and assign automatic begin buf bufif0 bufif1 case casex casez cmos deassign default defparam
+    disable edge else end endcase endfunction endgenerate endmodule endprimitive endspecify endtable
+    endtask event for force forever fork function generate genvar highz0 highz1 if ifnone initial inout
+    input integer join large localparam macromodule medium module nand negedge nmos nor not notif0
+    notif1 or output parameter pmos posedge primitive pull0 pull1 pulldown pullup rcmos real realtime
+    reg release repeat rnmos rpmos rtran rtranif0 rtranif1 scalared signed small specify specparam
+    strong0 strong1 supply0 supply1 table task time tran tranif0 tranif1 tri tri0 tri1 triand trior
+    trireg unsigned vectored wait wand weak0 weak1 while wire wor xnor xor logic bit byte int
+    """.split())
+GATE_PRIMITIVES = {'and', 'nand', 'or', 'nor', 'xor', 'xnor', 'not', 'buf', 'bufif0', 'bufif1',
+                   'notif0', 'notif1', 'pullup', 'pulldown'}
+
+#=============================================================================
+# 工程文件解析
+#=============================================================================
+
+def parse_pds(path=PDS_FILE):
+    """
+    Odyssey.pds → 设计文件、IP源文件 (按IP分组) 与综合顶层
+
+    返回 dict(design=[...], ip={idf: [...]}, top=名称或None)
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    design, ip, top, cur = [], {}, None, None
+    for m in re.finditer(r'\(_file\s+"([^"]+)"(?:\s*\+\s*"(\w+)")?|\(_ip\s+"([^"]+)"|\(_ip_source_item\s+"([^"]+)"',
+                         text):
+        if m.group(1):
+            if m.group(1).endswith(SOURCE_EXTS + ('.vh',)):
+                design.append(m.group(1))
+                top = m.group(2) or top
+        elif m.group(3):
+            cur = m.group(3)
+            ip[cur] = []
+        elif cur is not None:
+            ip[cur].append(m.group(4))
+    return {'design': design, 'ip': ip, 'top': top}
+
+def parse_include_relation(path=INCLUDE_RELATION):
+    """
+    compile/include_relation.txt → {源文件: [被包含文件]}
+
+    每行一个源文件后跟其包含的文件 (可加引号, 分隔符 -> : => 均可); 文件由PDS编译生成,
+    不存在或为空时返回空表, 此时只靠扫描 `include 指令.
+    """
+    relation = {}
+    if not os.path.exists(path):
+        return relation
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.split('#')[0].strip()
+            if not line:
+                continue
+            tokens = [a or b for a, b in re.findall(r'"([^"]+)"|([^\s:,]+)', line) if (a or b) not in ('->', '=>')]
+            if len(tokens) >= 2:
+                relation.setdefault(os.path.normpath(tokens[0]), []).extend(os.path.normpath(t) for t in tokens[1:])
+    return relation
+
+#=============================================================================
+# Verilog 扫描
+#=============================================================================
+
+_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.S)
+
+def strip_comments(text):
+    """去掉 // 与 /* */ 注释, 保留字符串 (字符串中的 // 不是注释)"""
+    return _TOKEN.sub(lambda m: m.group(0) if m.group(0).startswith('"') else ' ', text)
+
+_MODULE = re.compile(r'\b(?:macro)?module\s+([A-Za-z_]\w*)(.*?)\bendmodule\b', re.S)
+_INSTANCE = re.compile(r'(?<![\w.$`])([A-Za-z_]\w*)(?:\s*#\s*\((?:[^()]|\((?:[^()]|\([^()]*\))*\))*\)\s*|\s+)'
+                       r'([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)?\(')
+_INCLUDE = re.compile(r'`include\s+"([^"]+)"')
+_STRING = re.compile(r'"([^"\n]+)"')
+
+class SourceFile:
+    """一个源文件: 定义的模块及各模块例化的模块名, `include 与数据文件字符串"""
+
+    def __init__(self, path):
+        self.path = path
+        self.encrypted = path.endswith('.vp')
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            raw = f.read()
+        self.modules = {}
+        self.includes = []
+        self.data = []
+        if self.encrypted and 'pragma protect begin_protected' in raw:
+            return
+        text = strip_comments(raw)
+        for m in _MODULE.finditer(text):
+            body = m.group(2)
+            self.modules[m.group(1)] = {a for a, b in _INSTANCE.findall(body)
+                                        if a not in VERILOG_KEYWORDS and b not in VERILOG_KEYWORDS
+                                        and a not in GATE_PRIMITIVES}
+        self.includes = _INCLUDE.findall(text)
+        self.data = [s for s in _STRING.findall(text) if s.lower().endswith(DATA_EXTS)]
+
+def scan_files(pds, lib_dirs):
+    """候选源文件: 工程文件优先, 然后 source/ ipcore/ 与 --lib-dir 下的全部源文件"""
+    files, seen = [], set()
+
+    def add(path):
+        norm = os.path.normpath(path)
+        if norm not in seen and os.path.isfile(norm):
+            seen.add(norm)
+            files.append(norm)
+
+    for path in pds['design']:
+        add(path)
+    for items in pds['ip'].values():
+        for path in items:
+            add(path)
+    for root in list(SCAN_DIRS) + list(lib_dirs):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                if name.endswith(SOURCE_EXTS):
+                    add(os.path.join(dirpath, name))
+    return files
+
+class ModuleIndex:
+    """模块名 → 定义文件 (先出现者优先, 重复定义记入 duplicates)"""
+
+    def __init__(self, files):
+        self.sources = {}
+        self.where = {}
+        self.duplicates = {}
+        self.encrypted = []
+        for path in files:
+            self.register(path)
+
+    def register(self, path):
+        """加入一个源文件 (已加入的忽略), 返回其 SourceFile"""
+        path = os.path.normpath(path)
+        if path in self.sources:
+            return self.sources[path]
+        src = self.sources[path] = SourceFile(path)
+        if src.encrypted and not src.modules:
+            self.encrypted.append(path)
+        for name in src.modules:
+            if name in self.where:
+                self.duplicates.setdefault(name, [self.where[name]]).append(path)
+            else:
+                self.where[name] = path
+        return src
+
+    def closure(self, top):
+        """顶层模块 → (文件列表, 未解析模块名)"""
+        files, unresolved, todo, done = [], set(), [top], set()
+        while todo:
+            name = todo.pop()
+            if name in done:
+                continue
+            done.add(name)
+            path = self.where.get(name)
+            if path is None:
+                unresolved.add(name)
+                continue
+            if path not in files:
+                files.append(path)
+            todo.extend(self.sources[path].modules[name])
+        return files, sorted(unresolved)
+
+def resolve_includes(files, sources, relation):
+    """闭包内文件的 `include 头文件 (递归) 与 include 目录"""
+    headers, incdirs, todo = [], [], list(files)
+    while todo:
+        path = todo.pop()
+        base = os.path.dirname(path)
+        names = list(relation.get(path, []))
+        src = sources.get(path)
+        if src is None and os.path.isfile(path):
+            src = sources[path] = SourceFile(path)
+        if src is not None:
+            names += src.includes
+        for name in names:
+            for cand in (os.path.normpath(os.path.join(base, name)), os.path.normpath(name)):
+                if os.path.isfile(cand):
+                    if cand not in headers:
+                        headers.append(cand)
+                        todo.append(cand)
+                    d = os.path.dirname(cand) or '.'
+                    if d not in incdirs:
+                        incdirs.append(d)
+                    break
+    for path in files:
+        d = os.path.dirname(path) or '.'
+        if d not in incdirs:
+            incdirs.append(d)
+    return headers, incdirs
+
+def resolve_data(paths, sources):
+    """源文件中以数据文件扩展名结尾的字符串: 相对仓库根目录或文件所在目录存在的才计入"""
+    found = []
+    for path in paths:
+        src = sources.get(path)
+        for name in (src.data if src else []):
+            for cand in (os.path.normpath(name), os.path.normpath(os.path.join(os.path.dirname(path), name))):
+                if os.path.isfile(cand):
+                    if cand not in found:
+                        found.append(cand)
+                    break
+    return found
+
+#=============================================================================
+# 测试发现
+#=============================================================================
+
+def discover_tests(index):
+    """手写测试平台 + 黄金向量测试, 返回测试字典列表"""
+    tests = []
+    for path, src in index.sources.items():
+        if TB_PATTERN.match(os.path.basename(path)) and src.modules:
+            top = next(iter(src.modules))
+            tests.append({'name': top, 'top': top, 'kind': 'testbench', 'extra': [], 'vectors': []})
+    for manifest in sorted(glob.glob(os.path.join(GOLDEN_DIR, '*', 'bench.json'))):
+        with open(manifest, 'r', encoding='utf-8') as f:
+            bench = json.load(f)
+        index.register(bench['testbench'])
+        tests.append({'name': f"golden/{bench['bench']}", 'top': bench['top'], 'kind': 'golden',
+                      'extra': [], 'vectors': [os.path.normpath(p) for p in bench['vectors'] + bench['data']],
+                      'known_issues': bench.get('known_issues', []), 'xfail': bool(bench.get('xfail'))})
+    return sorted(tests, key=lambda t: t['name'])
+
+def file_digest(path, memo):
+    if path not in memo:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        memo[path] = h.hexdigest()
+    return memo[path]
+
+def plan_test(test, index, relation, sim, memo):
+    """闭包、头文件、数据文件与哈希"""
+    files, unresolved = index.closure(test['top'])
+    headers, incdirs = resolve_includes(files, index.sources, relation)
+    data = resolve_data(files + headers, index.sources)
+    data += [p for p in test['vectors'] if p not in data]
+    h = hashlib.sha256()
+    h.update(json.dumps([sim['id'] if sim else None, test['top'], DEFINES], sort_keys=True).encode())
+    for path in files + headers + data:
+        h.update(path.replace(os.sep, '/').encode() + b'\0')
+        h.update((file_digest(path, memo) if os.path.isfile(path) else 'missing').encode())
+    test.update(files=files, headers=headers, incdirs=incdirs, data=data, unresolved=unresolved,
+                hash=h.hexdigest(), encrypted=[p for p in files if index.sources[p].encrypted])
+    return test
+
+#=============================================================================
+# 仿真器
+#=============================================================================
+
+def detect_simulator(choice):
+    """auto: 先 Icarus 后 Verilator; 返回 dict(name, id) 或 None"""
+    order = ['icarus', 'verilator'] if choice == 'auto' else [choice]
+    for name in order:
+        exe = 'iverilog' if name == 'icarus' else 'verilator'
+        if shutil.which(exe) and (name != 'icarus' or shutil.which('vvp')):
+            flag = '-V' if name == 'icarus' else '--version'
+            out = subprocess.run([exe, flag], capture_output=True, text=True)
+            version = (out.stdout or out.stderr).strip().splitlines()[:1]
+            return {'name': name, 'id': f"{name} {version[0] if version else '?'}"}
+    return None
+
+def commands(test, sim, build):
+    """(编译命令, 运行命令)"""
+    defines = [f"-D{d}" for d in DEFINES]
+    files = test['files']
+    if sim['name'] == 'icarus':
+        out = os.path.join(build, 'sim.vvp')
+        compile_cmd = (['iverilog', '-g2012', '-s', test['top'], '-o', out] + defines
+                       + [f"-I{d}" for d in test['incdirs']] + files)
+        return compile_cmd, ['vvp', '-n', out]
+    mdir = os.path.join(build, 'obj_dir')
+    compile_cmd = (['verilator', '--binary', '--timing', '-Wno-fatal', '-Wno-lint', '-Wno-style',
+                    '--top-module', test['top'], '-Mdir', mdir, '-o', 'sim'] + defines
+                   + [f"-I{d}" for d in test['incdirs']] + files)
+    return compile_cmd, [os.path.join(mdir, 'sim')]
+
+_GOLDEN = re.compile(r'GOLDEN_RESULT\s+\S+\s+(PASS|FAIL)\s+checked=(\d+)\s+errors=(\d+)\s+expected=(\d+)')
+_FAIL = re.compile(r'\b(FAIL(?:ED|URE)?|ERROR)\b')
+
+def judge(test, returncode, output):
+    """运行结果 → (状态, 说明)"""
+    if test['kind'] == 'golden':
+        m = _GOLDEN.search(output)
+        if not m:
+            return 'fail', f"没有 GOLDEN_RESULT 行 (退出码 {returncode})"
+        status = 'pass' if m.group(1) == 'PASS' and returncode == 0 else 'fail'
+        if test.get('xfail'):
+            status = 'xpass' if status == 'pass' else 'xfail'
+        return status, f"比对 {m.group(2)}/{m.group(4)}, 错误 {m.group(3)}"
+    if returncode != 0:
+        return 'fail', f"退出码 {returncode}"
+    bad = [line.strip() for line in output.splitlines() if _FAIL.search(line)]
+    if bad:
+        return 'fail', f"{len(bad)} 行含 FAIL/ERROR: {bad[0][:80]}"
+    return 'pass', ''
+
+def run_test(test, sim, timeout):
+    """编译 + 运行一个测试, 日志写入 sim/regression/<测试>/"""
+    build = os.path.join(BUILD_DIR, test['name'].replace('/', '__'))
+    os.makedirs(build, exist_ok=True)
+    compile_cmd, run_cmd = commands(test, sim, build)
+    t0 = time.time()
+    try:
+        comp = subprocess.run(compile_cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return 'timeout', '编译超时', time.time() - t0
+    write_if_changed(os.path.join(build, 'compile.log'),
+                     ' '.join(compile_cmd) + "\n\n" + comp.stdout + comp.stderr)
+    if comp.returncode != 0:
+        first = next((l for l in (comp.stderr + comp.stdout).splitlines() if l.strip()), '')
+        return 'compile_error', first[:120], time.time() - t0
+    try:
+        run = subprocess.run(run_cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        out = e.stdout.decode(errors='replace') if isinstance(e.stdout, bytes) else (e.stdout or '')
+        write_if_changed(os.path.join(build, 'sim.log'), out)
+        return 'timeout', f"运行超过 {timeout} s", time.time() - t0
+    write_if_changed(os.path.join(build, 'sim.log'), run.stdout + run.stderr)
+    status, note = judge(test, run.returncode, run.stdout + run.stderr)
+    return status, note, time.time() - t0
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def load_cache():
+    if os.path.exists(CACHE_FILE):
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+STATUS_MARK = {'pass': '✓', 'cached': '✓', 'skip': '⚠️ ', 'xfail': '⚠️ ', 'xpass': '⚠️ ',
+               'fail': '❌', 'compile_error': '❌', 'timeout': '❌'}
+
+def main():
+    parser = argparse.ArgumentParser(description="并行仿真回归 (Icarus/Verilator, 哈希缓存)")
+    parser.add_argument('--sim', choices=['auto', 'icarus', 'verilator'], default='auto', help="仿真器")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="并行测试数")
+    parser.add_argument('--test', action='append', help="只运行匹配的测试 (通配符, 可多次给出)")
+    parser.add_argument('--force', action='store_true', help="忽略缓存, 全部重跑")
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help="每个测试编译/运行的超时 (s)")
+    parser.add_argument('--lib-dir', action='append', default=[], help="厂商仿真库目录 (GTP_* 原语等)")
+    parser.add_argument('--list', action='store_true', help="只列出测试、闭包与缓存状态, 不仿真")
+    args = parser.parse_args()
+
+    pds = parse_pds()
+    missing = [p for p in pds['design'] + [i for v in pds['ip'].values() for i in v] if not os.path.isfile(p)]
+    relation = parse_include_relation()
+    index = ModuleIndex(scan_files(pds, args.lib_dir))
+    tests = discover_tests(index)
+    if args.test:
+        tests = [t for t in tests if any(fnmatch.fnmatch(t['name'], p) for p in args.test)]
+    sim = detect_simulator(args.sim)
+    memo = {}
+    for test in tests:
+        plan_test(test, index, relation, sim, memo)
+    cache = load_cache()
+
+    print(f"=== 仿真回归: {len(tests)} 个测试, {len(index.sources)} 个源文件, {len(index.where)} 个模块, "
+          f"仿真器 {sim['id'] if sim else '未找到'} ===")
+    print(f"{PDS_FILE}: {len(pds['design'])} 个设计文件, {len(pds['ip'])} 个IP, 顶层 {pds['top']}; "
+          + (f"{INCLUDE_RELATION}: {len(relation)} 条包含关系" if os.path.exists(INCLUDE_RELATION)
+             else f"{INCLUDE_RELATION} 不存在, 只按 `include 指令"))
+    if missing:
+        print(f"⚠️  工程中 {len(missing)} 个文件不存在: {', '.join(missing)}")
+    if index.duplicates:
+        print("⚠️  重复定义的模块 (使用先出现者): "
+              + ", ".join(f"{k} ({v[0]})" for k, v in sorted(index.duplicates.items())))
+
+    runnable = []
+    for test in tests:
+        reason = ''
+        if test['unresolved']:
+            reason = f"未解析模块 {', '.join(test['unresolved'])} (加密IP/厂商原语, 可用 --lib-dir)"
+        elif test['encrypted']:
+            reason = f"闭包含加密文件 {', '.join(test['encrypted'])}"
+        test['skip'] = reason
+        prev = cache.get(test['name'], {})
+        test['cached'] = (not args.force and not reason and prev.get('hash') == test['hash']
+                          and prev.get('status') == 'pass')
+        if not reason and not test['cached']:
+            runnable.append(test)
+
+    if args.list:
+        for test in tests:
+            state = 'skip' if test['skip'] else 'cached' if test['cached'] else 'run'
+            print(f"  {test['name']:<34} {test['kind']:<9} {len(test['files']):>3} 文件 "
+                  f"{len(test['headers'])} 头文件 {len(test['data'])} 数据  [{state}] {test['hash'][:12]}")
+            if test['skip']:
+                print(f"      {test['skip']}")
+        return
+
+    results = {}
+    for test in tests:
+        if test['skip']:
+            results[test['name']] = ('skip', test['skip'], 0.0)
+        elif test['cached']:
+            results[test['name']] = ('cached', '源文件与向量未变化', 0.0)
+    if runnable and sim is None:
+        print("❌ 找不到仿真器 (iverilog+vvp 或 verilator), 可用 --list 查看测试")
+        sys.exit(1)
+
+    t0 = time.time()
+    if runnable:
+        print(f"运行 {len(runnable)} 个测试, 并行 {min(args.jobs, len(runnable))} 个 ...")
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            futures = {pool.submit(run_test, t, sim, args.timeout): t for t in runnable}
+            for fut in as_completed(futures):
+                test = futures[fut]
+                results[test['name']] = fut.result()
+                status, note, seconds = results[test['name']]
+                print(f"  {STATUS_MARK[status]} {test['name']:<34} {status:<13} {seconds:6.1f} s  {note}")
+                if status == 'pass':
+                    cache[test['name']] = {'hash': test['hash'], 'status': status, 'seconds': round(seconds, 2),
+                                           'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+                else:
+                    cache.pop(test['name'], None)
+    elapsed = time.time() - t0
+
+    print("\n汇总:")
+    for test in tests:
+        status, note, seconds = results[test['name']]
+        print(f"  {STATUS_MARK[status]} {test['name']:<34} {status:<13} {note}")
+        for issue in test.get('known_issues', []) if status in ('fail', 'xfail') else []:
+            print(f"      已知问题: {issue}")
+    counts = {}
+    for status, _, _ in results.values():
+        counts[status] = counts.get(status, 0) + 1
+    print(f"\n{len(runnable)} 个运行 ({elapsed:.1f} s), " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+    if counts.get('xpass'):
+        print(f"⚠️  {counts['xpass']} 个预期失败的测试通过了: 确认RTL问题已修复后去掉 golden_vectors.py 中的 xfail")
+
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    write_if_changed(CACHE_FILE, json.dumps(cache, indent=2, ensure_ascii=False) + "\n")
+    summary = {name: {'status': s, 'note': n, 'seconds': round(sec, 2)} for name, (s, n, sec) in results.items()}
+    write_if_changed(os.path.join(BUILD_DIR, 'summary.json'),
+                     json.dumps({'simulator': sim['id'] if sim else None, 'tests': summary},
+                                indent=2, ensure_ascii=False) + "\n")
+    failed = sum(v for k, v in counts.items() if k in ('fail', 'compile_error', 'timeout'))
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
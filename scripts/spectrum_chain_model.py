@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+加窗 → FFT → spectrum_magnitude_calc 批量位精确模型
+
+数据通路 (dual_channel_fft_controller.v):
+    ADC 10位码 (FIFO[15:6]) → 自适应直流估计 (每256次读出更新, dc_sum 16位回绕, dc_avg = dc_sum[15:8])
+    → {1'b0, data} - dc_avg (11位) → [Hann窗 Q15 乘法取 [30:15], 当前RTL已禁用] → fft_din[9:0]
+    → fft_8192 IP (流水线, 块浮点, 收敛舍入, 10位输入/旋转因子) → fft_dout {im[31:16], re[15:0]}
+    → spectrum_magnitude_calc: max + min/2, ×2 饱和到16位
+
+FFT 用 IP 自带的C模型 (ipcore/fft_8192/sim/cmodel, ctypes调用, 与RTL逐位一致), 帧在进程池中并行;
+C模型不可用时用 NumPy 块浮点近似 (一次处理整叠帧, 报告中给出与C模型的一致率).
+直流估计器状态跨帧保持, 一次调用可处理任意多帧 (F, 8192).
+
+估计器评估:
+    - 对全部可达的 fft_dout (re/im 为10位符号扩展, 共2^20个) 穷举相对误差分布
+    - 与其它幅度估计器比较精度和成本: 不同系数的 alpha·max + beta·min, 两段式,
+      CORDIC 向量模式 (n次迭代 + 常数增益校正), 精确开方
+    - 在模拟帧的实际频谱上, 整条链路相对理想 |X|/2^blk_exp 的误差
+
+用法:
+    python scripts/spectrum_chain_model.py                      # 16帧合成信号 + 穷举估计器误差
+    python scripts/spectrum_chain_model.py --frames 64 --window hann
+    python scripts/spectrum_chain_model.py --input adc.npy --output spectra.npy
+    python scripts/spectrum_chain_model.py --engine numpy       # 不使用C模型
+"""
+
+import argparse
+import ctypes
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import fft_params
+from mem_image import read_mem_image, write_if_changed
+
+CTRL_FILE = "source/source/dual_channel_fft_controller.v"
+IDF_FILE = "ipcore/fft_8192/fft_8192.idf"
+CMODEL_LIB = "ipcore/fft_8192/sim/cmodel/lib_ipsxe_fft_v1_1.so"
+WINDOW_FILE = fft_params.FFT_WINDOW_HALF_FILE
+OUTPUT_DIR = "ipcore/spectrum_magnitude"
+
+N = fft_params.FFT_POINTS
+ADC_BITS = 10                   # data_10bit = fifo_dout[15:6]
+DC_PERIOD = 256                 # dc_count 计到255时更新
+MAG_BITS = 16
+ERR_BINS = np.arange(-0.15, 0.15 + 1e-9, 0.001)    # 相对误差直方图 (0.1%)
+MIN_MAG = 64                    # 统计相对误差的最小真实幅度 (更小的值受输出取整主导)
+
+#=============================================================================
+# RTL / IP 配置解析
+#=============================================================================
+
+def parse_idf(path=IDF_FILE):
+    """fft_8192.idf → C模型参数"""
+    with open(path, 'r', encoding='utf-8') as f:
+        params = dict(re.findall(r"<name>(\w+)</name>\s*(?:<item>.*?</item>\s*)*<value>([^<]*)</value>",
+                                 f.read(), re.S))
+    length = int(params['FFT_LEN'])
+    return {'fft_arch': 0 if params['FFT_ARCH'] == 'Pipeline' else 1,
+            'log2_len': length.bit_length() - 1,
+            'output_order': 1 if params['OUTPUT_ORDER'] == 'Natural Order' else 0,
+            'scale_mode': 1 if params['SCALE_MODE'] == 'Block Floating Point' else 0,
+            'round_mode': 1 if params['ROUND_MODE'] == 'Convergent Rounding' else 0,
+            'input_width': int(params['INPUT_WIDTH']),
+            'twiddle_width': int(params['TWIDDLE_WIDTH'])}
+
+def parse_window_enabled(path=CTRL_FILE):
+    """windowed_data 直接取 adc_signed 时为矩形窗"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = re.sub(r'//.*', '', f.read())
+    m = re.search(r'assign\s+windowed_data\s*=\s*([^;]+);', text)
+    if not m:
+        raise ValueError(f"{path} 中找不到 windowed_data")
+    return m.group(1).strip() != 'adc_signed'
+
+def load_window(path=WINDOW_FILE):
+    """半窗ROM镜像为完整窗 (window_half_addr = addr[11:0] ^ {12{addr[12]}})"""
+    half = read_mem_image(path).astype(np.int64)
+    addr = np.arange(N)
+    low = addr & (N // 2 - 1)
+    return half[np.where(addr & (N // 2), (N // 2 - 1) ^ low, low)]
+
+def wrap(v, bits):
+    half = 1 << (bits - 1)
+    return ((v + half) & ((1 << bits) - 1)) - half
+
+#=============================================================================
+# 前端: 直流估计 + 加窗 + 截位
+#=============================================================================
+
+class FrontEnd:
+    """
+    ADC码 → fft_din[9:0] (状态跨帧保持)
+
+    每次FIFO读出: data_buffer <= 新数据; 直流累加使用读出前的 data_buffer,
+    第255次计数时 dc_avg <= dc_sum[15:8] (零扩展), dc_sum 从当前 data_buffer 重新开始.
+    送入FFT的样本 = {1'b0, data} - 同一沿之后的 dc_avg.
+    """
+
+    def __init__(self, window=None, input_width=10):
+        self.window = window
+        self.input_width = input_width
+        self.buffer = 0                 # data_buffer 复位为0
+        self.dc_sum = 0
+        self.dc_count = 0
+        self.dc_avg = 1 << (ADC_BITS - 1)   # 复位值 11'd512
+        self.overflow = 0               # 超出 fft_din[9:0] 范围的样本数
+        self.samples = 0
+
+    def dc_track(self, codes):
+        """逐样本 dc_avg (每个读出沿之后的值)"""
+        n = len(codes)
+        prev = np.concatenate([[self.buffer], codes[:-1]])
+        avg = np.empty(n, dtype=np.int64)
+        pos = 0
+        while pos < n:
+            step = DC_PERIOD - 1 - self.dc_count       # 距离下一次更新的读出次数
+            if step >= n - pos:
+                self.dc_sum = wrap(self.dc_sum + int(prev[pos:].sum()), 16)
+                self.dc_count += n - pos
+                avg[pos:] = self.dc_avg
+                break
+            j = pos + step
+            self.dc_sum = wrap(self.dc_sum + int(prev[pos:j].sum()), 16)
+            avg[pos:j] = self.dc_avg
+            self.dc_avg = (self.dc_sum >> 8) & 0xFF
+            self.dc_sum = int(prev[j])
+            self.dc_count = 1
+            avg[j] = self.dc_avg
+            pos = j + 1
+        self.buffer = int(codes[-1]) if n else self.buffer
+        return avg
+
+    def process(self, frames):
+        """frames: (F, N) ADC码 → (F, N) 有符号 fft_din 实部"""
+        frames = np.asarray(frames, dtype=np.int64) & ((1 << ADC_BITS) - 1)
+        flat = frames.reshape(-1)
+        x = wrap(flat - self.dc_track(flat), ADC_BITS + 1).reshape(frames.shape)
+        if self.window is not None:
+            x = wrap((x * self.window[None, :]) >> 15, 16)       # windowed_mult[30:15]
+        lim = 1 << (self.input_width - 1)
+        self.overflow += int(((x < -lim) | (x >= lim)).sum())
+        self.samples += x.size
+        return wrap(x, self.input_width)
+
+#=============================================================================
+# FFT
+#=============================================================================
+
+_LIB = None
+
+def _load_cmodel(path=CMODEL_LIB):
+    lib = ctypes.CDLL(path)
+    fn = lib.ipsxe_fft_wrapper_v1_0
+    fn.restype = ctypes.c_int
+    fn.argtypes = [ctypes.c_void_p, ctypes.c_void_p] + [ctypes.c_int] * 8
+    return fn
+
+def _init_worker(path):
+    global _LIB
+    _LIB = _load_cmodel(path)
+
+def cmodel_frame(args):
+    """单帧C模型: 输入/输出为补码原始位, 返回 (re, im, blk_exp)"""
+    x, cfg = args
+    w = cfg['input_width']
+    buf = np.zeros((len(x), 2), dtype=np.float64)
+    buf[:, 0] = x & ((1 << w) - 1)
+    out = np.zeros_like(buf)
+    exp = _LIB(buf.ctypes.data, out.ctypes.data, cfg['fft_arch'], cfg['log2_len'], cfg['output_order'],
+               cfg['scale_mode'], cfg['round_mode'], w, cfg['twiddle_width'], 1)
+    raw = out.astype(np.int64)
+    return wrap(raw[:, 0], w), wrap(raw[:, 1], w), exp
+
+def fft_cmodel(frames, cfg, jobs):
+    """整叠帧送进程池, 每个进程各自加载C模型"""
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(CMODEL_LIB,)) as pool:
+        res = list(pool.map(cmodel_frame, [(x, cfg) for x in frames]))
+    return (np.stack([r[0] for r in res]), np.stack([r[1] for r in res]),
+            np.array([r[2] for r in res], dtype=np.int64))
+
+def fft_numpy(frames, cfg):
+    """
+    块浮点近似 (向量化): 理想FFT / 2^e 收敛舍入, e 取使结果不溢出的最小值
+
+    与IP的差别: IP逐级舍入并按级判溢出, 这里只在输出端舍入一次.
+    """
+    w = cfg['input_width']
+    spec = np.fft.fft(frames.astype(np.float64), axis=1)
+    peak = np.maximum(np.abs(spec.real), np.abs(spec.imag)).max(axis=1)
+    exp = np.maximum(np.ceil(np.log2(np.maximum(peak, 1) / ((1 << (w - 1)) - 0.5))), 0).astype(np.int64)
+    scaled = spec / (2.0 ** exp)[:, None]
+    re_ = np.clip(np.rint(scaled.real), -(1 << (w - 1)), (1 << (w - 1)) - 1).astype(np.int64)
+    im_ = np.clip(np.rint(scaled.imag), -(1 << (w - 1)), (1 << (w - 1)) - 1).astype(np.int64)
+    return re_, im_, exp
+
+def pack_dout(re_, im_):
+    """fft_dout = {im 符号扩展16位, re 符号扩展16位}"""
+    return ((im_ & 0xFFFF) << 16) | (re_ & 0xFFFF)
+
+#=============================================================================
+# 幅度估计器
+#=============================================================================
+
+def rtl_magnitude(dout):
+    """spectrum_magnitude_calc.v 位精确: max + min>>1, ×2, 高两位非0饱和"""
+    dout = np.asarray(dout, dtype=np.int64)
+    re_ = wrap(dout & 0xFFFF, 16)
+    im_ = wrap((dout >> 16) & 0xFFFF, 16)
+    a = np.abs(re_) & 0xFFFF
+    b = np.abs(im_) & 0xFFFF
+    hi, lo = np.maximum(a, b), np.minimum(a, b)
+    temp = hi + (lo >> 1)
+    return np.where(temp >> 15, 0xFFFF, (temp << 1) & 0xFFFF)
+
+def cordic_magnitude(a, b, iters, guard=2):
+    """CORDIC向量模式 (第一象限输入), 结果乘 round(K·2^15) 后右移15"""
+    x = a.astype(np.int64) << guard
+    y = b.astype(np.int64) << guard
+    for i in range(iters):
+        neg = y < 0
+        x, y = np.where(neg, x - (y >> i), x + (y >> i)), np.where(neg, y + (x >> i), y - (x >> i))
+    k = np.prod(1 / np.sqrt(1 + 2.0 ** (-2 * np.arange(iters))))
+    return (((x * int(round(k * 2 ** 15))) >> (15 + guard - 1)) + 1) >> 1
+
+def estimators(width):
+    """
+    候选估计器: (名称, 函数(|re|, |im|) → |z|估计, 成本)
+
+    成本为粗估: 输入w位, 加法/比较/二选一各约 w 个LUT; CORDIC每级两个加法器加一个符号选择.
+    """
+    w = width + 1
+    mx = lambda a, b: np.maximum(a, b)
+    mn = lambda a, b: np.minimum(a, b)
+    sort = 3 * w                                    # 比较 + 两个二选一
+    cand = [
+        ('max+min/2 (RTL)', lambda a, b: mx(a, b) + (mn(a, b) >> 1),
+         {'luts': sort + w, 'dsp': 0, 'latency': 3}),
+        ('max+min/4', lambda a, b: mx(a, b) + (mn(a, b) >> 2),
+         {'luts': sort + w, 'dsp': 0, 'latency': 3}),
+        ('15/16·(max+min/2)', lambda a, b: (lambda s: s - (s >> 4))(mx(a, b) + (mn(a, b) >> 1)),
+         {'luts': sort + 2 * w, 'dsp': 0, 'latency': 4}),
+        ('31/32·max+3/8·min', lambda a, b: mx(a, b) - (mx(a, b) >> 5) + (mn(a, b) >> 2) + (mn(a, b) >> 3),
+         {'luts': sort + 3 * w, 'dsp': 0, 'latency': 4}),
+        ('max(max, 7/8·max+min/2)', lambda a, b: np.maximum(mx(a, b), mx(a, b) - (mx(a, b) >> 3) + (mn(a, b) >> 1)),
+         {'luts': sort + 4 * w, 'dsp': 0, 'latency': 4}),
+    ]
+    for n in (4, 6, 8):
+        cand.append((f'CORDIC {n}级', lambda a, b, n=n: cordic_magnitude(a, b, n),
+                     {'luts': n * 2 * (w + 3) + w, 'dsp': 1, 'latency': n + 2}))
+    cand.append(('精确开方', lambda a, b: np.rint(np.hypot(a, b)).astype(np.int64),
+                 {'luts': 3 * w * w // 2, 'dsp': 2, 'latency': w + 3}))
+    return cand
+
+def error_stats(est, true):
+    """相对误差统计 (只统计真实幅度 ≥ MIN_MAG 的点) + 绝对误差 (LSB)"""
+    mask = true >= MIN_MAG
+    rel = (est[mask] - true[mask]) / true[mask]
+    absval = np.abs(est - true)
+    hist, _ = np.histogram(np.clip(rel, ERR_BINS[0], ERR_BINS[-1] - 1e-12), bins=ERR_BINS)
+    return {'max_rel': float(rel.max()), 'min_rel': float(rel.min()),
+            'mean_rel': float(rel.mean()), 'rms_rel': float(np.sqrt(np.mean(rel ** 2))),
+            'max_abs_lsb': float(absval.max()), 'points': int(mask.sum())}, hist
+
+def exhaustive_words(width):
+    """全部可达的 fft_dout: re/im 为 width 位有符号数"""
+    v = np.arange(-(1 << (width - 1)), 1 << (width - 1), dtype=np.int64)
+    re_, im_ = np.meshgrid(v, v, indexing='ij')
+    return re_.ravel(), im_.ravel()
+
+#=============================================================================
+# 激励
+#=============================================================================
+
+def synthetic_frames(rng, count, freqs, amplitude, noise_rms, dc):
+    """连续采样的 count 帧 (帧间不间断): 多个正弦 (随机初相) + 白噪声, 10位ADC码"""
+    t = np.arange(count * N, dtype=np.float64)
+    x = np.full(t.shape, float(dc))
+    for f in freqs:
+        x += amplitude * np.sin(2 * np.pi * f / fft_params.FFT_SAMPLE_RATE * t + rng.uniform(0, 2 * np.pi))
+    x += rng.normal(0, noise_rms, t.shape)
+    return np.clip(np.rint(x), 0, (1 << ADC_BITS) - 1).astype(np.int64).reshape(count, N)
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="加窗→FFT→幅度计算批量位精确模型")
+    parser.add_argument('--frames', type=int, default=16, help="合成帧数")
+    parser.add_argument('--freqs', default='1000,100000,1234567', help="合成信号频率 (Hz), 逗号分隔")
+    parser.add_argument('--amplitude', type=float, default=120.0, help="每个正弦的幅度 (ADC码)")
+    parser.add_argument('--noise', type=float, default=2.0, help="噪声RMS (ADC码)")
+    parser.add_argument('--dc', type=float, default=512.0, help="直流电平 (ADC码)")
+    parser.add_argument('--input', help="ADC码文件 (.npy, 长度为8192的整数倍), 代替合成信号")
+    parser.add_argument('--output', help="输出幅度谱 .npy (帧数, 8192) uint16")
+    parser.add_argument('--window', choices=['auto', 'rect', 'hann'], default='auto',
+                        help="加窗 (auto: 按RTL是否启用乘法器)")
+    parser.add_argument('--engine', choices=['auto', 'cmodel', 'numpy'], default='auto',
+                        help="FFT引擎: IP的C模型 (位精确) 或 NumPy块浮点近似")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="C模型进程数")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="报告输出目录")
+    args = parser.parse_args()
+
+    cfg = parse_idf()
+    rtl_window = parse_window_enabled()
+    use_window = rtl_window if args.window == 'auto' else args.window == 'hann'
+    engine = args.engine
+    if engine != 'numpy':
+        try:
+            _load_cmodel()
+            engine = 'cmodel'
+        except OSError as e:
+            if engine == 'cmodel':
+                print(f"❌ 无法加载C模型 {CMODEL_LIB}: {e}")
+                sys.exit(1)
+            print(f"⚠️  无法加载C模型 ({e}), 使用NumPy块浮点近似")
+            engine = 'numpy'
+    print(f"FFT: {N}点, 输入{cfg['input_width']}位, 旋转因子{cfg['twiddle_width']}位, "
+          f"{'块浮点' if cfg['scale_mode'] else '不缩放'}, {'收敛舍入' if cfg['round_mode'] else '截断'}, "
+          f"引擎 {engine}")
+    print(f"加窗: {'Hann (Q15, 取[30:15])' if use_window else '矩形 (RTL未启用乘法器)'}"
+          + ("" if use_window == rtl_window else " ⚠️ 与RTL不同"))
+
+    # 1. 全部可达 fft_dout 的估计器误差
+    width = cfg['input_width']
+    re_, im_ = exhaustive_words(width)
+    words = pack_dout(re_, im_)
+    true = np.hypot(re_, im_)
+    rtl = rtl_magnitude(words)
+    a, b = np.abs(re_), np.abs(im_)
+    print(f"\n=== 估计器误差: 全部 {len(words):,} 个可达 fft_dout (|z| ≥ {MIN_MAG} 统计相对误差) ===")
+    rtl_ok = np.array_equal(rtl, 2 * (np.maximum(a, b) + (np.minimum(a, b) >> 1)))
+    print(("✓" if rtl_ok else "⚠️ ") + " RTL输出 = 2·(max + min/2)" + ("" if rtl_ok else " (存在饱和)"))
+    print(f"{'估计器':<26}{'最大':>8}{'最小':>8}{'均值':>8}{'RMS':>8}{'最大LSB':>9}{'LUT':>6}{'DSP':>5}{'延迟':>5}")
+    rows, hists = [], []
+    for name, fn, cost in estimators(width):
+        stats, hist = error_stats(fn(a, b), true)
+        rows.append({'name': name, **stats, **cost})
+        hists.append(hist)
+        print(f"{name:<26}{stats['max_rel']:>+8.2%}{stats['min_rel']:>+8.2%}{stats['mean_rel']:>+8.2%}"
+              f"{stats['rms_rel']:>8.2%}{stats['max_abs_lsb']:>9.1f}{cost['luts']:>6}{cost['dsp']:>5}"
+              f"{cost['latency']:>5}")
+
+    # 2. 整条链路
+    if args.input:
+        codes = np.load(args.input, mmap_mode='r')
+        codes = np.asarray(codes[:len(codes) // N * N], dtype=np.int64).reshape(-1, N)
+        source = args.input
+    else:
+        freqs = [float(f) for f in args.freqs.split(',')]
+        codes = synthetic_frames(np.random.default_rng(args.seed), args.frames, freqs,
+                                 args.amplitude, args.noise, args.dc)
+        source = f"合成 {args.frames} 帧, {args.freqs} Hz, 幅度 {args.amplitude:g}, 噪声 {args.noise:g}, 直流 {args.dc:g}"
+    front = FrontEnd(load_window() if use_window else None, width)
+    x = front.process(codes)
+    if engine == 'cmodel':
+        fre, fim, exp = fft_cmodel(x, cfg, args.jobs)
+    else:
+        fre, fim, exp = fft_numpy(x, cfg)
+    dout = pack_dout(fre, fim)
+    mag = rtl_magnitude(dout)
+    ideal = np.abs(np.fft.fft(x.astype(np.float64), axis=1)) / (2.0 ** exp)[:, None]
+    print(f"\n=== 链路: {source} ===")
+    print(f"前端: {front.overflow:,}/{front.samples:,} 个样本超出 fft_din[{width - 1}:0] 范围 (回绕), "
+          f"直流估计末值 {front.dc_avg}")
+    print(f"块指数: {np.unique(exp).tolist()}")
+    chain = []
+    for (name, fn, cost), row in zip(estimators(width), rows):
+        est = fn(np.abs(fre), np.abs(fim))
+        mask = ideal >= MIN_MAG
+        rel = (est[mask] - ideal[mask]) / ideal[mask]
+        chain.append({'name': name, 'max_rel': float(rel.max()), 'min_rel': float(rel.min()),
+                      'rms_rel': float(np.sqrt(np.mean(rel ** 2))), 'bins': int(mask.sum())})
+    for c in chain:
+        print(f"  {c['name']:<26} 相对理想|X|: {c['min_rel']:+.2%} ~ {c['max_rel']:+.2%}, RMS {c['rms_rel']:.2%}")
+    agree = None
+    if engine == 'cmodel':
+        nre, nim, nexp = fft_numpy(x, cfg)
+        agree = {'exp_match': float((nexp == exp).mean()),
+                 'bin_match': float(((nre == fre) & (nim == fim)).mean()),
+                 'max_lsb_diff': int(max(np.abs(nre - fre).max(), np.abs(nim - fim).max()))}
+        print(f"  NumPy块浮点近似 vs C模型: 块指数一致 {agree['exp_match']:.0%}, "
+              f"频点逐位一致 {agree['bin_match']:.1%}, 最大差 {agree['max_lsb_diff']} LSB")
+
+    if args.output:
+        np.save(args.output, mag.astype(np.uint16))
+        print(f"✓ 幅度谱: {args.output} ({mag.shape[0]} 帧)")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    centers = (ERR_BINS[:-1] + ERR_BINS[1:]) / 2
+    lines = ['rel_error,' + ','.join(r['name'] for r in rows)]
+    for i, c in enumerate(centers):
+        lines.append(f"{c:+.4f}," + ','.join(str(int(h[i])) for h in hists))
+    report = {'fft': cfg, 'window': 'hann' if use_window else 'rect', 'engine': engine,
+              'exhaustive': {'words': len(words), 'min_magnitude': MIN_MAG, 'estimators': rows},
+              'chain': {'source': source, 'frames': int(codes.shape[0]), 'blk_exp': np.unique(exp).tolist(),
+                        'frontend_overflow': front.overflow, 'estimators': chain,
+                        'numpy_vs_cmodel': agree}}
+    outputs = [(os.path.join(args.output_dir, 'magnitude_error_hist.csv'), '\n'.join(lines) + '\n'),
+               (os.path.join(args.output_dir, 'spectrum_report.json'),
+                json.dumps(report, indent=2, ensure_ascii=False) + '\n')]
+    print()
+    for path, data in outputs:
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    main()
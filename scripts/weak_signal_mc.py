@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+weak_signal_detector 蒙特卡洛检测曲线 (进程池并行)
+
+每次试验从复位开始运行 --trial-ms 毫秒: 输入为11位偏移二进制ADC数据 (随机初相的正弦
++ 高斯白噪声, 或纯噪声), CH1 用 lock_in_amplifier_model 的位精确模型处理, 外层按
+weak_signal_detector.v 复现:
+    - 调谐字寄存器两拍延迟 (复位后前两个样本相位累加0)
+    - AGC: 每256条 ch1_valid 记录按幅度阈值 ±1 调整 agc_gain, 新增益从下一个采样沿生效
+      (模型在更新记录后一拍处切块, 反馈逐周期准确)
+    - SNR估计: 每1001条记录按 ch1_locked/ch1_magnitude 查阈值表 (Q8.8 dB)
+
+统计 (每个 频率 × 增益 × 输入SNR):
+    - 检测概率 Pd (Wilson 95%区间): 判决窗口 (试验末 --decision-ms) 内 locked 过半
+    - 虚警概率 Pfa: 同频率/增益的纯噪声试验按同一判决
+    - 锁定时间: 最后一次失锁之后的第一条记录 (试验结束时未锁定的不计入), 直方图
+    - snr_estimate 偏差: 试验末的估计值 - 输入SNR
+
+试验按批分发到 ProcessPoolExecutor, 随机数由 SeedSequence 按批派生,
+结果与进程数无关. 输出写入 ipcore/weak_signal_detector/.
+
+用法:
+    python scripts/weak_signal_mc.py                                  # 默认扫描, 全部CPU核
+    python scripts/weak_signal_mc.py --dc 0                           # 去直流输入 (提交的 ipcore 结果)
+    python scripts/weak_signal_mc.py --snr=-60:0:5 --freq 1000,10000 --gain agc,4 --trials 500
+    python scripts/weak_signal_mc.py --jobs 8 --batch 16 --trial-ms 5
+    python scripts/weak_signal_mc.py --clk 50e6      # 按该时钟重新生成的 dds_params.vh 调谐字
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from generate_dds_table import choose_tw_multiplier
+from lock_in_amplifier_model import (ADC_BITS, CLK_HZ, LockInAmplifierModel, parse_rtl,
+                                     tuning_word)
+from mem_image import write_if_changed
+
+OUTPUT_DIR = "ipcore/weak_signal_detector"
+
+AGC_PERIOD = 256                # agc_update_cnt 8位: 每256条记录更新一次
+AGC_RESET_GAIN = 4
+AGC_LOW = 0x010000              # ch1_magnitude 低于此值增益+1
+AGC_HIGH = 0x700000             # 高于此值增益-1
+AGC_MAX = 15
+SNR_PERIOD = 1001               # snr_counter 计到1000时更新 (每1001条记录)
+TW_LATENCY = 2                  # tw_product → freq_tuning_word 两级寄存器
+LOCK_HIST_BIN_MS = 0.05         # 锁定时间直方图分辨率
+
+#=============================================================================
+# 位精确检测器模型
+#=============================================================================
+
+def snr_estimate(magnitude, locked):
+    """weak_signal_detector.v 的SNR阈值表, 返回Q8.8 dB"""
+    return np.where(
+        locked.astype(bool),
+        np.select([magnitude > 0x100000, magnitude > 0x010000, magnitude > 0x001000],
+                  [0x3C00, 0x3200, 0x2800], 0x1E00),
+        np.select([magnitude > 0x010000, magnitude > 0x001000], [0x1400, 0x0A00], 0x0000))
+
+class WeakSignalDetectorModel:
+    """
+    weak_signal_detector CH1 路径 (内部DDS参考) 的逐周期模型
+
+    参数:
+        rtl: lock_in_amplifier_model.parse_rtl() 的结果
+        ref_hz: ref_frequency (Hz, 整数)
+        gain: digital_gain (auto_gain 关闭时使用)
+        agc: auto_gain_enable
+    """
+
+    def __init__(self, rtl, ref_hz, gain=AGC_RESET_GAIN, agc=True):
+        self.rtl = rtl
+        self.tw = tuning_word(ref_hz, rtl)
+        self.agc = bool(agc)
+        self.gain = AGC_RESET_GAIN if self.agc else int(gain)
+        self.lia = LockInAmplifierModel(rtl, self.tw, self.gain)
+        # 复位后前两个沿 freq_tuning_word 仍为0: 第k个样本相位为 (k-2)·tw
+        self.lia.phase_acc = (-TW_LATENCY * self.tw) % (1 << rtl['phase_width'])
+        self.records = 0
+        self.parts = []
+
+    def _next_update_cycle(self):
+        """下一次AGC更新所用记录的 cycle (首条记录时刻未知时为None)"""
+        if self.lia.next_decim is None:
+            return None
+        r = self.records
+        update = r - r % AGC_PERIOD + AGC_PERIOD - 1
+        return self.lia.next_decim + 1 + self.rtl['decimation'] * (update - r)
+
+    def run(self, signal):
+        """
+        处理整段逐周期输入 (每个时钟有效)
+
+        返回:
+            dict(cycle, magnitude, locked, gain): 每条 ch1_valid 记录, gain 为该记录之后的 agc_gain
+        """
+        n = len(signal)
+        pos = 0
+        while pos < n:
+            end = n
+            if self.agc:
+                upd = self._next_update_cycle()
+                # 更新沿为记录之后一拍, 再下一拍的样本才用新增益
+                end = min(n, pos + self.lia.taps) if upd is None else min(n, upd + 2)
+            rec = self.lia.process(signal[pos:end])
+            pos = end
+            count = len(rec['cycle'])
+            if count == 0:
+                continue
+            gains = np.full(count, self.gain, dtype=np.int64)
+            if self.agc:
+                hit = np.flatnonzero((self.records + np.arange(count)) % AGC_PERIOD == AGC_PERIOD - 1)
+                for j in hit:
+                    mag = int(rec['magnitude'][j])
+                    if mag < AGC_LOW and self.gain < AGC_MAX:
+                        self.gain += 1
+                    elif mag > AGC_HIGH and self.gain > 0:
+                        self.gain -= 1
+                    gains[j:] = self.gain
+                self.lia.gain = self.gain
+            self.records += count
+            self.parts.append((rec['cycle'], rec['magnitude'], rec['locked'], gains))
+        cols = [np.concatenate(c) if c else np.zeros(0, dtype=np.int64) for c in zip(*self.parts)] \
+            if self.parts else [np.zeros(0, dtype=np.int64)] * 4
+        self.parts = []
+        return dict(zip(('cycle', 'magnitude', 'locked', 'gain'), cols))
+
+#=============================================================================
+# 单次试验 / 批
+#=============================================================================
+
+def stimulus(rng, cycles, clk_hz, freq, amplitude, noise_rms, dc, adc_bits=ADC_BITS):
+    """
+    随机初相正弦 + 高斯白噪声, 量化为 adc_bits 位, 直流偏置 dc
+
+    dc = 2^(adc_bits-1) 即顶层的偏移二进制 {5'd0, ch_data_11b}; dc = 0 为去直流后的补码输入
+    """
+    full = 1 << adc_bits
+    t = np.arange(cycles, dtype=np.float64)
+    x = dc + amplitude * np.sin(2 * np.pi * freq / clk_hz * t + rng.uniform(0, 2 * np.pi)) \
+        + rng.normal(0, noise_rms, cycles)
+    return np.clip(np.rint(x), dc - full // 2, dc + full // 2 - 1).astype(np.int64)
+
+def run_trial(rtl, rng, point, cfg):
+    """
+    返回: (判决, 首次锁定ms, 稳定锁定ms, 末次snr_estimate dB, 末次增益)
+    未发生的时间记为NaN
+    """
+    cycles = int(cfg['trial_ms'] * 1e-3 * cfg['clk'])
+    snr = point['snr']
+    amp = 0.0 if snr is None else cfg['noise_rms'] * np.sqrt(2) * 10 ** (snr / 20)
+    model = WeakSignalDetectorModel(rtl, point['freq'], point['gain'], point['gain'] == 'agc')
+    rec = model.run(stimulus(rng, cycles, cfg['clk'], point['freq'], amp, cfg['noise_rms'], cfg['dc']))
+    if len(rec['cycle']) == 0:
+        return (0, np.nan, np.nan, np.nan, model.gain)
+    to_ms = 1e3 / cfg['clk']
+    locked = rec['locked'].astype(bool)
+    window = rec['cycle'] >= cycles - cfg['decision_ms'] * 1e-3 * cfg['clk']
+    detected = int(window.any() and locked[window].mean() > 0.5)
+    first = rec['cycle'][np.argmax(locked)] * to_ms if locked.any() else np.nan
+    unlocked = np.flatnonzero(~locked)
+    if not locked[-1]:
+        stable = np.nan
+    else:
+        stable = rec['cycle'][unlocked[-1] + 1 if len(unlocked) else 0] * to_ms
+    upd = np.arange(SNR_PERIOD - 1, len(locked), SNR_PERIOD)
+    est = snr_estimate(rec['magnitude'][upd], rec['locked'][upd])[-1] / 256 if len(upd) else np.nan
+    return (detected, first, stable, est, model.gain)
+
+def rtl_at_clock(rtl, clk):
+    """
+    时钟不是 DDS_CLK_HZ 时, 换成 generate_dds_table.py 为该时钟生成的调谐字常数
+
+    RTL 的调谐字固定按 dds_params.vh 的时钟计算, 只改激励采样率会使参考偏离信号频率;
+    这里模拟在该时钟下重新生成 dds_params.vh 后的检测器.
+    """
+    if clk == CLK_HZ:
+        return rtl
+    tw = choose_tw_multiplier(int(round(clk)), fmax=int(clk) // 2)
+    return dict(rtl, tw_mult=tw['mult'], tw_shift=tw['shift'])
+
+_RTL = None
+
+def _init_worker(clk=CLK_HZ):
+    global _RTL
+    _RTL = rtl_at_clock(parse_rtl(), clk)
+
+def run_batch(task):
+    """进程池任务: (点序号, 点, 试验数, 种子, 配置) → (点序号, 结果数组)"""
+    index, point, trials, seed, cfg = task
+    rng = np.random.default_rng(seed)
+    return index, np.array([run_trial(_RTL, rng, point, cfg) for _ in range(trials)], dtype=np.float64)
+
+#=============================================================================
+# 统计
+#=============================================================================
+
+def wilson(k, n, z=1.96):
+    """二项比例的Wilson区间"""
+    if n == 0:
+        return (np.nan, np.nan)
+    p = k / n
+    d = 1 + z * z / n
+    c = (p + z * z / (2 * n)) / d
+    h = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / d
+    return (c - h, c + h)
+
+def summarize(point, res):
+    n = len(res)
+    k = int(res[:, 0].sum())
+    lo, hi = wilson(k, n)
+    stable = res[:, 2][~np.isnan(res[:, 2])]
+    est = res[:, 3][~np.isnan(res[:, 3])]
+    row = {'freq': point['freq'], 'gain': point['gain'],
+           'snr': 'noise' if point['snr'] is None else point['snr'],
+           'trials': n, 'p_detect': k / n, 'ci_low': lo, 'ci_high': hi,
+           'lock_p50_ms': float(np.median(stable)) if len(stable) else np.nan,
+           'lock_p90_ms': float(np.percentile(stable, 90)) if len(stable) else np.nan,
+           'first_lock_p50_ms': float(np.nanmedian(res[:, 1])) if (~np.isnan(res[:, 1])).any() else np.nan,
+           'snr_est_mean': float(est.mean()) if len(est) else np.nan,
+           'snr_est_bias': float(est.mean() - point['snr']) if len(est) and point['snr'] is not None else np.nan,
+           'final_gain_mean': float(res[:, 4].mean())}
+    return row
+
+def lock_histogram(points, results, trial_ms):
+    edges = np.arange(0, trial_ms + LOCK_HIST_BIN_MS, LOCK_HIST_BIN_MS)
+    rows = []
+    for p, res in zip(points, results):
+        stable = res[:, 2][~np.isnan(res[:, 2])]
+        hist, _ = np.histogram(stable, bins=edges)
+        rows.append([p['freq'], p['gain'], 'noise' if p['snr'] is None else p['snr']] + hist.tolist())
+    header = ['freq', 'gain', 'snr'] + [f"{e:.2f}" for e in edges[:-1]]
+    return header, rows
+
+def csv_text(header, rows):
+    import io
+    buf = io.StringIO()
+    w = csv.writer(buf, lineterminator='\n')
+    w.writerow(header)
+    for r in rows:
+        w.writerow([f"{v:.4g}" if isinstance(v, float) else v for v in r])
+    return buf.getvalue()
+
+#=============================================================================
+# 主程序
+#=============================================================================
+
+def parse_list(text, conv=float):
+    """'a:b:step' 或逗号分隔列表"""
+    if ':' in text:
+        a, b, s = (float(v) for v in text.split(':'))
+        return [conv(v) for v in np.arange(a, b + s / 2, s)]
+    return [conv(v) for v in text.split(',')]
+
+def parse_gain(text):
+    return [g if g == 'agc' else int(g) for g in text.split(',')]
+
+def main():
+    parser = argparse.ArgumentParser(description="weak_signal_detector 蒙特卡洛检测曲线")
+    parser.add_argument('--snr', default='-50:10:5', help="输入SNR (dB), 'a:b:步进' 或列表; 负数开头须写成 --snr=-60:0:5")
+    parser.add_argument('--freq', default='1000,10000', help="参考/信号频率 (Hz) 列表")
+    parser.add_argument('--gain', default='agc,4', help="增益: agc 或 digital_gain 值, 逗号分隔")
+    parser.add_argument('--noise-rms', type=float, default=8.0, help="噪声RMS (ADC码)")
+    parser.add_argument('--dc', type=int, default=1 << (ADC_BITS - 1),
+                        help="输入直流偏置 (默认中点, 同顶层偏移二进制; 0 表示去直流)")
+    parser.add_argument('--trials', type=int, default=100, help="每个点的试验次数")
+    parser.add_argument('--trial-ms', type=float, default=2.0, help="每次试验时长 (ms)")
+    parser.add_argument('--decision-ms', type=float, default=0.5, help="判决窗口 (试验末, ms)")
+    parser.add_argument('--clk', type=float, default=CLK_HZ,
+                        help="时钟频率 (Hz); 与DDS_CLK_HZ不同时调谐字常数按该时钟重新生成")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help="进程数 (默认全部CPU核)")
+    parser.add_argument('--batch', type=int, default=8, help="每个任务的试验数")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="输出目录")
+    args = parser.parse_args()
+
+    cfg = {'trial_ms': args.trial_ms, 'decision_ms': args.decision_ms, 'clk': args.clk,
+           'noise_rms': args.noise_rms, 'dc': args.dc}
+    points = [{'freq': int(f), 'gain': g, 'snr': s}
+              for f in parse_list(args.freq, int)
+              for g in parse_gain(args.gain)
+              for s in [None] + parse_list(args.snr)]
+    tasks = []
+    for i, p in enumerate(points):
+        for b in range(0, args.trials, args.batch):
+            tasks.append((i, p, min(args.batch, args.trials - b), None, cfg))
+    seeds = np.random.SeedSequence(args.seed).spawn(len(tasks))
+    tasks = [t[:3] + (s,) + t[4:] for t, s in zip(tasks, seeds)]
+
+    total = len(points) * args.trials
+    cycles = int(args.trial_ms * 1e-3 * args.clk)
+    print(f"=== weak_signal_detector 蒙特卡洛: {len(points)} 个点 × {args.trials} 次 = {total:,} 次试验, "
+          f"每次 {cycles:,} 周期 ===")
+    print(f"进程数 {args.jobs}, {len(tasks)} 个任务 (每批 {args.batch} 次)")
+
+    collected = [[] for _ in points]
+    start = time.time()
+    done = 0
+    if args.clk != CLK_HZ:
+        print(f"⚠️  时钟 {args.clk:g} Hz 与 DDS_CLK_HZ ({CLK_HZ}) 不同: 调谐字按该时钟重新生成的 dds_params.vh 计算")
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                             initargs=(args.clk,)) as pool:
+        for index, res in pool.map(run_batch, tasks):
+            collected[index].append(res)
+            done += len(res)
+            if done * 10 // total != (done - len(res)) * 10 // total:
+                print(f"  {done:,}/{total:,} ({time.time() - start:.0f} s)")
+    elapsed = time.time() - start
+    results = [np.concatenate(c) for c in collected]
+    rate = total * cycles / elapsed
+    print(f"✓ 完成: {elapsed:.1f} s, {rate / 1e6:.1f} M周期/s")
+
+    rows = [summarize(p, r) for p, r in zip(points, results)]
+    pfa = {(r['freq'], r['gain']): r['p_detect'] for r in rows if r['snr'] == 'noise'}
+    for r in rows:
+        r['p_false_alarm'] = pfa[(r['freq'], r['gain'])]
+
+    print(f"\n{'频率':>8}{'增益':>5}{'SNR':>7}{'Pd':>7}{'95%区间':>15}{'Pfa':>7}"
+          f"{'锁定p50':>9}{'p90 ms':>8}{'SNR估计':>9}{'偏差':>7}{'末增益':>7}")
+    for r in rows:
+        snr = r['snr'] if r['snr'] == 'noise' else f"{r['snr']:g}"
+        print(f"{r['freq']:>8}{str(r['gain']):>5}{snr:>7}{r['p_detect']:>7.3f}"
+              f"  [{r['ci_low']:.3f},{r['ci_high']:.3f}]{r['p_false_alarm']:>7.3f}"
+              f"{r['lock_p50_ms']:>9.3f}{r['lock_p90_ms']:>8.3f}{r['snr_est_mean']:>9.1f}"
+              f"{r['snr_est_bias']:>7.1f}{r['final_gain_mean']:>7.1f}")
+
+    highest_snr = max((r for r in rows if r['snr'] != 'noise'), key=lambda r: r['snr'])
+    if pfa and max(pfa.values()) > 0.1:
+        print(f"\n⚠️  纯噪声虚警概率最高 {max(pfa.values()):.1%}: locked 只判断幅度稳定, 不区分有无信号"
+              + (" (直流偏置经混频泄漏为稳定幅度, 可用 --dc 0 对比)" if args.dc else ""))
+    if highest_snr['p_detect'] < 0.9:
+        print(f"⚠️  最高SNR ({highest_snr['snr']:g} dB) 的检测概率只有 {highest_snr['p_detect']:.1%}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    fields = ['freq', 'gain', 'snr', 'trials', 'p_detect', 'ci_low', 'ci_high', 'p_false_alarm',
+              'lock_p50_ms', 'lock_p90_ms', 'first_lock_p50_ms', 'snr_est_mean', 'snr_est_bias',
+              'final_gain_mean']
+    header, hist = lock_histogram(points, results, args.trial_ms)
+    report = {'config': {**cfg, 'trials': args.trials, 'seed': args.seed,
+                         'cycles_per_trial': cycles},
+              'points': [{k: (None if isinstance(v, float) and np.isnan(v) else v)
+                          for k, v in r.items()} for r in rows]}
+    outputs = [(os.path.join(args.output_dir, 'mc_curves.csv'),
+                csv_text(fields, [[r[k] for k in fields] for r in rows])),
+               (os.path.join(args.output_dir, 'mc_lock_time.csv'), csv_text(header, hist)),
+               (os.path.join(args.output_dir, 'mc_report.json'),
+                json.dumps(report, indent=2, ensure_ascii=False) + '\n')]
+    print()
+    for path, data in outputs:
+        print(("✓ 写入: " if write_if_changed(path, data) else "✓ 未变化: ") + path)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -206,8 +206,8 @@ always @(posedge clk or negedge rst_n) begin
         {freq_max_d5, freq_max_d4, freq_max_d3, freq_max_d2, freq_max_d1, freq_max_d0} <= 24'h105000;
         {amp_min_d3, amp_min_d2, amp_min_d1, amp_min_d0} <= 16'h2500;
         {amp_max_d3, amp_max_d2, amp_max_d1, amp_max_d0} <= 16'h3500;
-        {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= 16'h0450;
-        {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= 16'h0550;
+        {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= 16'h0550;
+        {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= 16'h0650;
         {thd_max_d3, thd_max_d2, thd_max_d1, thd_max_d0} <= 16'h0600;
     end else begin
         case (bcd_state)
@@ -220,8 +220,8 @@ always @(posedge clk or negedge rst_n) begin
                     {amp_min_d3, amp_min_d2, amp_min_d1, amp_min_d0} <= 16'h2500;
                     {amp_max_d3, amp_max_d2, amp_max_d1, amp_max_d0} <= 16'h3500;
                 end else if (bcd_restore_duty) begin
-                    {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= 16'h0450;
-                    {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= 16'h0550;
+                    {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= 16'h0550;
+                    {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= 16'h0650;
                 end else if (bcd_restore_thd) begin
                     {thd_max_d3, thd_max_d2, thd_max_d1, thd_max_d0} <= 16'h0600;
                 end else if (bcd_start_32) begin
@@ -253,11 +253,11 @@ always @(posedge clk or negedge rst_n) begin
                 bcd_cnt <= bcd_cnt + 1;
                 
                 if (bcd_cnt == 31) begin
-                    // 最后一次迭代：不左移，直接提取BCD结果
+                    // 最后一次迭代：加3后的第32次左移直接并入截取位置（[54:31]）
                     bcd_state <= BCD_WAIT;
                     case (bcd_target)
-                        BCD_TGT_FREQ_MIN: {freq_min_d5, freq_min_d4, freq_min_d3, freq_min_d2, freq_min_d1, freq_min_d0} <= bcd_shift_temp_32[55:32];
-                        BCD_TGT_FREQ_MAX: {freq_max_d5, freq_max_d4, freq_max_d3, freq_max_d2, freq_max_d1, freq_max_d0} <= bcd_shift_temp_32[55:32];
+                        BCD_TGT_FREQ_MIN: {freq_min_d5, freq_min_d4, freq_min_d3, freq_min_d2, freq_min_d1, freq_min_d0} <= bcd_shift_temp_32[54:31];
+                        BCD_TGT_FREQ_MAX: {freq_max_d5, freq_max_d4, freq_max_d3, freq_max_d2, freq_max_d1, freq_max_d0} <= bcd_shift_temp_32[54:31];
                     endcase
                 end else begin
                     // 左移1位（前31次迭代）
@@ -280,14 +280,14 @@ always @(posedge clk or negedge rst_n) begin
                 bcd_cnt <= bcd_cnt + 1;
                 
                 if (bcd_cnt == 15) begin
-                    // 转换完成，更新目标寄存器
+                    // 转换完成，更新目标寄存器（截取第16次左移后的BCD区，即[30:15]）
                     bcd_state <= BCD_WAIT;
                     case (bcd_target)
-                        BCD_TGT_AMP_MIN:  {amp_min_d3, amp_min_d2, amp_min_d1, amp_min_d0} <= bcd_shift_temp_16[31:16];
-                        BCD_TGT_AMP_MAX:  {amp_max_d3, amp_max_d2, amp_max_d1, amp_max_d0} <= bcd_shift_temp_16[31:16];
-                        BCD_TGT_DUTY_MIN: {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= bcd_shift_temp_16[31:16];
-                        BCD_TGT_DUTY_MAX: {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= bcd_shift_temp_16[31:16];
-                        BCD_TGT_THD_MAX:  {thd_max_d3, thd_max_d2, thd_max_d1, thd_max_d0} <= bcd_shift_temp_16[31:16];
+                        BCD_TGT_AMP_MIN:  {amp_min_d3, amp_min_d2, amp_min_d1, amp_min_d0} <= bcd_shift_temp_16[30:15];
+                        BCD_TGT_AMP_MAX:  {amp_max_d3, amp_max_d2, amp_max_d1, amp_max_d0} <= bcd_shift_temp_16[30:15];
+                        BCD_TGT_DUTY_MIN: {duty_min_d3, duty_min_d2, duty_min_d1, duty_min_d0} <= bcd_shift_temp_16[30:15];
+                        BCD_TGT_DUTY_MAX: {duty_max_d3, duty_max_d2, duty_max_d1, duty_max_d0} <= bcd_shift_temp_16[30:15];
+                        BCD_TGT_THD_MAX:  {thd_max_d3, thd_max_d2, thd_max_d1, thd_max_d0} <= bcd_shift_temp_16[30:15];
                     endcase
                 end
             end
@@ -49,7 +49,7 @@ initial begin
     freq_rom[50]  = 24'h005000;  // 5000 Hz
     freq_rom[100] = 24'h010000;  // 10 kHz
     freq_rom[200] = 24'h020000;  // 20 kHz
-    // ... (完整数据由generate_bcd_rom.py生成)
+    // ... (完整数据由generate_bcd_lut.py生成)
     
     // 幅度ROM: 0-127 → 0-6.35V (50mV步进)
     amp_rom[0]   = 16'h0000;  // 0.0V
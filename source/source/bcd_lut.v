@@ -1,19 +1,22 @@
 //=============================================================================
 // 文件名: bcd_lut.v
-// 描述: BCD转换查找表模块 - 纯组合逻辑，无除法运算
+// 描述: BCD转换查找表模块 - 无除法运算, 读取延迟1周期
 //       为自动测试参数显示提供预先计算的BCD数值
 //       使用ROM查找表替代除法运算，解决HDMI域时序违例问题
+// 自动生成: scripts/generate_bcd_lut.py, 请勿手动修改
 //
 // 设计思路：
-//   - 利用输入值已经是量化的特点（步进值固定）
-//   - 直接用位切片作为ROM地址，查找预存储的BCD值
-//   - 完全避免除法、取模等复杂运算
+//   - 地址 = 输入 / 步进, 除法由乘法 + 位切片实现 (常量已穷举验证, 显示零误差)
+//   - 小表用case编码 (分布式逻辑), 大表用$readmemh初始化的DRM数组
+//   - 超出范围的输入饱和到最大值
 //=============================================================================
 
-module bcd_lut (
+module bcd_lut #(
+    parameter DUTY_ROM_FILE = "source/bcd_duty_rom.hex"  // 仿真时可按工作目录覆盖
+)(
     input  wire         clk,            // 时钟（同步ROM读取）
     
-    // 频率BCD转换（支持0-500kHz，100Hz步进）
+    // 频率BCD转换（支持0-500kHz）
     input  wire [31:0]  freq_in,        // 输入频率 (Hz)
     output wire [23:0]  freq_bcd,       // 6位BCD输出 {d5,d4,d3,d2,d1,d0}
     
@@ -21,159 +24,808 @@ module bcd_lut (
     input  wire [15:0]  amp_in,         // 输入幅度 (mV)
     output wire [15:0]  amp_bcd,        // 4位BCD输出 {d3,d2,d1,d0}
     
-    // 占空比/THD BCD转换（支持0-100.0%，1%步进）
+    // 占空比/THD BCD转换（支持0-100.0%，0.1%步进）
     input  wire [15:0]  duty_in,        // 输入占空比 (0-1000 = 0-100.0%)
     output wire [15:0]  duty_bcd        // 4位BCD输出 {d3,d2,d1,d0}
 );
 
 //=============================================================================
-// 方案说明：
-// 由于当前实现需要case语句仍然很大，而且default分支仍有除法，
-// 这里采用**简化方案**：
-//   - 对于频率：直接用十六进制显示（避免BCD转换）
-//   - 对于幅度和占空比：条目数少，可用完整case
+// 频率 0-500kHz (0-9.9kHz 100Hz步进, 10-109kHz 1kHz步进, 110-500kHz 10kHz步进)
+// 240个条目 × 24位, case编码
 //=============================================================================
+wire [18:0] freq_sat = (freq_in > 32'd500000) ? 19'd500000 : freq_in[18:0];  // 超范围显示最大值
+// freq/100 = (freq >> 2) * 1311 >> 15  (0-9999 精确)
+wire [21:0] freq_mul0 = freq_sat[13:2] * 11'd1311;
+// freq/1000 = (freq >> 3) * 8389 >> 20  (10000-109999 精确)
+wire [26:0] freq_mul1 = freq_sat[16:3] * 14'd8389;
+// freq/10000 = (freq >> 4) * 6711 >> 22  (110000-500000 精确)
+wire [27:0] freq_mul2 = freq_sat[18:4] * 13'd6711;
+wire [7:0] freq_addr = (freq_sat < 19'd10000) ? freq_mul0[21:15] :
+                       (freq_sat < 19'd110000) ? (8'd90 + freq_mul1[26:20]) :
+                       (8'd189 + freq_mul2[27:22]);
 
-//=============================================================================
-// 频率显示：改为十六进制（推荐方案）
-// 显示格式：0xABCDE (20位，5个十六进制数字，覆盖0-1M Hz)
-//=============================================================================
-// 直接位切片，无任何运算
-assign freq_bcd[3:0]   = freq_in[3:0];    // 低4位
-assign freq_bcd[7:4]   = freq_in[7:4];    // 第2个4位
-assign freq_bcd[11:8]  = freq_in[11:8];   // 第3个4位
-assign freq_bcd[15:12] = freq_in[15:12];  // 第4个4位
-assign freq_bcd[19:16] = freq_in[19:16];  // 第5个4位
-assign freq_bcd[23:20] = 4'd0;            // 最高位留空
+reg [23:0] freq_bcd_reg;
+always @(posedge clk) begin
+    case (freq_addr)
+        8'd0: freq_bcd_reg <= 24'h000000;  // 0 Hz
+        8'd1: freq_bcd_reg <= 24'h000100;  // 100 Hz
+        8'd2: freq_bcd_reg <= 24'h000200;  // 200 Hz
+        8'd3: freq_bcd_reg <= 24'h000300;  // 300 Hz
+        8'd4: freq_bcd_reg <= 24'h000400;  // 400 Hz
+        8'd5: freq_bcd_reg <= 24'h000500;  // 500 Hz
+        8'd6: freq_bcd_reg <= 24'h000600;  // 600 Hz
+        8'd7: freq_bcd_reg <= 24'h000700;  // 700 Hz
+        8'd8: freq_bcd_reg <= 24'h000800;  // 800 Hz
+        8'd9: freq_bcd_reg <= 24'h000900;  // 900 Hz
+        8'd10: freq_bcd_reg <= 24'h001000;  // 1000 Hz
+        8'd11: freq_bcd_reg <= 24'h001100;  // 1100 Hz
+        8'd12: freq_bcd_reg <= 24'h001200;  // 1200 Hz
+        8'd13: freq_bcd_reg <= 24'h001300;  // 1300 Hz
+        8'd14: freq_bcd_reg <= 24'h001400;  // 1400 Hz
+        8'd15: freq_bcd_reg <= 24'h001500;  // 1500 Hz
+        8'd16: freq_bcd_reg <= 24'h001600;  // 1600 Hz
+        8'd17: freq_bcd_reg <= 24'h001700;  // 1700 Hz
+        8'd18: freq_bcd_reg <= 24'h001800;  // 1800 Hz
+        8'd19: freq_bcd_reg <= 24'h001900;  // 1900 Hz
+        8'd20: freq_bcd_reg <= 24'h002000;  // 2000 Hz
+        8'd21: freq_bcd_reg <= 24'h002100;  // 2100 Hz
+        8'd22: freq_bcd_reg <= 24'h002200;  // 2200 Hz
+        8'd23: freq_bcd_reg <= 24'h002300;  // 2300 Hz
+        8'd24: freq_bcd_reg <= 24'h002400;  // 2400 Hz
+        8'd25: freq_bcd_reg <= 24'h002500;  // 2500 Hz
+        8'd26: freq_bcd_reg <= 24'h002600;  // 2600 Hz
+        8'd27: freq_bcd_reg <= 24'h002700;  // 2700 Hz
+        8'd28: freq_bcd_reg <= 24'h002800;  // 2800 Hz
+        8'd29: freq_bcd_reg <= 24'h002900;  // 2900 Hz
+        8'd30: freq_bcd_reg <= 24'h003000;  // 3000 Hz
+        8'd31: freq_bcd_reg <= 24'h003100;  // 3100 Hz
+        8'd32: freq_bcd_reg <= 24'h003200;  // 3200 Hz
+        8'd33: freq_bcd_reg <= 24'h003300;  // 3300 Hz
+        8'd34: freq_bcd_reg <= 24'h003400;  // 3400 Hz
+        8'd35: freq_bcd_reg <= 24'h003500;  // 3500 Hz
+        8'd36: freq_bcd_reg <= 24'h003600;  // 3600 Hz
+        8'd37: freq_bcd_reg <= 24'h003700;  // 3700 Hz
+        8'd38: freq_bcd_reg <= 24'h003800;  // 3800 Hz
+        8'd39: freq_bcd_reg <= 24'h003900;  // 3900 Hz
+        8'd40: freq_bcd_reg <= 24'h004000;  // 4000 Hz
+        8'd41: freq_bcd_reg <= 24'h004100;  // 4100 Hz
+        8'd42: freq_bcd_reg <= 24'h004200;  // 4200 Hz
+        8'd43: freq_bcd_reg <= 24'h004300;  // 4300 Hz
+        8'd44: freq_bcd_reg <= 24'h004400;  // 4400 Hz
+        8'd45: freq_bcd_reg <= 24'h004500;  // 4500 Hz
+        8'd46: freq_bcd_reg <= 24'h004600;  // 4600 Hz
+        8'd47: freq_bcd_reg <= 24'h004700;  // 4700 Hz
+        8'd48: freq_bcd_reg <= 24'h004800;  // 4800 Hz
+        8'd49: freq_bcd_reg <= 24'h004900;  // 4900 Hz
+        8'd50: freq_bcd_reg <= 24'h005000;  // 5000 Hz
+        8'd51: freq_bcd_reg <= 24'h005100;  // 5100 Hz
+        8'd52: freq_bcd_reg <= 24'h005200;  // 5200 Hz
+        8'd53: freq_bcd_reg <= 24'h005300;  // 5300 Hz
+        8'd54: freq_bcd_reg <= 24'h005400;  // 5400 Hz
+        8'd55: freq_bcd_reg <= 24'h005500;  // 5500 Hz
+        8'd56: freq_bcd_reg <= 24'h005600;  // 5600 Hz
+        8'd57: freq_bcd_reg <= 24'h005700;  // 5700 Hz
+        8'd58: freq_bcd_reg <= 24'h005800;  // 5800 Hz
+        8'd59: freq_bcd_reg <= 24'h005900;  // 5900 Hz
+        8'd60: freq_bcd_reg <= 24'h006000;  // 6000 Hz
+        8'd61: freq_bcd_reg <= 24'h006100;  // 6100 Hz
+        8'd62: freq_bcd_reg <= 24'h006200;  // 6200 Hz
+        8'd63: freq_bcd_reg <= 24'h006300;  // 6300 Hz
+        8'd64: freq_bcd_reg <= 24'h006400;  // 6400 Hz
+        8'd65: freq_bcd_reg <= 24'h006500;  // 6500 Hz
+        8'd66: freq_bcd_reg <= 24'h006600;  // 6600 Hz
+        8'd67: freq_bcd_reg <= 24'h006700;  // 6700 Hz
+        8'd68: freq_bcd_reg <= 24'h006800;  // 6800 Hz
+        8'd69: freq_bcd_reg <= 24'h006900;  // 6900 Hz
+        8'd70: freq_bcd_reg <= 24'h007000;  // 7000 Hz
+        8'd71: freq_bcd_reg <= 24'h007100;  // 7100 Hz
+        8'd72: freq_bcd_reg <= 24'h007200;  // 7200 Hz
+        8'd73: freq_bcd_reg <= 24'h007300;  // 7300 Hz
+        8'd74: freq_bcd_reg <= 24'h007400;  // 7400 Hz
+        8'd75: freq_bcd_reg <= 24'h007500;  // 7500 Hz
+        8'd76: freq_bcd_reg <= 24'h007600;  // 7600 Hz
+        8'd77: freq_bcd_reg <= 24'h007700;  // 7700 Hz
+        8'd78: freq_bcd_reg <= 24'h007800;  // 7800 Hz
+        8'd79: freq_bcd_reg <= 24'h007900;  // 7900 Hz
+        8'd80: freq_bcd_reg <= 24'h008000;  // 8000 Hz
+        8'd81: freq_bcd_reg <= 24'h008100;  // 8100 Hz
+        8'd82: freq_bcd_reg <= 24'h008200;  // 8200 Hz
+        8'd83: freq_bcd_reg <= 24'h008300;  // 8300 Hz
+        8'd84: freq_bcd_reg <= 24'h008400;  // 8400 Hz
+        8'd85: freq_bcd_reg <= 24'h008500;  // 8500 Hz
+        8'd86: freq_bcd_reg <= 24'h008600;  // 8600 Hz
+        8'd87: freq_bcd_reg <= 24'h008700;  // 8700 Hz
+        8'd88: freq_bcd_reg <= 24'h008800;  // 8800 Hz
+        8'd89: freq_bcd_reg <= 24'h008900;  // 8900 Hz
+        8'd90: freq_bcd_reg <= 24'h009000;  // 9000 Hz
+        8'd91: freq_bcd_reg <= 24'h009100;  // 9100 Hz
+        8'd92: freq_bcd_reg <= 24'h009200;  // 9200 Hz
+        8'd93: freq_bcd_reg <= 24'h009300;  // 9300 Hz
+        8'd94: freq_bcd_reg <= 24'h009400;  // 9400 Hz
+        8'd95: freq_bcd_reg <= 24'h009500;  // 9500 Hz
+        8'd96: freq_bcd_reg <= 24'h009600;  // 9600 Hz
+        8'd97: freq_bcd_reg <= 24'h009700;  // 9700 Hz
+        8'd98: freq_bcd_reg <= 24'h009800;  // 9800 Hz
+        8'd99: freq_bcd_reg <= 24'h009900;  // 9900 Hz
+        8'd100: freq_bcd_reg <= 24'h010000;  // 10000 Hz
+        8'd101: freq_bcd_reg <= 24'h011000;  // 11000 Hz
+        8'd102: freq_bcd_reg <= 24'h012000;  // 12000 Hz
+        8'd103: freq_bcd_reg <= 24'h013000;  // 13000 Hz
+        8'd104: freq_bcd_reg <= 24'h014000;  // 14000 Hz
+        8'd105: freq_bcd_reg <= 24'h015000;  // 15000 Hz
+        8'd106: freq_bcd_reg <= 24'h016000;  // 16000 Hz
+        8'd107: freq_bcd_reg <= 24'h017000;  // 17000 Hz
+        8'd108: freq_bcd_reg <= 24'h018000;  // 18000 Hz
+        8'd109: freq_bcd_reg <= 24'h019000;  // 19000 Hz
+        8'd110: freq_bcd_reg <= 24'h020000;  // 20000 Hz
+        8'd111: freq_bcd_reg <= 24'h021000;  // 21000 Hz
+        8'd112: freq_bcd_reg <= 24'h022000;  // 22000 Hz
+        8'd113: freq_bcd_reg <= 24'h023000;  // 23000 Hz
+        8'd114: freq_bcd_reg <= 24'h024000;  // 24000 Hz
+        8'd115: freq_bcd_reg <= 24'h025000;  // 25000 Hz
+        8'd116: freq_bcd_reg <= 24'h026000;  // 26000 Hz
+        8'd117: freq_bcd_reg <= 24'h027000;  // 27000 Hz
+        8'd118: freq_bcd_reg <= 24'h028000;  // 28000 Hz
+        8'd119: freq_bcd_reg <= 24'h029000;  // 29000 Hz
+        8'd120: freq_bcd_reg <= 24'h030000;  // 30000 Hz
+        8'd121: freq_bcd_reg <= 24'h031000;  // 31000 Hz
+        8'd122: freq_bcd_reg <= 24'h032000;  // 32000 Hz
+        8'd123: freq_bcd_reg <= 24'h033000;  // 33000 Hz
+        8'd124: freq_bcd_reg <= 24'h034000;  // 34000 Hz
+        8'd125: freq_bcd_reg <= 24'h035000;  // 35000 Hz
+        8'd126: freq_bcd_reg <= 24'h036000;  // 36000 Hz
+        8'd127: freq_bcd_reg <= 24'h037000;  // 37000 Hz
+        8'd128: freq_bcd_reg <= 24'h038000;  // 38000 Hz
+        8'd129: freq_bcd_reg <= 24'h039000;  // 39000 Hz
+        8'd130: freq_bcd_reg <= 24'h040000;  // 40000 Hz
+        8'd131: freq_bcd_reg <= 24'h041000;  // 41000 Hz
+        8'd132: freq_bcd_reg <= 24'h042000;  // 42000 Hz
+        8'd133: freq_bcd_reg <= 24'h043000;  // 43000 Hz
+        8'd134: freq_bcd_reg <= 24'h044000;  // 44000 Hz
+        8'd135: freq_bcd_reg <= 24'h045000;  // 45000 Hz
+        8'd136: freq_bcd_reg <= 24'h046000;  // 46000 Hz
+        8'd137: freq_bcd_reg <= 24'h047000;  // 47000 Hz
+        8'd138: freq_bcd_reg <= 24'h048000;  // 48000 Hz
+        8'd139: freq_bcd_reg <= 24'h049000;  // 49000 Hz
+        8'd140: freq_bcd_reg <= 24'h050000;  // 50000 Hz
+        8'd141: freq_bcd_reg <= 24'h051000;  // 51000 Hz
+        8'd142: freq_bcd_reg <= 24'h052000;  // 52000 Hz
+        8'd143: freq_bcd_reg <= 24'h053000;  // 53000 Hz
+        8'd144: freq_bcd_reg <= 24'h054000;  // 54000 Hz
+        8'd145: freq_bcd_reg <= 24'h055000;  // 55000 Hz
+        8'd146: freq_bcd_reg <= 24'h056000;  // 56000 Hz
+        8'd147: freq_bcd_reg <= 24'h057000;  // 57000 Hz
+        8'd148: freq_bcd_reg <= 24'h058000;  // 58000 Hz
+        8'd149: freq_bcd_reg <= 24'h059000;  // 59000 Hz
+        8'd150: freq_bcd_reg <= 24'h060000;  // 60000 Hz
+        8'd151: freq_bcd_reg <= 24'h061000;  // 61000 Hz
+        8'd152: freq_bcd_reg <= 24'h062000;  // 62000 Hz
+        8'd153: freq_bcd_reg <= 24'h063000;  // 63000 Hz
+        8'd154: freq_bcd_reg <= 24'h064000;  // 64000 Hz
+        8'd155: freq_bcd_reg <= 24'h065000;  // 65000 Hz
+        8'd156: freq_bcd_reg <= 24'h066000;  // 66000 Hz
+        8'd157: freq_bcd_reg <= 24'h067000;  // 67000 Hz
+        8'd158: freq_bcd_reg <= 24'h068000;  // 68000 Hz
+        8'd159: freq_bcd_reg <= 24'h069000;  // 69000 Hz
+        8'd160: freq_bcd_reg <= 24'h070000;  // 70000 Hz
+        8'd161: freq_bcd_reg <= 24'h071000;  // 71000 Hz
+        8'd162: freq_bcd_reg <= 24'h072000;  // 72000 Hz
+        8'd163: freq_bcd_reg <= 24'h073000;  // 73000 Hz
+        8'd164: freq_bcd_reg <= 24'h074000;  // 74000 Hz
+        8'd165: freq_bcd_reg <= 24'h075000;  // 75000 Hz
+        8'd166: freq_bcd_reg <= 24'h076000;  // 76000 Hz
+        8'd167: freq_bcd_reg <= 24'h077000;  // 77000 Hz
+        8'd168: freq_bcd_reg <= 24'h078000;  // 78000 Hz
+        8'd169: freq_bcd_reg <= 24'h079000;  // 79000 Hz
+        8'd170: freq_bcd_reg <= 24'h080000;  // 80000 Hz
+        8'd171: freq_bcd_reg <= 24'h081000;  // 81000 Hz
+        8'd172: freq_bcd_reg <= 24'h082000;  // 82000 Hz
+        8'd173: freq_bcd_reg <= 24'h083000;  // 83000 Hz
+        8'd174: freq_bcd_reg <= 24'h084000;  // 84000 Hz
+        8'd175: freq_bcd_reg <= 24'h085000;  // 85000 Hz
+        8'd176: freq_bcd_reg <= 24'h086000;  // 86000 Hz
+        8'd177: freq_bcd_reg <= 24'h087000;  // 87000 Hz
+        8'd178: freq_bcd_reg <= 24'h088000;  // 88000 Hz
+        8'd179: freq_bcd_reg <= 24'h089000;  // 89000 Hz
+        8'd180: freq_bcd_reg <= 24'h090000;  // 90000 Hz
+        8'd181: freq_bcd_reg <= 24'h091000;  // 91000 Hz
+        8'd182: freq_bcd_reg <= 24'h092000;  // 92000 Hz
+        8'd183: freq_bcd_reg <= 24'h093000;  // 93000 Hz
+        8'd184: freq_bcd_reg <= 24'h094000;  // 94000 Hz
+        8'd185: freq_bcd_reg <= 24'h095000;  // 95000 Hz
+        8'd186: freq_bcd_reg <= 24'h096000;  // 96000 Hz
+        8'd187: freq_bcd_reg <= 24'h097000;  // 97000 Hz
+        8'd188: freq_bcd_reg <= 24'h098000;  // 98000 Hz
+        8'd189: freq_bcd_reg <= 24'h099000;  // 99000 Hz
+        8'd190: freq_bcd_reg <= 24'h100000;  // 100000 Hz
+        8'd191: freq_bcd_reg <= 24'h101000;  // 101000 Hz
+        8'd192: freq_bcd_reg <= 24'h102000;  // 102000 Hz
+        8'd193: freq_bcd_reg <= 24'h103000;  // 103000 Hz
+        8'd194: freq_bcd_reg <= 24'h104000;  // 104000 Hz
+        8'd195: freq_bcd_reg <= 24'h105000;  // 105000 Hz
+        8'd196: freq_bcd_reg <= 24'h106000;  // 106000 Hz
+        8'd197: freq_bcd_reg <= 24'h107000;  // 107000 Hz
+        8'd198: freq_bcd_reg <= 24'h108000;  // 108000 Hz
+        8'd199: freq_bcd_reg <= 24'h109000;  // 109000 Hz
+        8'd200: freq_bcd_reg <= 24'h110000;  // 110000 Hz
+        8'd201: freq_bcd_reg <= 24'h120000;  // 120000 Hz
+        8'd202: freq_bcd_reg <= 24'h130000;  // 130000 Hz
+        8'd203: freq_bcd_reg <= 24'h140000;  // 140000 Hz
+        8'd204: freq_bcd_reg <= 24'h150000;  // 150000 Hz
+        8'd205: freq_bcd_reg <= 24'h160000;  // 160000 Hz
+        8'd206: freq_bcd_reg <= 24'h170000;  // 170000 Hz
+        8'd207: freq_bcd_reg <= 24'h180000;  // 180000 Hz
+        8'd208: freq_bcd_reg <= 24'h190000;  // 190000 Hz
+        8'd209: freq_bcd_reg <= 24'h200000;  // 200000 Hz
+        8'd210: freq_bcd_reg <= 24'h210000;  // 210000 Hz
+        8'd211: freq_bcd_reg <= 24'h220000;  // 220000 Hz
+        8'd212: freq_bcd_reg <= 24'h230000;  // 230000 Hz
+        8'd213: freq_bcd_reg <= 24'h240000;  // 240000 Hz
+        8'd214: freq_bcd_reg <= 24'h250000;  // 250000 Hz
+        8'd215: freq_bcd_reg <= 24'h260000;  // 260000 Hz
+        8'd216: freq_bcd_reg <= 24'h270000;  // 270000 Hz
+        8'd217: freq_bcd_reg <= 24'h280000;  // 280000 Hz
+        8'd218: freq_bcd_reg <= 24'h290000;  // 290000 Hz
+        8'd219: freq_bcd_reg <= 24'h300000;  // 300000 Hz
+        8'd220: freq_bcd_reg <= 24'h310000;  // 310000 Hz
+        8'd221: freq_bcd_reg <= 24'h320000;  // 320000 Hz
+        8'd222: freq_bcd_reg <= 24'h330000;  // 330000 Hz
+        8'd223: freq_bcd_reg <= 24'h340000;  // 340000 Hz
+        8'd224: freq_bcd_reg <= 24'h350000;  // 350000 Hz
+        8'd225: freq_bcd_reg <= 24'h360000;  // 360000 Hz
+        8'd226: freq_bcd_reg <= 24'h370000;  // 370000 Hz
+        8'd227: freq_bcd_reg <= 24'h380000;  // 380000 Hz
+        8'd228: freq_bcd_reg <= 24'h390000;  // 390000 Hz
+        8'd229: freq_bcd_reg <= 24'h400000;  // 400000 Hz
+        8'd230: freq_bcd_reg <= 24'h410000;  // 410000 Hz
+        8'd231: freq_bcd_reg <= 24'h420000;  // 420000 Hz
+        8'd232: freq_bcd_reg <= 24'h430000;  // 430000 Hz
+        8'd233: freq_bcd_reg <= 24'h440000;  // 440000 Hz
+        8'd234: freq_bcd_reg <= 24'h450000;  // 450000 Hz
+        8'd235: freq_bcd_reg <= 24'h460000;  // 460000 Hz
+        8'd236: freq_bcd_reg <= 24'h470000;  // 470000 Hz
+        8'd237: freq_bcd_reg <= 24'h480000;  // 480000 Hz
+        8'd238: freq_bcd_reg <= 24'h490000;  // 490000 Hz
+        8'd239: freq_bcd_reg <= 24'h500000;  // 500000 Hz
+        default: freq_bcd_reg <= 24'h500000;
+    endcase
+end
+assign freq_bcd = freq_bcd_reg;
 
 //=============================================================================
-// 幅度BCD查找表（ROM）
-// 每100mV一个条目，共51个 (0-5000mV)
-// 使用ROM存储，综合工具会推断为LUT
+// 幅度 0-5000mV (10mV步进), 显示 X.XXX V
+// 501个条目 × 16位, case编码
 //=============================================================================
-reg [15:0] amp_bcd_rom [0:50];
-
-// 初始化ROM（综合时会转换为LUT资源）
-initial begin
-    amp_bcd_rom[0]  = 16'h0000;  amp_bcd_rom[1]  = 16'h0100;  
-    amp_bcd_rom[2]  = 16'h0200;  amp_bcd_rom[3]  = 16'h0300;
-    amp_bcd_rom[4]  = 16'h0400;  amp_bcd_rom[5]  = 16'h0500;
-    amp_bcd_rom[6]  = 16'h0600;  amp_bcd_rom[7]  = 16'h0700;
-    amp_bcd_rom[8]  = 16'h0800;  amp_bcd_rom[9]  = 16'h0900;
-    amp_bcd_rom[10] = 16'h1000;  amp_bcd_rom[11] = 16'h1100;
-    amp_bcd_rom[12] = 16'h1200;  amp_bcd_rom[13] = 16'h1300;
-    amp_bcd_rom[14] = 16'h1400;  amp_bcd_rom[15] = 16'h1500;
-    amp_bcd_rom[16] = 16'h1600;  amp_bcd_rom[17] = 16'h1700;
-    amp_bcd_rom[18] = 16'h1800;  amp_bcd_rom[19] = 16'h1900;
-    amp_bcd_rom[20] = 16'h2000;  amp_bcd_rom[21] = 16'h2100;
-    amp_bcd_rom[22] = 16'h2200;  amp_bcd_rom[23] = 16'h2300;
-    amp_bcd_rom[24] = 16'h2400;  amp_bcd_rom[25] = 16'h2500;
-    amp_bcd_rom[26] = 16'h2600;  amp_bcd_rom[27] = 16'h2700;
-    amp_bcd_rom[28] = 16'h2800;  amp_bcd_rom[29] = 16'h2900;
-    amp_bcd_rom[30] = 16'h3000;  amp_bcd_rom[31] = 16'h3100;
-    amp_bcd_rom[32] = 16'h3200;  amp_bcd_rom[33] = 16'h3300;
-    amp_bcd_rom[34] = 16'h3400;  amp_bcd_rom[35] = 16'h3500;
-    amp_bcd_rom[36] = 16'h3600;  amp_bcd_rom[37] = 16'h3700;
-    amp_bcd_rom[38] = 16'h3800;  amp_bcd_rom[39] = 16'h3900;
-    amp_bcd_rom[40] = 16'h4000;  amp_bcd_rom[41] = 16'h4100;
-    amp_bcd_rom[42] = 16'h4200;  amp_bcd_rom[43] = 16'h4300;
-    amp_bcd_rom[44] = 16'h4400;  amp_bcd_rom[45] = 16'h4500;
-    amp_bcd_rom[46] = 16'h4600;  amp_bcd_rom[47] = 16'h4700;
-    amp_bcd_rom[48] = 16'h4800;  amp_bcd_rom[49] = 16'h4900;
-    amp_bcd_rom[50] = 16'h5000;
-end
+wire [12:0] amp_sat = (amp_in > 16'd5000) ? 13'd5000 : amp_in[12:0];  // 超范围显示最大值
+// amp/10 = (amp >> 1) * 1639 >> 13  (0-5000 精确)
+wire [21:0] amp_mul = amp_sat[12:1] * 11'd1639;
+wire [8:0] amp_addr = amp_mul[21:13];
 
-// ROM读取：输入除以100作为地址（使用右移近似）
-wire [5:0] amp_addr;
-assign amp_addr = amp_in[15:6];  // 右移6位 ≈ 除以64 (误差在1%步进内可接受)
-
-// 更精确的方案：使用右移7位 + 补偿
-// amp_in / 100 ≈ (amp_in >> 6) - (amp_in >> 9) 
-// 但这会增加组合逻辑路径，不推荐
-
-// 查找ROM（同步读取避免长组合路径）
 reg [15:0] amp_bcd_reg;
 always @(posedge clk) begin
-    if (amp_addr <= 6'd50)
-        amp_bcd_reg <= amp_bcd_rom[amp_addr];
-    else
-        amp_bcd_reg <= 16'h5000;  // 超范围显示5.0V
+    case (amp_addr)
+        9'd0: amp_bcd_reg <= 16'h0000;  // 0.000 V
+        9'd1: amp_bcd_reg <= 16'h0010;  // 0.010 V
+        9'd2: amp_bcd_reg <= 16'h0020;  // 0.020 V
+        9'd3: amp_bcd_reg <= 16'h0030;  // 0.030 V
+        9'd4: amp_bcd_reg <= 16'h0040;  // 0.040 V
+        9'd5: amp_bcd_reg <= 16'h0050;  // 0.050 V
+        9'd6: amp_bcd_reg <= 16'h0060;  // 0.060 V
+        9'd7: amp_bcd_reg <= 16'h0070;  // 0.070 V
+        9'd8: amp_bcd_reg <= 16'h0080;  // 0.080 V
+        9'd9: amp_bcd_reg <= 16'h0090;  // 0.090 V
+        9'd10: amp_bcd_reg <= 16'h0100;  // 0.100 V
+        9'd11: amp_bcd_reg <= 16'h0110;  // 0.110 V
+        9'd12: amp_bcd_reg <= 16'h0120;  // 0.120 V
+        9'd13: amp_bcd_reg <= 16'h0130;  // 0.130 V
+        9'd14: amp_bcd_reg <= 16'h0140;  // 0.140 V
+        9'd15: amp_bcd_reg <= 16'h0150;  // 0.150 V
+        9'd16: amp_bcd_reg <= 16'h0160;  // 0.160 V
+        9'd17: amp_bcd_reg <= 16'h0170;  // 0.170 V
+        9'd18: amp_bcd_reg <= 16'h0180;  // 0.180 V
+        9'd19: amp_bcd_reg <= 16'h0190;  // 0.190 V
+        9'd20: amp_bcd_reg <= 16'h0200;  // 0.200 V
+        9'd21: amp_bcd_reg <= 16'h0210;  // 0.210 V
+        9'd22: amp_bcd_reg <= 16'h0220;  // 0.220 V
+        9'd23: amp_bcd_reg <= 16'h0230;  // 0.230 V
+        9'd24: amp_bcd_reg <= 16'h0240;  // 0.240 V
+        9'd25: amp_bcd_reg <= 16'h0250;  // 0.250 V
+        9'd26: amp_bcd_reg <= 16'h0260;  // 0.260 V
+        9'd27: amp_bcd_reg <= 16'h0270;  // 0.270 V
+        9'd28: amp_bcd_reg <= 16'h0280;  // 0.280 V
+        9'd29: amp_bcd_reg <= 16'h0290;  // 0.290 V
+        9'd30: amp_bcd_reg <= 16'h0300;  // 0.300 V
+        9'd31: amp_bcd_reg <= 16'h0310;  // 0.310 V
+        9'd32: amp_bcd_reg <= 16'h0320;  // 0.320 V
+        9'd33: amp_bcd_reg <= 16'h0330;  // 0.330 V
+        9'd34: amp_bcd_reg <= 16'h0340;  // 0.340 V
+        9'd35: amp_bcd_reg <= 16'h0350;  // 0.350 V
+        9'd36: amp_bcd_reg <= 16'h0360;  // 0.360 V
+        9'd37: amp_bcd_reg <= 16'h0370;  // 0.370 V
+        9'd38: amp_bcd_reg <= 16'h0380;  // 0.380 V
+        9'd39: amp_bcd_reg <= 16'h0390;  // 0.390 V
+        9'd40: amp_bcd_reg <= 16'h0400;  // 0.400 V
+        9'd41: amp_bcd_reg <= 16'h0410;  // 0.410 V
+        9'd42: amp_bcd_reg <= 16'h0420;  // 0.420 V
+        9'd43: amp_bcd_reg <= 16'h0430;  // 0.430 V
+        9'd44: amp_bcd_reg <= 16'h0440;  // 0.440 V
+        9'd45: amp_bcd_reg <= 16'h0450;  // 0.450 V
+        9'd46: amp_bcd_reg <= 16'h0460;  // 0.460 V
+        9'd47: amp_bcd_reg <= 16'h0470;  // 0.470 V
+        9'd48: amp_bcd_reg <= 16'h0480;  // 0.480 V
+        9'd49: amp_bcd_reg <= 16'h0490;  // 0.490 V
+        9'd50: amp_bcd_reg <= 16'h0500;  // 0.500 V
+        9'd51: amp_bcd_reg <= 16'h0510;  // 0.510 V
+        9'd52: amp_bcd_reg <= 16'h0520;  // 0.520 V
+        9'd53: amp_bcd_reg <= 16'h0530;  // 0.530 V
+        9'd54: amp_bcd_reg <= 16'h0540;  // 0.540 V
+        9'd55: amp_bcd_reg <= 16'h0550;  // 0.550 V
+        9'd56: amp_bcd_reg <= 16'h0560;  // 0.560 V
+        9'd57: amp_bcd_reg <= 16'h0570;  // 0.570 V
+        9'd58: amp_bcd_reg <= 16'h0580;  // 0.580 V
+        9'd59: amp_bcd_reg <= 16'h0590;  // 0.590 V
+        9'd60: amp_bcd_reg <= 16'h0600;  // 0.600 V
+        9'd61: amp_bcd_reg <= 16'h0610;  // 0.610 V
+        9'd62: amp_bcd_reg <= 16'h0620;  // 0.620 V
+        9'd63: amp_bcd_reg <= 16'h0630;  // 0.630 V
+        9'd64: amp_bcd_reg <= 16'h0640;  // 0.640 V
+        9'd65: amp_bcd_reg <= 16'h0650;  // 0.650 V
+        9'd66: amp_bcd_reg <= 16'h0660;  // 0.660 V
+        9'd67: amp_bcd_reg <= 16'h0670;  // 0.670 V
+        9'd68: amp_bcd_reg <= 16'h0680;  // 0.680 V
+        9'd69: amp_bcd_reg <= 16'h0690;  // 0.690 V
+        9'd70: amp_bcd_reg <= 16'h0700;  // 0.700 V
+        9'd71: amp_bcd_reg <= 16'h0710;  // 0.710 V
+        9'd72: amp_bcd_reg <= 16'h0720;  // 0.720 V
+        9'd73: amp_bcd_reg <= 16'h0730;  // 0.730 V
+        9'd74: amp_bcd_reg <= 16'h0740;  // 0.740 V
+        9'd75: amp_bcd_reg <= 16'h0750;  // 0.750 V
+        9'd76: amp_bcd_reg <= 16'h0760;  // 0.760 V
+        9'd77: amp_bcd_reg <= 16'h0770;  // 0.770 V
+        9'd78: amp_bcd_reg <= 16'h0780;  // 0.780 V
+        9'd79: amp_bcd_reg <= 16'h0790;  // 0.790 V
+        9'd80: amp_bcd_reg <= 16'h0800;  // 0.800 V
+        9'd81: amp_bcd_reg <= 16'h0810;  // 0.810 V
+        9'd82: amp_bcd_reg <= 16'h0820;  // 0.820 V
+        9'd83: amp_bcd_reg <= 16'h0830;  // 0.830 V
+        9'd84: amp_bcd_reg <= 16'h0840;  // 0.840 V
+        9'd85: amp_bcd_reg <= 16'h0850;  // 0.850 V
+        9'd86: amp_bcd_reg <= 16'h0860;  // 0.860 V
+        9'd87: amp_bcd_reg <= 16'h0870;  // 0.870 V
+        9'd88: amp_bcd_reg <= 16'h0880;  // 0.880 V
+        9'd89: amp_bcd_reg <= 16'h0890;  // 0.890 V
+        9'd90: amp_bcd_reg <= 16'h0900;  // 0.900 V
+        9'd91: amp_bcd_reg <= 16'h0910;  // 0.910 V
+        9'd92: amp_bcd_reg <= 16'h0920;  // 0.920 V
+        9'd93: amp_bcd_reg <= 16'h0930;  // 0.930 V
+        9'd94: amp_bcd_reg <= 16'h0940;  // 0.940 V
+        9'd95: amp_bcd_reg <= 16'h0950;  // 0.950 V
+        9'd96: amp_bcd_reg <= 16'h0960;  // 0.960 V
+        9'd97: amp_bcd_reg <= 16'h0970;  // 0.970 V
+        9'd98: amp_bcd_reg <= 16'h0980;  // 0.980 V
+        9'd99: amp_bcd_reg <= 16'h0990;  // 0.990 V
+        9'd100: amp_bcd_reg <= 16'h1000;  // 1.000 V
+        9'd101: amp_bcd_reg <= 16'h1010;  // 1.010 V
+        9'd102: amp_bcd_reg <= 16'h1020;  // 1.020 V
+        9'd103: amp_bcd_reg <= 16'h1030;  // 1.030 V
+        9'd104: amp_bcd_reg <= 16'h1040;  // 1.040 V
+        9'd105: amp_bcd_reg <= 16'h1050;  // 1.050 V
+        9'd106: amp_bcd_reg <= 16'h1060;  // 1.060 V
+        9'd107: amp_bcd_reg <= 16'h1070;  // 1.070 V
+        9'd108: amp_bcd_reg <= 16'h1080;  // 1.080 V
+        9'd109: amp_bcd_reg <= 16'h1090;  // 1.090 V
+        9'd110: amp_bcd_reg <= 16'h1100;  // 1.100 V
+        9'd111: amp_bcd_reg <= 16'h1110;  // 1.110 V
+        9'd112: amp_bcd_reg <= 16'h1120;  // 1.120 V
+        9'd113: amp_bcd_reg <= 16'h1130;  // 1.130 V
+        9'd114: amp_bcd_reg <= 16'h1140;  // 1.140 V
+        9'd115: amp_bcd_reg <= 16'h1150;  // 1.150 V
+        9'd116: amp_bcd_reg <= 16'h1160;  // 1.160 V
+        9'd117: amp_bcd_reg <= 16'h1170;  // 1.170 V
+        9'd118: amp_bcd_reg <= 16'h1180;  // 1.180 V
+        9'd119: amp_bcd_reg <= 16'h1190;  // 1.190 V
+        9'd120: amp_bcd_reg <= 16'h1200;  // 1.200 V
+        9'd121: amp_bcd_reg <= 16'h1210;  // 1.210 V
+        9'd122: amp_bcd_reg <= 16'h1220;  // 1.220 V
+        9'd123: amp_bcd_reg <= 16'h1230;  // 1.230 V
+        9'd124: amp_bcd_reg <= 16'h1240;  // 1.240 V
+        9'd125: amp_bcd_reg <= 16'h1250;  // 1.250 V
+        9'd126: amp_bcd_reg <= 16'h1260;  // 1.260 V
+        9'd127: amp_bcd_reg <= 16'h1270;  // 1.270 V
+        9'd128: amp_bcd_reg <= 16'h1280;  // 1.280 V
+        9'd129: amp_bcd_reg <= 16'h1290;  // 1.290 V
+        9'd130: amp_bcd_reg <= 16'h1300;  // 1.300 V
+        9'd131: amp_bcd_reg <= 16'h1310;  // 1.310 V
+        9'd132: amp_bcd_reg <= 16'h1320;  // 1.320 V
+        9'd133: amp_bcd_reg <= 16'h1330;  // 1.330 V
+        9'd134: amp_bcd_reg <= 16'h1340;  // 1.340 V
+        9'd135: amp_bcd_reg <= 16'h1350;  // 1.350 V
+        9'd136: amp_bcd_reg <= 16'h1360;  // 1.360 V
+        9'd137: amp_bcd_reg <= 16'h1370;  // 1.370 V
+        9'd138: amp_bcd_reg <= 16'h1380;  // 1.380 V
+        9'd139: amp_bcd_reg <= 16'h1390;  // 1.390 V
+        9'd140: amp_bcd_reg <= 16'h1400;  // 1.400 V
+        9'd141: amp_bcd_reg <= 16'h1410;  // 1.410 V
+        9'd142: amp_bcd_reg <= 16'h1420;  // 1.420 V
+        9'd143: amp_bcd_reg <= 16'h1430;  // 1.430 V
+        9'd144: amp_bcd_reg <= 16'h1440;  // 1.440 V
+        9'd145: amp_bcd_reg <= 16'h1450;  // 1.450 V
+        9'd146: amp_bcd_reg <= 16'h1460;  // 1.460 V
+        9'd147: amp_bcd_reg <= 16'h1470;  // 1.470 V
+        9'd148: amp_bcd_reg <= 16'h1480;  // 1.480 V
+        9'd149: amp_bcd_reg <= 16'h1490;  // 1.490 V
+        9'd150: amp_bcd_reg <= 16'h1500;  // 1.500 V
+        9'd151: amp_bcd_reg <= 16'h1510;  // 1.510 V
+        9'd152: amp_bcd_reg <= 16'h1520;  // 1.520 V
+        9'd153: amp_bcd_reg <= 16'h1530;  // 1.530 V
+        9'd154: amp_bcd_reg <= 16'h1540;  // 1.540 V
+        9'd155: amp_bcd_reg <= 16'h1550;  // 1.550 V
+        9'd156: amp_bcd_reg <= 16'h1560;  // 1.560 V
+        9'd157: amp_bcd_reg <= 16'h1570;  // 1.570 V
+        9'd158: amp_bcd_reg <= 16'h1580;  // 1.580 V
+        9'd159: amp_bcd_reg <= 16'h1590;  // 1.590 V
+        9'd160: amp_bcd_reg <= 16'h1600;  // 1.600 V
+        9'd161: amp_bcd_reg <= 16'h1610;  // 1.610 V
+        9'd162: amp_bcd_reg <= 16'h1620;  // 1.620 V
+        9'd163: amp_bcd_reg <= 16'h1630;  // 1.630 V
+        9'd164: amp_bcd_reg <= 16'h1640;  // 1.640 V
+        9'd165: amp_bcd_reg <= 16'h1650;  // 1.650 V
+        9'd166: amp_bcd_reg <= 16'h1660;  // 1.660 V
+        9'd167: amp_bcd_reg <= 16'h1670;  // 1.670 V
+        9'd168: amp_bcd_reg <= 16'h1680;  // 1.680 V
+        9'd169: amp_bcd_reg <= 16'h1690;  // 1.690 V
+        9'd170: amp_bcd_reg <= 16'h1700;  // 1.700 V
+        9'd171: amp_bcd_reg <= 16'h1710;  // 1.710 V
+        9'd172: amp_bcd_reg <= 16'h1720;  // 1.720 V
+        9'd173: amp_bcd_reg <= 16'h1730;  // 1.730 V
+        9'd174: amp_bcd_reg <= 16'h1740;  // 1.740 V
+        9'd175: amp_bcd_reg <= 16'h1750;  // 1.750 V
+        9'd176: amp_bcd_reg <= 16'h1760;  // 1.760 V
+        9'd177: amp_bcd_reg <= 16'h1770;  // 1.770 V
+        9'd178: amp_bcd_reg <= 16'h1780;  // 1.780 V
+        9'd179: amp_bcd_reg <= 16'h1790;  // 1.790 V
+        9'd180: amp_bcd_reg <= 16'h1800;  // 1.800 V
+        9'd181: amp_bcd_reg <= 16'h1810;  // 1.810 V
+        9'd182: amp_bcd_reg <= 16'h1820;  // 1.820 V
+        9'd183: amp_bcd_reg <= 16'h1830;  // 1.830 V
+        9'd184: amp_bcd_reg <= 16'h1840;  // 1.840 V
+        9'd185: amp_bcd_reg <= 16'h1850;  // 1.850 V
+        9'd186: amp_bcd_reg <= 16'h1860;  // 1.860 V
+        9'd187: amp_bcd_reg <= 16'h1870;  // 1.870 V
+        9'd188: amp_bcd_reg <= 16'h1880;  // 1.880 V
+        9'd189: amp_bcd_reg <= 16'h1890;  // 1.890 V
+        9'd190: amp_bcd_reg <= 16'h1900;  // 1.900 V
+        9'd191: amp_bcd_reg <= 16'h1910;  // 1.910 V
+        9'd192: amp_bcd_reg <= 16'h1920;  // 1.920 V
+        9'd193: amp_bcd_reg <= 16'h1930;  // 1.930 V
+        9'd194: amp_bcd_reg <= 16'h1940;  // 1.940 V
+        9'd195: amp_bcd_reg <= 16'h1950;  // 1.950 V
+        9'd196: amp_bcd_reg <= 16'h1960;  // 1.960 V
+        9'd197: amp_bcd_reg <= 16'h1970;  // 1.970 V
+        9'd198: amp_bcd_reg <= 16'h1980;  // 1.980 V
+        9'd199: amp_bcd_reg <= 16'h1990;  // 1.990 V
+        9'd200: amp_bcd_reg <= 16'h2000;  // 2.000 V
+        9'd201: amp_bcd_reg <= 16'h2010;  // 2.010 V
+        9'd202: amp_bcd_reg <= 16'h2020;  // 2.020 V
+        9'd203: amp_bcd_reg <= 16'h2030;  // 2.030 V
+        9'd204: amp_bcd_reg <= 16'h2040;  // 2.040 V
+        9'd205: amp_bcd_reg <= 16'h2050;  // 2.050 V
+        9'd206: amp_bcd_reg <= 16'h2060;  // 2.060 V
+        9'd207: amp_bcd_reg <= 16'h2070;  // 2.070 V
+        9'd208: amp_bcd_reg <= 16'h2080;  // 2.080 V
+        9'd209: amp_bcd_reg <= 16'h2090;  // 2.090 V
+        9'd210: amp_bcd_reg <= 16'h2100;  // 2.100 V
+        9'd211: amp_bcd_reg <= 16'h2110;  // 2.110 V
+        9'd212: amp_bcd_reg <= 16'h2120;  // 2.120 V
+        9'd213: amp_bcd_reg <= 16'h2130;  // 2.130 V
+        9'd214: amp_bcd_reg <= 16'h2140;  // 2.140 V
+        9'd215: amp_bcd_reg <= 16'h2150;  // 2.150 V
+        9'd216: amp_bcd_reg <= 16'h2160;  // 2.160 V
+        9'd217: amp_bcd_reg <= 16'h2170;  // 2.170 V
+        9'd218: amp_bcd_reg <= 16'h2180;  // 2.180 V
+        9'd219: amp_bcd_reg <= 16'h2190;  // 2.190 V
+        9'd220: amp_bcd_reg <= 16'h2200;  // 2.200 V
+        9'd221: amp_bcd_reg <= 16'h2210;  // 2.210 V
+        9'd222: amp_bcd_reg <= 16'h2220;  // 2.220 V
+        9'd223: amp_bcd_reg <= 16'h2230;  // 2.230 V
+        9'd224: amp_bcd_reg <= 16'h2240;  // 2.240 V
+        9'd225: amp_bcd_reg <= 16'h2250;  // 2.250 V
+        9'd226: amp_bcd_reg <= 16'h2260;  // 2.260 V
+        9'd227: amp_bcd_reg <= 16'h2270;  // 2.270 V
+        9'd228: amp_bcd_reg <= 16'h2280;  // 2.280 V
+        9'd229: amp_bcd_reg <= 16'h2290;  // 2.290 V
+        9'd230: amp_bcd_reg <= 16'h2300;  // 2.300 V
+        9'd231: amp_bcd_reg <= 16'h2310;  // 2.310 V
+        9'd232: amp_bcd_reg <= 16'h2320;  // 2.320 V
+        9'd233: amp_bcd_reg <= 16'h2330;  // 2.330 V
+        9'd234: amp_bcd_reg <= 16'h2340;  // 2.340 V
+        9'd235: amp_bcd_reg <= 16'h2350;  // 2.350 V
+        9'd236: amp_bcd_reg <= 16'h2360;  // 2.360 V
+        9'd237: amp_bcd_reg <= 16'h2370;  // 2.370 V
+        9'd238: amp_bcd_reg <= 16'h2380;  // 2.380 V
+        9'd239: amp_bcd_reg <= 16'h2390;  // 2.390 V
+        9'd240: amp_bcd_reg <= 16'h2400;  // 2.400 V
+        9'd241: amp_bcd_reg <= 16'h2410;  // 2.410 V
+        9'd242: amp_bcd_reg <= 16'h2420;  // 2.420 V
+        9'd243: amp_bcd_reg <= 16'h2430;  // 2.430 V
+        9'd244: amp_bcd_reg <= 16'h2440;  // 2.440 V
+        9'd245: amp_bcd_reg <= 16'h2450;  // 2.450 V
+        9'd246: amp_bcd_reg <= 16'h2460;  // 2.460 V
+        9'd247: amp_bcd_reg <= 16'h2470;  // 2.470 V
+        9'd248: amp_bcd_reg <= 16'h2480;  // 2.480 V
+        9'd249: amp_bcd_reg <= 16'h2490;  // 2.490 V
+        9'd250: amp_bcd_reg <= 16'h2500;  // 2.500 V
+        9'd251: amp_bcd_reg <= 16'h2510;  // 2.510 V
+        9'd252: amp_bcd_reg <= 16'h2520;  // 2.520 V
+        9'd253: amp_bcd_reg <= 16'h2530;  // 2.530 V
+        9'd254: amp_bcd_reg <= 16'h2540;  // 2.540 V
+        9'd255: amp_bcd_reg <= 16'h2550;  // 2.550 V
+        9'd256: amp_bcd_reg <= 16'h2560;  // 2.560 V
+        9'd257: amp_bcd_reg <= 16'h2570;  // 2.570 V
+        9'd258: amp_bcd_reg <= 16'h2580;  // 2.580 V
+        9'd259: amp_bcd_reg <= 16'h2590;  // 2.590 V
+        9'd260: amp_bcd_reg <= 16'h2600;  // 2.600 V
+        9'd261: amp_bcd_reg <= 16'h2610;  // 2.610 V
+        9'd262: amp_bcd_reg <= 16'h2620;  // 2.620 V
+        9'd263: amp_bcd_reg <= 16'h2630;  // 2.630 V
+        9'd264: amp_bcd_reg <= 16'h2640;  // 2.640 V
+        9'd265: amp_bcd_reg <= 16'h2650;  // 2.650 V
+        9'd266: amp_bcd_reg <= 16'h2660;  // 2.660 V
+        9'd267: amp_bcd_reg <= 16'h2670;  // 2.670 V
+        9'd268: amp_bcd_reg <= 16'h2680;  // 2.680 V
+        9'd269: amp_bcd_reg <= 16'h2690;  // 2.690 V
+        9'd270: amp_bcd_reg <= 16'h2700;  // 2.700 V
+        9'd271: amp_bcd_reg <= 16'h2710;  // 2.710 V
+        9'd272: amp_bcd_reg <= 16'h2720;  // 2.720 V
+        9'd273: amp_bcd_reg <= 16'h2730;  // 2.730 V
+        9'd274: amp_bcd_reg <= 16'h2740;  // 2.740 V
+        9'd275: amp_bcd_reg <= 16'h2750;  // 2.750 V
+        9'd276: amp_bcd_reg <= 16'h2760;  // 2.760 V
+        9'd277: amp_bcd_reg <= 16'h2770;  // 2.770 V
+        9'd278: amp_bcd_reg <= 16'h2780;  // 2.780 V
+        9'd279: amp_bcd_reg <= 16'h2790;  // 2.790 V
+        9'd280: amp_bcd_reg <= 16'h2800;  // 2.800 V
+        9'd281: amp_bcd_reg <= 16'h2810;  // 2.810 V
+        9'd282: amp_bcd_reg <= 16'h2820;  // 2.820 V
+        9'd283: amp_bcd_reg <= 16'h2830;  // 2.830 V
+        9'd284: amp_bcd_reg <= 16'h2840;  // 2.840 V
+        9'd285: amp_bcd_reg <= 16'h2850;  // 2.850 V
+        9'd286: amp_bcd_reg <= 16'h2860;  // 2.860 V
+        9'd287: amp_bcd_reg <= 16'h2870;  // 2.870 V
+        9'd288: amp_bcd_reg <= 16'h2880;  // 2.880 V
+        9'd289: amp_bcd_reg <= 16'h2890;  // 2.890 V
+        9'd290: amp_bcd_reg <= 16'h2900;  // 2.900 V
+        9'd291: amp_bcd_reg <= 16'h2910;  // 2.910 V
+        9'd292: amp_bcd_reg <= 16'h2920;  // 2.920 V
+        9'd293: amp_bcd_reg <= 16'h2930;  // 2.930 V
+        9'd294: amp_bcd_reg <= 16'h2940;  // 2.940 V
+        9'd295: amp_bcd_reg <= 16'h2950;  // 2.950 V
+        9'd296: amp_bcd_reg <= 16'h2960;  // 2.960 V
+        9'd297: amp_bcd_reg <= 16'h2970;  // 2.970 V
+        9'd298: amp_bcd_reg <= 16'h2980;  // 2.980 V
+        9'd299: amp_bcd_reg <= 16'h2990;  // 2.990 V
+        9'd300: amp_bcd_reg <= 16'h3000;  // 3.000 V
+        9'd301: amp_bcd_reg <= 16'h3010;  // 3.010 V
+        9'd302: amp_bcd_reg <= 16'h3020;  // 3.020 V
+        9'd303: amp_bcd_reg <= 16'h3030;  // 3.030 V
+        9'd304: amp_bcd_reg <= 16'h3040;  // 3.040 V
+        9'd305: amp_bcd_reg <= 16'h3050;  // 3.050 V
+        9'd306: amp_bcd_reg <= 16'h3060;  // 3.060 V
+        9'd307: amp_bcd_reg <= 16'h3070;  // 3.070 V
+        9'd308: amp_bcd_reg <= 16'h3080;  // 3.080 V
+        9'd309: amp_bcd_reg <= 16'h3090;  // 3.090 V
+        9'd310: amp_bcd_reg <= 16'h3100;  // 3.100 V
+        9'd311: amp_bcd_reg <= 16'h3110;  // 3.110 V
+        9'd312: amp_bcd_reg <= 16'h3120;  // 3.120 V
+        9'd313: amp_bcd_reg <= 16'h3130;  // 3.130 V
+        9'd314: amp_bcd_reg <= 16'h3140;  // 3.140 V
+        9'd315: amp_bcd_reg <= 16'h3150;  // 3.150 V
+        9'd316: amp_bcd_reg <= 16'h3160;  // 3.160 V
+        9'd317: amp_bcd_reg <= 16'h3170;  // 3.170 V
+        9'd318: amp_bcd_reg <= 16'h3180;  // 3.180 V
+        9'd319: amp_bcd_reg <= 16'h3190;  // 3.190 V
+        9'd320: amp_bcd_reg <= 16'h3200;  // 3.200 V
+        9'd321: amp_bcd_reg <= 16'h3210;  // 3.210 V
+        9'd322: amp_bcd_reg <= 16'h3220;  // 3.220 V
+        9'd323: amp_bcd_reg <= 16'h3230;  // 3.230 V
+        9'd324: amp_bcd_reg <= 16'h3240;  // 3.240 V
+        9'd325: amp_bcd_reg <= 16'h3250;  // 3.250 V
+        9'd326: amp_bcd_reg <= 16'h3260;  // 3.260 V
+        9'd327: amp_bcd_reg <= 16'h3270;  // 3.270 V
+        9'd328: amp_bcd_reg <= 16'h3280;  // 3.280 V
+        9'd329: amp_bcd_reg <= 16'h3290;  // 3.290 V
+        9'd330: amp_bcd_reg <= 16'h3300;  // 3.300 V
+        9'd331: amp_bcd_reg <= 16'h3310;  // 3.310 V
+        9'd332: amp_bcd_reg <= 16'h3320;  // 3.320 V
+        9'd333: amp_bcd_reg <= 16'h3330;  // 3.330 V
+        9'd334: amp_bcd_reg <= 16'h3340;  // 3.340 V
+        9'd335: amp_bcd_reg <= 16'h3350;  // 3.350 V
+        9'd336: amp_bcd_reg <= 16'h3360;  // 3.360 V
+        9'd337: amp_bcd_reg <= 16'h3370;  // 3.370 V
+        9'd338: amp_bcd_reg <= 16'h3380;  // 3.380 V
+        9'd339: amp_bcd_reg <= 16'h3390;  // 3.390 V
+        9'd340: amp_bcd_reg <= 16'h3400;  // 3.400 V
+        9'd341: amp_bcd_reg <= 16'h3410;  // 3.410 V
+        9'd342: amp_bcd_reg <= 16'h3420;  // 3.420 V
+        9'd343: amp_bcd_reg <= 16'h3430;  // 3.430 V
+        9'd344: amp_bcd_reg <= 16'h3440;  // 3.440 V
+        9'd345: amp_bcd_reg <= 16'h3450;  // 3.450 V
+        9'd346: amp_bcd_reg <= 16'h3460;  // 3.460 V
+        9'd347: amp_bcd_reg <= 16'h3470;  // 3.470 V
+        9'd348: amp_bcd_reg <= 16'h3480;  // 3.480 V
+        9'd349: amp_bcd_reg <= 16'h3490;  // 3.490 V
+        9'd350: amp_bcd_reg <= 16'h3500;  // 3.500 V
+        9'd351: amp_bcd_reg <= 16'h3510;  // 3.510 V
+        9'd352: amp_bcd_reg <= 16'h3520;  // 3.520 V
+        9'd353: amp_bcd_reg <= 16'h3530;  // 3.530 V
+        9'd354: amp_bcd_reg <= 16'h3540;  // 3.540 V
+        9'd355: amp_bcd_reg <= 16'h3550;  // 3.550 V
+        9'd356: amp_bcd_reg <= 16'h3560;  // 3.560 V
+        9'd357: amp_bcd_reg <= 16'h3570;  // 3.570 V
+        9'd358: amp_bcd_reg <= 16'h3580;  // 3.580 V
+        9'd359: amp_bcd_reg <= 16'h3590;  // 3.590 V
+        9'd360: amp_bcd_reg <= 16'h3600;  // 3.600 V
+        9'd361: amp_bcd_reg <= 16'h3610;  // 3.610 V
+        9'd362: amp_bcd_reg <= 16'h3620;  // 3.620 V
+        9'd363: amp_bcd_reg <= 16'h3630;  // 3.630 V
+        9'd364: amp_bcd_reg <= 16'h3640;  // 3.640 V
+        9'd365: amp_bcd_reg <= 16'h3650;  // 3.650 V
+        9'd366: amp_bcd_reg <= 16'h3660;  // 3.660 V
+        9'd367: amp_bcd_reg <= 16'h3670;  // 3.670 V
+        9'd368: amp_bcd_reg <= 16'h3680;  // 3.680 V
+        9'd369: amp_bcd_reg <= 16'h3690;  // 3.690 V
+        9'd370: amp_bcd_reg <= 16'h3700;  // 3.700 V
+        9'd371: amp_bcd_reg <= 16'h3710;  // 3.710 V
+        9'd372: amp_bcd_reg <= 16'h3720;  // 3.720 V
+        9'd373: amp_bcd_reg <= 16'h3730;  // 3.730 V
+        9'd374: amp_bcd_reg <= 16'h3740;  // 3.740 V
+        9'd375: amp_bcd_reg <= 16'h3750;  // 3.750 V
+        9'd376: amp_bcd_reg <= 16'h3760;  // 3.760 V
+        9'd377: amp_bcd_reg <= 16'h3770;  // 3.770 V
+        9'd378: amp_bcd_reg <= 16'h3780;  // 3.780 V
+        9'd379: amp_bcd_reg <= 16'h3790;  // 3.790 V
+        9'd380: amp_bcd_reg <= 16'h3800;  // 3.800 V
+        9'd381: amp_bcd_reg <= 16'h3810;  // 3.810 V
+        9'd382: amp_bcd_reg <= 16'h3820;  // 3.820 V
+        9'd383: amp_bcd_reg <= 16'h3830;  // 3.830 V
+        9'd384: amp_bcd_reg <= 16'h3840;  // 3.840 V
+        9'd385: amp_bcd_reg <= 16'h3850;  // 3.850 V
+        9'd386: amp_bcd_reg <= 16'h3860;  // 3.860 V
+        9'd387: amp_bcd_reg <= 16'h3870;  // 3.870 V
+        9'd388: amp_bcd_reg <= 16'h3880;  // 3.880 V
+        9'd389: amp_bcd_reg <= 16'h3890;  // 3.890 V
+        9'd390: amp_bcd_reg <= 16'h3900;  // 3.900 V
+        9'd391: amp_bcd_reg <= 16'h3910;  // 3.910 V
+        9'd392: amp_bcd_reg <= 16'h3920;  // 3.920 V
+        9'd393: amp_bcd_reg <= 16'h3930;  // 3.930 V
+        9'd394: amp_bcd_reg <= 16'h3940;  // 3.940 V
+        9'd395: amp_bcd_reg <= 16'h3950;  // 3.950 V
+        9'd396: amp_bcd_reg <= 16'h3960;  // 3.960 V
+        9'd397: amp_bcd_reg <= 16'h3970;  // 3.970 V
+        9'd398: amp_bcd_reg <= 16'h3980;  // 3.980 V
+        9'd399: amp_bcd_reg <= 16'h3990;  // 3.990 V
+        9'd400: amp_bcd_reg <= 16'h4000;  // 4.000 V
+        9'd401: amp_bcd_reg <= 16'h4010;  // 4.010 V
+        9'd402: amp_bcd_reg <= 16'h4020;  // 4.020 V
+        9'd403: amp_bcd_reg <= 16'h4030;  // 4.030 V
+        9'd404: amp_bcd_reg <= 16'h4040;  // 4.040 V
+        9'd405: amp_bcd_reg <= 16'h4050;  // 4.050 V
+        9'd406: amp_bcd_reg <= 16'h4060;  // 4.060 V
+        9'd407: amp_bcd_reg <= 16'h4070;  // 4.070 V
+        9'd408: amp_bcd_reg <= 16'h4080;  // 4.080 V
+        9'd409: amp_bcd_reg <= 16'h4090;  // 4.090 V
+        9'd410: amp_bcd_reg <= 16'h4100;  // 4.100 V
+        9'd411: amp_bcd_reg <= 16'h4110;  // 4.110 V
+        9'd412: amp_bcd_reg <= 16'h4120;  // 4.120 V
+        9'd413: amp_bcd_reg <= 16'h4130;  // 4.130 V
+        9'd414: amp_bcd_reg <= 16'h4140;  // 4.140 V
+        9'd415: amp_bcd_reg <= 16'h4150;  // 4.150 V
+        9'd416: amp_bcd_reg <= 16'h4160;  // 4.160 V
+        9'd417: amp_bcd_reg <= 16'h4170;  // 4.170 V
+        9'd418: amp_bcd_reg <= 16'h4180;  // 4.180 V
+        9'd419: amp_bcd_reg <= 16'h4190;  // 4.190 V
+        9'd420: amp_bcd_reg <= 16'h4200;  // 4.200 V
+        9'd421: amp_bcd_reg <= 16'h4210;  // 4.210 V
+        9'd422: amp_bcd_reg <= 16'h4220;  // 4.220 V
+        9'd423: amp_bcd_reg <= 16'h4230;  // 4.230 V
+        9'd424: amp_bcd_reg <= 16'h4240;  // 4.240 V
+        9'd425: amp_bcd_reg <= 16'h4250;  // 4.250 V
+        9'd426: amp_bcd_reg <= 16'h4260;  // 4.260 V
+        9'd427: amp_bcd_reg <= 16'h4270;  // 4.270 V
+        9'd428: amp_bcd_reg <= 16'h4280;  // 4.280 V
+        9'd429: amp_bcd_reg <= 16'h4290;  // 4.290 V
+        9'd430: amp_bcd_reg <= 16'h4300;  // 4.300 V
+        9'd431: amp_bcd_reg <= 16'h4310;  // 4.310 V
+        9'd432: amp_bcd_reg <= 16'h4320;  // 4.320 V
+        9'd433: amp_bcd_reg <= 16'h4330;  // 4.330 V
+        9'd434: amp_bcd_reg <= 16'h4340;  // 4.340 V
+        9'd435: amp_bcd_reg <= 16'h4350;  // 4.350 V
+        9'd436: amp_bcd_reg <= 16'h4360;  // 4.360 V
+        9'd437: amp_bcd_reg <= 16'h4370;  // 4.370 V
+        9'd438: amp_bcd_reg <= 16'h4380;  // 4.380 V
+        9'd439: amp_bcd_reg <= 16'h4390;  // 4.390 V
+        9'd440: amp_bcd_reg <= 16'h4400;  // 4.400 V
+        9'd441: amp_bcd_reg <= 16'h4410;  // 4.410 V
+        9'd442: amp_bcd_reg <= 16'h4420;  // 4.420 V
+        9'd443: amp_bcd_reg <= 16'h4430;  // 4.430 V
+        9'd444: amp_bcd_reg <= 16'h4440;  // 4.440 V
+        9'd445: amp_bcd_reg <= 16'h4450;  // 4.450 V
+        9'd446: amp_bcd_reg <= 16'h4460;  // 4.460 V
+        9'd447: amp_bcd_reg <= 16'h4470;  // 4.470 V
+        9'd448: amp_bcd_reg <= 16'h4480;  // 4.480 V
+        9'd449: amp_bcd_reg <= 16'h4490;  // 4.490 V
+        9'd450: amp_bcd_reg <= 16'h4500;  // 4.500 V
+        9'd451: amp_bcd_reg <= 16'h4510;  // 4.510 V
+        9'd452: amp_bcd_reg <= 16'h4520;  // 4.520 V
+        9'd453: amp_bcd_reg <= 16'h4530;  // 4.530 V
+        9'd454: amp_bcd_reg <= 16'h4540;  // 4.540 V
+        9'd455: amp_bcd_reg <= 16'h4550;  // 4.550 V
+        9'd456: amp_bcd_reg <= 16'h4560;  // 4.560 V
+        9'd457: amp_bcd_reg <= 16'h4570;  // 4.570 V
+        9'd458: amp_bcd_reg <= 16'h4580;  // 4.580 V
+        9'd459: amp_bcd_reg <= 16'h4590;  // 4.590 V
+        9'd460: amp_bcd_reg <= 16'h4600;  // 4.600 V
+        9'd461: amp_bcd_reg <= 16'h4610;  // 4.610 V
+        9'd462: amp_bcd_reg <= 16'h4620;  // 4.620 V
+        9'd463: amp_bcd_reg <= 16'h4630;  // 4.630 V
+        9'd464: amp_bcd_reg <= 16'h4640;  // 4.640 V
+        9'd465: amp_bcd_reg <= 16'h4650;  // 4.650 V
+        9'd466: amp_bcd_reg <= 16'h4660;  // 4.660 V
+        9'd467: amp_bcd_reg <= 16'h4670;  // 4.670 V
+        9'd468: amp_bcd_reg <= 16'h4680;  // 4.680 V
+        9'd469: amp_bcd_reg <= 16'h4690;  // 4.690 V
+        9'd470: amp_bcd_reg <= 16'h4700;  // 4.700 V
+        9'd471: amp_bcd_reg <= 16'h4710;  // 4.710 V
+        9'd472: amp_bcd_reg <= 16'h4720;  // 4.720 V
+        9'd473: amp_bcd_reg <= 16'h4730;  // 4.730 V
+        9'd474: amp_bcd_reg <= 16'h4740;  // 4.740 V
+        9'd475: amp_bcd_reg <= 16'h4750;  // 4.750 V
+        9'd476: amp_bcd_reg <= 16'h4760;  // 4.760 V
+        9'd477: amp_bcd_reg <= 16'h4770;  // 4.770 V
+        9'd478: amp_bcd_reg <= 16'h4780;  // 4.780 V
+        9'd479: amp_bcd_reg <= 16'h4790;  // 4.790 V
+        9'd480: amp_bcd_reg <= 16'h4800;  // 4.800 V
+        9'd481: amp_bcd_reg <= 16'h4810;  // 4.810 V
+        9'd482: amp_bcd_reg <= 16'h4820;  // 4.820 V
+        9'd483: amp_bcd_reg <= 16'h4830;  // 4.830 V
+        9'd484: amp_bcd_reg <= 16'h4840;  // 4.840 V
+        9'd485: amp_bcd_reg <= 16'h4850;  // 4.850 V
+        9'd486: amp_bcd_reg <= 16'h4860;  // 4.860 V
+        9'd487: amp_bcd_reg <= 16'h4870;  // 4.870 V
+        9'd488: amp_bcd_reg <= 16'h4880;  // 4.880 V
+        9'd489: amp_bcd_reg <= 16'h4890;  // 4.890 V
+        9'd490: amp_bcd_reg <= 16'h4900;  // 4.900 V
+        9'd491: amp_bcd_reg <= 16'h4910;  // 4.910 V
+        9'd492: amp_bcd_reg <= 16'h4920;  // 4.920 V
+        9'd493: amp_bcd_reg <= 16'h4930;  // 4.930 V
+        9'd494: amp_bcd_reg <= 16'h4940;  // 4.940 V
+        9'd495: amp_bcd_reg <= 16'h4950;  // 4.950 V
+        9'd496: amp_bcd_reg <= 16'h4960;  // 4.960 V
+        9'd497: amp_bcd_reg <= 16'h4970;  // 4.970 V
+        9'd498: amp_bcd_reg <= 16'h4980;  // 4.980 V
+        9'd499: amp_bcd_reg <= 16'h4990;  // 4.990 V
+        9'd500: amp_bcd_reg <= 16'h5000;  // 5.000 V
+        default: amp_bcd_reg <= 16'h5000;
+    endcase
 end
 assign amp_bcd = amp_bcd_reg;
 
 //=============================================================================
-// 占空比/THD BCD查找表（ROM）
-// 每10为一个条目，共101个 (0-1000 = 0-100.0%)
+// 占空比/THD 0-1000 = 0-100.0% (0.1%步进), 显示 XXX.X %
+// 1001个条目 × 16位, DRM数组
 //=============================================================================
-reg [15:0] duty_bcd_rom [0:100];
+wire [9:0] duty_sat = (duty_in > 16'd1000) ? 10'd1000 : duty_in[9:0];  // 超范围显示最大值
+wire [9:0] duty_addr = duty_sat[9:0];
+
+reg [15:0] duty_rom [0:1023];
+reg [15:0] duty_bcd_reg;
 
 initial begin
-    duty_bcd_rom[0]   = 16'h0000;  duty_bcd_rom[1]   = 16'h0001;
-    duty_bcd_rom[2]   = 16'h0002;  duty_bcd_rom[3]   = 16'h0003;
-    duty_bcd_rom[4]   = 16'h0004;  duty_bcd_rom[5]   = 16'h0005;
-    duty_bcd_rom[6]   = 16'h0006;  duty_bcd_rom[7]   = 16'h0007;
-    duty_bcd_rom[8]   = 16'h0008;  duty_bcd_rom[9]   = 16'h0009;
-    duty_bcd_rom[10]  = 16'h0010;  duty_bcd_rom[11]  = 16'h0011;
-    duty_bcd_rom[12]  = 16'h0012;  duty_bcd_rom[13]  = 16'h0013;
-    duty_bcd_rom[14]  = 16'h0014;  duty_bcd_rom[15]  = 16'h0015;
-    duty_bcd_rom[16]  = 16'h0016;  duty_bcd_rom[17]  = 16'h0017;
-    duty_bcd_rom[18]  = 16'h0018;  duty_bcd_rom[19]  = 16'h0019;
-    duty_bcd_rom[20]  = 16'h0020;  duty_bcd_rom[21]  = 16'h0021;
-    duty_bcd_rom[22]  = 16'h0022;  duty_bcd_rom[23]  = 16'h0023;
-    duty_bcd_rom[24]  = 16'h0024;  duty_bcd_rom[25]  = 16'h0025;
-    duty_bcd_rom[26]  = 16'h0026;  duty_bcd_rom[27]  = 16'h0027;
-    duty_bcd_rom[28]  = 16'h0028;  duty_bcd_rom[29]  = 16'h0029;
-    duty_bcd_rom[30]  = 16'h0030;  duty_bcd_rom[31]  = 16'h0031;
-    duty_bcd_rom[32]  = 16'h0032;  duty_bcd_rom[33]  = 16'h0033;
-    duty_bcd_rom[34]  = 16'h0034;  duty_bcd_rom[35]  = 16'h0035;
-    duty_bcd_rom[36]  = 16'h0036;  duty_bcd_rom[37]  = 16'h0037;
-    duty_bcd_rom[38]  = 16'h0038;  duty_bcd_rom[39]  = 16'h0039;
-    duty_bcd_rom[40]  = 16'h0040;  duty_bcd_rom[41]  = 16'h0041;
-    duty_bcd_rom[42]  = 16'h0042;  duty_bcd_rom[43]  = 16'h0043;
-    duty_bcd_rom[44]  = 16'h0044;  duty_bcd_rom[45]  = 16'h0045;
-    duty_bcd_rom[46]  = 16'h0046;  duty_bcd_rom[47]  = 16'h0047;
-    duty_bcd_rom[48]  = 16'h0048;  duty_bcd_rom[49]  = 16'h0049;
-    duty_bcd_rom[50]  = 16'h0050;  duty_bcd_rom[51]  = 16'h0051;
-    duty_bcd_rom[52]  = 16'h0052;  duty_bcd_rom[53]  = 16'h0053;
-    duty_bcd_rom[54]  = 16'h0054;  duty_bcd_rom[55]  = 16'h0055;
-    duty_bcd_rom[56]  = 16'h0056;  duty_bcd_rom[57]  = 16'h0057;
-    duty_bcd_rom[58]  = 16'h0058;  duty_bcd_rom[59]  = 16'h0059;
-    duty_bcd_rom[60]  = 16'h0060;  duty_bcd_rom[61]  = 16'h0061;
-    duty_bcd_rom[62]  = 16'h0062;  duty_bcd_rom[63]  = 16'h0063;
-    duty_bcd_rom[64]  = 16'h0064;  duty_bcd_rom[65]  = 16'h0065;
-    duty_bcd_rom[66]  = 16'h0066;  duty_bcd_rom[67]  = 16'h0067;
-    duty_bcd_rom[68]  = 16'h0068;  duty_bcd_rom[69]  = 16'h0069;
-    duty_bcd_rom[70]  = 16'h0070;  duty_bcd_rom[71]  = 16'h0071;
-    duty_bcd_rom[72]  = 16'h0072;  duty_bcd_rom[73]  = 16'h0073;
-    duty_bcd_rom[74]  = 16'h0074;  duty_bcd_rom[75]  = 16'h0075;
-    duty_bcd_rom[76]  = 16'h0076;  duty_bcd_rom[77]  = 16'h0077;
-    duty_bcd_rom[78]  = 16'h0078;  duty_bcd_rom[79]  = 16'h0079;
-    duty_bcd_rom[80]  = 16'h0080;  duty_bcd_rom[81]  = 16'h0081;
-    duty_bcd_rom[82]  = 16'h0082;  duty_bcd_rom[83]  = 16'h0083;
-    duty_bcd_rom[84]  = 16'h0084;  duty_bcd_rom[85]  = 16'h0085;
-    duty_bcd_rom[86]  = 16'h0086;  duty_bcd_rom[87]  = 16'h0087;
-    duty_bcd_rom[88]  = 16'h0088;  duty_bcd_rom[89]  = 16'h0089;
-    duty_bcd_rom[90]  = 16'h0090;  duty_bcd_rom[91]  = 16'h0091;
-    duty_bcd_rom[92]  = 16'h0092;  duty_bcd_rom[93]  = 16'h0093;
-    duty_bcd_rom[94]  = 16'h0094;  duty_bcd_rom[95]  = 16'h0095;
-    duty_bcd_rom[96]  = 16'h0096;  duty_bcd_rom[97]  = 16'h0097;
-    duty_bcd_rom[98]  = 16'h0098;  duty_bcd_rom[99]  = 16'h0099;
-    duty_bcd_rom[100] = 16'h0100;
+    $readmemh(DUTY_ROM_FILE, duty_rom);
 end
 
-// ROM读取：输入除以10作为地址（使用右移近似）
-wire [6:0] duty_addr;
-assign duty_addr = duty_in[15:3];  // 右移3位 ≈ 除以8 (需要校准)
-
-// 更精确方案：duty_in / 10 ≈ (duty_in >> 3) + (duty_in >> 6)
-// 但增加组合逻辑，暂不采用
-
-reg [15:0] duty_bcd_reg;
 always @(posedge clk) begin
-    if (duty_addr <= 7'd100)
-        duty_bcd_reg <= duty_bcd_rom[duty_addr];
-    else
-        duty_bcd_reg <= 16'h0100;  // 超范围显示100%
+    duty_bcd_reg <= duty_rom[duty_addr];
 end
 assign duty_bcd = duty_bcd_reg;
 
@@ -1,9 +1,10 @@
 //=============================================================================
 // 文件名: cordic_atan2.v
 // 描述: 高精度CORDIC算法实现atan2(y, x)
-// 算法: CORDIC旋转模式（16次迭代）
-// 精度: ±0.01° (输出范围：-1800 ~ +1800，表示 -180.0° ~ +180.0°)
-// 延迟: 18个时钟周期（2周期预处理 + 16次迭代）
+// 算法: CORDIC向量模式（14次迭代）
+// 精度: ±0.07° (|输入| ≥ 1024; 输出范围：-1800 ~ +1800，表示 -180.0° ~ +180.0°)
+//       小幅度输入误差变大, 见 scripts/cordic_atan2_model.py 按幅度的误差统计
+// 延迟: 17个时钟周期（2周期预处理 + 14次迭代 + 1周期输出）
 // 资源: 纯组合逻辑 + 流水线寄存器（无乘法器，仅移位和加法）
 //
 // 原理:
@@ -23,7 +24,7 @@
 module cordic_atan2 #(
     parameter WIDTH = 16,           // 输入数据位宽
     parameter ANGLE_WIDTH = 16,     // 角度位宽（输出-1800~+1800，需要带符号16位）
-    parameter ITERATIONS = 16       // 迭代次数（16次可达0.01°精度）
+    parameter ITERATIONS = 14       // 迭代次数（1~16；14次误差最小，再多受角度表舍入限制）
 )(
     input  wire                         clk,
     input  wire                         rst_n,
@@ -39,57 +40,73 @@ module cordic_atan2 #(
 );
 
 //=============================================================================
-// CORDIC角度查找表（arctan(2^-i) * 10，单位0.1°）
-// 预计算值，避免除法和三角函数
+// 内部位宽
+//   x/y 高位扩展 GUARD 位: CORDIC增益 1.647 × 满量程对角 √2 ≈ 2.33，需多2位
+//   x/y 低位扩展 XY_FRAC 位小数: 减小每级右移的截断误差（小幅度输入时是主要误差）
+//   z   扩展 FRAC 位小数: 内部角度单位 0.1°/16，输出前四舍五入到0.1°
+//       (若按0.1°直接累加，16项表的舍入误差累积可达±0.4°)
+//=============================================================================
+localparam GUARD    = 2;
+localparam XY_FRAC  = 4;
+localparam FRAC     = 4;
+localparam XY_WIDTH = WIDTH + GUARD + XY_FRAC;
+localparam Z_WIDTH  = ANGLE_WIDTH + FRAC;
+
+localparam signed [Z_WIDTH-1:0] Z_90    = 900 * (1 << FRAC);
+localparam signed [Z_WIDTH-1:0] Z_ROUND = 1 << (FRAC - 1);
+
 //=============================================================================
-// arctan(2^0)  = 45.0°   → 450
-// arctan(2^-1) = 26.565° → 265.65 → 266
-// arctan(2^-2) = 14.036° → 140.36 → 140
-// ... 依此类推
-reg signed [ANGLE_WIDTH-1:0] atan_table [0:15];
+// CORDIC角度查找表（arctan(2^-i) * 10 * 16，单位0.1°/16）
+// 预计算值，避免除法和三角函数 (scripts/cordic_atan2_model.py 核对)
+//=============================================================================
+reg signed [Z_WIDTH-1:0] atan_table [0:15];
 
 initial begin
-    atan_table[0]  = 16'sd450;  // arctan(1)      = 45.000°
-    atan_table[1]  = 16'sd266;  // arctan(0.5)    = 26.565°
-    atan_table[2]  = 16'sd140;  // arctan(0.25)   = 14.036°
-    atan_table[3]  = 16'sd71;   // arctan(0.125)  = 7.125°
-    atan_table[4]  = 16'sd36;   // arctan(1/16)   = 3.576°
-    atan_table[5]  = 16'sd18;   // arctan(1/32)   = 1.790°
-    atan_table[6]  = 16'sd9;    // arctan(1/64)   = 0.895°
-    atan_table[7]  = 16'sd4;    // arctan(1/128)  = 0.448°
-    atan_table[8]  = 16'sd2;    // arctan(1/256)  = 0.224°
-    atan_table[9]  = 16'sd1;    // arctan(1/512)  = 0.112°
-    atan_table[10] = 16'sd1;    // arctan(1/1024) = 0.056° → 四舍五入为0.1°
-    atan_table[11] = 16'sd0;    // arctan(1/2048) = 0.028° → 0
-    atan_table[12] = 16'sd0;    // arctan(1/4096) = 0.014° → 0
-    atan_table[13] = 16'sd0;    // 后续迭代对0.1°精度贡献小
-    atan_table[14] = 16'sd0;
-    atan_table[15] = 16'sd0;
+    atan_table[0]  = 7200;  // arctan(1)      = 45.000°
+    atan_table[1]  = 4250;  // arctan(0.5)    = 26.565°
+    atan_table[2]  = 2246;  // arctan(0.25)   = 14.036°
+    atan_table[3]  = 1140;  // arctan(0.125)  = 7.125°
+    atan_table[4]  = 572;   // arctan(1/16)   = 3.576°
+    atan_table[5]  = 286;   // arctan(1/32)   = 1.790°
+    atan_table[6]  = 143;   // arctan(1/64)   = 0.895°
+    atan_table[7]  = 72;    // arctan(1/128)  = 0.448°
+    atan_table[8]  = 36;    // arctan(1/256)  = 0.224°
+    atan_table[9]  = 18;    // arctan(1/512)  = 0.112°
+    atan_table[10] = 9;     // arctan(1/1024) = 0.056°
+    atan_table[11] = 4;     // arctan(1/2048) = 0.028°
+    atan_table[12] = 2;     // arctan(1/4096) = 0.014°
+    atan_table[13] = 1;     // arctan(1/8192) = 0.007°
+    atan_table[14] = 1;     // arctan(1/16384)= 0.0035°
+    atan_table[15] = 0;     // 后续迭代低于内部角度分辨率
 end
 
 //=============================================================================
 // 流水线寄存器
 //=============================================================================
 // 阶段0：输入预处理（象限判断）
-reg signed [WIDTH-1:0]      x_stage0, y_stage0;
-reg signed [ANGLE_WIDTH-1:0] z_stage0;  // 初始角度偏移
+reg signed [XY_WIDTH-1:0]   x_stage0, y_stage0;
+reg signed [Z_WIDTH-1:0]    z_stage0;  // 初始角度偏移
 reg                         valid_stage0;
 reg [1:0]                   quadrant;   // 象限标志
 
 // 阶段1-16：CORDIC迭代
-reg signed [WIDTH-1:0]      x_stage [0:ITERATIONS];
-reg signed [WIDTH-1:0]      y_stage [0:ITERATIONS];
-reg signed [ANGLE_WIDTH-1:0] z_stage [0:ITERATIONS];
+reg signed [XY_WIDTH-1:0]   x_stage [0:ITERATIONS];
+reg signed [XY_WIDTH-1:0]   y_stage [0:ITERATIONS];
+reg signed [Z_WIDTH-1:0]    z_stage [0:ITERATIONS];
 reg                         valid_stage [0:ITERATIONS];
 
+// 输入扩展到XY_WIDTH位（低位补XY_FRAC个0）
+wire signed [XY_WIDTH-1:0]  x_ext = x_in <<< XY_FRAC;
+wire signed [XY_WIDTH-1:0]  y_ext = y_in <<< XY_FRAC;
+
 // 临时变量（组合逻辑）
-wire signed [WIDTH-1:0]     x_shifted [0:ITERATIONS-1];
-wire signed [WIDTH-1:0]     y_shifted [0:ITERATIONS-1];
+wire signed [XY_WIDTH-1:0]  x_shifted [0:ITERATIONS-1];
+wire signed [XY_WIDTH-1:0]  y_shifted [0:ITERATIONS-1];
 wire                        d_sign [0:ITERATIONS-1];
 
 //=============================================================================
 // 阶段0：输入预处理 - 象限判断和坐标转换
-// 目的：将所有输入转换到第一象限（x>0, y>0），便于CORDIC收敛
+// 目的：将左半平面的输入旋转±90°到右半平面（x>=0），CORDIC只在±99.9°内收敛
 //=============================================================================
 always @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
@@ -101,30 +118,30 @@ always @(posedge clk or negedge rst_n) begin
     end else if (valid_in) begin
         valid_stage0 <= 1'b1;
         
-        // 判断象限并转换坐标
+        // 判断象限并转换坐标（在XY_WIDTH位宽下取反，-32768不会溢出）
         case ({x_in[WIDTH-1], y_in[WIDTH-1]})  // {x符号位, y符号位}
-            2'b00: begin  // 第一象限 (x>0, y>0)
-                x_stage0 <= x_in;
-                y_stage0 <= y_in;
-                z_stage0 <= 16'sd0;      // 初始角度0°
+            2'b00: begin  // 第一象限 (x>=0, y>=0)
+                x_stage0 <= x_ext;
+                y_stage0 <= y_ext;
+                z_stage0 <= 0;           // 初始角度0°
                 quadrant <= 2'd0;
             end
-            2'b01: begin  // 第四象限 (x>0, y<0)
-                x_stage0 <= x_in;
-                y_stage0 <= y_in;        // 保持负数，CORDIC会处理
-                z_stage0 <= 16'sd0;
+            2'b01: begin  // 第四象限 (x>=0, y<0)
+                x_stage0 <= x_ext;
+                y_stage0 <= y_ext;       // 保持负数，CORDIC会处理
+                z_stage0 <= 0;
                 quadrant <= 2'd3;
             end
-            2'b10: begin  // 第二象限 (x<0, y>0)
-                x_stage0 <= -y_in;       // 旋转90°：(x,y) → (y,-x)
-                y_stage0 <= x_in;        // 然后再旋转到第一象限
-                z_stage0 <= 16'sd900;    // 初始角度90°
+            2'b10: begin  // 第二象限 (x<0, y>=0)
+                x_stage0 <= y_ext;       // 顺时针旋转90°：(x,y) → (y,-x)
+                y_stage0 <= -x_ext;
+                z_stage0 <= Z_90;        // 初始角度+90°
                 quadrant <= 2'd1;
             end
             2'b11: begin  // 第三象限 (x<0, y<0)
-                x_stage0 <= -x_in;       // 取反进入第一象限
-                y_stage0 <= -y_in;
-                z_stage0 <= -16'sd1800;  // 初始角度-180°（后续会调整）
+                x_stage0 <= -y_ext;      // 逆时针旋转90°：(x,y) → (-y,x)
+                y_stage0 <= x_ext;
+                z_stage0 <= -Z_90;       // 初始角度-90°
                 quadrant <= 2'd2;
             end
         endcase
@@ -152,14 +169,14 @@ end
 
 //=============================================================================
 // CORDIC迭代核心（组合逻辑 + 流水线寄存器）
-// 每次迭代旋转角度：arctan(2^-i)
+// 向量模式：每次迭代把向量向x轴旋转arctan(2^-i)，z累加已旋转的角度
 //=============================================================================
 genvar i;
 generate
     for (i = 0; i < ITERATIONS; i = i + 1) begin : cordic_iteration
         
         // 组合逻辑：计算下一次迭代的值
-        assign d_sign[i] = y_stage[i][WIDTH-1];  // y的符号位：1=负数，0=正数
+        assign d_sign[i] = y_stage[i][XY_WIDTH-1];  // y的符号位：1=负数，0=正数
         
         // 右移实现除以2^i
         assign x_shifted[i] = y_stage[i] >>> i;  // 算术右移保留符号
@@ -175,13 +192,13 @@ generate
             end else begin
                 // CORDIC迭代公式
                 if (d_sign[i]) begin  // y < 0，逆时针旋转
-                    x_stage[i+1] <= x_stage[i] + x_shifted[i];
+                    x_stage[i+1] <= x_stage[i] - x_shifted[i];
                     y_stage[i+1] <= y_stage[i] + y_shifted[i];
-                    z_stage[i+1] <= z_stage[i] + atan_table[i];
+                    z_stage[i+1] <= z_stage[i] - atan_table[i];
                 end else begin        // y >= 0，顺时针旋转
-                    x_stage[i+1] <= x_stage[i] - x_shifted[i];
+                    x_stage[i+1] <= x_stage[i] + x_shifted[i];
                     y_stage[i+1] <= y_stage[i] - y_shifted[i];
-                    z_stage[i+1] <= z_stage[i] - atan_table[i];
+                    z_stage[i+1] <= z_stage[i] + atan_table[i];
                 end
                 
                 valid_stage[i+1] <= valid_stage[i];
@@ -191,8 +208,11 @@ generate
 endgenerate
 
 //=============================================================================
-// 输出阶段：角度范围调整到 -180° ~ +180°
+// 输出阶段：四舍五入到0.1°，角度范围调整到 -180° ~ +180°
 //=============================================================================
+wire signed [Z_WIDTH-1:0] z_round = z_stage[ITERATIONS] + Z_ROUND;
+wire signed [Z_WIDTH-1:0] z_final = z_round >>> FRAC;
+
 always @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
         angle_out <= 16'sd0;
@@ -201,16 +221,13 @@ always @(posedge clk or negedge rst_n) begin
         valid_out <= valid_stage[ITERATIONS];
         
         if (valid_stage[ITERATIONS]) begin
-            // z_stage[ITERATIONS] 已经是最终角度
-            angle_out <= z_stage[ITERATIONS];
-            
             // 边界处理：确保在 -1800 ~ +1800 范围内
-            if (z_stage[ITERATIONS] > 16'sd1800) begin
-                angle_out <= z_stage[ITERATIONS] - 16'sd3600;
-            end else if (z_stage[ITERATIONS] < -16'sd1800) begin
-                angle_out <= z_stage[ITERATIONS] + 16'sd3600;
+            if (z_final > 1800) begin
+                angle_out <= z_final - 3600;
+            end else if (z_final < -1800) begin
+                angle_out <= z_final + 3600;
             end else begin
-                angle_out <= z_stage[ITERATIONS];
+                angle_out <= z_final;
             end
         end
     end
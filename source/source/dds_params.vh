@@ -0,0 +1,25 @@
+//=============================================================================
+// 文件名: dds_params.vh
+// 功能: DDS参考表与调谐字参数 (时钟 35000000 Hz)
+// 自动生成: scripts/generate_dds_table.py, 请勿手动修改
+// 使用: `include "dds_params.vh"
+//=============================================================================
+
+`ifndef DDS_PARAMS_VH
+`define DDS_PARAMS_VH
+
+`define DDS_ADDR_BITS               12
+`define DDS_AMP_WIDTH               11
+`define DDS_QUARTER_WAVE            1
+`define DDS_CLK_HZ                  35000000
+`define DDS_TW_MULT                 31'd2058788401
+`define DDS_TW_SHIFT                24
+`define DDS_TW_PRODUCT_WIDTH        56
+
+// ref_freq_tuning = (ref_hz * DDS_TW_MULT + 2^(DDS_TW_SHIFT-1)) >> DDS_TW_SHIFT
+//   ≈ ref_hz * 2^32 / 35000000, 0~17500000 Hz 每100Hz穷举 (175001 点),
+//   与理想值最大偏差 0.587 LSB (4.78 mHz)
+// 正弦表: 2^12 点/周期, 11 位幅度, 1/4周期对称存储 (1024 项, 10240 位)
+//   最坏SFDR 72.2 dBc (幅度量化 73.3, 相位截断 72.2), 锁相噪底抬升 1.52e-06 dB
+
+`endif
@@ -0,0 +1,1062 @@
+//=============================================================================
+// 文件名: dds_sin_lut.vh
+// 功能: DDS正弦/余弦表 (2^12点/周期, 11位幅度, 1/4周期对称存储)
+// 自动生成: scripts/generate_dds_table.py, 请勿手动修改
+// 使用: 在模块内部 `include "dds_sin_lut.vh" (需先 `include "dds_params.vh")
+//
+// 表项 = round(1023 * sin(2*pi*(i+0.5)/4096)), 相位偏移半个地址
+// 输出为16位有符号数 (Q15, 低5位补0)
+//=============================================================================
+
+function [9:0] dds_sin_rom;
+    input [9:0] idx;
+    begin
+        case (idx)
+            10'd0: dds_sin_rom = 10'h001;
+            10'd1: dds_sin_rom = 10'h002;
+            10'd2: dds_sin_rom = 10'h004;
+            10'd3: dds_sin_rom = 10'h005;
+            10'd4: dds_sin_rom = 10'h007;
+            10'd5: dds_sin_rom = 10'h009;
+            10'd6: dds_sin_rom = 10'h00A;
+            10'd7: dds_sin_rom = 10'h00C;
+            10'd8: dds_sin_rom = 10'h00D;
+            10'd9: dds_sin_rom = 10'h00F;
+            10'd10: dds_sin_rom = 10'h010;
+            10'd11: dds_sin_rom = 10'h012;
+            10'd12: dds_sin_rom = 10'h014;
+            10'd13: dds_sin_rom = 10'h015;
+            10'd14: dds_sin_rom = 10'h017;
+            10'd15: dds_sin_rom = 10'h018;
+            10'd16: dds_sin_rom = 10'h01A;
+            10'd17: dds_sin_rom = 10'h01B;
+            10'd18: dds_sin_rom = 10'h01D;
+            10'd19: dds_sin_rom = 10'h01F;
+            10'd20: dds_sin_rom = 10'h020;
+            10'd21: dds_sin_rom = 10'h022;
+            10'd22: dds_sin_rom = 10'h023;
+            10'd23: dds_sin_rom = 10'h025;
+            10'd24: dds_sin_rom = 10'h026;
+            10'd25: dds_sin_rom = 10'h028;
+            10'd26: dds_sin_rom = 10'h02A;
+            10'd27: dds_sin_rom = 10'h02B;
+            10'd28: dds_sin_rom = 10'h02D;
+            10'd29: dds_sin_rom = 10'h02E;
+            10'd30: dds_sin_rom = 10'h030;
+            10'd31: dds_sin_rom = 10'h031;
+            10'd32: dds_sin_rom = 10'h033;
+            10'd33: dds_sin_rom = 10'h035;
+            10'd34: dds_sin_rom = 10'h036;
+            10'd35: dds_sin_rom = 10'h038;
+            10'd36: dds_sin_rom = 10'h039;
+            10'd37: dds_sin_rom = 10'h03B;
+            10'd38: dds_sin_rom = 10'h03C;
+            10'd39: dds_sin_rom = 10'h03E;
+            10'd40: dds_sin_rom = 10'h040;
+            10'd41: dds_sin_rom = 10'h041;
+            10'd42: dds_sin_rom = 10'h043;
+            10'd43: dds_sin_rom = 10'h044;
+            10'd44: dds_sin_rom = 10'h046;
+            10'd45: dds_sin_rom = 10'h047;
+            10'd46: dds_sin_rom = 10'h049;
+            10'd47: dds_sin_rom = 10'h04A;
+            10'd48: dds_sin_rom = 10'h04C;
+            10'd49: dds_sin_rom = 10'h04E;
+            10'd50: dds_sin_rom = 10'h04F;
+            10'd51: dds_sin_rom = 10'h051;
+            10'd52: dds_sin_rom = 10'h052;
+            10'd53: dds_sin_rom = 10'h054;
+            10'd54: dds_sin_rom = 10'h055;
+            10'd55: dds_sin_rom = 10'h057;
+            10'd56: dds_sin_rom = 10'h059;
+            10'd57: dds_sin_rom = 10'h05A;
+            10'd58: dds_sin_rom = 10'h05C;
+            10'd59: dds_sin_rom = 10'h05D;
+            10'd60: dds_sin_rom = 10'h05F;
+            10'd61: dds_sin_rom = 10'h060;
+            10'd62: dds_sin_rom = 10'h062;
+            10'd63: dds_sin_rom = 10'h063;
+            10'd64: dds_sin_rom = 10'h065;
+            10'd65: dds_sin_rom = 10'h067;
+            10'd66: dds_sin_rom = 10'h068;
+            10'd67: dds_sin_rom = 10'h06A;
+            10'd68: dds_sin_rom = 10'h06B;
+            10'd69: dds_sin_rom = 10'h06D;
+            10'd70: dds_sin_rom = 10'h06E;
+            10'd71: dds_sin_rom = 10'h070;
+            10'd72: dds_sin_rom = 10'h072;
+            10'd73: dds_sin_rom = 10'h073;
+            10'd74: dds_sin_rom = 10'h075;
+            10'd75: dds_sin_rom = 10'h076;
+            10'd76: dds_sin_rom = 10'h078;
+            10'd77: dds_sin_rom = 10'h079;
+            10'd78: dds_sin_rom = 10'h07B;
+            10'd79: dds_sin_rom = 10'h07C;
+            10'd80: dds_sin_rom = 10'h07E;
+            10'd81: dds_sin_rom = 10'h080;
+            10'd82: dds_sin_rom = 10'h081;
+            10'd83: dds_sin_rom = 10'h083;
+            10'd84: dds_sin_rom = 10'h084;
+            10'd85: dds_sin_rom = 10'h086;
+            10'd86: dds_sin_rom = 10'h087;
+            10'd87: dds_sin_rom = 10'h089;
+            10'd88: dds_sin_rom = 10'h08A;
+            10'd89: dds_sin_rom = 10'h08C;
+            10'd90: dds_sin_rom = 10'h08E;
+            10'd91: dds_sin_rom = 10'h08F;
+            10'd92: dds_sin_rom = 10'h091;
+            10'd93: dds_sin_rom = 10'h092;
+            10'd94: dds_sin_rom = 10'h094;
+            10'd95: dds_sin_rom = 10'h095;
+            10'd96: dds_sin_rom = 10'h097;
+            10'd97: dds_sin_rom = 10'h098;
+            10'd98: dds_sin_rom = 10'h09A;
+            10'd99: dds_sin_rom = 10'h09C;
+            10'd100: dds_sin_rom = 10'h09D;
+            10'd101: dds_sin_rom = 10'h09F;
+            10'd102: dds_sin_rom = 10'h0A0;
+            10'd103: dds_sin_rom = 10'h0A2;
+            10'd104: dds_sin_rom = 10'h0A3;
+            10'd105: dds_sin_rom = 10'h0A5;
+            10'd106: dds_sin_rom = 10'h0A6;
+            10'd107: dds_sin_rom = 10'h0A8;
+            10'd108: dds_sin_rom = 10'h0A9;
+            10'd109: dds_sin_rom = 10'h0AB;
+            10'd110: dds_sin_rom = 10'h0AD;
+            10'd111: dds_sin_rom = 10'h0AE;
+            10'd112: dds_sin_rom = 10'h0B0;
+            10'd113: dds_sin_rom = 10'h0B1;
+            10'd114: dds_sin_rom = 10'h0B3;
+            10'd115: dds_sin_rom = 10'h0B4;
+            10'd116: dds_sin_rom = 10'h0B6;
+            10'd117: dds_sin_rom = 10'h0B7;
+            10'd118: dds_sin_rom = 10'h0B9;
+            10'd119: dds_sin_rom = 10'h0BA;
+            10'd120: dds_sin_rom = 10'h0BC;
+            10'd121: dds_sin_rom = 10'h0BE;
+            10'd122: dds_sin_rom = 10'h0BF;
+            10'd123: dds_sin_rom = 10'h0C1;
+            10'd124: dds_sin_rom = 10'h0C2;
+            10'd125: dds_sin_rom = 10'h0C4;
+            10'd126: dds_sin_rom = 10'h0C5;
+            10'd127: dds_sin_rom = 10'h0C7;
+            10'd128: dds_sin_rom = 10'h0C8;
+            10'd129: dds_sin_rom = 10'h0CA;
+            10'd130: dds_sin_rom = 10'h0CB;
+            10'd131: dds_sin_rom = 10'h0CD;
+            10'd132: dds_sin_rom = 10'h0CE;
+            10'd133: dds_sin_rom = 10'h0D0;
+            10'd134: dds_sin_rom = 10'h0D2;
+            10'd135: dds_sin_rom = 10'h0D3;
+            10'd136: dds_sin_rom = 10'h0D5;
+            10'd137: dds_sin_rom = 10'h0D6;
+            10'd138: dds_sin_rom = 10'h0D8;
+            10'd139: dds_sin_rom = 10'h0D9;
+            10'd140: dds_sin_rom = 10'h0DB;
+            10'd141: dds_sin_rom = 10'h0DC;
+            10'd142: dds_sin_rom = 10'h0DE;
+            10'd143: dds_sin_rom = 10'h0DF;
+            10'd144: dds_sin_rom = 10'h0E1;
+            10'd145: dds_sin_rom = 10'h0E2;
+            10'd146: dds_sin_rom = 10'h0E4;
+            10'd147: dds_sin_rom = 10'h0E5;
+            10'd148: dds_sin_rom = 10'h0E7;
+            10'd149: dds_sin_rom = 10'h0E9;
+            10'd150: dds_sin_rom = 10'h0EA;
+            10'd151: dds_sin_rom = 10'h0EC;
+            10'd152: dds_sin_rom = 10'h0ED;
+            10'd153: dds_sin_rom = 10'h0EF;
+            10'd154: dds_sin_rom = 10'h0F0;
+            10'd155: dds_sin_rom = 10'h0F2;
+            10'd156: dds_sin_rom = 10'h0F3;
+            10'd157: dds_sin_rom = 10'h0F5;
+            10'd158: dds_sin_rom = 10'h0F6;
+            10'd159: dds_sin_rom = 10'h0F8;
+            10'd160: dds_sin_rom = 10'h0F9;
+            10'd161: dds_sin_rom = 10'h0FB;
+            10'd162: dds_sin_rom = 10'h0FC;
+            10'd163: dds_sin_rom = 10'h0FE;
+            10'd164: dds_sin_rom = 10'h0FF;
+            10'd165: dds_sin_rom = 10'h101;
+            10'd166: dds_sin_rom = 10'h102;
+            10'd167: dds_sin_rom = 10'h104;
+            10'd168: dds_sin_rom = 10'h105;
+            10'd169: dds_sin_rom = 10'h107;
+            10'd170: dds_sin_rom = 10'h109;
+            10'd171: dds_sin_rom = 10'h10A;
+            10'd172: dds_sin_rom = 10'h10C;
+            10'd173: dds_sin_rom = 10'h10D;
+            10'd174: dds_sin_rom = 10'h10F;
+            10'd175: dds_sin_rom = 10'h110;
+            10'd176: dds_sin_rom = 10'h112;
+            10'd177: dds_sin_rom = 10'h113;
+            10'd178: dds_sin_rom = 10'h115;
+            10'd179: dds_sin_rom = 10'h116;
+            10'd180: dds_sin_rom = 10'h118;
+            10'd181: dds_sin_rom = 10'h119;
+            10'd182: dds_sin_rom = 10'h11B;
+            10'd183: dds_sin_rom = 10'h11C;
+            10'd184: dds_sin_rom = 10'h11E;
+            10'd185: dds_sin_rom = 10'h11F;
+            10'd186: dds_sin_rom = 10'h121;
+            10'd187: dds_sin_rom = 10'h122;
+            10'd188: dds_sin_rom = 10'h124;
+            10'd189: dds_sin_rom = 10'h125;
+            10'd190: dds_sin_rom = 10'h127;
+            10'd191: dds_sin_rom = 10'h128;
+            10'd192: dds_sin_rom = 10'h12A;
+            10'd193: dds_sin_rom = 10'h12B;
+            10'd194: dds_sin_rom = 10'h12D;
+            10'd195: dds_sin_rom = 10'h12E;
+            10'd196: dds_sin_rom = 10'h130;
+            10'd197: dds_sin_rom = 10'h131;
+            10'd198: dds_sin_rom = 10'h133;
+            10'd199: dds_sin_rom = 10'h134;
+            10'd200: dds_sin_rom = 10'h136;
+            10'd201: dds_sin_rom = 10'h137;
+            10'd202: dds_sin_rom = 10'h139;
+            10'd203: dds_sin_rom = 10'h13A;
+            10'd204: dds_sin_rom = 10'h13C;
+            10'd205: dds_sin_rom = 10'h13D;
+            10'd206: dds_sin_rom = 10'h13F;
+            10'd207: dds_sin_rom = 10'h140;
+            10'd208: dds_sin_rom = 10'h142;
+            10'd209: dds_sin_rom = 10'h143;
+            10'd210: dds_sin_rom = 10'h145;
+            10'd211: dds_sin_rom = 10'h146;
+            10'd212: dds_sin_rom = 10'h148;
+            10'd213: dds_sin_rom = 10'h149;
+            10'd214: dds_sin_rom = 10'h14B;
+            10'd215: dds_sin_rom = 10'h14C;
+            10'd216: dds_sin_rom = 10'h14E;
+            10'd217: dds_sin_rom = 10'h14F;
+            10'd218: dds_sin_rom = 10'h150;
+            10'd219: dds_sin_rom = 10'h152;
+            10'd220: dds_sin_rom = 10'h153;
+            10'd221: dds_sin_rom = 10'h155;
+            10'd222: dds_sin_rom = 10'h156;
+            10'd223: dds_sin_rom = 10'h158;
+            10'd224: dds_sin_rom = 10'h159;
+            10'd225: dds_sin_rom = 10'h15B;
+            10'd226: dds_sin_rom = 10'h15C;
+            10'd227: dds_sin_rom = 10'h15E;
+            10'd228: dds_sin_rom = 10'h15F;
+            10'd229: dds_sin_rom = 10'h161;
+            10'd230: dds_sin_rom = 10'h162;
+            10'd231: dds_sin_rom = 10'h164;
+            10'd232: dds_sin_rom = 10'h165;
+            10'd233: dds_sin_rom = 10'h167;
+            10'd234: dds_sin_rom = 10'h168;
+            10'd235: dds_sin_rom = 10'h16A;
+            10'd236: dds_sin_rom = 10'h16B;
+            10'd237: dds_sin_rom = 10'h16D;
+            10'd238: dds_sin_rom = 10'h16E;
+            10'd239: dds_sin_rom = 10'h16F;
+            10'd240: dds_sin_rom = 10'h171;
+            10'd241: dds_sin_rom = 10'h172;
+            10'd242: dds_sin_rom = 10'h174;
+            10'd243: dds_sin_rom = 10'h175;
+            10'd244: dds_sin_rom = 10'h177;
+            10'd245: dds_sin_rom = 10'h178;
+            10'd246: dds_sin_rom = 10'h17A;
+            10'd247: dds_sin_rom = 10'h17B;
+            10'd248: dds_sin_rom = 10'h17D;
+            10'd249: dds_sin_rom = 10'h17E;
+            10'd250: dds_sin_rom = 10'h17F;
+            10'd251: dds_sin_rom = 10'h181;
+            10'd252: dds_sin_rom = 10'h182;
+            10'd253: dds_sin_rom = 10'h184;
+            10'd254: dds_sin_rom = 10'h185;
+            10'd255: dds_sin_rom = 10'h187;
+            10'd256: dds_sin_rom = 10'h188;
+            10'd257: dds_sin_rom = 10'h18A;
+            10'd258: dds_sin_rom = 10'h18B;
+            10'd259: dds_sin_rom = 10'h18D;
+            10'd260: dds_sin_rom = 10'h18E;
+            10'd261: dds_sin_rom = 10'h18F;
+            10'd262: dds_sin_rom = 10'h191;
+            10'd263: dds_sin_rom = 10'h192;
+            10'd264: dds_sin_rom = 10'h194;
+            10'd265: dds_sin_rom = 10'h195;
+            10'd266: dds_sin_rom = 10'h197;
+            10'd267: dds_sin_rom = 10'h198;
+            10'd268: dds_sin_rom = 10'h19A;
+            10'd269: dds_sin_rom = 10'h19B;
+            10'd270: dds_sin_rom = 10'h19C;
+            10'd271: dds_sin_rom = 10'h19E;
+            10'd272: dds_sin_rom = 10'h19F;
+            10'd273: dds_sin_rom = 10'h1A1;
+            10'd274: dds_sin_rom = 10'h1A2;
+            10'd275: dds_sin_rom = 10'h1A4;
+            10'd276: dds_sin_rom = 10'h1A5;
+            10'd277: dds_sin_rom = 10'h1A6;
+            10'd278: dds_sin_rom = 10'h1A8;
+            10'd279: dds_sin_rom = 10'h1A9;
+            10'd280: dds_sin_rom = 10'h1AB;
+            10'd281: dds_sin_rom = 10'h1AC;
+            10'd282: dds_sin_rom = 10'h1AE;
+            10'd283: dds_sin_rom = 10'h1AF;
+            10'd284: dds_sin_rom = 10'h1B0;
+            10'd285: dds_sin_rom = 10'h1B2;
+            10'd286: dds_sin_rom = 10'h1B3;
+            10'd287: dds_sin_rom = 10'h1B5;
+            10'd288: dds_sin_rom = 10'h1B6;
+            10'd289: dds_sin_rom = 10'h1B8;
+            10'd290: dds_sin_rom = 10'h1B9;
+            10'd291: dds_sin_rom = 10'h1BA;
+            10'd292: dds_sin_rom = 10'h1BC;
+            10'd293: dds_sin_rom = 10'h1BD;
+            10'd294: dds_sin_rom = 10'h1BF;
+            10'd295: dds_sin_rom = 10'h1C0;
+            10'd296: dds_sin_rom = 10'h1C1;
+            10'd297: dds_sin_rom = 10'h1C3;
+            10'd298: dds_sin_rom = 10'h1C4;
+            10'd299: dds_sin_rom = 10'h1C6;
+            10'd300: dds_sin_rom = 10'h1C7;
+            10'd301: dds_sin_rom = 10'h1C8;
+            10'd302: dds_sin_rom = 10'h1CA;
+            10'd303: dds_sin_rom = 10'h1CB;
+            10'd304: dds_sin_rom = 10'h1CD;
+            10'd305: dds_sin_rom = 10'h1CE;
+            10'd306: dds_sin_rom = 10'h1CF;
+            10'd307: dds_sin_rom = 10'h1D1;
+            10'd308: dds_sin_rom = 10'h1D2;
+            10'd309: dds_sin_rom = 10'h1D4;
+            10'd310: dds_sin_rom = 10'h1D5;
+            10'd311: dds_sin_rom = 10'h1D6;
+            10'd312: dds_sin_rom = 10'h1D8;
+            10'd313: dds_sin_rom = 10'h1D9;
+            10'd314: dds_sin_rom = 10'h1DB;
+            10'd315: dds_sin_rom = 10'h1DC;
+            10'd316: dds_sin_rom = 10'h1DD;
+            10'd317: dds_sin_rom = 10'h1DF;
+            10'd318: dds_sin_rom = 10'h1E0;
+            10'd319: dds_sin_rom = 10'h1E2;
+            10'd320: dds_sin_rom = 10'h1E3;
+            10'd321: dds_sin_rom = 10'h1E4;
+            10'd322: dds_sin_rom = 10'h1E6;
+            10'd323: dds_sin_rom = 10'h1E7;
+            10'd324: dds_sin_rom = 10'h1E8;
+            10'd325: dds_sin_rom = 10'h1EA;
+            10'd326: dds_sin_rom = 10'h1EB;
+            10'd327: dds_sin_rom = 10'h1ED;
+            10'd328: dds_sin_rom = 10'h1EE;
+            10'd329: dds_sin_rom = 10'h1EF;
+            10'd330: dds_sin_rom = 10'h1F1;
+            10'd331: dds_sin_rom = 10'h1F2;
+            10'd332: dds_sin_rom = 10'h1F3;
+            10'd333: dds_sin_rom = 10'h1F5;
+            10'd334: dds_sin_rom = 10'h1F6;
+            10'd335: dds_sin_rom = 10'h1F8;
+            10'd336: dds_sin_rom = 10'h1F9;
+            10'd337: dds_sin_rom = 10'h1FA;
+            10'd338: dds_sin_rom = 10'h1FC;
+            10'd339: dds_sin_rom = 10'h1FD;
+            10'd340: dds_sin_rom = 10'h1FE;
+            10'd341: dds_sin_rom = 10'h200;
+            10'd342: dds_sin_rom = 10'h201;
+            10'd343: dds_sin_rom = 10'h202;
+            10'd344: dds_sin_rom = 10'h204;
+            10'd345: dds_sin_rom = 10'h205;
+            10'd346: dds_sin_rom = 10'h207;
+            10'd347: dds_sin_rom = 10'h208;
+            10'd348: dds_sin_rom = 10'h209;
+            10'd349: dds_sin_rom = 10'h20B;
+            10'd350: dds_sin_rom = 10'h20C;
+            10'd351: dds_sin_rom = 10'h20D;
+            10'd352: dds_sin_rom = 10'h20F;
+            10'd353: dds_sin_rom = 10'h210;
+            10'd354: dds_sin_rom = 10'h211;
+            10'd355: dds_sin_rom = 10'h213;
+            10'd356: dds_sin_rom = 10'h214;
+            10'd357: dds_sin_rom = 10'h215;
+            10'd358: dds_sin_rom = 10'h217;
+            10'd359: dds_sin_rom = 10'h218;
+            10'd360: dds_sin_rom = 10'h219;
+            10'd361: dds_sin_rom = 10'h21B;
+            10'd362: dds_sin_rom = 10'h21C;
+            10'd363: dds_sin_rom = 10'h21D;
+            10'd364: dds_sin_rom = 10'h21F;
+            10'd365: dds_sin_rom = 10'h220;
+            10'd366: dds_sin_rom = 10'h221;
+            10'd367: dds_sin_rom = 10'h223;
+            10'd368: dds_sin_rom = 10'h224;
+            10'd369: dds_sin_rom = 10'h225;
+            10'd370: dds_sin_rom = 10'h227;
+            10'd371: dds_sin_rom = 10'h228;
+            10'd372: dds_sin_rom = 10'h229;
+            10'd373: dds_sin_rom = 10'h22B;
+            10'd374: dds_sin_rom = 10'h22C;
+            10'd375: dds_sin_rom = 10'h22D;
+            10'd376: dds_sin_rom = 10'h22F;
+            10'd377: dds_sin_rom = 10'h230;
+            10'd378: dds_sin_rom = 10'h231;
+            10'd379: dds_sin_rom = 10'h232;
+            10'd380: dds_sin_rom = 10'h234;
+            10'd381: dds_sin_rom = 10'h235;
+            10'd382: dds_sin_rom = 10'h236;
+            10'd383: dds_sin_rom = 10'h238;
+            10'd384: dds_sin_rom = 10'h239;
+            10'd385: dds_sin_rom = 10'h23A;
+            10'd386: dds_sin_rom = 10'h23C;
+            10'd387: dds_sin_rom = 10'h23D;
+            10'd388: dds_sin_rom = 10'h23E;
+            10'd389: dds_sin_rom = 10'h240;
+            10'd390: dds_sin_rom = 10'h241;
+            10'd391: dds_sin_rom = 10'h242;
+            10'd392: dds_sin_rom = 10'h243;
+            10'd393: dds_sin_rom = 10'h245;
+            10'd394: dds_sin_rom = 10'h246;
+            10'd395: dds_sin_rom = 10'h247;
+            10'd396: dds_sin_rom = 10'h249;
+            10'd397: dds_sin_rom = 10'h24A;
+            10'd398: dds_sin_rom = 10'h24B;
+            10'd399: dds_sin_rom = 10'h24C;
+            10'd400: dds_sin_rom = 10'h24E;
+            10'd401: dds_sin_rom = 10'h24F;
+            10'd402: dds_sin_rom = 10'h250;
+            10'd403: dds_sin_rom = 10'h252;
+            10'd404: dds_sin_rom = 10'h253;
+            10'd405: dds_sin_rom = 10'h254;
+            10'd406: dds_sin_rom = 10'h255;
+            10'd407: dds_sin_rom = 10'h257;
+            10'd408: dds_sin_rom = 10'h258;
+            10'd409: dds_sin_rom = 10'h259;
+            10'd410: dds_sin_rom = 10'h25A;
+            10'd411: dds_sin_rom = 10'h25C;
+            10'd412: dds_sin_rom = 10'h25D;
+            10'd413: dds_sin_rom = 10'h25E;
+            10'd414: dds_sin_rom = 10'h260;
+            10'd415: dds_sin_rom = 10'h261;
+            10'd416: dds_sin_rom = 10'h262;
+            10'd417: dds_sin_rom = 10'h263;
+            10'd418: dds_sin_rom = 10'h265;
+            10'd419: dds_sin_rom = 10'h266;
+            10'd420: dds_sin_rom = 10'h267;
+            10'd421: dds_sin_rom = 10'h268;
+            10'd422: dds_sin_rom = 10'h26A;
+            10'd423: dds_sin_rom = 10'h26B;
+            10'd424: dds_sin_rom = 10'h26C;
+            10'd425: dds_sin_rom = 10'h26D;
+            10'd426: dds_sin_rom = 10'h26F;
+            10'd427: dds_sin_rom = 10'h270;
+            10'd428: dds_sin_rom = 10'h271;
+            10'd429: dds_sin_rom = 10'h272;
+            10'd430: dds_sin_rom = 10'h274;
+            10'd431: dds_sin_rom = 10'h275;
+            10'd432: dds_sin_rom = 10'h276;
+            10'd433: dds_sin_rom = 10'h277;
+            10'd434: dds_sin_rom = 10'h278;
+            10'd435: dds_sin_rom = 10'h27A;
+            10'd436: dds_sin_rom = 10'h27B;
+            10'd437: dds_sin_rom = 10'h27C;
+            10'd438: dds_sin_rom = 10'h27D;
+            10'd439: dds_sin_rom = 10'h27F;
+            10'd440: dds_sin_rom = 10'h280;
+            10'd441: dds_sin_rom = 10'h281;
+            10'd442: dds_sin_rom = 10'h282;
+            10'd443: dds_sin_rom = 10'h284;
+            10'd444: dds_sin_rom = 10'h285;
+            10'd445: dds_sin_rom = 10'h286;
+            10'd446: dds_sin_rom = 10'h287;
+            10'd447: dds_sin_rom = 10'h288;
+            10'd448: dds_sin_rom = 10'h28A;
+            10'd449: dds_sin_rom = 10'h28B;
+            10'd450: dds_sin_rom = 10'h28C;
+            10'd451: dds_sin_rom = 10'h28D;
+            10'd452: dds_sin_rom = 10'h28E;
+            10'd453: dds_sin_rom = 10'h290;
+            10'd454: dds_sin_rom = 10'h291;
+            10'd455: dds_sin_rom = 10'h292;
+            10'd456: dds_sin_rom = 10'h293;
+            10'd457: dds_sin_rom = 10'h294;
+            10'd458: dds_sin_rom = 10'h296;
+            10'd459: dds_sin_rom = 10'h297;
+            10'd460: dds_sin_rom = 10'h298;
+            10'd461: dds_sin_rom = 10'h299;
+            10'd462: dds_sin_rom = 10'h29A;
+            10'd463: dds_sin_rom = 10'h29C;
+            10'd464: dds_sin_rom = 10'h29D;
+            10'd465: dds_sin_rom = 10'h29E;
+            10'd466: dds_sin_rom = 10'h29F;
+            10'd467: dds_sin_rom = 10'h2A0;
+            10'd468: dds_sin_rom = 10'h2A2;
+            10'd469: dds_sin_rom = 10'h2A3;
+            10'd470: dds_sin_rom = 10'h2A4;
+            10'd471: dds_sin_rom = 10'h2A5;
+            10'd472: dds_sin_rom = 10'h2A6;
+            10'd473: dds_sin_rom = 10'h2A7;
+            10'd474: dds_sin_rom = 10'h2A9;
+            10'd475: dds_sin_rom = 10'h2AA;
+            10'd476: dds_sin_rom = 10'h2AB;
+            10'd477: dds_sin_rom = 10'h2AC;
+            10'd478: dds_sin_rom = 10'h2AD;
+            10'd479: dds_sin_rom = 10'h2AE;
+            10'd480: dds_sin_rom = 10'h2B0;
+            10'd481: dds_sin_rom = 10'h2B1;
+            10'd482: dds_sin_rom = 10'h2B2;
+            10'd483: dds_sin_rom = 10'h2B3;
+            10'd484: dds_sin_rom = 10'h2B4;
+            10'd485: dds_sin_rom = 10'h2B5;
+            10'd486: dds_sin_rom = 10'h2B7;
+            10'd487: dds_sin_rom = 10'h2B8;
+            10'd488: dds_sin_rom = 10'h2B9;
+            10'd489: dds_sin_rom = 10'h2BA;
+            10'd490: dds_sin_rom = 10'h2BB;
+            10'd491: dds_sin_rom = 10'h2BC;
+            10'd492: dds_sin_rom = 10'h2BD;
+            10'd493: dds_sin_rom = 10'h2BF;
+            10'd494: dds_sin_rom = 10'h2C0;
+            10'd495: dds_sin_rom = 10'h2C1;
+            10'd496: dds_sin_rom = 10'h2C2;
+            10'd497: dds_sin_rom = 10'h2C3;
+            10'd498: dds_sin_rom = 10'h2C4;
+            10'd499: dds_sin_rom = 10'h2C5;
+            10'd500: dds_sin_rom = 10'h2C6;
+            10'd501: dds_sin_rom = 10'h2C8;
+            10'd502: dds_sin_rom = 10'h2C9;
+            10'd503: dds_sin_rom = 10'h2CA;
+            10'd504: dds_sin_rom = 10'h2CB;
+            10'd505: dds_sin_rom = 10'h2CC;
+            10'd506: dds_sin_rom = 10'h2CD;
+            10'd507: dds_sin_rom = 10'h2CE;
+            10'd508: dds_sin_rom = 10'h2CF;
+            10'd509: dds_sin_rom = 10'h2D1;
+            10'd510: dds_sin_rom = 10'h2D2;
+            10'd511: dds_sin_rom = 10'h2D3;
+            10'd512: dds_sin_rom = 10'h2D4;
+            10'd513: dds_sin_rom = 10'h2D5;
+            10'd514: dds_sin_rom = 10'h2D6;
+            10'd515: dds_sin_rom = 10'h2D7;
+            10'd516: dds_sin_rom = 10'h2D8;
+            10'd517: dds_sin_rom = 10'h2D9;
+            10'd518: dds_sin_rom = 10'h2DB;
+            10'd519: dds_sin_rom = 10'h2DC;
+            10'd520: dds_sin_rom = 10'h2DD;
+            10'd521: dds_sin_rom = 10'h2DE;
+            10'd522: dds_sin_rom = 10'h2DF;
+            10'd523: dds_sin_rom = 10'h2E0;
+            10'd524: dds_sin_rom = 10'h2E1;
+            10'd525: dds_sin_rom = 10'h2E2;
+            10'd526: dds_sin_rom = 10'h2E3;
+            10'd527: dds_sin_rom = 10'h2E4;
+            10'd528: dds_sin_rom = 10'h2E5;
+            10'd529: dds_sin_rom = 10'h2E7;
+            10'd530: dds_sin_rom = 10'h2E8;
+            10'd531: dds_sin_rom = 10'h2E9;
+            10'd532: dds_sin_rom = 10'h2EA;
+            10'd533: dds_sin_rom = 10'h2EB;
+            10'd534: dds_sin_rom = 10'h2EC;
+            10'd535: dds_sin_rom = 10'h2ED;
+            10'd536: dds_sin_rom = 10'h2EE;
+            10'd537: dds_sin_rom = 10'h2EF;
+            10'd538: dds_sin_rom = 10'h2F0;
+            10'd539: dds_sin_rom = 10'h2F1;
+            10'd540: dds_sin_rom = 10'h2F2;
+            10'd541: dds_sin_rom = 10'h2F3;
+            10'd542: dds_sin_rom = 10'h2F4;
+            10'd543: dds_sin_rom = 10'h2F5;
+            10'd544: dds_sin_rom = 10'h2F7;
+            10'd545: dds_sin_rom = 10'h2F8;
+            10'd546: dds_sin_rom = 10'h2F9;
+            10'd547: dds_sin_rom = 10'h2FA;
+            10'd548: dds_sin_rom = 10'h2FB;
+            10'd549: dds_sin_rom = 10'h2FC;
+            10'd550: dds_sin_rom = 10'h2FD;
+            10'd551: dds_sin_rom = 10'h2FE;
+            10'd552: dds_sin_rom = 10'h2FF;
+            10'd553: dds_sin_rom = 10'h300;
+            10'd554: dds_sin_rom = 10'h301;
+            10'd555: dds_sin_rom = 10'h302;
+            10'd556: dds_sin_rom = 10'h303;
+            10'd557: dds_sin_rom = 10'h304;
+            10'd558: dds_sin_rom = 10'h305;
+            10'd559: dds_sin_rom = 10'h306;
+            10'd560: dds_sin_rom = 10'h307;
+            10'd561: dds_sin_rom = 10'h308;
+            10'd562: dds_sin_rom = 10'h309;
+            10'd563: dds_sin_rom = 10'h30A;
+            10'd564: dds_sin_rom = 10'h30B;
+            10'd565: dds_sin_rom = 10'h30C;
+            10'd566: dds_sin_rom = 10'h30D;
+            10'd567: dds_sin_rom = 10'h30E;
+            10'd568: dds_sin_rom = 10'h30F;
+            10'd569: dds_sin_rom = 10'h310;
+            10'd570: dds_sin_rom = 10'h311;
+            10'd571: dds_sin_rom = 10'h312;
+            10'd572: dds_sin_rom = 10'h313;
+            10'd573: dds_sin_rom = 10'h314;
+            10'd574: dds_sin_rom = 10'h315;
+            10'd575: dds_sin_rom = 10'h316;
+            10'd576: dds_sin_rom = 10'h317;
+            10'd577: dds_sin_rom = 10'h318;
+            10'd578: dds_sin_rom = 10'h319;
+            10'd579: dds_sin_rom = 10'h31A;
+            10'd580: dds_sin_rom = 10'h31B;
+            10'd581: dds_sin_rom = 10'h31C;
+            10'd582: dds_sin_rom = 10'h31D;
+            10'd583: dds_sin_rom = 10'h31E;
+            10'd584: dds_sin_rom = 10'h31F;
+            10'd585: dds_sin_rom = 10'h320;
+            10'd586: dds_sin_rom = 10'h321;
+            10'd587: dds_sin_rom = 10'h322;
+            10'd588: dds_sin_rom = 10'h323;
+            10'd589: dds_sin_rom = 10'h324;
+            10'd590: dds_sin_rom = 10'h325;
+            10'd591: dds_sin_rom = 10'h326;
+            10'd592: dds_sin_rom = 10'h327;
+            10'd593: dds_sin_rom = 10'h328;
+            10'd594: dds_sin_rom = 10'h329;
+            10'd595: dds_sin_rom = 10'h32A;
+            10'd596: dds_sin_rom = 10'h32B;
+            10'd597: dds_sin_rom = 10'h32C;
+            10'd598: dds_sin_rom = 10'h32D;
+            10'd599: dds_sin_rom = 10'h32E;
+            10'd600: dds_sin_rom = 10'h32F;
+            10'd601: dds_sin_rom = 10'h330;
+            10'd602: dds_sin_rom = 10'h331;
+            10'd603: dds_sin_rom = 10'h331;
+            10'd604: dds_sin_rom = 10'h332;
+            10'd605: dds_sin_rom = 10'h333;
+            10'd606: dds_sin_rom = 10'h334;
+            10'd607: dds_sin_rom = 10'h335;
+            10'd608: dds_sin_rom = 10'h336;
+            10'd609: dds_sin_rom = 10'h337;
+            10'd610: dds_sin_rom = 10'h338;
+            10'd611: dds_sin_rom = 10'h339;
+            10'd612: dds_sin_rom = 10'h33A;
+            10'd613: dds_sin_rom = 10'h33B;
+            10'd614: dds_sin_rom = 10'h33C;
+            10'd615: dds_sin_rom = 10'h33D;
+            10'd616: dds_sin_rom = 10'h33E;
+            10'd617: dds_sin_rom = 10'h33E;
+            10'd618: dds_sin_rom = 10'h33F;
+            10'd619: dds_sin_rom = 10'h340;
+            10'd620: dds_sin_rom = 10'h341;
+            10'd621: dds_sin_rom = 10'h342;
+            10'd622: dds_sin_rom = 10'h343;
+            10'd623: dds_sin_rom = 10'h344;
+            10'd624: dds_sin_rom = 10'h345;
+            10'd625: dds_sin_rom = 10'h346;
+            10'd626: dds_sin_rom = 10'h347;
+            10'd627: dds_sin_rom = 10'h348;
+            10'd628: dds_sin_rom = 10'h348;
+            10'd629: dds_sin_rom = 10'h349;
+            10'd630: dds_sin_rom = 10'h34A;
+            10'd631: dds_sin_rom = 10'h34B;
+            10'd632: dds_sin_rom = 10'h34C;
+            10'd633: dds_sin_rom = 10'h34D;
+            10'd634: dds_sin_rom = 10'h34E;
+            10'd635: dds_sin_rom = 10'h34F;
+            10'd636: dds_sin_rom = 10'h350;
+            10'd637: dds_sin_rom = 10'h350;
+            10'd638: dds_sin_rom = 10'h351;
+            10'd639: dds_sin_rom = 10'h352;
+            10'd640: dds_sin_rom = 10'h353;
+            10'd641: dds_sin_rom = 10'h354;
+            10'd642: dds_sin_rom = 10'h355;
+            10'd643: dds_sin_rom = 10'h356;
+            10'd644: dds_sin_rom = 10'h356;
+            10'd645: dds_sin_rom = 10'h357;
+            10'd646: dds_sin_rom = 10'h358;
+            10'd647: dds_sin_rom = 10'h359;
+            10'd648: dds_sin_rom = 10'h35A;
+            10'd649: dds_sin_rom = 10'h35B;
+            10'd650: dds_sin_rom = 10'h35C;
+            10'd651: dds_sin_rom = 10'h35C;
+            10'd652: dds_sin_rom = 10'h35D;
+            10'd653: dds_sin_rom = 10'h35E;
+            10'd654: dds_sin_rom = 10'h35F;
+            10'd655: dds_sin_rom = 10'h360;
+            10'd656: dds_sin_rom = 10'h361;
+            10'd657: dds_sin_rom = 10'h362;
+            10'd658: dds_sin_rom = 10'h362;
+            10'd659: dds_sin_rom = 10'h363;
+            10'd660: dds_sin_rom = 10'h364;
+            10'd661: dds_sin_rom = 10'h365;
+            10'd662: dds_sin_rom = 10'h366;
+            10'd663: dds_sin_rom = 10'h367;
+            10'd664: dds_sin_rom = 10'h367;
+            10'd665: dds_sin_rom = 10'h368;
+            10'd666: dds_sin_rom = 10'h369;
+            10'd667: dds_sin_rom = 10'h36A;
+            10'd668: dds_sin_rom = 10'h36B;
+            10'd669: dds_sin_rom = 10'h36B;
+            10'd670: dds_sin_rom = 10'h36C;
+            10'd671: dds_sin_rom = 10'h36D;
+            10'd672: dds_sin_rom = 10'h36E;
+            10'd673: dds_sin_rom = 10'h36F;
+            10'd674: dds_sin_rom = 10'h36F;
+            10'd675: dds_sin_rom = 10'h370;
+            10'd676: dds_sin_rom = 10'h371;
+            10'd677: dds_sin_rom = 10'h372;
+            10'd678: dds_sin_rom = 10'h373;
+            10'd679: dds_sin_rom = 10'h373;
+            10'd680: dds_sin_rom = 10'h374;
+            10'd681: dds_sin_rom = 10'h375;
+            10'd682: dds_sin_rom = 10'h376;
+            10'd683: dds_sin_rom = 10'h377;
+            10'd684: dds_sin_rom = 10'h377;
+            10'd685: dds_sin_rom = 10'h378;
+            10'd686: dds_sin_rom = 10'h379;
+            10'd687: dds_sin_rom = 10'h37A;
+            10'd688: dds_sin_rom = 10'h37A;
+            10'd689: dds_sin_rom = 10'h37B;
+            10'd690: dds_sin_rom = 10'h37C;
+            10'd691: dds_sin_rom = 10'h37D;
+            10'd692: dds_sin_rom = 10'h37E;
+            10'd693: dds_sin_rom = 10'h37E;
+            10'd694: dds_sin_rom = 10'h37F;
+            10'd695: dds_sin_rom = 10'h380;
+            10'd696: dds_sin_rom = 10'h381;
+            10'd697: dds_sin_rom = 10'h381;
+            10'd698: dds_sin_rom = 10'h382;
+            10'd699: dds_sin_rom = 10'h383;
+            10'd700: dds_sin_rom = 10'h384;
+            10'd701: dds_sin_rom = 10'h384;
+            10'd702: dds_sin_rom = 10'h385;
+            10'd703: dds_sin_rom = 10'h386;
+            10'd704: dds_sin_rom = 10'h387;
+            10'd705: dds_sin_rom = 10'h387;
+            10'd706: dds_sin_rom = 10'h388;
+            10'd707: dds_sin_rom = 10'h389;
+            10'd708: dds_sin_rom = 10'h38A;
+            10'd709: dds_sin_rom = 10'h38A;
+            10'd710: dds_sin_rom = 10'h38B;
+            10'd711: dds_sin_rom = 10'h38C;
+            10'd712: dds_sin_rom = 10'h38C;
+            10'd713: dds_sin_rom = 10'h38D;
+            10'd714: dds_sin_rom = 10'h38E;
+            10'd715: dds_sin_rom = 10'h38F;
+            10'd716: dds_sin_rom = 10'h38F;
+            10'd717: dds_sin_rom = 10'h390;
+            10'd718: dds_sin_rom = 10'h391;
+            10'd719: dds_sin_rom = 10'h391;
+            10'd720: dds_sin_rom = 10'h392;
+            10'd721: dds_sin_rom = 10'h393;
+            10'd722: dds_sin_rom = 10'h394;
+            10'd723: dds_sin_rom = 10'h394;
+            10'd724: dds_sin_rom = 10'h395;
+            10'd725: dds_sin_rom = 10'h396;
+            10'd726: dds_sin_rom = 10'h396;
+            10'd727: dds_sin_rom = 10'h397;
+            10'd728: dds_sin_rom = 10'h398;
+            10'd729: dds_sin_rom = 10'h398;
+            10'd730: dds_sin_rom = 10'h399;
+            10'd731: dds_sin_rom = 10'h39A;
+            10'd732: dds_sin_rom = 10'h39A;
+            10'd733: dds_sin_rom = 10'h39B;
+            10'd734: dds_sin_rom = 10'h39C;
+            10'd735: dds_sin_rom = 10'h39C;
+            10'd736: dds_sin_rom = 10'h39D;
+            10'd737: dds_sin_rom = 10'h39E;
+            10'd738: dds_sin_rom = 10'h39E;
+            10'd739: dds_sin_rom = 10'h39F;
+            10'd740: dds_sin_rom = 10'h3A0;
+            10'd741: dds_sin_rom = 10'h3A0;
+            10'd742: dds_sin_rom = 10'h3A1;
+            10'd743: dds_sin_rom = 10'h3A2;
+            10'd744: dds_sin_rom = 10'h3A2;
+            10'd745: dds_sin_rom = 10'h3A3;
+            10'd746: dds_sin_rom = 10'h3A4;
+            10'd747: dds_sin_rom = 10'h3A4;
+            10'd748: dds_sin_rom = 10'h3A5;
+            10'd749: dds_sin_rom = 10'h3A6;
+            10'd750: dds_sin_rom = 10'h3A6;
+            10'd751: dds_sin_rom = 10'h3A7;
+            10'd752: dds_sin_rom = 10'h3A8;
+            10'd753: dds_sin_rom = 10'h3A8;
+            10'd754: dds_sin_rom = 10'h3A9;
+            10'd755: dds_sin_rom = 10'h3A9;
+            10'd756: dds_sin_rom = 10'h3AA;
+            10'd757: dds_sin_rom = 10'h3AB;
+            10'd758: dds_sin_rom = 10'h3AB;
+            10'd759: dds_sin_rom = 10'h3AC;
+            10'd760: dds_sin_rom = 10'h3AD;
+            10'd761: dds_sin_rom = 10'h3AD;
+            10'd762: dds_sin_rom = 10'h3AE;
+            10'd763: dds_sin_rom = 10'h3AE;
+            10'd764: dds_sin_rom = 10'h3AF;
+            10'd765: dds_sin_rom = 10'h3B0;
+            10'd766: dds_sin_rom = 10'h3B0;
+            10'd767: dds_sin_rom = 10'h3B1;
+            10'd768: dds_sin_rom = 10'h3B1;
+            10'd769: dds_sin_rom = 10'h3B2;
+            10'd770: dds_sin_rom = 10'h3B3;
+            10'd771: dds_sin_rom = 10'h3B3;
+            10'd772: dds_sin_rom = 10'h3B4;
+            10'd773: dds_sin_rom = 10'h3B4;
+            10'd774: dds_sin_rom = 10'h3B5;
+            10'd775: dds_sin_rom = 10'h3B6;
+            10'd776: dds_sin_rom = 10'h3B6;
+            10'd777: dds_sin_rom = 10'h3B7;
+            10'd778: dds_sin_rom = 10'h3B7;
+            10'd779: dds_sin_rom = 10'h3B8;
+            10'd780: dds_sin_rom = 10'h3B8;
+            10'd781: dds_sin_rom = 10'h3B9;
+            10'd782: dds_sin_rom = 10'h3BA;
+            10'd783: dds_sin_rom = 10'h3BA;
+            10'd784: dds_sin_rom = 10'h3BB;
+            10'd785: dds_sin_rom = 10'h3BB;
+            10'd786: dds_sin_rom = 10'h3BC;
+            10'd787: dds_sin_rom = 10'h3BC;
+            10'd788: dds_sin_rom = 10'h3BD;
+            10'd789: dds_sin_rom = 10'h3BE;
+            10'd790: dds_sin_rom = 10'h3BE;
+            10'd791: dds_sin_rom = 10'h3BF;
+            10'd792: dds_sin_rom = 10'h3BF;
+            10'd793: dds_sin_rom = 10'h3C0;
+            10'd794: dds_sin_rom = 10'h3C0;
+            10'd795: dds_sin_rom = 10'h3C1;
+            10'd796: dds_sin_rom = 10'h3C1;
+            10'd797: dds_sin_rom = 10'h3C2;
+            10'd798: dds_sin_rom = 10'h3C2;
+            10'd799: dds_sin_rom = 10'h3C3;
+            10'd800: dds_sin_rom = 10'h3C3;
+            10'd801: dds_sin_rom = 10'h3C4;
+            10'd802: dds_sin_rom = 10'h3C5;
+            10'd803: dds_sin_rom = 10'h3C5;
+            10'd804: dds_sin_rom = 10'h3C6;
+            10'd805: dds_sin_rom = 10'h3C6;
+            10'd806: dds_sin_rom = 10'h3C7;
+            10'd807: dds_sin_rom = 10'h3C7;
+            10'd808: dds_sin_rom = 10'h3C8;
+            10'd809: dds_sin_rom = 10'h3C8;
+            10'd810: dds_sin_rom = 10'h3C9;
+            10'd811: dds_sin_rom = 10'h3C9;
+            10'd812: dds_sin_rom = 10'h3CA;
+            10'd813: dds_sin_rom = 10'h3CA;
+            10'd814: dds_sin_rom = 10'h3CB;
+            10'd815: dds_sin_rom = 10'h3CB;
+            10'd816: dds_sin_rom = 10'h3CC;
+            10'd817: dds_sin_rom = 10'h3CC;
+            10'd818: dds_sin_rom = 10'h3CD;
+            10'd819: dds_sin_rom = 10'h3CD;
+            10'd820: dds_sin_rom = 10'h3CE;
+            10'd821: dds_sin_rom = 10'h3CE;
+            10'd822: dds_sin_rom = 10'h3CF;
+            10'd823: dds_sin_rom = 10'h3CF;
+            10'd824: dds_sin_rom = 10'h3CF;
+            10'd825: dds_sin_rom = 10'h3D0;
+            10'd826: dds_sin_rom = 10'h3D0;
+            10'd827: dds_sin_rom = 10'h3D1;
+            10'd828: dds_sin_rom = 10'h3D1;
+            10'd829: dds_sin_rom = 10'h3D2;
+            10'd830: dds_sin_rom = 10'h3D2;
+            10'd831: dds_sin_rom = 10'h3D3;
+            10'd832: dds_sin_rom = 10'h3D3;
+            10'd833: dds_sin_rom = 10'h3D4;
+            10'd834: dds_sin_rom = 10'h3D4;
+            10'd835: dds_sin_rom = 10'h3D5;
+            10'd836: dds_sin_rom = 10'h3D5;
+            10'd837: dds_sin_rom = 10'h3D5;
+            10'd838: dds_sin_rom = 10'h3D6;
+            10'd839: dds_sin_rom = 10'h3D6;
+            10'd840: dds_sin_rom = 10'h3D7;
+            10'd841: dds_sin_rom = 10'h3D7;
+            10'd842: dds_sin_rom = 10'h3D8;
+            10'd843: dds_sin_rom = 10'h3D8;
+            10'd844: dds_sin_rom = 10'h3D8;
+            10'd845: dds_sin_rom = 10'h3D9;
+            10'd846: dds_sin_rom = 10'h3D9;
+            10'd847: dds_sin_rom = 10'h3DA;
+            10'd848: dds_sin_rom = 10'h3DA;
+            10'd849: dds_sin_rom = 10'h3DB;
+            10'd850: dds_sin_rom = 10'h3DB;
+            10'd851: dds_sin_rom = 10'h3DB;
+            10'd852: dds_sin_rom = 10'h3DC;
+            10'd853: dds_sin_rom = 10'h3DC;
+            10'd854: dds_sin_rom = 10'h3DD;
+            10'd855: dds_sin_rom = 10'h3DD;
+            10'd856: dds_sin_rom = 10'h3DD;
+            10'd857: dds_sin_rom = 10'h3DE;
+            10'd858: dds_sin_rom = 10'h3DE;
+            10'd859: dds_sin_rom = 10'h3DF;
+            10'd860: dds_sin_rom = 10'h3DF;
+            10'd861: dds_sin_rom = 10'h3DF;
+            10'd862: dds_sin_rom = 10'h3E0;
+            10'd863: dds_sin_rom = 10'h3E0;
+            10'd864: dds_sin_rom = 10'h3E1;
+            10'd865: dds_sin_rom = 10'h3E1;
+            10'd866: dds_sin_rom = 10'h3E1;
+            10'd867: dds_sin_rom = 10'h3E2;
+            10'd868: dds_sin_rom = 10'h3E2;
+            10'd869: dds_sin_rom = 10'h3E2;
+            10'd870: dds_sin_rom = 10'h3E3;
+            10'd871: dds_sin_rom = 10'h3E3;
+            10'd872: dds_sin_rom = 10'h3E3;
+            10'd873: dds_sin_rom = 10'h3E4;
+            10'd874: dds_sin_rom = 10'h3E4;
+            10'd875: dds_sin_rom = 10'h3E5;
+            10'd876: dds_sin_rom = 10'h3E5;
+            10'd877: dds_sin_rom = 10'h3E5;
+            10'd878: dds_sin_rom = 10'h3E6;
+            10'd879: dds_sin_rom = 10'h3E6;
+            10'd880: dds_sin_rom = 10'h3E6;
+            10'd881: dds_sin_rom = 10'h3E7;
+            10'd882: dds_sin_rom = 10'h3E7;
+            10'd883: dds_sin_rom = 10'h3E7;
+            10'd884: dds_sin_rom = 10'h3E8;
+            10'd885: dds_sin_rom = 10'h3E8;
+            10'd886: dds_sin_rom = 10'h3E8;
+            10'd887: dds_sin_rom = 10'h3E9;
+            10'd888: dds_sin_rom = 10'h3E9;
+            10'd889: dds_sin_rom = 10'h3E9;
+            10'd890: dds_sin_rom = 10'h3EA;
+            10'd891: dds_sin_rom = 10'h3EA;
+            10'd892: dds_sin_rom = 10'h3EA;
+            10'd893: dds_sin_rom = 10'h3EB;
+            10'd894: dds_sin_rom = 10'h3EB;
+            10'd895: dds_sin_rom = 10'h3EB;
+            10'd896: dds_sin_rom = 10'h3EB;
+            10'd897: dds_sin_rom = 10'h3EC;
+            10'd898: dds_sin_rom = 10'h3EC;
+            10'd899: dds_sin_rom = 10'h3EC;
+            10'd900: dds_sin_rom = 10'h3ED;
+            10'd901: dds_sin_rom = 10'h3ED;
+            10'd902: dds_sin_rom = 10'h3ED;
+            10'd903: dds_sin_rom = 10'h3EE;
+            10'd904: dds_sin_rom = 10'h3EE;
+            10'd905: dds_sin_rom = 10'h3EE;
+            10'd906: dds_sin_rom = 10'h3EE;
+            10'd907: dds_sin_rom = 10'h3EF;
+            10'd908: dds_sin_rom = 10'h3EF;
+            10'd909: dds_sin_rom = 10'h3EF;
+            10'd910: dds_sin_rom = 10'h3F0;
+            10'd911: dds_sin_rom = 10'h3F0;
+            10'd912: dds_sin_rom = 10'h3F0;
+            10'd913: dds_sin_rom = 10'h3F0;
+            10'd914: dds_sin_rom = 10'h3F1;
+            10'd915: dds_sin_rom = 10'h3F1;
+            10'd916: dds_sin_rom = 10'h3F1;
+            10'd917: dds_sin_rom = 10'h3F1;
+            10'd918: dds_sin_rom = 10'h3F2;
+            10'd919: dds_sin_rom = 10'h3F2;
+            10'd920: dds_sin_rom = 10'h3F2;
+            10'd921: dds_sin_rom = 10'h3F2;
+            10'd922: dds_sin_rom = 10'h3F3;
+            10'd923: dds_sin_rom = 10'h3F3;
+            10'd924: dds_sin_rom = 10'h3F3;
+            10'd925: dds_sin_rom = 10'h3F3;
+            10'd926: dds_sin_rom = 10'h3F4;
+            10'd927: dds_sin_rom = 10'h3F4;
+            10'd928: dds_sin_rom = 10'h3F4;
+            10'd929: dds_sin_rom = 10'h3F4;
+            10'd930: dds_sin_rom = 10'h3F4;
+            10'd931: dds_sin_rom = 10'h3F5;
+            10'd932: dds_sin_rom = 10'h3F5;
+            10'd933: dds_sin_rom = 10'h3F5;
+            10'd934: dds_sin_rom = 10'h3F5;
+            10'd935: dds_sin_rom = 10'h3F6;
+            10'd936: dds_sin_rom = 10'h3F6;
+            10'd937: dds_sin_rom = 10'h3F6;
+            10'd938: dds_sin_rom = 10'h3F6;
+            10'd939: dds_sin_rom = 10'h3F6;
+            10'd940: dds_sin_rom = 10'h3F7;
+            10'd941: dds_sin_rom = 10'h3F7;
+            10'd942: dds_sin_rom = 10'h3F7;
+            10'd943: dds_sin_rom = 10'h3F7;
+            10'd944: dds_sin_rom = 10'h3F7;
+            10'd945: dds_sin_rom = 10'h3F8;
+            10'd946: dds_sin_rom = 10'h3F8;
+            10'd947: dds_sin_rom = 10'h3F8;
+            10'd948: dds_sin_rom = 10'h3F8;
+            10'd949: dds_sin_rom = 10'h3F8;
+            10'd950: dds_sin_rom = 10'h3F9;
+            10'd951: dds_sin_rom = 10'h3F9;
+            10'd952: dds_sin_rom = 10'h3F9;
+            10'd953: dds_sin_rom = 10'h3F9;
+            10'd954: dds_sin_rom = 10'h3F9;
+            10'd955: dds_sin_rom = 10'h3F9;
+            10'd956: dds_sin_rom = 10'h3FA;
+            10'd957: dds_sin_rom = 10'h3FA;
+            10'd958: dds_sin_rom = 10'h3FA;
+            10'd959: dds_sin_rom = 10'h3FA;
+            10'd960: dds_sin_rom = 10'h3FA;
+            10'd961: dds_sin_rom = 10'h3FA;
+            10'd962: dds_sin_rom = 10'h3FA;
+            10'd963: dds_sin_rom = 10'h3FB;
+            10'd964: dds_sin_rom = 10'h3FB;
+            10'd965: dds_sin_rom = 10'h3FB;
+            10'd966: dds_sin_rom = 10'h3FB;
+            10'd967: dds_sin_rom = 10'h3FB;
+            10'd968: dds_sin_rom = 10'h3FB;
+            10'd969: dds_sin_rom = 10'h3FB;
+            10'd970: dds_sin_rom = 10'h3FC;
+            10'd971: dds_sin_rom = 10'h3FC;
+            10'd972: dds_sin_rom = 10'h3FC;
+            10'd973: dds_sin_rom = 10'h3FC;
+            10'd974: dds_sin_rom = 10'h3FC;
+            10'd975: dds_sin_rom = 10'h3FC;
+            10'd976: dds_sin_rom = 10'h3FC;
+            10'd977: dds_sin_rom = 10'h3FC;
+            10'd978: dds_sin_rom = 10'h3FD;
+            10'd979: dds_sin_rom = 10'h3FD;
+            10'd980: dds_sin_rom = 10'h3FD;
+            10'd981: dds_sin_rom = 10'h3FD;
+            10'd982: dds_sin_rom = 10'h3FD;
+            10'd983: dds_sin_rom = 10'h3FD;
+            10'd984: dds_sin_rom = 10'h3FD;
+            10'd985: dds_sin_rom = 10'h3FD;
+            10'd986: dds_sin_rom = 10'h3FD;
+            10'd987: dds_sin_rom = 10'h3FD;
+            10'd988: dds_sin_rom = 10'h3FD;
+            10'd989: dds_sin_rom = 10'h3FE;
+            10'd990: dds_sin_rom = 10'h3FE;
+            10'd991: dds_sin_rom = 10'h3FE;
+            10'd992: dds_sin_rom = 10'h3FE;
+            10'd993: dds_sin_rom = 10'h3FE;
+            10'd994: dds_sin_rom = 10'h3FE;
+            10'd995: dds_sin_rom = 10'h3FE;
+            10'd996: dds_sin_rom = 10'h3FE;
+            10'd997: dds_sin_rom = 10'h3FE;
+            10'd998: dds_sin_rom = 10'h3FE;
+            10'd999: dds_sin_rom = 10'h3FE;
+            10'd1000: dds_sin_rom = 10'h3FE;
+            10'd1001: dds_sin_rom = 10'h3FE;
+            10'd1002: dds_sin_rom = 10'h3FE;
+            10'd1003: dds_sin_rom = 10'h3FE;
+            10'd1004: dds_sin_rom = 10'h3FF;
+            10'd1005: dds_sin_rom = 10'h3FF;
+            10'd1006: dds_sin_rom = 10'h3FF;
+            10'd1007: dds_sin_rom = 10'h3FF;
+            10'd1008: dds_sin_rom = 10'h3FF;
+            10'd1009: dds_sin_rom = 10'h3FF;
+            10'd1010: dds_sin_rom = 10'h3FF;
+            10'd1011: dds_sin_rom = 10'h3FF;
+            10'd1012: dds_sin_rom = 10'h3FF;
+            10'd1013: dds_sin_rom = 10'h3FF;
+            10'd1014: dds_sin_rom = 10'h3FF;
+            10'd1015: dds_sin_rom = 10'h3FF;
+            10'd1016: dds_sin_rom = 10'h3FF;
+            10'd1017: dds_sin_rom = 10'h3FF;
+            10'd1018: dds_sin_rom = 10'h3FF;
+            10'd1019: dds_sin_rom = 10'h3FF;
+            10'd1020: dds_sin_rom = 10'h3FF;
+            10'd1021: dds_sin_rom = 10'h3FF;
+            10'd1022: dds_sin_rom = 10'h3FF;
+            10'd1023: dds_sin_rom = 10'h3FF;
+            default: dds_sin_rom = 10'h000;
+        endcase
+    end
+endfunction
+
+function signed [15:0] sin_lut_func;
+    input [`DDS_ADDR_BITS-1:0] addr;
+    reg [`DDS_ADDR_BITS-3:0] idx;
+    reg [15:0]               mag;
+    begin
+        // 第2/4象限地址镜像 (按位取反), 第3/4象限取负
+        idx = addr[`DDS_ADDR_BITS-2] ? ~addr[`DDS_ADDR_BITS-3:0] : addr[`DDS_ADDR_BITS-3:0];
+        mag = {1'b0, dds_sin_rom(idx), {5{1'b0}}};
+        sin_lut_func = addr[`DDS_ADDR_BITS-1] ? -mag : mag;
+    end
+endfunction
+
+// 余弦 = sin(x + 90度)
+function signed [15:0] cos_lut_func;
+    input [`DDS_ADDR_BITS-1:0] addr;
+    begin
+        cos_lut_func = sin_lut_func(addr + (1 << (`DDS_ADDR_BITS-2)));
+    end
+endfunction
@@ -5,8 +5,10 @@
 // 优点: 零额外APM消耗，支持8192点10位精度
 //=============================================================================
 
+`include "fft_params.vh"  // FFT点数/窗表路径 (scripts/generate_fft_params.py生成)
+
 module dual_channel_fft_controller #(
-    parameter FFT_POINTS = 8192,  // ✓ 默认改为8192点
+    parameter FFT_POINTS = `FFT_POINTS,  // ✓ 默认8192点, 由fft_params.vh给出
     parameter DATA_WIDTH = 16
 )(
     input  wire                     clk,
@@ -37,12 +39,12 @@ module dual_channel_fft_controller #(
     
     // 频谱输出 - 通道1
     output reg  [15:0]              ch1_spectrum_data,
-    output reg  [12:0]              ch1_spectrum_addr,  // 8192需要13位地址
+    output reg  [`FFT_ADDR_WIDTH-1:0] ch1_spectrum_addr,  // 8192需要13位地址
     output reg                      ch1_spectrum_valid,
     
     // 频谱输出 - 通道2
     output reg  [15:0]              ch2_spectrum_data,
-    output reg  [12:0]              ch2_spectrum_addr,  // 8192需要13位地址
+    output reg  [`FFT_ADDR_WIDTH-1:0] ch2_spectrum_addr,  // 8192需要13位地址
     output reg                      ch2_spectrum_valid,
     
     // 控制信号
@@ -74,8 +76,8 @@ reg [3:0]  state, next_state;
 //=============================================================================
 // 内部信号
 //=============================================================================
-reg [12:0]  send_cnt;           // 发送计数器（8192需要13位）
-reg [12:0]  recv_cnt;           // 接收计数器（8192需要13位）
+reg [`FFT_ADDR_WIDTH-1:0]  send_cnt;           // 发送计数器（8192需要13位）
+reg [`FFT_ADDR_WIDTH-1:0]  recv_cnt;           // 接收计数器（8192需要13位）
 reg [15:0]  data_buffer;        // 数据缓存
 reg         fifo_rd_en;         // 统一的FIFO读使能
 wire [15:0] fifo_dout_mux;      // 多路复用后的FIFO输出
@@ -83,24 +85,28 @@ wire [9:0]  data_10bit;         // 10位ADC数据（从16位FIFO数据中提取
 
 // 频谱计算相关
 wire [15:0] spectrum_magnitude;
-wire [12:0] spectrum_addr;      // 8192需要13位地址
+wire [`FFT_ADDR_WIDTH-1:0] spectrum_addr;      // 8192需要13位地址
 wire        spectrum_valid;
 
 //=============================================================================
 // Hann窗函数相关信号
 //=============================================================================
-reg  [15:0] hann_window_rom [0:8191];  // Hann窗系数ROM (16位Q15格式)
+reg  [15:0] hann_window_rom [0:`FFT_HALF_POINTS-1];  // Hann窗系数ROM (前半N/2点, 16位Q15格式, 对称镜像读取)
 reg  [15:0] window_coeff;              // 窗系数寄存器
-reg  [12:0] window_addr;               // 窗系数读取地址（独立计数器）
+reg  [`FFT_ADDR_WIDTH-1:0] window_addr;               // 窗系数读取地址（独立计数器）
 wire signed [15:0] adc_signed;         // ADC数据符号扩展
 wire signed [31:0] windowed_mult;      // 乘法结果
 wire signed [15:0] windowed_data;      // 加窗后的数据
 
-// 初始化Hann窗ROM（HEX文件位于source目录）
+// 初始化Hann窗ROM（HEX文件位于source目录, 由generate_fft_params.py生成）
 initial begin
-    $readmemh("source/hann_window_8192.hex", hann_window_rom);
+    $readmemh(`FFT_WINDOW_HALF_FILE, hann_window_rom);
 end
 
+// 镜像地址: addr >= N/2 时读 window[N-1-addr], 其低位即 ~addr (8192点: ~addr[11:0])
+wire [`FFT_ADDR_WIDTH-2:0] window_half_addr = window_addr[`FFT_ADDR_WIDTH-2:0] ^
+                                              {(`FFT_ADDR_WIDTH-1){window_addr[`FFT_ADDR_WIDTH-1]}};
+
 // 从FIFO输出的16位数据中提取10位有效数据（高10位）
 assign data_10bit = fifo_dout_mux[15:6];
 
@@ -134,7 +140,7 @@ always @(posedge clk or negedge rst_n) begin
     if (!rst_n)
         window_coeff <= 16'd0;
     else
-        window_coeff <= hann_window_rom[window_addr];
+        window_coeff <= hann_window_rom[window_half_addr];
 end
 
 //=============================================================================
@@ -0,0 +1,34 @@
+//=============================================================================
+// 文件名: fft_params.vh
+// 功能: FFT派生参数 (8192点, 采样率 35000000 Hz)
+// 自动生成: scripts/generate_fft_params.py, 请勿手动修改
+// 使用: `include "fft_params.vh"
+//=============================================================================
+
+`ifndef FFT_PARAMS_VH
+`define FFT_PARAMS_VH
+
+`define FFT_POINTS                  8192
+`define FFT_ADDR_WIDTH              13
+`define FFT_HALF_POINTS             4096
+`define FFT_SAMPLE_RATE             35000000
+`define FFT_FREQ_RES                4272
+`define FFT_FREQ_RES_Q16            280000000
+`define FFT_FREQ_RES_Q16_WIDTH      29
+`define FFT_FREQ_PRODUCT_WIDTH      25
+`define FFT_FREQ_Q16_PRODUCT_WIDTH  41
+`define FFT_HZ_TO_BIN_Q32           1005268
+`define FFT_WINDOW_WIDTH            16
+`define FFT_WINDOW_SCALE            32767
+`define FFT_WINDOW_CG_Q16           32764
+`define FFT_WINDOW_ENBW_Q16         98316
+`define FFT_WINDOW_HALF_FILE        "source/hann_window_8192_half.hex"
+
+// 误差预算 (取整常量 / 精确值):
+//   FFT_FREQ_RES                  4272  精确 4272.460938 Hz/bin, 误差 -0.461 (-1.08e-04), 最坏 1.89e+03, 13位
+//   FFT_FREQ_RES_Q16         280000000  精确 4272.460938 Hz/bin, 误差 +0 (+0.00e+00), 最坏 0, 29位
+//   FFT_HZ_TO_BIN_Q32          1005268  精确 0.0002340571429 bin/Hz, 误差 +5.26e-11 (+2.25e-07), 最坏 0.000921, 20位
+//   FFT_WINDOW_CG_Q16            32764  精确 0.4999390375, 误差 -7.26e-08 (-1.45e-07), 最坏 7.26e-08, 15位
+//   FFT_WINDOW_ENBW_Q16          98316  精确 1.500182903 bin, 误差 +2.02e-07 (+1.35e-07), 最坏 2.02e-07, 17位
+
+`endif
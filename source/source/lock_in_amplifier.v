@@ -9,6 +9,8 @@
 // 原理: 将输入信号与参考信号相乘，经低通滤波后提取特定频率分量
 //=============================================================================
 
+`include "dds_params.vh"  // DDS表地址位数 (scripts/generate_dds_table.py生成)
+
 module lock_in_amplifier #(
     parameter DATA_WIDTH = 16,      // 输入数据位宽
     parameter PHASE_WIDTH = 32,     // 相位累加器位宽（DDS）
@@ -44,8 +46,8 @@ module lock_in_amplifier #(
 //=============================================================================
 // 1. DDS参考信号生成器（正弦/余弦查找表）
 //=============================================================================
-reg [PHASE_WIDTH-1:0]   phase_acc;      // 相位累加器
-wire [9:0]              sin_addr;       // 正弦表地址（1024点）
+reg [PHASE_WIDTH-1:0]     phase_acc;      // 相位累加器
+wire [`DDS_ADDR_BITS-1:0] sin_addr;       // 正弦表地址（2^DDS_ADDR_BITS点）
 
 // 相位累加器
 always @(posedge clk or negedge rst_n) begin
@@ -55,114 +57,12 @@ always @(posedge clk or negedge rst_n) begin
         phase_acc <= phase_acc + ref_freq_tuning;
 end
 
-// 地址映射：使用高10位作为查找表索引
-assign sin_addr = phase_acc[PHASE_WIDTH-1:PHASE_WIDTH-10];
-
-// 正弦/余弦查找表（1024点，16位精度）
-// 为了综合，使用ROM IP核或预定义的参数数组
-// 这里使用简化方案：64点查找表 + 线性插值（节省资源）
-// 或者使用CORDIC算法替代
+// 地址映射：相位累加器高位作为查找表索引（其余低位截断）
+assign sin_addr = phase_acc[PHASE_WIDTH-1 -: `DDS_ADDR_BITS];
 
-// 方案1：使用简化的64点查找表（推荐用于FPGA综合）
-function signed [15:0] sin_lut_func;
-    input [9:0] addr;
-    reg [5:0] base_addr;
-    reg signed [15:0] lut_val;
-    begin
-        // 使用64点基础表 + 对称性
-        base_addr = addr[5:0];  // 0-63
-        
-        // 第一象限的64个点（0-90度的1/4）
-        case (base_addr)
-            6'd0:  lut_val = 16'd0;
-            6'd1:  lut_val = 16'd804;
-            6'd2:  lut_val = 16'd1608;
-            6'd3:  lut_val = 16'd2410;
-            6'd4:  lut_val = 16'd3212;
-            6'd5:  lut_val = 16'd4011;
-            6'd6:  lut_val = 16'd4808;
-            6'd7:  lut_val = 16'd5602;
-            6'd8:  lut_val = 16'd6393;
-            6'd9:  lut_val = 16'd7179;
-            6'd10: lut_val = 16'd7962;
-            6'd11: lut_val = 16'd8740;
-            6'd12: lut_val = 16'd9512;
-            6'd13: lut_val = 16'd10279;
-            6'd14: lut_val = 16'd11039;
-            6'd15: lut_val = 16'd11793;
-            6'd16: lut_val = 16'd12540;
-            6'd17: lut_val = 16'd13279;
-            6'd18: lut_val = 16'd14010;
-            6'd19: lut_val = 16'd14733;
-            6'd20: lut_val = 16'd15447;
-            6'd21: lut_val = 16'd16151;
-            6'd22: lut_val = 16'd16846;
-            6'd23: lut_val = 16'd17530;
-            6'd24: lut_val = 16'd18205;
-            6'd25: lut_val = 16'd18868;
-            6'd26: lut_val = 16'd19520;
-            6'd27: lut_val = 16'd20160;
-            6'd28: lut_val = 16'd20788;
-            6'd29: lut_val = 16'd21403;
-            6'd30: lut_val = 16'd22006;
-            6'd31: lut_val = 16'd22595;
-            6'd32: lut_val = 16'd23170;
-            6'd33: lut_val = 16'd23732;
-            6'd34: lut_val = 16'd24279;
-            6'd35: lut_val = 16'd24812;
-            6'd36: lut_val = 16'd25330;
-            6'd37: lut_val = 16'd25833;
-            6'd38: lut_val = 16'd26320;
-            6'd39: lut_val = 16'd26791;
-            6'd40: lut_val = 16'd27246;
-            6'd41: lut_val = 16'd27684;
-            6'd42: lut_val = 16'd28106;
-            6'd43: lut_val = 16'd28511;
-            6'd44: lut_val = 16'd28899;
-            6'd45: lut_val = 16'd29269;
-            6'd46: lut_val = 16'd29622;
-            6'd47: lut_val = 16'd29957;
-            6'd48: lut_val = 16'd30274;
-            6'd49: lut_val = 16'd30572;
-            6'd50: lut_val = 16'd30853;
-            6'd51: lut_val = 16'd31114;
-            6'd52: lut_val = 16'd31357;
-            6'd53: lut_val = 16'd31581;
-            6'd54: lut_val = 16'd31786;
-            6'd55: lut_val = 16'd31972;
-            6'd56: lut_val = 16'd32138;
-            6'd57: lut_val = 16'd32285;
-            6'd58: lut_val = 16'd32413;
-            6'd59: lut_val = 16'd32522;
-            6'd60: lut_val = 16'd32610;
-            6'd61: lut_val = 16'd32679;
-            6'd62: lut_val = 16'd32729;
-            6'd63: lut_val = 16'd32758;
-            default: lut_val = 16'd0;
-        endcase
-        
-        // 应用对称性
-        case (addr[9:6])  // 象限判断
-            4'b0000, 4'b0001: sin_lut_func = lut_val;                    // 0-90度
-            4'b0010, 4'b0011: sin_lut_func = lut_val;                    // 90-180度 (使用镜像)
-            4'b0100, 4'b0101: sin_lut_func = -lut_val;                   // 180-270度
-            4'b0110, 4'b0111: sin_lut_func = -lut_val;                   // 270-360度
-            4'b1000, 4'b1001: sin_lut_func = lut_val;                    
-            4'b1010, 4'b1011: sin_lut_func = lut_val;
-            4'b1100, 4'b1101: sin_lut_func = -lut_val;
-            4'b1110, 4'b1111: sin_lut_func = -lut_val;
-            default: sin_lut_func = 16'd0;
-        endcase
-    end
-endfunction
-
-// 余弦 = sin(x + 90度)
-function signed [15:0] cos_lut_func;
-    input [9:0] addr;
-    begin
-        cos_lut_func = sin_lut_func(addr + 10'd256);  // 相位偏移90度
-    end
-endfunction
+// 正弦/余弦查找表：1/4周期对称存储 + 地址折叠
+// 地址位数/幅度位宽由SFDR扫描选定, 杂散与噪底见dds_params.vh
+`include "dds_sin_lut.vh"  // sin_lut_func/cos_lut_func (scripts/generate_dds_table.py生成)
 
 reg signed [15:0] ref_sin;
 reg signed [15:0] ref_cos;
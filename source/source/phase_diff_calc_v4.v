@@ -1,10 +1,14 @@
 //=============================================================================
 // 文件名: phase_diff_calc_v4.v
 // 描述: 高精度双通道相位差计算模块（CORDIC优化版）
-// 算法: 单次atan2法 + 16次迭代CORDIC + IIR平滑滤波
+// 算法: 单次atan2法 + 14次迭代CORDIC + IIR平滑滤波
 //       Phase_diff = atan2(Re1*Im2 - Im1*Re2, Re1*Re2 + Im1*Im2)
-// 精度: ±0.05° (理论±0.01°，实际考虑噪声和量化误差)
-// 延迟: ~25个时钟周期（4周期乘法 + 18周期CORDIC + 3周期滤波）
+// 精度: CORDIC本身最坏0.070° (输入幅度 ≥ 1024), 全部输入最坏4.4° (小幅度量化)
+//       (scripts/cordic_atan2_model.py 实测)
+//       归一化按 cross_re/cross_im 的最高有效位右移 0~16 位, 使 |x|,|y| < 2^15 不回绕
+//       (原实现只在 |cross| ≥ 2^30 时右移16位, 其余直接截取 cross[15:0], 同相输入得到180°;
+//        scripts/phase_diff_model.py 发现)
+// 延迟: ~24个时钟周期（4周期乘法 + 17周期CORDIC + 3周期滤波）
 // 
 // 优势:
 //   1. 单次atan2避免误差累积（传统方法需计算两次atan2再相减）
@@ -154,18 +158,27 @@ reg               cordic_valid_in;
 reg [7:0]         signal_magnitude;  // 信号幅度（用于置信度计算）
 
 // 找到最大值的位数，动态确定缩放因子
-wire [5:0] cross_re_msb;  // 最高有效位位置
-wire [5:0] cross_im_msb;
-wire [5:0] max_msb;
-wire [4:0] shift_amount;  // 右移量
+wire [30:0] cross_re_abs;  // 反码绝对值 (负数为 |x|-1)
+wire [30:0] cross_im_abs;
+wire [30:0] cross_or;      // 两者按位或, 最高位即max(|re|,|im|)的最高有效位
+reg  [4:0]  cross_top;     // 最高有效位位置
+wire [4:0]  shift_amount;  // 右移量
+integer     k;
 
-// 简化的前导零检测（仅检查高16位）
-assign cross_re_msb = cross_re[31] ? (~cross_re[31:26]) : cross_re[31:26];
-assign cross_im_msb = cross_im[31] ? (~cross_im[31:26]) : cross_im[31:26];
-assign max_msb = (cross_re_msb > cross_im_msb) ? cross_re_msb : cross_im_msb;
+assign cross_re_abs = cross_re[30:0] ^ {31{cross_re[31]}};
+assign cross_im_abs = cross_im[30:0] ^ {31{cross_im[31]}};
+assign cross_or     = cross_re_abs | cross_im_abs;
 
-// 根据幅度动态缩放（保留16位精度）
-assign shift_amount = (max_msb > 6'd15) ? 5'd16 : 5'd0;
+// 前导零检测（全部31位）
+always @(*) begin
+    cross_top = 5'd0;
+    for (k = 0; k < 31; k = k + 1)
+        if (cross_or[k])
+            cross_top = k;
+end
+
+// 根据幅度动态缩放: 最高有效位右移到第14位, 符号扩展后正好16位
+assign shift_amount = (cross_top > 5'd14) ? (cross_top - 5'd14) : 5'd0;
 
 always @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
@@ -197,7 +210,7 @@ wire               cordic_valid_out;
 cordic_atan2 #(
     .WIDTH          (16),
     .ANGLE_WIDTH    (16),
-    .ITERATIONS     (16)
+    .ITERATIONS     (14)
 ) u_cordic (
     .clk        (clk),
     .rst_n      (rst_n),
@@ -12,6 +12,8 @@
 // 版本: v2.0 - 时序优化版
 //=============================================================================
 
+`include "fft_params.vh"  // FFT点数 (scripts/generate_fft_params.py生成)
+
  module signal_analyzer_top (
     // 系统时钟和复位
     input  wire         sys_clk_50m,        // 板载50MHz时钟
@@ -51,7 +53,7 @@
 //=============================================================================
 // 参数定义
 //=============================================================================
-localparam FFT_POINTS = 8192;               // FFT点数
+localparam FFT_POINTS = `FFT_POINTS;        // FFT点数 (fft_params.vh)
 localparam ADC_WIDTH  = 10;                 // ADC位宽
 localparam FFT_WIDTH  = 10;                 // FFT数据位宽（10位ADC直接使用）
 
@@ -1840,7 +1842,6 @@ weak_signal_detector #(
     // 参考信号配置
     .ref_mode           (weak_sig_ref_mode),
     .ref_frequency      (weak_sig_ref_freq),
-    .clk_frequency      (32'd35_000_000),  // 35MHz采样时钟
     
     // 增益配置（滤波器阶数已固定为8）
     .digital_gain       (weak_sig_gain),
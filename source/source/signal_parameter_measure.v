@@ -28,6 +28,8 @@
 //   v2.0 - 优化版本（自适应阈值，10位精度，FFT峰值检测）
 //=============================================================================
 
+`include "fft_params.vh"  // FFT点数/频率分辨率 (scripts/generate_fft_params.py生成)
+
 module signal_parameter_measure (
     input  wire         clk,                // 系统时钟 100MHz
     input  wire         rst_n,
@@ -39,7 +41,7 @@ module signal_parameter_measure (
     
     // 频域数据输入 (用于THD测量)
     input  wire [15:0]  spectrum_data,      // 频谱幅度
-    input  wire [12:0]  spectrum_addr,      // 频谱地址�?192点需�?3位）
+    input  wire [`FFT_ADDR_WIDTH-1:0] spectrum_addr,      // 频谱地址�?192点需�?3位）
     input  wire         spectrum_valid,     // 频谱有效
     
     // 参数输出
@@ -81,8 +83,8 @@ localparam MEASURE_TIME = 35_000_000;       // 测量周期�?5M个sample_valid
 localparam TIME_100MS = 10_000_000;         // 【优化�?00ms�?00MHz时钟周期�?(10Hz更新�?
 
 // 【新增】FFT频率测量参数
-localparam FFT_POINTS = 8192;               // FFT点数
-localparam FREQ_RES = 4272;                 // 频率分辨�? 35MHz/8192 �?4272 Hz/bin
+localparam FFT_POINTS = `FFT_POINTS;         // FFT点数 (fft_params.vh)
+localparam FREQ_RES = `FFT_FREQ_RES;         // 频率分辨率 Hz/bin (35MHz/8192取整为4272, 误差见fft_params.vh)
 
 //=============================================================================
 // 信号定义
@@ -100,16 +102,16 @@ reg [9:0]   sample_data_sync;                             // 同步后的采样
 
 // 【新增】FFT峰值检测（用于频域频率/幅度测量）
 reg [15:0]  fft_max_amp;                    // FFT峰值幅�?
-reg [12:0]  fft_peak_bin;                   // 峰值bin位置
+reg [`FFT_ADDR_WIDTH-1:0]  fft_peak_bin;                   // 峰值bin位置
 reg         fft_scan_active;                // FFT扫描激�?
 reg [31:0]  fft_freq_hz;                    // FFT计算的频率（Hz�?
 reg         fft_freq_ready;                 // FFT频率就绪
 reg         use_fft_freq;                   // 使用FFT频率（频域模式）
 
 // 【新增】FFT谐波并行检测（用于THD计算）
-reg [12:0]  harm2_bin, harm3_bin, harm4_bin, harm5_bin;  // 谐波bin位置
+reg [`FFT_ADDR_WIDTH-1:0]  harm2_bin, harm3_bin, harm4_bin, harm5_bin;  // 谐波bin位置
 reg [15:0]  harm2_amp, harm3_amp, harm4_amp, harm5_amp;  // 谐波峰值幅度
-reg [12:0]  harm_detect_base_bin;           // 【新增】谐波检测基波bin（锁定值）
+reg [`FFT_ADDR_WIDTH-1:0]  harm_detect_base_bin;           // 【新增】谐波检测基波bin（锁定值）
 reg [15:0]  fft_harmonic_2;                 // 2次谐波幅度（最终锁存值）
 reg [15:0]  fft_harmonic_3;                 // 3次谐波幅度
 reg [15:0]  fft_harmonic_4;                 // 4次谐波幅度
@@ -604,7 +606,7 @@ end
 // 实时流式峰值搜�?- 在FFT输出数据流中找最大�?
 // 【新增】峰值历史记录（用于稳定性判断）
 reg [15:0] fft_max_amp_history [0:3];  // 最近4次FFT的峰值幅度
-reg [12:0] fft_peak_bin_history [0:3]; // 最近4次FFT的峰值bin
+reg [`FFT_ADDR_WIDTH-1:0] fft_peak_bin_history [0:3]; // 最近4次FFT的峰值bin
 reg [1:0]  fft_history_index;          // 历史索引
 reg [15:0] fft_avg_amp;                // 平均峰值幅度
 
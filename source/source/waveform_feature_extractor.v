@@ -66,20 +66,13 @@ reg [15:0] form_div_result;      // 波形因子结果
 reg [15:0] centroid_div_result;  // 频谱质心结果
 
 // 倒数查找表查询结果 (COMPUTE2 → COMPUTE3A 流水线)
-reg [15:0] thd_recip_base, thd_recip_next;
-reg [7:0]  thd_offset;
+// 查表结果由reciprocal_lut内部的同步读寄存器保存, 这里只传递被除数
 reg [23:0] thd_mult_pipe;
 
-reg [15:0] crest_recip_base, crest_recip_next;
-reg [7:0]  crest_offset;
 reg [23:0] crest_mult_pipe;
 
-reg [15:0] form_recip_base, form_recip_next;
-reg [7:0]  form_offset;
 reg [23:0] form_mult_pipe;
 
-reg [15:0] centroid_recip_base, centroid_recip_next;
-reg [7:0]  centroid_offset;
 reg [31:0] centroid_mult_pipe;
 
 // 倒数差值 (COMPUTE3A → COMPUTE3B 流水线 - 时序优化新增)
@@ -279,36 +272,50 @@ end
 //=============================================================================
 // 倒数查找表模块实例化 (用于高精度除法近似)
 //=============================================================================
-// THD 除法查表
+// 查表为同步读取 (推断为DRM): 除数在COMPUTE1末锁存, COMPUTE2期间稳定,
+// COMPUTE3A时LUT输出寄存器即为本帧查表结果, 流水线级数不变
+// THD 除法查表 (与COMPUTE2同拍取表, 直接用本帧基波, 不能用thd_divisor)
 wire [15:0] thd_recip_base_wire, thd_recip_next_wire;
+wire [7:0]  thd_recip_offset_wire;
 reciprocal_lut u_thd_recip_lut (
-    .divisor    (thd_divisor),
-    .recip_base (thd_recip_base_wire),
-    .recip_next (thd_recip_next_wire)
+    .clk          (clk),
+    .divisor      (fft_fundamental_reg),
+    .recip_base   (thd_recip_base_wire),
+    .recip_next   (thd_recip_next_wire),
+    .recip_offset (thd_recip_offset_wire)
 );
 
 // Crest Factor 除法查表
 wire [15:0] crest_recip_base_wire, crest_recip_next_wire;
+wire [7:0]  crest_recip_offset_wire;
 reciprocal_lut u_crest_recip_lut (
-    .divisor    (rms_value_reg),
-    .recip_base (crest_recip_base_wire),
-    .recip_next (crest_recip_next_wire)
+    .clk          (clk),
+    .divisor      (rms_value_reg),
+    .recip_base   (crest_recip_base_wire),
+    .recip_next   (crest_recip_next_wire),
+    .recip_offset (crest_recip_offset_wire)
 );
 
 // Form Factor 除法查表
 wire [15:0] form_recip_base_wire, form_recip_next_wire;
+wire [7:0]  form_recip_offset_wire;
 reciprocal_lut u_form_recip_lut (
-    .divisor    (avg_abs_value_reg),
-    .recip_base (form_recip_base_wire),
-    .recip_next (form_recip_next_wire)
+    .clk          (clk),
+    .divisor      (avg_abs_value_reg),
+    .recip_base   (form_recip_base_wire),
+    .recip_next   (form_recip_next_wire),
+    .recip_offset (form_recip_offset_wire)
 );
 
 // Spectral Centroid 除法查表
 wire [15:0] centroid_recip_base_wire, centroid_recip_next_wire;
+wire [7:0]  centroid_recip_offset_wire;
 reciprocal_lut u_centroid_recip_lut (
-    .divisor    (fft_sum_mag_reg),
-    .recip_base (centroid_recip_base_wire),
-    .recip_next (centroid_recip_next_wire)
+    .clk          (clk),
+    .divisor      (fft_sum_mag_reg),
+    .recip_base   (centroid_recip_base_wire),
+    .recip_next   (centroid_recip_next_wire),
+    .recip_offset (centroid_recip_offset_wire)
 );
 
 //=============================================================================
@@ -418,59 +425,35 @@ always @(posedge clk or negedge rst_n) begin
         form_mult  <= 0;
         thd_divisor <= 0;
         
-        // 倒数查表结果寄存
-        thd_recip_base <= 0;
-        thd_recip_next <= 0;
-        thd_offset <= 0;
+        // 被除数流水线 (查表结果在reciprocal_lut内寄存)
         thd_mult_pipe <= 0;
         
-        crest_recip_base <= 0;
-        crest_recip_next <= 0;
-        crest_offset <= 0;
         crest_mult_pipe <= 0;
         
-        form_recip_base <= 0;
-        form_recip_next <= 0;
-        form_offset <= 0;
         form_mult_pipe <= 0;
         
-        centroid_recip_base <= 0;
-        centroid_recip_next <= 0;
-        centroid_offset <= 0;
         centroid_mult_pipe <= 0;
     end else if (state == COMPUTE2) begin
         // THD 乘法: (谐波能量 × 100)
         thd_mult    <= fft_harmonic_sum_reg * 8'd100;
         thd_divisor <= fft_fundamental_reg;
         
-        // THD 倒数查表 + 保存插值参数
-        thd_recip_base <= thd_recip_base_wire;
-        thd_recip_next <= thd_recip_next_wire;
-        thd_offset     <= fft_fundamental_reg[7:0];
-        thd_mult_pipe  <= fft_harmonic_sum_reg * 8'd100; // 流水线传递被除数
+        // THD 倒数查表 (LUT内部寄存) + 流水线传递被除数
+        thd_mult_pipe  <= fft_harmonic_sum_reg * 8'd100;
         
         // 峰值因子乘法: (Peak × 256)
         crest_mult  <= peak_to_peak_reg << 8;
         
-        // Crest 倒数查表
-        crest_recip_base <= crest_recip_base_wire;
-        crest_recip_next <= crest_recip_next_wire;
-        crest_offset     <= rms_value_reg[7:0];
+        // Crest 倒数查表 (LUT内部寄存)
         crest_mult_pipe  <= peak_to_peak_reg << 8;
         
         // 波形因子乘法: (RMS × 256)
         form_mult   <= rms_value_reg << 8;
         
-        // Form 倒数查表
-        form_recip_base <= form_recip_base_wire;
-        form_recip_next <= form_recip_next_wire;
-        form_offset     <= avg_abs_value_reg[7:0];
+        // Form 倒数查表 (LUT内部寄存)
         form_mult_pipe  <= rms_value_reg << 8;
         
-        // Centroid 倒数查表
-        centroid_recip_base <= centroid_recip_base_wire;
-        centroid_recip_next <= centroid_recip_next_wire;
-        centroid_offset     <= fft_sum_mag_reg[7:0];
+        // Centroid 倒数查表 (LUT内部寄存)
         centroid_mult_pipe  <= fft_weighted_sum_reg;
     end
 end
@@ -504,21 +487,21 @@ always @(posedge clk or negedge rst_n) begin
         centroid_divisor_pipe2 <= 0;
     end else if (state == COMPUTE3A) begin
         // 计算差值: recip_next - recip_base
-        thd_recip_diff <= $signed({1'b0, thd_recip_next}) - $signed({1'b0, thd_recip_base});
-        crest_recip_diff <= $signed({1'b0, crest_recip_next}) - $signed({1'b0, crest_recip_base});
-        form_recip_diff <= $signed({1'b0, form_recip_next}) - $signed({1'b0, form_recip_base});
-        centroid_recip_diff <= $signed({1'b0, centroid_recip_next}) - $signed({1'b0, centroid_recip_base});
+        thd_recip_diff <= $signed({1'b0, thd_recip_next_wire}) - $signed({1'b0, thd_recip_base_wire});
+        crest_recip_diff <= $signed({1'b0, crest_recip_next_wire}) - $signed({1'b0, crest_recip_base_wire});
+        form_recip_diff <= $signed({1'b0, form_recip_next_wire}) - $signed({1'b0, form_recip_base_wire});
+        centroid_recip_diff <= $signed({1'b0, centroid_recip_next_wire}) - $signed({1'b0, centroid_recip_base_wire});
         
         // 传递基准值和偏移量
-        thd_recip_base_pipe <= thd_recip_base;
-        crest_recip_base_pipe <= crest_recip_base;
-        form_recip_base_pipe <= form_recip_base;
-        centroid_recip_base_pipe <= centroid_recip_base;
+        thd_recip_base_pipe <= thd_recip_base_wire;
+        crest_recip_base_pipe <= crest_recip_base_wire;
+        form_recip_base_pipe <= form_recip_base_wire;
+        centroid_recip_base_pipe <= centroid_recip_base_wire;
         
-        thd_offset_pipe <= thd_offset;
-        crest_offset_pipe <= crest_offset;
-        form_offset_pipe <= form_offset;
-        centroid_offset_pipe <= centroid_offset;
+        thd_offset_pipe <= thd_recip_offset_wire;
+        crest_offset_pipe <= crest_recip_offset_wire;
+        form_offset_pipe <= form_recip_offset_wire;
+        centroid_offset_pipe <= centroid_recip_offset_wire;
         
         // 传递被除数
         thd_mult_pipe2 <= thd_mult_pipe;
@@ -536,6 +519,12 @@ end
 
 // 流水线阶段3B: 倒数插值计算 (时序优化: 乘法和加法分离)
 // 算法: reciprocal = recip_base + (recip_diff * offset / 256)
+// 乘积单独用有符号wire算出再取[23:8]: 若直接写在与无符号base相加的表达式里,
+// 整个表达式按无符号、17位计算, 负的差值会被当成大正数
+wire signed [25:0] thd_recip_step      = thd_recip_diff      * $signed({1'b0, thd_offset_pipe});
+wire signed [25:0] crest_recip_step    = crest_recip_diff    * $signed({1'b0, crest_offset_pipe});
+wire signed [25:0] form_recip_step     = form_recip_diff     * $signed({1'b0, form_offset_pipe});
+wire signed [25:0] centroid_recip_step = centroid_recip_diff * $signed({1'b0, centroid_offset_pipe});
 
 always @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
@@ -555,32 +544,35 @@ always @(posedge clk or negedge rst_n) begin
         centroid_divisor_pipe <= 0;
     end else if (state == COMPUTE3B) begin
         // THD 插值计算: base + (diff * offset) >> 8
-        thd_recip_interp_reg <= thd_recip_base_pipe + 
-            (((thd_recip_diff * $signed({1'b0, thd_offset_pipe}))) >>> 8);
+        thd_recip_interp_reg <= thd_recip_base_pipe + thd_recip_step[23:8];
         thd_dividend_pipe <= thd_mult_pipe2;
         thd_divisor_pipe <= thd_divisor_pipe2;
         
         // Crest Factor 插值计算
-        crest_recip_interp_reg <= crest_recip_base_pipe + 
-            (((crest_recip_diff * $signed({1'b0, crest_offset_pipe}))) >>> 8);
+        crest_recip_interp_reg <= crest_recip_base_pipe + crest_recip_step[23:8];
         crest_dividend_pipe <= crest_mult_pipe2;
         crest_divisor_pipe <= crest_divisor_pipe2;
         
         // Form Factor 插值计算
-        form_recip_interp_reg <= form_recip_base_pipe + 
-            (((form_recip_diff * $signed({1'b0, form_offset_pipe}))) >>> 8);
+        form_recip_interp_reg <= form_recip_base_pipe + form_recip_step[23:8];
         form_dividend_pipe <= form_mult_pipe2;
         form_divisor_pipe <= form_divisor_pipe2;
         
         // Spectral Centroid 插值计算
-        centroid_recip_interp_reg <= centroid_recip_base_pipe + 
-            (((centroid_recip_diff * $signed({1'b0, centroid_offset_pipe}))) >>> 8);
+        centroid_recip_interp_reg <= centroid_recip_base_pipe + centroid_recip_step[23:8];
         centroid_dividend_pipe <= centroid_mult_pipe2;
         centroid_divisor_pipe <= centroid_divisor_pipe2;
     end
 end
 
 // 流水线阶段4: 最终乘法 (dividend * reciprocal)
+// 乘积先放在全宽wire中再取[..:15]; 直接写 (a*b)>>>15 会先按结果位宽截断乘积.
+// 商超出结果位宽时饱和到全1
+wire [39:0] thd_prod      = thd_dividend_pipe * thd_recip_interp_reg;
+wire [31:0] crest_prod    = crest_dividend_pipe[15:0] * crest_recip_interp_reg;
+wire [31:0] form_prod     = form_dividend_pipe[15:0] * form_recip_interp_reg;
+wire [31:0] centroid_prod = centroid_dividend_pipe[15:0] * centroid_recip_interp_reg;
+
 always @(posedge clk or negedge rst_n) begin
     if (!rst_n) begin
         thd_mult_result      <= 0;
@@ -590,25 +582,25 @@ always @(posedge clk or negedge rst_n) begin
     end else if (state == COMPUTE4) begin
         // THD 除法: dividend / divisor = dividend * reciprocal
         if (thd_divisor_pipe != 0) begin
-            thd_mult_result <= (thd_dividend_pipe * thd_recip_interp_reg) >>> 15;
+            thd_mult_result <= thd_prod[39] ? 24'hFFFFFF : thd_prod[38:15];
         end else
             thd_mult_result <= 0;
         
         // Crest Factor 除法
         if (crest_divisor_pipe != 0) begin
-            crest_div_result <= (crest_dividend_pipe[15:0] * crest_recip_interp_reg) >>> 15;
+            crest_div_result <= crest_prod[31] ? 16'hFFFF : crest_prod[30:15];
         end else
             crest_div_result <= 16'hFFFF;
         
         // Form Factor 除法
         if (form_divisor_pipe != 0) begin
-            form_div_result <= (form_dividend_pipe[15:0] * form_recip_interp_reg) >>> 15;
+            form_div_result <= form_prod[31] ? 16'hFFFF : form_prod[30:15];
         end else
             form_div_result <= 16'h0100;
         
         // Spectral Centroid 除法
         if (centroid_divisor_pipe != 0) begin
-            centroid_div_result <= (centroid_dividend_pipe[15:0] * centroid_recip_interp_reg) >>> 15;
+            centroid_div_result <= centroid_prod[31] ? 16'hFFFF : centroid_prod[30:15];
         end else
             centroid_div_result <= 0;
     end
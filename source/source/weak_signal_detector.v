@@ -8,6 +8,8 @@
 //   4. 自动频率跟踪
 //=============================================================================
 
+`include "dds_params.vh"  // 调谐字乘法常数 (scripts/generate_dds_table.py生成)
+
 module weak_signal_detector #(
     parameter DATA_WIDTH = 16,
     parameter OUTPUT_WIDTH = 24
@@ -22,8 +24,7 @@ module weak_signal_detector #(
     
     // 参考信号配置
     input  wire [1:0]                   ref_mode,         // 0=内部DDS, 1=CH2作参考, 2=外部, 3=自动搜索
-    input  wire [31:0]                  ref_frequency,    // 参考频率（Hz）
-    input  wire [31:0]                  clk_frequency,    // 时钟频率（Hz）
+    input  wire [31:0]                  ref_frequency,    // 参考频率（Hz）, 时钟固定为DDS_CLK_HZ
     
     // 增益和滤波配置
     input  wire [3:0]                   digital_gain,     // 数字增益：0-15 (对应1x-32768x)
@@ -58,16 +59,20 @@ module weak_signal_detector #(
 //=============================================================================
 // 1. 频率调谐字计算
 //=============================================================================
-// Tuning_Word = (Fout / Fclk) * 2^32
-reg [31:0] freq_tuning_word;
+// Tuning_Word = round(Fout * 2^32 / Fclk)
+// 常数乘法 + 移位代替32位除法: (Fref * DDS_TW_MULT + 舍入) >> DDS_TW_SHIFT
+// 0~17.5MHz 误差<1 LSB (dds_params.vh), Fclk固定为DDS_CLK_HZ;
+// 时钟改变时须修改 generate_dds_table.py 的 CLK_HZ 并重新生成 dds_params.vh
+reg  [`DDS_TW_PRODUCT_WIDTH-1:0] tw_product;
+reg  [31:0]                      freq_tuning_word;
 
 always @(posedge clk or negedge rst_n) begin
-    if (!rst_n)
+    if (!rst_n) begin
+        tw_product       <= {`DDS_TW_PRODUCT_WIDTH{1'b0}};
         freq_tuning_word <= 32'd0;
-    else begin
-        // 简化计算：TW = (Fref << 32) / Fclk
-        // 实际使用时需要用除法器IP或查找表
-        freq_tuning_word <= (ref_frequency << 16) / (clk_frequency >> 16);
+    end else begin
+        tw_product       <= ref_frequency * `DDS_TW_MULT + (1'b1 << (`DDS_TW_SHIFT - 1));
+        freq_tuning_word <= tw_product[`DDS_TW_SHIFT +: 32];
     end
 end
 